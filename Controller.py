@@ -40,6 +40,7 @@ Usage:
   uv run Controller.py --skip-hcpa --skip-nal    # Skip bulk steps
   uv run Controller.py --skip-auction-scrape     # Skip Phase B scraping
   uv run Controller.py --ori-limit 10            # Limit ORI to 10 properties
+  uv run Controller.py --step-workers 4          # Run independent steps concurrently
 """
 
 from __future__ import annotations
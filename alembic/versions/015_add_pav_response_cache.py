@@ -0,0 +1,56 @@
+"""Add pav_response_cache table for the PAV API response cache.
+
+Replaces the flat ``data/cache/pav_api/*.json.gz`` directory with one indexed
+table holding gzip-compressed JSON bodies keyed by payload hash. Rows are
+LRU-evicted by ``src.services.pav_cache`` using ``last_accessed_at`` and a
+byte budget over ``body_bytes``.
+
+Revision ID: 015_add_pav_response_cache
+Revises: 014_add_raw_ocr_column
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "015_add_pav_response_cache"
+down_revision = "014_add_raw_ocr_column"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pav_response_cache",
+        sa.Column("cache_key", sa.Text(), primary_key=True),
+        sa.Column("body", sa.LargeBinary(), nullable=False),
+        sa.Column("body_bytes", sa.Integer(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column(
+            "last_accessed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+    op.create_index(
+        "idx_pav_response_cache_last_accessed",
+        "pav_response_cache",
+        ["last_accessed_at"],
+    )
+    op.create_index(
+        "idx_pav_response_cache_created",
+        "pav_response_cache",
+        ["created_at"],
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Forward-only migration policy")
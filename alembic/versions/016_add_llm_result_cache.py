@@ -0,0 +1,52 @@
+"""Add llm_result_cache table for content-addressed VisionService results.
+
+Rows are keyed by a hash of the full chat-completion payload (image bytes or
+OCR text, prompt, model, response_format) and hold the extracted response
+text. ``src.services.llm_result_cache`` LRU-evicts by ``last_accessed_at``
+against a byte budget over ``body_bytes``.
+
+Revision ID: 016_add_llm_result_cache
+Revises: 015_add_pav_response_cache
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "016_add_llm_result_cache"
+down_revision = "015_add_pav_response_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_result_cache",
+        sa.Column("cache_key", sa.Text(), primary_key=True),
+        sa.Column("model", sa.Text(), nullable=False),
+        sa.Column("response_text", sa.Text(), nullable=False),
+        sa.Column("body_bytes", sa.Integer(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column(
+            "last_accessed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+    op.create_index(
+        "idx_llm_result_cache_last_accessed",
+        "llm_result_cache",
+        ["last_accessed_at"],
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Forward-only migration policy")
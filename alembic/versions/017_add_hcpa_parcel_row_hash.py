@@ -0,0 +1,29 @@
+"""Add row_hash to hcpa_bulk_parcels for change-detecting weekly loads.
+
+``load_hcpa_bulk`` stores a content hash of each parcel row and only rewrites
+rows whose hash changed since the previous dump, so ``updated_at`` now marks
+parcels that actually changed.  Existing rows start with NULL and are all
+rewritten (once) by the next load.
+
+``hcpa_bulk_parcels`` is created by ``sunbiz/pg_loader.py init-db``
+(``create_all``), so the column is added only if the table already exists.
+
+Revision ID: 017_add_hcpa_parcel_row_hash
+Revises: 016_add_llm_result_cache
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "017_add_hcpa_parcel_row_hash"
+down_revision = "016_add_llm_result_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE IF EXISTS hcpa_bulk_parcels ADD COLUMN IF NOT EXISTS row_hash VARCHAR(32)")
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Forward-only migration policy")
@@ -0,0 +1,32 @@
+"""Add parsed legal-description columns to hcpa_bulk_parcels.
+
+``load_hcpa_bulk`` now parses ``raw_legal1..4`` once per load and stores lot,
+block, subdivision and plat book/page, so readers no longer re-parse the raw
+legal text.  The parsed columns feed ``row_hash``, so the next load sees every
+existing row as changed and fills them in (once).
+
+``hcpa_bulk_parcels`` is created by ``sunbiz/pg_loader.py init-db``
+(``create_all``), so the columns are added only if the table already exists.
+
+Revision ID: 018_add_hcpa_parcel_legal_columns
+Revises: 017_add_hcpa_parcel_row_hash
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "018_add_hcpa_parcel_legal_columns"
+down_revision = "017_add_hcpa_parcel_row_hash"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ("legal_lot", "legal_block", "legal_subdivision", "legal_plat_book", "legal_plat_page")
+
+
+def upgrade() -> None:
+    for column in _COLUMNS:
+        op.execute(f"ALTER TABLE IF EXISTS hcpa_bulk_parcels ADD COLUMN IF NOT EXISTS {column} TEXT")
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Forward-only migration policy")
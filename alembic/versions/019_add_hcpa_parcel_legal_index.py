@@ -0,0 +1,63 @@
+"""Add hcpa_parcel_legal_index for indexed identifier-recovery legal lookups.
+
+One row per HCPA parcel with the upper-cased ``raw_legal1..4`` text
+(trigram-indexed for the subdivision LIKE / plat regex lookups) and GIN-indexed
+lot / block / unit key arrays.  ``load_hcpa_bulk`` fills it, including every
+parcel not indexed yet, so the first load after this migration builds it.
+
+Like the other ``hcpa_*`` tables it is also created by ``sunbiz/pg_loader.py
+init-db`` (``create_all``); here it is only created when
+``hcpa_bulk_parcels`` already exists, since it references that table.
+
+Revision ID: 019_add_hcpa_parcel_legal_index
+Revises: 018_add_hcpa_parcel_legal_columns
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = "019_add_hcpa_parcel_legal_index"
+down_revision = "018_add_hcpa_parcel_legal_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF to_regclass('hcpa_bulk_parcels') IS NULL THEN
+                RETURN;
+            END IF;
+            CREATE TABLE IF NOT EXISTS hcpa_parcel_legal_index (
+                folio VARCHAR(32) PRIMARY KEY
+                    REFERENCES hcpa_bulk_parcels (folio) ON DELETE CASCADE,
+                legal_text TEXT NOT NULL,
+                subdivision TEXT,
+                lot_keys TEXT[] NOT NULL,
+                block_keys TEXT[] NOT NULL,
+                unit_keys TEXT[] NOT NULL,
+                plat_book TEXT,
+                plat_page TEXT,
+                updated_at TIMESTAMPTZ NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_hcpa_parcel_legal_index_text_trgm
+                ON hcpa_parcel_legal_index USING gin (legal_text gin_trgm_ops);
+            CREATE INDEX IF NOT EXISTS idx_hcpa_parcel_legal_index_lot_keys
+                ON hcpa_parcel_legal_index USING gin (lot_keys);
+            CREATE INDEX IF NOT EXISTS idx_hcpa_parcel_legal_index_block_keys
+                ON hcpa_parcel_legal_index USING gin (block_keys);
+            CREATE INDEX IF NOT EXISTS idx_hcpa_parcel_legal_index_unit_keys
+                ON hcpa_parcel_legal_index USING gin (unit_keys);
+            CREATE INDEX IF NOT EXISTS idx_hcpa_parcel_legal_index_plat
+                ON hcpa_parcel_legal_index (plat_book, plat_page);
+        END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Forward-only migration policy")
@@ -0,0 +1,173 @@
+"""Bounded thread-pool offload for the dashboard's synchronous PostgreSQL access.
+
+Architectural purpose:
+- the routers are ``async def`` but their data layer (``pg_web``,
+  ``pg_database``, the ``_pg_*`` helpers in the routers) is synchronous
+  SQLAlchemy; run on the event loop, one slow property dossier stalls every
+  other request;
+- ``db_route`` wraps a plain ``def`` handler so FastAPI still sees an async
+  endpoint, but the body runs on a dedicated, bounded ``ThreadPoolExecutor``;
+- ``web_engine`` is the web's own SQLAlchemy engine, sized to that pool and
+  carrying a server-side ``statement_timeout``.
+
+Configuration (environment, read once per process):
+
+| Variable | Default | Meaning |
+|---|---|---|
+| ``WEB_DB_THREADS`` | 8 | handler threads (concurrent DB-bound requests) |
+| ``WEB_DB_POOL_SIZE`` | ``WEB_DB_THREADS`` | persistent PG connections |
+| ``WEB_DB_MAX_OVERFLOW`` | 4 | extra connections above the pool size |
+| ``WEB_DB_POOL_TIMEOUT`` | 10 | seconds to wait for a free connection |
+| ``WEB_DB_STATEMENT_TIMEOUT_MS`` | 30000 | per-statement limit enforced by PG |
+| ``WEB_DB_REQUEST_TIMEOUT`` | 45 | seconds before the request answers 503 |
+
+A request that times out returns 503 through ``DatabaseTimeoutError``; its
+thread cannot be interrupted, but ``statement_timeout`` cancels the query it
+is waiting on, so the thread is released shortly after.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import create_engine
+
+from app.web.exceptions import DatabaseTimeoutError
+from sunbiz.db import resolve_pg_dsn
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from sqlalchemy.engine import Engine
+
+
+@dataclass(frozen=True)
+class WebDbSettings:
+    threads: int = 8
+    pool_size: int = 8
+    max_overflow: int = 4
+    pool_timeout: float = 10.0
+    statement_timeout_ms: int = 30_000
+    request_timeout: float = 45.0
+
+    @classmethod
+    def from_env(cls) -> WebDbSettings:
+        threads = max(1, int(os.getenv("WEB_DB_THREADS", str(cls.threads))))
+        return cls(
+            threads=threads,
+            pool_size=max(1, int(os.getenv("WEB_DB_POOL_SIZE", str(threads)))),
+            max_overflow=max(
+                0, int(os.getenv("WEB_DB_MAX_OVERFLOW", str(cls.max_overflow)))
+            ),
+            pool_timeout=float(os.getenv("WEB_DB_POOL_TIMEOUT", str(cls.pool_timeout))),
+            statement_timeout_ms=max(
+                0,
+                int(
+                    os.getenv(
+                        "WEB_DB_STATEMENT_TIMEOUT_MS", str(cls.statement_timeout_ms)
+                    )
+                ),
+            ),
+            request_timeout=float(
+                os.getenv("WEB_DB_REQUEST_TIMEOUT", str(cls.request_timeout))
+            ),
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def web_db_settings() -> WebDbSettings:
+    return WebDbSettings.from_env()
+
+
+@functools.lru_cache(maxsize=1)
+def web_engine() -> Engine:
+    """Return the dashboard's engine (pool sized to the handler threads)."""
+    settings = web_db_settings()
+    connect_args: dict[str, Any] = {}
+    if settings.statement_timeout_ms:
+        connect_args["options"] = (
+            f"-c statement_timeout={settings.statement_timeout_ms}"
+        )
+    return create_engine(
+        resolve_pg_dsn(),
+        pool_pre_ping=True,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        connect_args=connect_args,
+    )
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            threads = web_db_settings().threads
+            _executor = ThreadPoolExecutor(
+                max_workers=threads, thread_name_prefix="web-db"
+            )
+            logger.info("Web DB executor started with {} threads", threads)
+        return _executor
+
+
+def shutdown_executor() -> None:
+    """Stop the handler pool (FastAPI lifespan shutdown)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_db[**P, R](func: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+    """Run blocking ``func`` on the handler pool, bounded by the request timeout."""
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    future = asyncio.get_running_loop().run_in_executor(_get_executor(), call)
+    timeout = web_db_settings().request_timeout
+    try:
+        return await asyncio.wait_for(future, timeout=timeout if timeout > 0 else None)
+    except TimeoutError:
+        name = getattr(func, "__qualname__", repr(func))
+        logger.warning("Web DB call {} exceeded {:.0f}s", name, timeout)
+        raise DatabaseTimeoutError(
+            f"Database request timed out after {timeout:.0f}s"
+        ) from None
+
+
+def db_route[**P, R](func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+    """Expose a blocking route handler as async, running it via ``run_db``.
+
+    The wrapper carries ``func``'s signature with its annotations already
+    evaluated against ``func``'s module.  FastAPI releases that do not
+    unwrap endpoints resolve string annotations (every router uses
+    ``from __future__ import annotations``) against the wrapper's globals,
+    i.e. this module, where ``Request`` is unknown and would be read as a
+    required query parameter.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        return await run_db(func, *args, **kwargs)
+
+    try:
+        wrapper.__signature__ = inspect.signature(func, eval_str=True)  # type: ignore[attr-defined]
+    except NameError:
+        # An annotation only importable under TYPE_CHECKING: leave it to
+        # FastAPI, which resolves what it can.
+        wrapper.__signature__ = inspect.signature(func)  # type: ignore[attr-defined]
+    return wrapper
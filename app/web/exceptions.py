@@ -7,3 +7,7 @@ class DatabaseLockedError(Exception):
 
 class DatabaseUnavailableError(Exception):
     """Raised when the database is not accessible."""
+
+
+class DatabaseTimeoutError(DatabaseUnavailableError):
+    """Raised when a request's database work exceeds its time budget."""
@@ -31,6 +31,7 @@ from loguru import logger
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.web.routers import dashboard, properties, api, review, history, database_view, auction_intel, connections
+from app.web.db_executor import db_route, shutdown_executor, web_db_settings
 from app.web.exceptions import DatabaseLockedError, DatabaseUnavailableError
 
 
@@ -44,7 +45,9 @@ setup_default_logging()
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
     logger.info("HillsInspector Web starting up...")
+    logger.info("Web DB settings: {}", web_db_settings())
     yield
+    shutdown_executor()
     logger.info("HillsInspector Web shutting down...")
 
 
@@ -274,7 +277,8 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
 
 
 @app.get("/health")
-async def health_check():
+@db_route
+def health_check():
     """Health check endpoint."""
     from app.web.pg_web import check_database_health
 
@@ -20,7 +20,7 @@ from loguru import logger
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
-from sunbiz.db import get_engine, resolve_pg_dsn
+from app.web.db_executor import web_engine
 
 # Sale type code -> human-readable deed type
 SALE_TYPE_MAP: dict[str, str] = {
@@ -49,8 +49,7 @@ class PgDashboardQueries:
         self._available = False
         self._engine = None
         try:
-            dsn = resolve_pg_dsn()
-            self._engine = get_engine(dsn)
+            self._engine = web_engine()
             with self._engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
             self._available = True
@@ -19,11 +19,11 @@ from sqlalchemy import text
 from sqlalchemy.exc import OperationalError
 
 from src.utils.time import today_local
-from sunbiz.db import get_engine, resolve_pg_dsn
+from app.web.db_executor import web_engine
 
 
 def _engine():
-    return get_engine(resolve_pg_dsn())
+    return web_engine()
 
 
 def _sql_placeholder_photo_condition(url_expr: str) -> str:
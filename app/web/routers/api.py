@@ -2,6 +2,7 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from loguru import logger
 
+from app.web.db_executor import db_route
 from app.web.pg_web import (
     get_auction_map_points,
     check_database_health,
@@ -13,7 +14,8 @@ router = APIRouter(tags=["api"])
 
 
 @router.get("/map-auctions")
-async def map_auctions():
+@db_route
+def map_auctions():
     """Get auction locations for map display."""
     try:
         rows = get_auction_map_points()
@@ -52,7 +54,8 @@ async def map_auctions():
 
 
 @router.get("/search")
-async def api_search(request: Request, q: str = ""):
+@db_route
+def api_search(request: Request, q: str = ""):
     """Search auctions by case_number, address, or owner_name. Returns HTML for HTMX dropdown."""
     if not q or len(q) < 2:
         return HTMLResponse("")
@@ -87,7 +90,8 @@ async def api_search(request: Request, q: str = ""):
 # -------------------------------------------------------------------------
 
 @router.get("/search-fuzzy")
-async def search_fuzzy(request: Request, q: str = "", limit: int = 25):
+@db_route
+def search_fuzzy(request: Request, q: str = "", limit: int = 25):
     """Fuzzy property search using PG trigram matching.
 
     Returns HTML for HTMX dropdown or JSON depending on Accept header.
@@ -118,7 +122,8 @@ async def search_fuzzy(request: Request, q: str = "", limit: int = 25):
 
 
 @router.get("/resolve-name")
-async def resolve_name(q: str = "", threshold: float = 0.3):
+@db_route
+def resolve_name(q: str = "", threshold: float = 0.3):
     """Resolve a defendant/owner name to property folios via PG fuzzy matching."""
     if not q or len(q) < 2:
         return JSONResponse({"results": []})
@@ -139,7 +144,8 @@ async def resolve_name(q: str = "", threshold: float = 0.3):
 # -------------------------------------------------------------------------
 
 @router.get("/property/{folio}/comparables")
-async def get_comparables(folio: str, years: int = 3):
+@db_route
+def get_comparables(folio: str, years: int = 3):
     """Comparable sales for a property from PG hcpa_allsales."""
     pg = get_pg_queries()
     if not pg.available:
@@ -157,7 +163,8 @@ async def get_comparables(folio: str, years: int = 3):
 
 
 @router.get("/property/{folio}/pg-sales-history")
-async def get_pg_sales_history(folio: str):
+@db_route
+def get_pg_sales_history(folio: str):
     """Full sales chain from PG hcpa_allsales (more complete than SQLite)."""
     pg = get_pg_queries()
     if not pg.available:
@@ -174,7 +181,8 @@ async def get_pg_sales_history(folio: str):
 
 
 @router.get("/property/{folio}/subdivision")
-async def get_subdivision(folio: str):
+@db_route
+def get_subdivision(folio: str):
     """Subdivision info for a property."""
     pg = get_pg_queries()
     if not pg.available:
@@ -188,7 +196,8 @@ async def get_subdivision(folio: str):
 
 
 @router.get("/property/{folio}/multi-unit")
-async def get_multi_unit(folio: str):
+@db_route
+def get_multi_unit(folio: str):
     """Check if property is multi-unit and get sibling units."""
     pg = get_pg_queries()
     if not pg.available:
@@ -211,7 +220,8 @@ async def get_multi_unit(folio: str):
 # -------------------------------------------------------------------------
 
 @router.get("/analytics/sales-volume")
-async def sales_volume(zip_code: str | None = None, months: int = 24):
+@db_route
+def sales_volume(zip_code: str | None = None, months: int = 24):
     """Monthly sales volume chart data from PG."""
     pg = get_pg_queries()
     if not pg.available:
@@ -234,7 +244,8 @@ async def sales_volume(zip_code: str | None = None, months: int = 24):
 
 
 @router.get("/analytics/value-distribution")
-async def value_distribution(zip_code: str | None = None):
+@db_route
+def value_distribution(zip_code: str | None = None):
     """Property value distribution histogram data from PG."""
     pg = get_pg_queries()
     if not pg.available:
@@ -248,7 +259,8 @@ async def value_distribution(zip_code: str | None = None):
 
 
 @router.get("/analytics/property-stats-by-zip")
-async def property_stats_by_zip():
+@db_route
+def property_stats_by_zip():
     """Property distribution stats by zip code from PG."""
     pg = get_pg_queries()
     if not pg.available:
@@ -266,7 +278,8 @@ async def property_stats_by_zip():
 
 
 @router.get("/analytics/foreclosure-deeds")
-async def foreclosure_deed_stats(months: int = 12):
+@db_route
+def foreclosure_deed_stats(months: int = 12):
     """Foreclosure and tax deed volume by month from PG."""
     pg = get_pg_queries()
     if not pg.available:
@@ -287,7 +300,8 @@ async def foreclosure_deed_stats(months: int = 12):
 # -------------------------------------------------------------------------
 
 @router.get("/health")
-async def api_health():
+@db_route
+def api_health():
     """API health check with database status."""
     db_status = check_database_health()
     pg = get_pg_queries()
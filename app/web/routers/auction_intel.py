@@ -7,6 +7,7 @@ from datetime import date
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 
+from app.web.db_executor import db_route
 from app.web.pg_web import get_auction_intel_for_date
 from app.web.template_filters import get_templates
 
@@ -17,7 +18,8 @@ templates = get_templates()
 
 @router.get("", response_class=HTMLResponse)
 @router.get("/", response_class=HTMLResponse)
-async def auction_intel_dashboard(request: Request):
+@db_route
+def auction_intel_dashboard(request: Request):
     """
     Main auction intelligence dashboard.
 
@@ -37,7 +39,8 @@ async def auction_intel_dashboard(request: Request):
 
 
 @router.get("/{target_date}", response_class=HTMLResponse)
-async def auction_intel_by_date(request: Request, target_date: date):
+@db_route
+def auction_intel_by_date(request: Request, target_date: date):
     """View auction intelligence for a specific date."""
     target_date, auctions, stats = get_auction_intel_for_date(target_date)
 
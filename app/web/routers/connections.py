@@ -21,13 +21,13 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from loguru import logger
 from sqlalchemy import text as sa_text
 
+from app.web.db_executor import db_route, web_engine
+
 router = APIRouter()
 
 
 def _pg_engine():
-    from sunbiz.db import get_engine, resolve_pg_dsn
-
-    return get_engine(resolve_pg_dsn())
+    return web_engine()
 
 
 def _age_years(filed_date) -> int | None:
@@ -78,7 +78,8 @@ def _search_entities(query: str, limit: int = 10) -> list[dict]:
 
 
 @router.get("/connections", response_class=HTMLResponse)
-async def connections_page(request: Request):
+@db_route
+def connections_page(request: Request):
     from app.web.template_filters import get_templates
 
     templates = get_templates()
@@ -89,7 +90,8 @@ async def connections_page(request: Request):
 
 
 @router.get("/api/connections/search")
-async def api_search(q: str = Query("", min_length=0)):
+@db_route
+def api_search(q: str = Query("", min_length=0)):
     try:
         results = _search_entities(q)
     except Exception as exc:
@@ -201,7 +203,8 @@ def _expand_entity(doc_number: str) -> dict | None:
 
 
 @router.get("/api/connections/entity/{doc_number}")
-async def api_entity(doc_number: str):
+@db_route
+def api_entity(doc_number: str):
     try:
         result = _expand_entity(doc_number)
     except Exception as exc:
@@ -376,7 +379,8 @@ def _expand_property(folio: str) -> dict | None:
 
 
 @router.get("/api/connections/person")
-async def api_person(name: str = Query("", min_length=0)):
+@db_route
+def api_person(name: str = Query("", min_length=0)):
     try:
         result = _expand_person(name)
     except Exception as exc:
@@ -386,7 +390,8 @@ async def api_person(name: str = Query("", min_length=0)):
 
 
 @router.get("/api/connections/property/{folio}")
-async def api_property(folio: str):
+@db_route
+def api_property(folio: str):
     try:
         result = _expand_property(folio)
     except Exception as exc:
@@ -35,6 +35,8 @@ from fastapi.responses import HTMLResponse
 from loguru import logger
 from sqlalchemy import text as sa_text
 
+from app.web.db_executor import db_route, web_engine
+
 router = APIRouter()
 
 
@@ -43,9 +45,8 @@ router = APIRouter()
 # ---------------------------------------------------------------------------
 
 def _pg_engine():
-    """Deferred import to avoid startup failures if PG is unavailable."""
-    from sunbiz.db import get_engine, resolve_pg_dsn
-    return get_engine(resolve_pg_dsn())
+    """Engine is created lazily so startup does not fail if PG is unavailable."""
+    return web_engine()
 
 
 def _dedupe_nonempty(values: Iterable[object]) -> list[str]:
@@ -255,7 +256,8 @@ def _resolve_property_targets(conn, query: str) -> dict[str, list[str]]:
 # ---------------------------------------------------------------------------
 
 @router.get("/database", response_class=HTMLResponse)
-async def database_page(request: Request):
+@db_route
+def database_page(request: Request):
     """Render the database search page with person and property search boxes."""
     from app.web.main import templates
     return templates.TemplateResponse("database.html", {"request": request})
@@ -266,7 +268,8 @@ async def database_page(request: Request):
 # ---------------------------------------------------------------------------
 
 @router.post("/database/person-search", response_class=HTMLResponse)
-async def person_search(request: Request, name: str = Form("")):
+@db_route
+def person_search(request: Request, name: str = Form("")):
     """Fuzzy person search across all PG people-related tables.
 
     Returns an HTMX partial (``partials/person_search_results.html``) with
@@ -479,7 +482,8 @@ async def person_search(request: Request, name: str = Form("")):
 # ---------------------------------------------------------------------------
 
 @router.post("/database/property-search", response_class=HTMLResponse)
-async def property_search(request: Request, identifier: str = Form("")):
+@db_route
+def property_search(request: Request, identifier: str = Form("")):
     """Property search by folio, strap, address, or case number.
 
     Returns an HTMX partial (``partials/property_search_results.html``) with
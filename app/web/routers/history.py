@@ -11,12 +11,12 @@ from fastapi.responses import HTMLResponse
 from loguru import logger
 from sqlalchemy import text as sa_text
 
-from sunbiz.db import get_engine, resolve_pg_dsn
+from app.web.db_executor import db_route, web_engine
 
 router = APIRouter()
 
 def _pg_engine():
-    return get_engine(resolve_pg_dsn())
+    return web_engine()
 
 CASE_NUMBER_RE = re.compile(
     r"id=[\"']case_number[\"'][^>]*value=[\"']([^\"']+)[\"']",
@@ -170,7 +170,8 @@ def get_history_stats():
         }
 
 @router.get("/history", response_class=HTMLResponse)
-async def history_page(request: Request):
+@db_route
+def history_page(request: Request):
     """Render the historical analysis dashboard."""
     from app.web.main import templates
 
@@ -190,7 +191,8 @@ async def history_page(request: Request):
     })
 
 @router.get("/history/data")
-async def history_data(limit: int = 5000):
+@db_route
+def history_data(limit: int = 5000):
     """Return JSON data from PostgreSQL for the history grid."""
     try:
         limit = max(1, min(limit, 50000))
@@ -285,7 +287,8 @@ async def history_data(limit: int = 5000):
 
 
 @router.get("/history/chain-gaps/{identifier}")
-async def history_chain_gaps(identifier: str):
+@db_route
+def history_chain_gaps(identifier: str):
     """Return chain diagnostics for a case/strap/folio identifier."""
     try:
         folio = _resolve_folio_for_history(identifier)
@@ -19,7 +19,7 @@ from app.web.template_filters import get_templates
 from src.utils.time import today_local
 from sqlalchemy import text as sa_text
 
-from sunbiz.db import get_engine, resolve_pg_dsn
+from app.web.db_executor import db_route, web_engine
 from src.services.audit.web_audit_service import (
     get_property_audit_snapshot,
     group_issues_by_family,
@@ -32,7 +32,7 @@ UTC_TZ = getattr(datetime, "UTC", timezone(timedelta(0)))
 
 
 def _pg_engine():
-    return get_engine(resolve_pg_dsn())
+    return web_engine()
 
 
 def _pg_case_numbers_for_property(identifier: str) -> list[str]:
@@ -1675,7 +1675,8 @@ def _pg_property_detail(identifier: str) -> dict[str, Any] | None:
 
 
 @router.get("/{folio}", response_class=HTMLResponse)
-async def property_detail(request: Request, folio: str):
+@db_route
+def property_detail(request: Request, folio: str):
     """
     Full property detail page.
     """
@@ -1738,7 +1739,8 @@ async def property_detail(request: Request, folio: str):
 
 
 @router.get("/{folio}/audit", response_class=HTMLResponse)
-async def property_audit(request: Request, folio: str):
+@db_route
+def property_audit(request: Request, folio: str):
     """HTMX partial - audit issues tab for a property."""
     try:
         prop = _pg_property_detail(folio)
@@ -1803,7 +1805,8 @@ async def property_audit(request: Request, folio: str):
 
 
 @router.get("/{folio}/liens", response_class=HTMLResponse)
-async def property_liens(request: Request, folio: str):
+@db_route
+def property_liens(request: Request, folio: str):
     """
     HTMX partial - liens table for a property.
     """
@@ -1822,7 +1825,8 @@ async def property_liens(request: Request, folio: str):
 
 
 @router.get("/{folio}/documents", response_class=HTMLResponse)
-async def property_documents(request: Request, folio: str):
+@db_route
+def property_documents(request: Request, folio: str):
     """
     HTMX partial - all on-disk files for a property, grouped by category.
     """
@@ -1835,7 +1839,8 @@ async def property_documents(request: Request, folio: str):
 
 
 @router.get("/{folio}/analysis", response_class=HTMLResponse)
-async def property_analysis(request: Request, folio: str):
+@db_route
+def property_analysis(request: Request, folio: str):
     """
     HTMX partial - equity analysis card.
     """
@@ -1856,7 +1861,8 @@ async def property_analysis(request: Request, folio: str):
 
 
 @router.get("/{folio}/sales", response_class=HTMLResponse)
-async def property_sales_history(request: Request, folio: str):
+@db_route
+def property_sales_history(request: Request, folio: str):
     """
     HTMX partial - sales history for a property (PG-only).
     """
@@ -1874,7 +1880,8 @@ async def property_sales_history(request: Request, folio: str):
 
 
 @router.get("/{folio}/market", response_class=HTMLResponse)
-async def property_market(request: Request, folio: str):
+@db_route
+def property_market(request: Request, folio: str):
     """
     HTMX partial - blended market data + HomeHarvest gallery.
     """
@@ -1894,7 +1901,8 @@ async def property_market(request: Request, folio: str):
 
 
 @router.get("/{folio}/tax", response_class=HTMLResponse)
-async def property_tax(request: Request, folio: str):
+@db_route
+def property_tax(request: Request, folio: str):
     """
     HTMX partial - tax status and tax liens.
     """
@@ -2204,7 +2212,8 @@ def _pg_personal_dossier(
 
 
 @router.get("/{folio}/personal", response_class=HTMLResponse)
-async def property_personal(request: Request, folio: str):
+@db_route
+def property_personal(request: Request, folio: str):
     """HTMX partial - personal owner dossier."""
     prop = _pg_property_detail(folio)
     if not prop:
@@ -2230,7 +2239,8 @@ async def property_personal(request: Request, folio: str):
 
 
 @router.get("/{folio}/permits", response_class=HTMLResponse)
-async def property_permits(request: Request, folio: str):
+@db_route
+def property_permits(request: Request, folio: str):
     """
     HTMX partial - permits and NOCs.
     """
@@ -2248,7 +2258,8 @@ async def property_permits(request: Request, folio: str):
 
 
 @router.get("/{folio}/chain", response_class=HTMLResponse)
-async def property_chain_of_title(request: Request, folio: str):
+@db_route
+def property_chain_of_title(request: Request, folio: str):
     """
     HTMX partial - chain of title for a property.
     """
@@ -2319,7 +2330,8 @@ async def property_chain_of_title(request: Request, folio: str):
 
 
 @router.get("/{folio}/judgment", response_class=HTMLResponse)
-async def property_judgment(request: Request, folio: str):
+@db_route
+def property_judgment(request: Request, folio: str):
     """
     HTMX partial - extracted final judgment data.
     """
@@ -2345,7 +2357,8 @@ async def property_judgment(request: Request, folio: str):
 
 
 @router.get("/{folio}/comparables", response_class=HTMLResponse)
-async def property_comparables(request: Request, folio: str, years: int = 3):
+@db_route
+def property_comparables(request: Request, folio: str, years: int = 3):
     """
     HTMX partial - comparable sales from PG.
     """
@@ -2382,7 +2395,8 @@ def _sanitize_folio(folio: str) -> str:
 
 
 @router.api_route("/{folio}/doc/{doc_id}", methods=["GET", "HEAD"])
-async def property_document_file(folio: str, doc_id: int):
+@db_route
+def property_document_file(folio: str, doc_id: int):
     """
     Serve a document file by its DB id.
     Checks data/Foreclosure/{case_number}/documents/ first, then data/properties/{folio}/.
@@ -2406,7 +2420,8 @@ async def property_document_file(folio: str, doc_id: int):
 
 
 @router.api_route("/{folio}/documents/{filename:path}", methods=["GET", "HEAD"])
-async def serve_document_by_name(folio: str, filename: str):
+@db_route
+def serve_document_by_name(folio: str, filename: str):
     """
     Serve a document file by filename for a property.
     Looks in data/Foreclosure/{case_number}/documents/ and data/properties/{folio}/.
@@ -2434,7 +2449,8 @@ async def serve_document_by_name(folio: str, filename: str):
 
 
 @router.api_route("/{folio}/photos/{filename}", methods=["GET", "HEAD"])
-async def serve_photo(folio: str, filename: str):
+@db_route
+def serve_photo(folio: str, filename: str):
     """Serve a locally downloaded property photo."""
     # Path traversal protection
     if ".." in filename or "/" in filename or filename.startswith("."):
@@ -2454,7 +2470,8 @@ async def serve_photo(folio: str, filename: str):
 
 
 @router.api_route("/{folio}/files/{filepath:path}", methods=["GET", "HEAD"])
-async def serve_property_file(folio: str, filepath: str):
+@db_route
+def serve_property_file(folio: str, filepath: str):
     """
     Serve any on-disk file for a property.
 
@@ -2474,7 +2491,8 @@ async def serve_property_file(folio: str, filepath: str):
 
 
 @router.get("/{folio}/title-report", response_class=HTMLResponse)
-async def property_title_report(request: Request, folio: str):
+@db_route
+def property_title_report(request: Request, folio: str):
     """
     Generate a printable Title Report.
     """
@@ -11,7 +11,7 @@ from loguru import logger
 from sqlalchemy import text
 
 from app.web.template_filters import get_templates
-from sunbiz.db import get_engine, resolve_pg_dsn
+from app.web.db_executor import db_route, web_engine
 from src.services.audit.web_audit_service import get_encumbrance_audit_inbox
 
 router = APIRouter()
@@ -19,11 +19,12 @@ templates = get_templates()
 
 
 def _engine():
-    return get_engine(resolve_pg_dsn())
+    return web_engine()
 
 
 @router.get("/hcpa-failures", response_class=HTMLResponse)
-async def hcpa_failures(
+@db_route
+def hcpa_failures(
     request: Request,
     page: int = 1,
     per_page: int = 25,
@@ -82,7 +83,8 @@ async def hcpa_failures(
 
 
 @router.get("/encumbrance-audit", response_class=HTMLResponse)
-async def encumbrance_audit(
+@db_route
+def encumbrance_audit(
     request: Request,
     bucket: str | None = None,
     family: str | None = None,
@@ -7,6 +7,12 @@ Usage examples:
   uv run python sunbiz/sync.py sync --mode quarterly
   uv run python sunbiz/sync.py sync --mode quarterly --dataset-profile entity-quarterly
   uv run python sunbiz/sync.py sync --mode daily --modified-since 2026-01-01
+  uv run python sunbiz/sync.py sync --mode quarterly --workers 6
+
+Downloads run on ``--workers`` parallel SFTP sessions with pipelined
+(prefetched) reads.  Each file streams into ``<name>.part`` whose mtime is
+pinned to the remote mtime; an interrupted transfer resumes from the bytes
+already on disk as long as that mtime still matches the remote file.
 """
 
 from __future__ import annotations
@@ -16,10 +22,13 @@ import datetime as dt
 import json
 import os
 import posixpath
+import queue
 import re
 import stat
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from dataclasses import dataclass
 from pathlib import Path
@@ -46,6 +55,13 @@ DEFAULT_DAILY_DIR = os.getenv("SUNBIZ_SFTP_DAILY_DIR", "/public/doc")
 DEFAULT_QUARTERLY_DIR = os.getenv("SUNBIZ_SFTP_QUARTERLY_DIR", "/public/doc/quarterly")
 DEFAULT_DATA_DIR = Path(os.getenv("SUNBIZ_DATA_DIR", "data/sunbiz"))
 DEFAULT_MANIFEST = Path(os.getenv("SUNBIZ_MANIFEST", "data/sunbiz/manifest.json"))
+DEFAULT_WORKERS = int(os.getenv("SUNBIZ_SFTP_WORKERS", "4"))
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Outstanding 32 KB read requests per file (~2 MB in flight per session).
+PREFETCH_MAX_REQUESTS = 64
+DOWNLOAD_MAX_ATTEMPTS = 5
+MANIFEST_SAVE_INTERVAL_SECONDS = 30.0
 
 
 @dataclass
@@ -55,6 +71,18 @@ class RemoteFile:
     mtime: int
 
 
+@dataclass
+class TransferStat:
+    path: str
+    bytes_fetched: int
+    resumed_from: int
+    seconds: float
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes_fetched / 1_000_000 / self.seconds if self.seconds > 0 else 0.0
+
+
 def _utc_ts_to_iso(ts: int) -> str:
     return dt.datetime.fromtimestamp(ts, tz=dt.UTC).isoformat()
 
@@ -83,6 +111,7 @@ class SunbizMirror:
         data_dir: Path,
         manifest_path: Path,
         recursive: bool = True,
+        workers: int = DEFAULT_WORKERS,
     ):
         self.host = host
         self.port = port
@@ -91,12 +120,22 @@ class SunbizMirror:
         self.data_dir = data_dir
         self.manifest_path = manifest_path
         self.recursive = recursive
+        self.workers = max(1, workers)
 
     def _connect(self) -> tuple[paramiko.Transport, paramiko.SFTPClient]:
         transport = paramiko.Transport((self.host, self.port))
         transport.connect(username=self.username, password=self.password)
         return transport, paramiko.SFTPClient.from_transport(transport)
 
+    @staticmethod
+    def _close(session: tuple[paramiko.Transport, paramiko.SFTPClient]) -> None:
+        transport, sftp = session
+        try:
+            sftp.close()
+            transport.close()
+        except Exception as close_exc:
+            _print(f"Warning: failed to close SFTP session cleanly: {close_exc}")
+
     @staticmethod
     def _norm_remote(remote_path: str) -> str:
         path = posixpath.normpath(remote_path.strip())
@@ -259,21 +298,169 @@ class SunbizMirror:
             json.dump(manifest, f, indent=2, sort_keys=True)
         tmp.replace(self.manifest_path)
 
+    @staticmethod
+    def _resume_offset(local_tmp_path: Path, item: RemoteFile) -> int:
+        """Bytes already in ``.part`` that belong to this remote version, else 0."""
+        try:
+            part = local_tmp_path.stat()
+        except FileNotFoundError:
+            return 0
+        if int(part.st_mtime) != item.mtime or part.st_size > item.size:
+            return 0
+        return part.st_size
+
     @staticmethod
     def _stream_download_file(
         sftp: paramiko.SFTPClient,
         remote_path: str,
         local_tmp_path: Path,
-        chunk_size: int = 64 * 1024,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        offset: int = 0,
+        mtime: int | None = None,
     ) -> None:
-        """Download with streamed reads to reduce server-side SFTP pressure."""
-        with sftp.open(remote_path, "rb") as remote_fp:
-            with local_tmp_path.open("wb") as local_fp:
-                while True:
-                    chunk = remote_fp.read(chunk_size)
-                    if not chunk:
-                        break
-                    local_fp.write(chunk)
+        """Download from ``offset`` with pipelined reads, appending to ``.part``.
+
+        A bounded number of read requests stay in flight so throughput is not
+        capped by round-trip latency.  ``mtime`` is stamped on the ``.part``
+        file even on failure so a later attempt can tell whether it may resume.
+        """
+        try:
+            with sftp.open(remote_path, "rb") as remote_fp:
+                remote_fp.seek(offset)
+                remote_fp.prefetch(
+                    remote_fp.stat().st_size,
+                    max_concurrent_requests=PREFETCH_MAX_REQUESTS,
+                )
+                with local_tmp_path.open("ab" if offset else "wb") as local_fp:
+                    while True:
+                        chunk = remote_fp.read(chunk_size)
+                        if not chunk:
+                            break
+                        local_fp.write(chunk)
+        finally:
+            if mtime is not None and local_tmp_path.exists():
+                os.utime(local_tmp_path, (mtime, mtime))
+
+    def _download_with_retries(
+        self,
+        session: tuple[paramiko.Transport, paramiko.SFTPClient] | None,
+        item: RemoteFile,
+        local_path: Path,
+    ) -> tuple[tuple[paramiko.Transport, paramiko.SFTPClient] | None, TransferStat]:
+        """Download one file on ``session``, reconnecting and resuming on errors."""
+        tmp_path = local_path.with_suffix(local_path.suffix + ".part")
+        started = time.monotonic()
+        first_offset: int | None = None
+        for attempt in range(1, DOWNLOAD_MAX_ATTEMPTS + 1):
+            offset = self._resume_offset(tmp_path, item)
+            if first_offset is None:
+                first_offset = offset
+            if offset:
+                _print(f"Resuming {item.path} at {offset:,}/{item.size:,} bytes")
+            try:
+                if session is None:
+                    session = self._connect()
+                self._stream_download_file(
+                    session[1], item.path, tmp_path, offset=offset, mtime=item.mtime
+                )
+                received = tmp_path.stat().st_size
+                if received < item.size:
+                    raise OSError(
+                        f"short transfer: {received:,} of {item.size:,} bytes"
+                    )
+                break
+            except (OSError, paramiko.SSHException) as exc:
+                if session is not None:
+                    self._close(session)
+                    session = None
+                if attempt == DOWNLOAD_MAX_ATTEMPTS:
+                    raise
+                delay = min(60, 3 * (2 ** (attempt - 1)))
+                _print(
+                    f"Retrying {item.path} after SFTP error "
+                    f"(attempt {attempt}/{DOWNLOAD_MAX_ATTEMPTS}): {exc}. "
+                    f"Sleeping {delay}s."
+                )
+                time.sleep(delay)
+        tmp_path.replace(local_path)
+        resumed_from = first_offset or 0
+        transfer = TransferStat(
+            path=item.path,
+            bytes_fetched=local_path.stat().st_size - resumed_from,
+            resumed_from=resumed_from,
+            seconds=time.monotonic() - started,
+        )
+        resumed_note = f", resumed at {resumed_from:,}" if resumed_from else ""
+        _print(
+            f"Downloaded {item.path}: {transfer.bytes_fetched:,} bytes in "
+            f"{transfer.seconds:.1f}s ({transfer.mb_per_s:.2f} MB/s{resumed_note})"
+        )
+        return session, transfer
+
+    def _download_pending(
+        self,
+        pending: list[tuple[RemoteFile, Path]],
+        manifest: dict[str, dict],
+    ) -> list[TransferStat]:
+        """Download ``pending`` on up to ``self.workers`` parallel SFTP sessions.
+
+        Each worker owns one session and pulls files from a shared queue.  The
+        manifest is updated as files land and saved periodically, so an
+        interrupted run keeps credit for finished files; the first worker
+        failure stops new files from starting and is re-raised.
+        """
+        work: queue.SimpleQueue[tuple[RemoteFile, Path]] = queue.SimpleQueue()
+        for entry in pending:
+            work.put(entry)
+        transfers: list[TransferStat] = []
+        lock = threading.Lock()
+        stop = threading.Event()
+        last_save = time.monotonic()
+
+        def record(item: RemoteFile, local_path: Path, transfer: TransferStat) -> None:
+            nonlocal last_save
+            with lock:
+                transfers.append(transfer)
+                manifest[item.path] = {
+                    **asdict(item),
+                    "mtime_iso": _utc_ts_to_iso(item.mtime),
+                    "local_path": str(local_path),
+                    "downloaded_at_utc": dt.datetime.now(tz=dt.UTC).isoformat(),
+                }
+                if time.monotonic() - last_save >= MANIFEST_SAVE_INTERVAL_SECONDS:
+                    self.save_manifest(manifest)
+                    last_save = time.monotonic()
+
+        def worker() -> None:
+            session: tuple[paramiko.Transport, paramiko.SFTPClient] | None = None
+            try:
+                while not stop.is_set():
+                    try:
+                        item, local_path = work.get_nowait()
+                    except queue.Empty:
+                        return
+                    session, transfer = self._download_with_retries(
+                        session, item, local_path
+                    )
+                    record(item, local_path, transfer)
+            except BaseException:
+                stop.set()
+                raise
+            finally:
+                if session is not None:
+                    self._close(session)
+
+        workers = min(self.workers, len(pending))
+        _print(f"Downloading {len(pending)} files on {workers} SFTP sessions")
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="sunbiz-sftp"
+        ) as pool:
+            futures = [pool.submit(worker) for _ in range(workers)]
+        errors = [exc for future in futures if (exc := future.exception())]
+        if errors:
+            self.save_manifest(manifest)
+            raise errors[0]
+        return transfers
 
     @staticmethod
     def _matches_patterns(
@@ -332,103 +519,89 @@ class SunbizMirror:
                 else None
             )
             files = self.list_remote_files(sftp, dirs, limit=pre_limit)
-            files.sort(key=lambda x: (x.mtime, x.path), reverse=True)
-
-            if modified_since:
-                threshold = int(modified_since.timestamp())
-                files = [f for f in files if f.mtime >= threshold]
-            files = [
-                f
-                for f in files
-                if self._matches_patterns(f.path, include=include, exclude=exclude)
-            ]
-            files = [
-                f
-                for f in files
-                if self._matches_dataset_profile(f.path, dataset_profile)
-            ]
-            if max_files is not None:
-                files = files[:max_files]
-
-            candidate_files = len(files)
-            _print(f"Candidate files: {candidate_files}")
-            downloaded = 0
-            skipped = 0
-
-            for item in files:
-                rel = item.path.lstrip("/")
-                local_path = self.data_dir / rel
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-
-                prior = manifest.get(item.path)
-                unchanged = (
-                    prior
-                    and int(prior.get("size", -1)) == item.size
-                    and int(prior.get("mtime", -1)) == item.mtime
-                    and Path(prior.get("local_path", "")).exists()
-                )
-                if unchanged and not force:
-                    skipped += 1
-                    continue
-
-                if dry_run:
-                    _print(f"[DRY RUN] download {item.path} -> {local_path}")
-                    downloaded += 1
-                    continue
-
-                tmp_path = local_path.with_suffix(local_path.suffix + ".part")
-                _print(f"Downloading {item.path} ({item.size:,} bytes)")
-                max_attempts = 5
-                for attempt in range(1, max_attempts + 1):
-                    try:
-                        if tmp_path.exists():
-                            tmp_path.unlink()
-                        self._stream_download_file(sftp, item.path, tmp_path)
-                        break
-                    except OSError as exc:
-                        if attempt == max_attempts:
-                            raise
-                        delay = min(60, 3 * (2 ** (attempt - 1)))
-                        _print(
-                            f"Retrying {item.path} after SFTP error "
-                            f"(attempt {attempt}/{max_attempts}): {exc}. "
-                            f"Sleeping {delay}s."
-                        )
-                        try:
-                            sftp.close()
-                            transport.close()
-                        except Exception as close_exc:
-                            _print(f"Warning: failed to close SFTP session cleanly: {close_exc}")
-                        time.sleep(delay)
-                        transport, sftp = self._connect()
-                tmp_path.replace(local_path)
-                downloaded += 1
-
-                manifest[item.path] = {
-                    **asdict(item),
-                    "mtime_iso": _utc_ts_to_iso(item.mtime),
-                    "local_path": str(local_path),
-                    "downloaded_at_utc": dt.datetime.now(tz=dt.UTC).isoformat(),
-                }
-
-            if not dry_run:
-                self.save_manifest(manifest)
-
-            summary = {
-                "resolved_dirs": dirs,
-                "candidate_files": candidate_files,
-                "downloaded": downloaded,
-                "skipped": skipped,
-                "manifest_path": str(self.manifest_path),
-            }
-            _print(
-                f"Sync finished: downloaded={downloaded}, skipped={skipped}, "
-                f"manifest={self.manifest_path}"
-            )
-            return summary
         finally:
+            # Downloads open their own sessions; don't hold an idle one open.
             sftp.close()
             transport.close()
+        files.sort(key=lambda x: (x.mtime, x.path), reverse=True)
+
+        if modified_since:
+            threshold = int(modified_since.timestamp())
+            files = [f for f in files if f.mtime >= threshold]
+        files = [
+            f
+            for f in files
+            if self._matches_patterns(f.path, include=include, exclude=exclude)
+        ]
+        files = [
+            f
+            for f in files
+            if self._matches_dataset_profile(f.path, dataset_profile)
+        ]
+        if max_files is not None:
+            files = files[:max_files]
+
+        candidate_files = len(files)
+        _print(f"Candidate files: {candidate_files}")
+        downloaded = 0
+        skipped = 0
+        pending: list[tuple[RemoteFile, Path]] = []
+
+        for item in files:
+            rel = item.path.lstrip("/")
+            local_path = self.data_dir / rel
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+
+            prior = manifest.get(item.path)
+            unchanged = (
+                prior
+                and int(prior.get("size", -1)) == item.size
+                and int(prior.get("mtime", -1)) == item.mtime
+                and Path(prior.get("local_path", "")).exists()
+            )
+            if unchanged and not force:
+                skipped += 1
+                continue
+
+            if dry_run:
+                _print(f"[DRY RUN] download {item.path} -> {local_path}")
+                downloaded += 1
+                continue
+
+            pending.append((item, local_path))
+
+        transfers: list[TransferStat] = []
+        started = time.monotonic()
+        if pending:
+            transfers = self._download_pending(pending, manifest)
+            downloaded += len(transfers)
+        elapsed = time.monotonic() - started
+        bytes_downloaded = sum(t.bytes_fetched for t in transfers)
+        throughput = bytes_downloaded / 1_000_000 / elapsed if transfers and elapsed > 0 else 0.0
+
+        if not dry_run:
+            self.save_manifest(manifest)
+
+        summary = {
+            "resolved_dirs": dirs,
+            "candidate_files": candidate_files,
+            "downloaded": downloaded,
+            "skipped": skipped,
+            "resumed": sum(1 for t in transfers if t.resumed_from),
+            "bytes_downloaded": bytes_downloaded,
+            "elapsed_seconds": round(elapsed, 2),
+            "throughput_mb_s": round(throughput, 2),
+            "transfers": [
+                {**asdict(t), "mb_per_s": round(t.mb_per_s, 2)} for t in transfers
+            ],
+            "manifest_path": str(self.manifest_path),
+        }
+        _print(
+            f"Sync finished: downloaded={downloaded}, skipped={skipped}, "
+            f"bytes={bytes_downloaded:,} in {elapsed:.1f}s ({throughput:.2f} MB/s), "
+            f"manifest={self.manifest_path}"
+        )
+        return summary
 
     def list(
         self,
@@ -553,6 +726,12 @@ def build_parser() -> argparse.ArgumentParser:
     add_common_args(sync_cmd)
     sync_cmd.add_argument("--dry-run", action="store_true")
     sync_cmd.add_argument("--force", action="store_true")
+    sync_cmd.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Parallel SFTP sessions for downloads (default SUNBIZ_SFTP_WORKERS or 4).",
+    )
 
     return parser
 
@@ -569,6 +748,7 @@ def main() -> int:
         data_dir=args.data_dir,
         manifest_path=args.manifest,
         recursive=not args.no_recursive,
+        workers=getattr(args, "workers", DEFAULT_WORKERS),
     )
 
     if args.command == "list":
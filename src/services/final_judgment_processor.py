@@ -20,33 +20,30 @@ analysis.
 
 from __future__ import annotations
 
-import importlib
 import json
 import os
 import re
-from contextlib import suppress
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, TypeVar
 
 import fitz  # PyMuPDF
-import pytesseract
 from loguru import logger
-from PIL import Image, ImageFilter, ImageOps
 from pydantic import ValidationError
 
 from src.models.judgment_extraction import JudgmentExtraction
+from src.services.ocr_engine import ocr_pages, preprocess_image_for_ocr
+from src.services.pdf_render import PdfPages
 from src.services.vision_service import VisionService, robust_json_parse
 
-cv2: Any | None
-np: Any | None
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
-try:  # pragma: no cover - optional dependency
-    cv2 = importlib.import_module("cv2")
-    np = importlib.import_module("numpy")
-except ImportError:
-    cv2 = None
-    np = None
+    from PIL import Image
+
+    from src.services.pdf_render import RenderedPage
+
+_PageT = TypeVar("_PageT")
 
 
 class FinalJudgmentProcessor:
@@ -106,8 +103,6 @@ class FinalJudgmentProcessor:
 
     def __init__(self) -> None:
         self.vision_service = VisionService()
-        self.temp_dir = Path("data/temp/doc_images")
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
         self._response_format = {
             "type": "json_schema",
             "json_schema": {
@@ -184,8 +179,7 @@ class FinalJudgmentProcessor:
             except Exception as e:
                 logger.warning(f"Bad cache file {cache_path}, re-extracting: {e}")
 
-        page_images: list[str] = []
-        rescue_page_images: list[str] = []
+        page_images: Sequence[RenderedPage] = []
         ocr_page_texts: list[str] = []
         try:
             logger.info(f"Processing Final Judgment PDF for case {case_number}...")
@@ -307,6 +301,7 @@ class FinalJudgmentProcessor:
                         case_number,
                         dpi=self._OCR_RESCUE_RENDER_DPI,
                         suffix="ocr_rescue",
+                        grayscale=True,
                     )
                 except Exception as exc:
                     logger.warning(
@@ -444,14 +439,6 @@ class FinalJudgmentProcessor:
         except Exception as e:
             logger.error(f"Error processing PDF for case {case_number}: {e}")
             return None
-        finally:
-            # Clean up temp images
-            for img_path in page_images:
-                with suppress(Exception):
-                    Path(img_path).unlink()
-            for img_path in rescue_page_images:
-                with suppress(Exception):
-                    Path(img_path).unlink()
     
     def _build_extraction_prompt(
         self,
@@ -603,7 +590,7 @@ OCR Text:
 
     def _extract_candidate_from_images(
         self,
-        image_paths: list[str],
+        image_paths: Sequence[str | RenderedPage],
         *,
         current_candidate: dict[str, Any] | None = None,
         validation_failures: list[str] | None = None,
@@ -933,7 +920,7 @@ OCR Text:
 
     def _extract_in_batches(
         self,
-        image_paths: list[str],
+        image_paths: Sequence[str | RenderedPage],
         batch_size: int = 3,
     ) -> Optional[dict[str, Any]]:
         """Extract final judgment data in smaller batches to reduce timeouts."""
@@ -949,7 +936,7 @@ OCR Text:
 
     def _repair_candidate(
         self,
-        image_paths: list[str],
+        image_paths: Sequence[str | RenderedPage],
         current_candidate: dict[str, Any],
         validation_failures: list[str],
     ) -> Optional[dict[str, Any]]:
@@ -959,7 +946,7 @@ OCR Text:
             validation_failures=validation_failures,
         )
 
-    def _select_priority_pages(self, page_images: list[str]) -> list[str]:
+    def _select_priority_pages(self, page_images: Sequence[_PageT]) -> list[_PageT]:
         """
         Select priority pages: first 3 pages + last 5 pages (often contains Exhibit A).
         Deduplicates if the document is short.
@@ -969,7 +956,7 @@ OCR Text:
         total = len(page_images)
         head_count = min(3, total)
         tail_count = min(5, max(0, total - head_count))
-        selected = page_images[:head_count]
+        selected = list(page_images[:head_count])
         if tail_count:
             selected += page_images[-tail_count:]
         # Deduplicate while preserving order
@@ -1045,92 +1032,67 @@ OCR Text:
         *,
         dpi: int,
         suffix: str = "",
-    ) -> tuple[list[str], int]:
-        """Render every judgment page to a temporary PNG at the requested DPI."""
-        doc = fitz.open(pdf_path)
-        try:
-            total_pages = len(doc)
-            image_paths: list[str] = []
-            for page_num in range(total_pages):
-                page = doc[page_num]
-                stem = f"{case_number}_page_{page_num + 1}"
-                if suffix:
-                    stem = f"{stem}_{suffix}"
-                temp_image_path = self.temp_dir / f"{stem}.png"
-                pix = page.get_pixmap(dpi=dpi)
-                pix.save(str(temp_image_path))
-                image_paths.append(str(temp_image_path))
-            return image_paths, total_pages
-        finally:
-            doc.close()
+        grayscale: bool = False,
+    ) -> tuple[PdfPages, int]:
+        """Open the judgment for lazy page rendering at the requested DPI.
 
-    @staticmethod
-    def _preprocess_image_for_ocr(image: Image.Image) -> Image.Image:
-        """Normalize a scanned page before OCR.
-
-        Rescue OCR should spend a little compute to improve line clarity. If
-        OpenCV is installed we use adaptive thresholding; otherwise we fall back
-        to a lighter-weight Pillow pipeline that is already available in the
-        repo.
+        Pages are rendered as raw pixel buffers (see ``pdf_render``) only when
+        OCR or ``VisionService`` reaches them, so a long judgment never holds
+        every page in memory; nothing is written to disk.
         """
-        normalized = ImageOps.exif_transpose(image).convert("L")
-
-        if cv2 is not None and np is not None:  # pragma: no branch - optional path
-            cv_image = np.array(normalized)
-            cv_image = cv2.GaussianBlur(cv_image, (3, 3), 0)
-            cv_image = cv2.adaptiveThreshold(
-                cv_image,
-                255,
-                cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                cv2.THRESH_BINARY,
-                35,
-                11,
-            )
-            return Image.fromarray(cv_image)
+        pages = PdfPages(pdf_path, dpi=dpi, grayscale=grayscale)
+        logger.debug(
+            "Opened {} page(s) for case {} at {} dpi{}",
+            len(pages),
+            case_number,
+            dpi,
+            f" ({suffix})" if suffix else "",
+        )
+        return pages, len(pages)
 
-        normalized = ImageOps.autocontrast(normalized)
-        normalized = normalized.filter(ImageFilter.MedianFilter(size=3))
-        return normalized.point(lambda value: 0 if value < 180 else 255, mode="L")
+    @staticmethod
+    def _preprocess_image_for_ocr(image: Image.Image) -> Image.Image:
+        """Normalize a scanned page before OCR (see ``ocr_engine``)."""
+        return preprocess_image_for_ocr(image)
 
     def _ocr_images_to_page_texts(
         self,
-        image_paths: list[str],
+        image_paths: Sequence[str | RenderedPage],
         *,
         preprocess: bool = False,
         user_defined_dpi: int | None = None,
     ) -> list[str]:
-        page_texts: list[str] = []
+        """OCR pages on the shared process pool, keeping page order.
+
+        Failed and empty pages are logged and dropped; callers compare the
+        ``--- PAGE N ---`` markers against the page count.
+        """
         config = self._TESSERACT_CONFIG
         if user_defined_dpi is not None:
             config = f"{config} -c user_defined_dpi={user_defined_dpi}"
-        for idx, image_path in enumerate(image_paths, start=1):
-            try:
-                with Image.open(image_path) as image:
-                    prepared = (
-                        self._preprocess_image_for_ocr(image)
-                        if preprocess
-                        else image
-                    )
-                    text = pytesseract.image_to_string(
-                        prepared,
-                        config=config,
-                    ).strip()
-            except Exception as exc:
+        page_texts: list[str] = []
+        for result in ocr_pages(
+            image_paths,
+            config=config,
+            preprocess=preprocess,
+            label="judgment",
+        ):
+            if result.error:
                 logger.warning(
                     "Tesseract OCR failed for judgment page {} ({}): {}",
-                    idx,
-                    image_path,
-                    exc,
+                    result.page,
+                    result.label,
+                    result.error,
                 )
                 continue
-            if not text:
+            if not result.text:
                 logger.warning(
                     "Tesseract OCR returned no text for judgment page {} ({})",
-                    idx,
-                    image_path,
+                    result.page,
+                    result.label,
                 )
                 continue
-            page_texts.append(f"--- PAGE {idx} ---\n{text}")
+            page_texts.append(f"--- PAGE {result.page} ---\n{result.text}")
         return page_texts
 
     @staticmethod
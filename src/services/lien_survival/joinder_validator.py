@@ -6,34 +6,42 @@ A junior lien survives if the holder was NOT joined.
 """
 
 from typing import List, Optional, Tuple, Any
-from src.utils.name_matcher import NameMatcher
+from src.utils.name_matcher import NameIndex
 
-def is_joined(creditor: str, defendants: List[Any]) -> Tuple[bool, Optional[str], float]:
+
+def _defendant_name(defendant: Any) -> str:
+    # Handle both string names and structured defendant objects
+    name = defendant.get('name') if isinstance(defendant, dict) else defendant
+    return name or ""
+
+
+def build_defendant_index(defendants: List[Any]) -> NameIndex:
+    """Normalize defendant names once for repeated ``is_joined`` checks."""
+    return NameIndex(_defendant_name(defendant) for defendant in defendants or [])
+
+
+def is_joined(
+    creditor: str,
+    defendants: List[Any],
+    index: Optional[NameIndex] = None,
+) -> Tuple[bool, Optional[str], float]:
     """
     Check if a creditor is joined as a defendant.
     Returns (is_joined, matched_name, confidence_score).
+
+    ``index`` may be a prebuilt ``build_defendant_index(defendants)``.
     """
     if not creditor or not defendants:
         return False, None, 0.0
-        
-    best_match = None
-    max_score = 0.0
-    
-    for defendant in defendants:
-        # Handle both string names and structured defendant objects
-        def_name = defendant.get('name') if isinstance(defendant, dict) else defendant
-        if not def_name:
-            continue
-            
-        _, score = NameMatcher.match(creditor, def_name)
-        
-        # EXACT or highly confident fuzzy match
-        if score > max_score:
-            max_score = score
-            best_match = defendant
-            
-    if max_score >= 0.85:
-        return True, best_match, max_score
+
+    if index is None:
+        index = build_defendant_index(defendants)
+    # First defendant with the highest score wins ties.
+    position, _, max_score = index.best(creditor)
+
+    # EXACT or highly confident fuzzy match
+    if position is not None and max_score >= 0.85:
+        return True, defendants[position], max_score
         
     return False, None, max_score
 
@@ -45,8 +53,9 @@ def validate_all_junior_liens(
     Helper to bulk-validate joinder for a list of junior liens.
     Updates the 'is_joined' key in each lien dict.
     """
+    index = build_defendant_index(defendants)
     for lien in junior_liens:
-        joined, match, score = is_joined(lien.get('creditor', ''), defendants)
+        joined, match, score = is_joined(lien.get('creditor', ''), defendants, index)
         lien['is_joined'] = joined
         lien['joined_as'] = match
         lien['joinder_confidence'] = score
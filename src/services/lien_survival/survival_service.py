@@ -173,6 +173,7 @@ class SurvivalService:
         lp_data = judgment_data.get('lis_pendens') or {}
         lp_date = lp_data.get('recording_date') if isinstance(lp_data, dict) else judgment_data.get('lis_pendens_date')
         defendants = judgment_data.get('defendants') or []
+        defendant_index = joinder_validator.build_defendant_index(defendants)
         fc_refs = judgment_data.get('foreclosing_refs')
         current_case_number = _normalize_case_number(judgment_data.get("case_number"))
         mortgage_count = sum(
@@ -552,7 +553,9 @@ class SurvivalService:
                     results['survived'].append(enc)
                 elif seniority.startswith("JUNIOR"):
                     # Check Joinder for Juniors (handles "JUNIOR" and "JUNIOR (Same Day Tie)")
-                    joined, match_name, _ = joinder_validator.is_joined(enc.get('creditor', ''), defendants)
+                    joined, match_name, _ = joinder_validator.is_joined(
+                        enc.get('creditor', ''), defendants, defendant_index
+                    )
                     if not joined:
                         enc['survival_status'] = 'SURVIVED'
                         enc['survival_reason'] = "Junior lienor NOT joined as defendant (survives)"
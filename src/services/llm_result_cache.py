@@ -0,0 +1,265 @@
+"""Content-addressed cache for VisionService chat-completion results.
+
+``VisionService.analyze_image``, ``analyze_images`` and ``analyze_text`` send
+deterministic payloads (temperature 0.1, fixed prompts, re-encoded page
+images).  The same page image or OCR text is sent again after a crash, on
+``--force-all`` re-runs, and for duplicate PDFs across rescheduled auctions.
+This cache returns the earlier answer instead of spending another GPU call.
+
+Key
+---
+``sha256`` of the canonical JSON request payload with ``model`` filled in.
+The payload already contains the base64 image bytes (or the OCR text), the
+prompt, ``max_tokens``, ``temperature`` and ``response_format``, so any change
+to those produces a new key.  The model is only known once the dispatcher
+picks an endpoint, so lookups probe the key for every model currently
+available and writes are stored under the model that actually answered.
+
+Storage
+-------
+PostgreSQL table ``llm_result_cache`` (migration 016): one row per key with
+the extracted response text.  Bounded by ``_BUDGET_BYTES`` (override with
+``VISION_RESULT_CACHE_MAX_MB``); every ``_EVICTION_CHECK_EVERY`` writes the
+least-recently-used rows are deleted down to ``_EVICTION_TARGET_RATIO`` of the
+budget.  Like ``pav_cache``, the table is best-effort: any DB error disables
+the cache for the rest of the process.
+
+Bypass
+------
+``VISION_RESULT_CACHE=0`` disables the cache process-wide;
+``use_cache=False`` on the ``analyze_*`` methods skips it for one call.
+
+Hit/miss counters are exposed through ``llm_cache_stats()``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import text
+
+from sunbiz.db import get_engine, resolve_pg_dsn
+
+# Bump when the stored value or key recipe changes so old rows stop matching.
+_KEY_VERSION = "v1"
+_DEFAULT_BUDGET_MB = 512
+_EVICTION_TARGET_RATIO = 0.9
+_EVICTION_CHECK_EVERY = 200
+
+_COUNTER_NAMES = ("hits", "misses", "writes", "evictions", "errors", "bypassed")
+
+_LOCK = threading.Lock()
+_COUNTERS: dict[str, int] = dict.fromkeys(_COUNTER_NAMES, 0)
+_STATE: dict[str, Any] = {"dsn": None, "disabled": False, "writes_since_evict": 0}
+
+
+def _env_enabled() -> bool:
+    return os.getenv("VISION_RESULT_CACHE", "1").strip().lower() not in ("0", "false", "no")
+
+
+def _budget_bytes() -> int:
+    raw = os.getenv("VISION_RESULT_CACHE_MAX_MB", "").strip()
+    try:
+        mb = int(raw) if raw else _DEFAULT_BUDGET_MB
+    except ValueError:
+        mb = _DEFAULT_BUDGET_MB
+    return max(1, mb) * 1024 * 1024
+
+
+def llm_cache_key(payload: dict[str, Any], model: str) -> str:
+    """Hash of the request payload as it would be sent to ``model``."""
+    keyed = {**payload, "model": model, "_cache": _KEY_VERSION}
+    canonical = json.dumps(keyed, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def configure_llm_cache(dsn: str | None = None) -> None:
+    """Point the cache at ``dsn`` (defaults to ``resolve_pg_dsn()``)."""
+    resolved = resolve_pg_dsn(dsn)
+    with _LOCK:
+        if _STATE["dsn"] != resolved:
+            _STATE["dsn"] = resolved
+            _STATE["disabled"] = False
+
+
+def _engine() -> Any | None:
+    if not _env_enabled():
+        return None
+    with _LOCK:
+        if _STATE["disabled"]:
+            return None
+        dsn = _STATE["dsn"] or resolve_pg_dsn(None)
+        _STATE["dsn"] = dsn
+    return get_engine(dsn)
+
+
+def _disable(exc: Exception) -> None:
+    with _LOCK:
+        already = _STATE["disabled"]
+        _STATE["disabled"] = True
+        _COUNTERS["errors"] += 1
+    if not already:
+        logger.warning("LLM result cache disabled for this process: {}", exc)
+
+
+def _bump(name: str) -> None:
+    with _LOCK:
+        _COUNTERS[name] += 1
+
+
+def note_bypass() -> None:
+    """Count a call that skipped the cache via ``use_cache=False``."""
+    _bump("bypassed")
+
+
+def llm_cache_get(payload: dict[str, Any], models: list[str]) -> str | None:
+    """Return the cached response text for ``payload`` under any of ``models``."""
+    engine = _engine()
+    if engine is None or not models:
+        return None
+    keys = [llm_cache_key(payload, model) for model in dict.fromkeys(models)]
+    try:
+        with engine.begin() as conn:
+            row = conn.execute(
+                text(
+                    """
+                    UPDATE llm_result_cache
+                    SET last_accessed_at = now(),
+                        hit_count = hit_count + 1
+                    WHERE cache_key = (
+                        SELECT cache_key
+                        FROM llm_result_cache
+                        WHERE cache_key = ANY(:keys)
+                        ORDER BY last_accessed_at DESC
+                        LIMIT 1
+                    )
+                    RETURNING response_text, model
+                    """
+                ),
+                {"keys": keys},
+            ).first()
+    except Exception as exc:
+        _disable(exc)
+        return None
+    if row is None:
+        _bump("misses")
+        return None
+    _bump("hits")
+    logger.debug("LLM result cache hit (model={})", row[1])
+    return str(row[0])
+
+
+def llm_cache_put(payload: dict[str, Any], model: str, response_text: str) -> None:
+    """Store ``response_text`` produced by ``model`` for ``payload``."""
+    engine = _engine()
+    if engine is None or not model or not response_text:
+        return
+    key = llm_cache_key(payload, model)
+    try:
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO llm_result_cache (
+                        cache_key, model, response_text, body_bytes,
+                        created_at, last_accessed_at
+                    )
+                    VALUES (:key, :model, :body, :body_bytes, now(), now())
+                    ON CONFLICT (cache_key) DO UPDATE SET
+                        response_text = EXCLUDED.response_text,
+                        body_bytes = EXCLUDED.body_bytes,
+                        last_accessed_at = EXCLUDED.last_accessed_at
+                    """
+                ),
+                {
+                    "key": key,
+                    "model": model,
+                    "body": response_text,
+                    "body_bytes": len(response_text.encode("utf-8")),
+                },
+            )
+    except Exception as exc:
+        _disable(exc)
+        return
+    with _LOCK:
+        _COUNTERS["writes"] += 1
+        _STATE["writes_since_evict"] += 1
+        due = _STATE["writes_since_evict"] >= _EVICTION_CHECK_EVERY
+        if due:
+            _STATE["writes_since_evict"] = 0
+    if due:
+        evict_llm_cache()
+
+
+def evict_llm_cache(budget_bytes: int | None = None) -> int:
+    """LRU-evict rows until the table is within its byte budget."""
+    engine = _engine()
+    if engine is None:
+        return 0
+    budget = int(budget_bytes if budget_bytes is not None else _budget_bytes())
+    target = int(budget * _EVICTION_TARGET_RATIO)
+    try:
+        with engine.begin() as conn:
+            total = int(
+                conn.execute(
+                    text("SELECT COALESCE(SUM(body_bytes), 0) FROM llm_result_cache")
+                ).scalar()
+                or 0
+            )
+            if total <= budget:
+                return 0
+            evicted = conn.execute(
+                text(
+                    """
+                    WITH ranked AS (
+                        SELECT cache_key,
+                               SUM(body_bytes) OVER (
+                                   ORDER BY last_accessed_at DESC, cache_key
+                               ) AS running_bytes
+                        FROM llm_result_cache
+                    )
+                    DELETE FROM llm_result_cache c
+                    USING ranked r
+                    WHERE c.cache_key = r.cache_key
+                      AND r.running_bytes > :target
+                    """
+                ),
+                {"target": target},
+            ).rowcount or 0
+    except Exception as exc:
+        _disable(exc)
+        return 0
+    with _LOCK:
+        _COUNTERS["evictions"] += int(evicted)
+    logger.info(
+        "LLM result cache eviction: lru_evicted={} size_before_mb={:.1f} budget_mb={:.1f}",
+        evicted,
+        total / (1024 * 1024),
+        budget / (1024 * 1024),
+    )
+    return int(evicted)
+
+
+def reset_llm_cache_counters() -> None:
+    with _LOCK:
+        for name in _COUNTER_NAMES:
+            _COUNTERS[name] = 0
+
+
+def llm_cache_stats() -> dict[str, Any]:
+    """Return hit/miss counters and the hit rate for this process."""
+    with _LOCK:
+        counters = dict(_COUNTERS)
+        disabled = bool(_STATE["disabled"])
+    lookups = counters["hits"] + counters["misses"]
+    return {
+        **counters,
+        "hit_rate": round(counters["hits"] / lookups, 4) if lookups else None,
+        "enabled": _env_enabled() and not disabled,
+        "budget_mb": round(_budget_bytes() / (1024 * 1024), 2),
+    }
@@ -11,9 +11,11 @@ Can run independently: `uv run python -m src.services.market_data_service`
 import asyncio
 import contextlib
 import datetime as dt
+import hashlib
 import json
 import random
 import re
+import time
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +29,7 @@ from src.scrapers.redfin_scraper import (
     RedfinScraper,
     normalize_address_for_match,
 )
+from src.services.photo_downloader import MAX_PHOTOS, PhotoDownloader, photo_index
 from src.utils.upsert import MARKET_SOURCE_COLUMN, MARKET_TRACKED_COLUMNS, OverwriteTracker
 from sunbiz.db import get_engine, resolve_pg_dsn
 from sunbiz.models import Base, PropertyMarket
@@ -276,7 +279,7 @@ class MarketDataService:
         if not total_need:
             # Even when no scraping is needed, download photos for properties
             # that have CDN URLs but missing local paths.
-            photo_stats = self._download_all_photos_with_stats(properties)
+            photo_stats = await self._download_all_photos_async(properties)
             summary["photos"] = photo_stats["downloaded"]
             photo_errors = int(photo_stats.get("errors", 0) or 0)
             state_failures = int(getattr(self, "_market_state_failures", 0) or 0)
@@ -420,7 +423,7 @@ class MarketDataService:
             logger.info(f"HomeHarvest done: {hh_count} properties matched")
 
         # --- Photo download (all input properties, not just need_market) ---
-        photo_stats = self._download_all_photos_with_stats(properties)
+        photo_stats = await self._download_all_photos_async(properties)
         summary["photos"] = photo_stats["downloaded"]
         photo_errors = int(photo_stats.get("errors", 0) or 0)
 
@@ -910,32 +913,16 @@ class MarketDataService:
         return self._download_all_photos_with_stats(properties)["downloaded"]
 
     def _download_all_photos_with_stats(self, properties: list[dict]) -> dict[str, int]:
-        """Download photos for all properties that have CDN URLs in PG."""
-        import hashlib
-        import time as _time
-
-        import requests
-
-        MAX_PHOTOS = 15
-        DOWNLOAD_TIMEOUT = 15
-        IMAGE_CONTENT_TYPES = frozenset({
-            "image/jpeg",
-            "image/png",
-            "image/webp",
-            "image/gif",
-        })
-        EXT_MAP = {
-            "image/jpeg": ".jpg",
-            "image/png": ".png",
-            "image/webp": ".webp",
-            "image/gif": ".gif",
-        }
+        """Synchronous entry point for scripts; ``run_batch`` awaits the async one."""
+        return asyncio.run(self._download_all_photos_async(properties))
 
-        session = requests.Session()
-        session.headers["User-Agent"] = (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
-        )
+    async def _download_all_photos_async(self, properties: list[dict]) -> dict[str, int]:
+        """Download photos for all properties that have CDN URLs in PG.
 
+        Photos download concurrently through ``PhotoDownloader`` (per-CDN-host
+        concurrency and token-bucket pacing); existing files are found with one
+        directory listing per property.
+        """
         straps = [p["strap"] for p in properties if p.get("strap")]
         if not straps:
             return {"downloaded": 0, "errors": 0}
@@ -957,62 +944,20 @@ class MarketDataService:
             logger.error(f"Failed to fetch photo CDN URLs from PG: {e}")
             return {"downloaded": 0, "errors": 1}
 
+        started = time.monotonic()
+        async with PhotoDownloader() as downloader:
+            results = await asyncio.gather(
+                *(
+                    self._download_property_photos(downloader, row[0], row[1], row[2])
+                    for row in rows
+                )
+            )
+
         total_downloaded = 0
         total_errors = 0
-        for row in rows:
-            strap, case_number, cdn_urls = row[0], row[1], row[2]
-            if not case_number or not cdn_urls:
-                continue
-
-            urls = cdn_urls if isinstance(cdn_urls, list) else []
-            if not urls:
-                continue
-
-            photos_dir = PROJECT_ROOT / "data" / "Foreclosure" / case_number / "photos"
-            photos_dir.mkdir(parents=True, exist_ok=True)
-
-            local_paths: list[str] = []
-            for idx, url in enumerate(urls[:MAX_PHOTOS]):
-                try:
-                    url_hash = hashlib.sha1(url.encode()).hexdigest()[:12]
-                    existing = list(photos_dir.glob(f"{idx:03d}_{url_hash}.*"))
-                    if existing:
-                        rel = str(existing[0].relative_to(PROJECT_ROOT / "data"))
-                        local_paths.append(rel)
-                        continue
-
-                    resp = session.get(url, timeout=DOWNLOAD_TIMEOUT, stream=True)
-                    if resp.status_code != 200:
-                        continue
-
-                    content_type = resp.headers.get("Content-Type", "").split(";")[0].strip().lower()
-                    if content_type not in IMAGE_CONTENT_TYPES:
-                        continue
-
-                    ext = EXT_MAP.get(content_type, ".jpg")
-                    filename = f"{idx:03d}_{url_hash}{ext}"
-                    filepath = photos_dir / filename
-                    filepath.write_bytes(resp.content)
-
-                    rel = str(filepath.relative_to(PROJECT_ROOT / "data"))
-                    local_paths.append(rel)
-                    total_downloaded += 1
-
-                    if idx < len(urls[:MAX_PHOTOS]) - 1:
-                        _time.sleep(0.5)
-
-                except Exception as dl_err:
-                    total_errors += 1
-                    logger.warning(
-                        "Photo download failed for strap={} case={} idx={} url={}: {}",
-                        strap,
-                        case_number,
-                        idx,
-                        url,
-                        dl_err,
-                    )
-                    continue
-
+        for strap, local_paths, downloaded, errors in results:
+            total_downloaded += downloaded
+            total_errors += errors
             # Update PG with local paths
             if local_paths:
                 try:
@@ -1028,8 +973,65 @@ class MarketDataService:
                     total_errors += 1
                     logger.error(f"Failed to update photo paths for {strap}: {e}")
 
+        if total_downloaded:
+            logger.info(
+                "Photos: downloaded {} for {} properties in {:.1f}s ({} errors)",
+                total_downloaded,
+                len(rows),
+                time.monotonic() - started,
+                total_errors,
+            )
         return {"downloaded": total_downloaded, "errors": total_errors}
 
+    async def _download_property_photos(
+        self,
+        downloader: PhotoDownloader,
+        strap: str,
+        case_number: str | None,
+        cdn_urls: Any,
+    ) -> tuple[str, list[str], int, int]:
+        """Fetch one property's missing photos; return (strap, paths, downloaded, errors)."""
+        urls = cdn_urls if isinstance(cdn_urls, list) else []
+        if not case_number or not urls:
+            return strap, [], 0, 0
+
+        data_root = PROJECT_ROOT / "data"
+        photos_dir = data_root / "Foreclosure" / case_number / "photos"
+        photos_dir.mkdir(parents=True, exist_ok=True)
+        existing = photo_index(photos_dir)
+
+        slots: list[Path | None] = []
+        pending: list[tuple[int, str, asyncio.Task[Path | None]]] = []
+        for idx, url in enumerate(urls[:MAX_PHOTOS]):
+            stem = f"{idx:03d}_{hashlib.sha1(url.encode()).hexdigest()[:12]}"
+            slots.append(existing.get(stem))
+            if stem not in existing:
+                task = asyncio.ensure_future(downloader.fetch(url, photos_dir, stem))
+                pending.append((idx, url, task))
+
+        downloaded = 0
+        errors = 0
+        for idx, url, task in pending:
+            try:
+                path = await task
+            except Exception as dl_err:
+                errors += 1
+                logger.warning(
+                    "Photo download failed for strap={} case={} idx={} url={}: {}",
+                    strap,
+                    case_number,
+                    idx,
+                    url,
+                    dl_err,
+                )
+                continue
+            if path is not None:
+                slots[idx] = path
+                downloaded += 1
+
+        local_paths = [str(path.relative_to(data_root)) for path in slots if path]
+        return strap, local_paths, downloaded, errors
+
     # ------------------------------------------------------------------
     # Browser lifecycle
     # ------------------------------------------------------------------
@@ -0,0 +1,259 @@
+"""Shared Tesseract OCR engine with process-pool page fan-out.
+
+``FinalJudgmentProcessor`` and ``PgEncumbranceExtractionService`` both OCR
+every rendered page of a document before a single text-first LLM call.  Doing
+that one page at a time pinned a single core for the whole document (a
+30-page judgment is ~30 sequential Tesseract runs, plus the optional OpenCV
+rescue preprocessing).
+
+``ocr_pages()`` sends pages to a process pool shared by the whole process and
+returns one ``OcrPageResult`` per input page, **in input order**, with the
+page number, text, wall time, any error and a label for log messages.  Callers keep their own framing
+(``--- PAGE N ---``) and their own policy for empty/failed pages.
+
+Pool sizing:
+
+- ``OCR_WORKERS`` env var, else ``os.cpu_count()``.
+- Workers run with ``OMP_THREAD_LIMIT=1`` so N Tesseract processes do not
+  each spawn N OpenMP threads.
+- The pool uses the ``spawn`` start method: callers run on worker threads
+  (judgment/encumbrance extraction are concurrent), and forking a
+  multi-threaded process is unsafe.
+
+Pages may be image paths or in-memory ``pdf_render.RenderedPage`` buffers;
+buffers are pickled to the workers as raw pixels, so no temp PNG is written
+or decoded.  At most ``OCR_PAGES_IN_FLIGHT_PER_WORKER`` pages per worker are
+submitted ahead of the results being collected, so a lazy
+``pdf_render.PdfPages`` is rendered as the pool drains rather than all at
+once.
+
+Documents with a single page, or ``OCR_WORKERS=1``, run inline with no pool.
+If the pool breaks (e.g. a worker was OOM-killed) the remaining pages are
+OCR'd inline and the pool is rebuilt on the next call.  The pool is shared by
+every thread, so it is only ever shut down without cancelling futures; a
+caller whose pool was swapped out from under it also finishes inline.
+"""
+
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import pytesseract
+from loguru import logger
+from PIL import Image, ImageFilter, ImageOps
+
+from src.services.pdf_render import RenderedPage
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from concurrent.futures import Future
+
+    PageSource = str | RenderedPage
+
+cv2: Any | None
+np: Any | None
+
+try:  # pragma: no cover - optional dependency
+    cv2 = importlib.import_module("cv2")
+    np = importlib.import_module("numpy")
+except ImportError:
+    cv2 = None
+    np = None
+
+
+@dataclass(frozen=True, slots=True)
+class OcrPageResult:
+    """OCR outcome for one page (``page`` is 1-based)."""
+
+    page: int
+    text: str
+    seconds: float
+    error: str | None = None
+    label: str = ""
+
+
+def preprocess_image_for_ocr(image: Image.Image) -> Image.Image:
+    """Normalize a scanned page before OCR.
+
+    Rescue OCR should spend a little compute to improve line clarity. If
+    OpenCV is installed we use adaptive thresholding; otherwise we fall back
+    to a lighter-weight Pillow pipeline that is already available in the
+    repo.
+    """
+    normalized = ImageOps.exif_transpose(image).convert("L")
+
+    if cv2 is not None and np is not None:  # pragma: no branch - optional path
+        cv_image = np.array(normalized)
+        cv_image = cv2.GaussianBlur(cv_image, (3, 3), 0)
+        cv_image = cv2.adaptiveThreshold(
+            cv_image,
+            255,
+            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+            cv2.THRESH_BINARY,
+            35,
+            11,
+        )
+        return Image.fromarray(cv_image)
+
+    normalized = ImageOps.autocontrast(normalized)
+    normalized = normalized.filter(ImageFilter.MedianFilter(size=3))
+    return normalized.point(lambda value: 0 if value < 180 else 255, mode="L")
+
+
+def _open_page(source: PageSource) -> Image.Image:
+    if isinstance(source, RenderedPage):
+        return source.to_image()
+    return Image.open(source)
+
+
+def _ocr_one(page: int, source: PageSource, config: str, preprocess: bool) -> OcrPageResult:
+    """OCR a single page image; runs inside a pool worker or inline."""
+    started = time.perf_counter()
+    try:
+        with _open_page(source) as image:
+            prepared = preprocess_image_for_ocr(image) if preprocess else image
+            if config:
+                text = pytesseract.image_to_string(prepared, config=config)
+            else:
+                text = pytesseract.image_to_string(prepared)
+    except Exception as exc:
+        return OcrPageResult(
+            page,
+            "",
+            time.perf_counter() - started,
+            f"{type(exc).__name__}: {exc}",
+            str(source),
+        )
+    return OcrPageResult(page, text.strip(), time.perf_counter() - started, label=str(source))
+
+
+def _worker_init() -> None:
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def ocr_worker_count() -> int:
+    raw = os.getenv("OCR_WORKERS", "").strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            logger.warning("Ignoring invalid OCR_WORKERS={!r}", raw)
+    return max(1, os.cpu_count() or 1)
+
+
+OCR_PAGES_IN_FLIGHT_PER_WORKER = 2
+
+_POOL_LOCK = threading.Lock()
+_POOL: dict[str, Any] = {"executor": None, "workers": 0}
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    with _POOL_LOCK:
+        executor = _POOL["executor"]
+        if executor is None or _POOL["workers"] != workers:
+            if executor is not None:
+                # Other threads may still be waiting on this pool's futures:
+                # let them finish, never cancel them.
+                executor.shutdown(wait=False)
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_worker_init,
+            )
+            _POOL["executor"] = executor
+            _POOL["workers"] = workers
+            logger.info("OCR engine: started process pool with {} workers", workers)
+        return executor
+
+
+def _discard_pool(broken: ProcessPoolExecutor | None = None) -> None:
+    """Drop the shared pool; with ``broken``, only if it is still the current one.
+
+    The pool is shared by every thread, so pending futures are never
+    cancelled: callers still waiting on them finish or fall back inline.
+    """
+    with _POOL_LOCK:
+        executor = _POOL["executor"]
+        if broken is not None and executor is not broken:
+            return
+        _POOL["executor"] = None
+        _POOL["workers"] = 0
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def shutdown_ocr_pool() -> None:
+    """Stop the shared pool (tests / long-lived workers between phases)."""
+    _discard_pool()
+
+
+def ocr_pages(
+    image_paths: Sequence[PageSource],
+    *,
+    config: str = "",
+    preprocess: bool = False,
+    label: str = "document",
+) -> list[OcrPageResult]:
+    """OCR ``image_paths`` (paths or rendered pages) in parallel, in page order."""
+    if not image_paths:
+        return []
+    started = time.perf_counter()
+    workers = min(ocr_worker_count(), len(image_paths))
+    results: dict[int, OcrPageResult] = {}
+
+    if workers > 1:
+        pool: ProcessPoolExecutor | None = None
+        try:
+            pool = _get_pool(ocr_worker_count())
+            window = workers * OCR_PAGES_IN_FLIGHT_PER_WORKER
+            pending: deque[tuple[int, Future[OcrPageResult]]] = deque()
+            for page, path in enumerate(image_paths, start=1):
+                pending.append((page, pool.submit(_ocr_one, page, path, config, preprocess)))
+                if len(pending) >= window:
+                    done_page, future = pending.popleft()
+                    results[done_page] = future.result()
+            while pending:
+                done_page, future = pending.popleft()
+                results[done_page] = future.result()
+        except (CancelledError, RuntimeError) as exc:
+            # RuntimeError covers BrokenProcessPool and a pool that another
+            # thread shut down or replaced while this document was queued.
+            logger.warning(
+                "OCR process pool unavailable while processing {} ({}: {}); finishing inline",
+                label,
+                type(exc).__name__,
+                exc,
+            )
+            if isinstance(exc, BrokenProcessPool):
+                _discard_pool(pool)
+
+    for page in range(1, len(image_paths) + 1):
+        if page not in results:
+            results[page] = _ocr_one(page, image_paths[page - 1], config, preprocess)
+
+    ordered = [results[page] for page in range(1, len(image_paths) + 1)]
+    wall = time.perf_counter() - started
+    busy = sum(result.seconds for result in ordered)
+    slowest = max(ordered, key=lambda result: result.seconds)
+    for result in ordered:
+        logger.debug("OCR {} page {} took {:.2f}s", label, result.page, result.seconds)
+    logger.info(
+        "OCR {}: {} page(s) in {:.2f}s wall ({:.2f}s page time, workers={}, slowest=page {} {:.2f}s)",
+        label,
+        len(ordered),
+        wall,
+        busy,
+        workers,
+        slowest.page,
+        slowest.seconds,
+    )
+    return ordered
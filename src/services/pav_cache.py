@@ -1,12 +1,39 @@
-"""File-based cache for PAV CustomQuery/KeywordSearch API responses.
+"""Two-tier cache for PAV CustomQuery/KeywordSearch API responses.
 
 Caches responses keyed by a hash of the full request payload (query_id,
-keywords, date range).  Responses are stored as gzip-compressed JSON in
-``data/cache/pav_api/``.
+keywords, date range).
+
+Tiers:
+
+1. **In-process LRU** (``_MemoryLRU``): an ``OrderedDict`` of the most recent
+   responses, bounded by ``_MEMORY_BUDGET_BYTES``.  Concurrent ORI target
+   workers in the same process share it, so a hit costs a dict lookup.
+2. **PostgreSQL table** ``pav_response_cache`` (migration 015): one indexed
+   row per payload hash holding the gzip-compressed JSON body.  Lookups are a
+   primary-key probe that also bumps ``last_accessed_at`` in the same
+   statement; writes are a single ``INSERT ... ON CONFLICT`` so concurrent
+   workers (controller, title-break, bulk step workers) can never produce a
+   torn entry.  The table is bounded by ``_DISK_BUDGET_BYTES``: every
+   ``_EVICTION_CHECK_EVERY`` writes, expired rows are dropped and the
+   least-recently-used rows are evicted down to ``_EVICTION_TARGET_RATIO`` of
+   the budget.
+
+This replaces the old flat ``data/cache/pav_api/*.json.gz`` layout, where every
+lookup paid a ``stat()`` plus gzip decode and nothing bounded the directory
+except the TTL.  Existing files can be imported once with
+``import_legacy_pav_cache()``.
 
 TTL is 7 days by default — ORI document metadata rarely changes, and the
 pipeline runs frequently enough that stale hits are acceptable.  A force
-flag can bypass the cache entirely.
+flag (``bypass_cache`` in ``PgOriService._post_pav``) skips the cache.
+
+The PG tier is best-effort: if the table is missing or the database is
+unreachable it is skipped for ``_DISK_RETRY_COOLDOWN_SECONDS`` and the memory
+tier keeps working; the first call after the cooldown probes PG again, so a
+transient outage does not cost the rest of a long run its shared cache.  The
+cache is never authoritative state.
+
+Hit/miss/eviction counters are exposed through ``pav_cache_stats()``.
 
 Usage::
 
@@ -21,18 +48,38 @@ Usage::
 
 from __future__ import annotations
 
-import contextlib
 import gzip
 import hashlib
 import json
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
+from sqlalchemy import text
+
+from sunbiz.db import get_engine, resolve_pg_dsn
 
-_CACHE_DIR = Path("data/cache/pav_api")
-_TTL_SECONDS = 7 * 24 * 3600  # 7 days
+_LEGACY_CACHE_DIR = Path("data/cache/pav_api")
+PAV_CACHE_TTL_SECONDS = 7 * 24 * 3600  # 7 days
+_MEMORY_BUDGET_BYTES = 64 * 1024 * 1024
+_DISK_BUDGET_BYTES = 2 * 1024 * 1024 * 1024
+_EVICTION_TARGET_RATIO = 0.9
+_EVICTION_CHECK_EVERY = 500
+_DISK_RETRY_COOLDOWN_SECONDS = 60.0
+
+_COUNTER_NAMES = (
+    "memory_hits",
+    "disk_hits",
+    "misses",
+    "expirations",
+    "writes",
+    "memory_evictions",
+    "disk_evictions",
+    "disk_errors",
+)
 
 
 def _cache_key(payload: dict[str, Any]) -> str:
@@ -42,47 +89,398 @@ def _cache_key(payload: dict[str, Any]) -> str:
     return hashlib.sha256(canonical.encode()).hexdigest()[:24]
 
 
+def _encode(data: dict[str, Any]) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _decode(raw: bytes) -> dict[str, Any]:
+    return json.loads(raw)
+
+
+class _MemoryLRU:
+    """Byte-bounded LRU of serialized (uncompressed) JSON response bodies.
+
+    Bodies are kept as bytes rather than dicts so every hit hands the caller
+    a fresh object it may mutate freely.
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self.budget_bytes = budget_bytes
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str, now: float) -> bytes | bool | None:
+        """Return the blob, ``None`` on miss, or ``False`` if it expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, blob = entry
+        if now - stored_at > PAV_CACHE_TTL_SECONDS:
+            self._drop(key)
+            return False
+        self._entries.move_to_end(key)
+        return blob
+
+    def put(self, key: str, blob: bytes, stored_at: float) -> int:
+        """Insert and return how many entries were evicted to fit."""
+        if len(blob) > self.budget_bytes:
+            return 0
+        self._drop(key)
+        self._entries[key] = (stored_at, blob)
+        self._bytes += len(blob)
+        evicted = 0
+        while self._bytes > self.budget_bytes and self._entries:
+            old_key = next(iter(self._entries))
+            self._drop(old_key)
+            evicted += 1
+        return evicted
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    @property
+    def entries(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+
+_LOCK = threading.Lock()
+_MEMORY = _MemoryLRU(_MEMORY_BUDGET_BYTES)
+_COUNTERS: dict[str, int] = dict.fromkeys(_COUNTER_NAMES, 0)
+_STATE: dict[str, Any] = {"dsn": None, "disk_retry_at": None, "writes_since_evict": 0}
+
+
+def configure_pav_cache(
+    dsn: str | None = None,
+    *,
+    memory_budget_bytes: int | None = None,
+) -> None:
+    """Point the PG tier at ``dsn`` (defaults to ``resolve_pg_dsn()``).
+
+    Services call this from ``__init__`` so the cache follows ``--dsn``.
+    Re-configuring with a different DSN re-enables a PG tier that is
+    cooling down after an error.
+    """
+    resolved = resolve_pg_dsn(dsn)
+    with _LOCK:
+        if _STATE["dsn"] != resolved:
+            _STATE["dsn"] = resolved
+            _STATE["disk_retry_at"] = None
+        if memory_budget_bytes is not None:
+            _MEMORY.budget_bytes = int(memory_budget_bytes)
+
+
+def _bump(name: str, amount: int = 1) -> None:
+    with _LOCK:
+        _COUNTERS[name] += amount
+
+
+def _disk_engine() -> Any | None:
+    with _LOCK:
+        retry_at = _STATE["disk_retry_at"]
+        if retry_at is not None and time.monotonic() < retry_at:
+            return None
+        dsn = _STATE["dsn"] or resolve_pg_dsn(None)
+        _STATE["dsn"] = dsn
+    return get_engine(dsn)
+
+
+def _disable_disk(exc: Exception) -> None:
+    with _LOCK:
+        first = _STATE["disk_retry_at"] is None
+        _STATE["disk_retry_at"] = time.monotonic() + _DISK_RETRY_COOLDOWN_SECONDS
+        _COUNTERS["disk_errors"] += 1
+    if first:
+        logger.warning(
+            "PAV cache PG tier unavailable, memory tier only; retrying every {:.0f}s: {}",
+            _DISK_RETRY_COOLDOWN_SECONDS,
+            exc,
+        )
+
+
+def _disk_recovered() -> None:
+    with _LOCK:
+        if _STATE["disk_retry_at"] is None:
+            return
+        _STATE["disk_retry_at"] = None
+    logger.info("PAV cache PG tier reachable again")
+
+
 def pav_cache_get(payload: dict[str, Any]) -> dict[str, Any] | None:
     """Return cached PAV response or None if miss/expired."""
     key = _cache_key(payload)
-    path = _CACHE_DIR / f"{key}.json.gz"
-    if not path.exists():
+    now = time.time()
+    with _LOCK:
+        blob = _MEMORY.get(key, now)
+        if blob is False:
+            _COUNTERS["expirations"] += 1
+        elif blob is not None:
+            _COUNTERS["memory_hits"] += 1
+    if isinstance(blob, bytes):
+        try:
+            return _decode(blob)
+        except Exception as exc:
+            logger.warning("PAV cache memory decode error for {}: {}", key, exc)
+
+    engine = _disk_engine()
+    if engine is None:
+        _bump("misses")
+        return None
+    try:
+        with engine.begin() as conn:
+            row = conn.execute(
+                text(
+                    """
+                    UPDATE pav_response_cache
+                    SET last_accessed_at = now(),
+                        hit_count = hit_count + 1
+                    WHERE cache_key = :key
+                      AND created_at > now() - make_interval(secs => :ttl)
+                    RETURNING body, EXTRACT(EPOCH FROM created_at) AS created_epoch
+                    """
+                ),
+                {"key": key, "ttl": PAV_CACHE_TTL_SECONDS},
+            ).first()
+    except Exception as exc:
+        _disable_disk(exc)
+        _bump("misses")
         return None
-    # Check TTL
-    age = time.time() - path.stat().st_mtime
-    if age > _TTL_SECONDS:
-        with contextlib.suppress(OSError):
-            path.unlink()
+    _disk_recovered()
+
+    if row is None:
+        _bump("misses")
         return None
     try:
-        with gzip.open(path, "rt", encoding="utf-8") as f:
-            return json.load(f)
+        raw = gzip.decompress(bytes(row[0]))
+        data = _decode(raw)
     except Exception as exc:
-        logger.warning("PAV cache read error for {}: {}", path.name, exc)
+        logger.warning("PAV cache read error for {}: {}", key, exc)
+        _bump("misses")
         return None
+    with _LOCK:
+        _COUNTERS["disk_hits"] += 1
+        _COUNTERS["memory_evictions"] += _MEMORY.put(key, raw, float(row[1]))
+    return data
 
 
 def pav_cache_put(payload: dict[str, Any], data: dict[str, Any]) -> None:
-    """Write PAV response to cache."""
+    """Write PAV response to both cache tiers."""
     try:
-        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
         key = _cache_key(payload)
-        path = _CACHE_DIR / f"{key}.json.gz"
-        with gzip.open(path, "wt", encoding="utf-8") as f:
-            json.dump(data, f, separators=(",", ":"))
+        raw = _encode(data)
+    except Exception as exc:
+        logger.debug("PAV cache encode error: {}", exc)
+        return
+    with _LOCK:
+        _COUNTERS["writes"] += 1
+        _COUNTERS["memory_evictions"] += _MEMORY.put(key, raw, time.time())
+
+    engine = _disk_engine()
+    if engine is None:
+        return
+    body = gzip.compress(raw, compresslevel=5)
+    try:
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO pav_response_cache (
+                        cache_key, body, body_bytes, created_at, last_accessed_at
+                    )
+                    VALUES (:key, :body, :body_bytes, now(), now())
+                    ON CONFLICT (cache_key) DO UPDATE SET
+                        body = EXCLUDED.body,
+                        body_bytes = EXCLUDED.body_bytes,
+                        created_at = EXCLUDED.created_at,
+                        last_accessed_at = EXCLUDED.last_accessed_at
+                    """
+                ),
+                {"key": key, "body": body, "body_bytes": len(body)},
+            )
+    except Exception as exc:
+        _disable_disk(exc)
+        return
+    _disk_recovered()
+
+    with _LOCK:
+        _STATE["writes_since_evict"] += 1
+        due = _STATE["writes_since_evict"] >= _EVICTION_CHECK_EVERY
+        if due:
+            _STATE["writes_since_evict"] = 0
+    if due:
+        evict_pav_cache()
+
+
+def evict_pav_cache(budget_bytes: int | None = None) -> int:
+    """Drop expired rows, then LRU-evict the PG tier down to its target size.
+
+    Returns the number of rows deleted.
+    """
+    engine = _disk_engine()
+    if engine is None:
+        return 0
+    budget = int(budget_bytes if budget_bytes is not None else _DISK_BUDGET_BYTES)
+    target = int(budget * _EVICTION_TARGET_RATIO)
+    try:
+        with engine.begin() as conn:
+            expired = conn.execute(
+                text(
+                    "DELETE FROM pav_response_cache "
+                    "WHERE created_at <= now() - make_interval(secs => :ttl)"
+                ),
+                {"ttl": PAV_CACHE_TTL_SECONDS},
+            ).rowcount or 0
+            total = int(
+                conn.execute(
+                    text("SELECT COALESCE(SUM(body_bytes), 0) FROM pav_response_cache")
+                ).scalar()
+                or 0
+            )
+            evicted = 0
+            if total > budget:
+                evicted = conn.execute(
+                    text(
+                        """
+                        WITH ranked AS (
+                            SELECT cache_key,
+                                   SUM(body_bytes) OVER (
+                                       ORDER BY last_accessed_at DESC, cache_key
+                                   ) AS running_bytes
+                            FROM pav_response_cache
+                        )
+                        DELETE FROM pav_response_cache c
+                        USING ranked r
+                        WHERE c.cache_key = r.cache_key
+                          AND r.running_bytes > :target
+                        """
+                    ),
+                    {"target": target},
+                ).rowcount or 0
     except Exception as exc:
-        logger.debug("PAV cache write error: {}", exc)
-
-
-def pav_cache_stats() -> dict[str, Any]:
-    """Return basic cache statistics."""
-    if not _CACHE_DIR.exists():
-        return {"entries": 0, "size_mb": 0.0}
-    files = list(_CACHE_DIR.glob("*.json.gz"))
-    total_bytes = sum(f.stat().st_size for f in files)
-    expired = sum(1 for f in files if (time.time() - f.stat().st_mtime) > _TTL_SECONDS)
-    return {
-        "entries": len(files),
-        "expired": expired,
-        "size_mb": round(total_bytes / (1024 * 1024), 2),
+        _disable_disk(exc)
+        return 0
+    with _LOCK:
+        _COUNTERS["expirations"] += int(expired)
+        _COUNTERS["disk_evictions"] += int(evicted)
+    if expired or evicted:
+        logger.info(
+            "PAV cache eviction: expired={} lru_evicted={} size_before_mb={:.1f} budget_mb={:.1f}",
+            expired,
+            evicted,
+            total / (1024 * 1024),
+            budget / (1024 * 1024),
+        )
+    return int(expired) + int(evicted)
+
+
+def import_legacy_pav_cache(
+    cache_dir: Path = _LEGACY_CACHE_DIR,
+    *,
+    remove_files: bool = False,
+) -> dict[str, int]:
+    """Copy unexpired ``*.json.gz`` files from the old flat directory into PG.
+
+    The legacy file name is already the payload hash, so keys carry over
+    unchanged.  ``created_at`` is taken from the file mtime so the TTL keeps
+    counting from the original fetch.
+    """
+    stats = {"imported": 0, "expired": 0, "errors": 0}
+    if not cache_dir.exists():
+        return stats
+    engine = _disk_engine()
+    if engine is None:
+        return stats
+    now = time.time()
+    for path in cache_dir.glob("*.json.gz"):
+        key = path.name.removesuffix(".json.gz")
+        try:
+            mtime = path.stat().st_mtime
+            if now - mtime > PAV_CACHE_TTL_SECONDS:
+                stats["expired"] += 1
+            else:
+                body = path.read_bytes()
+                _decode(gzip.decompress(body))
+                with engine.begin() as conn:
+                    conn.execute(
+                        text(
+                            """
+                            INSERT INTO pav_response_cache (
+                                cache_key, body, body_bytes, created_at, last_accessed_at
+                            )
+                            VALUES (:key, :body, :body_bytes, to_timestamp(:mtime), to_timestamp(:mtime))
+                            ON CONFLICT (cache_key) DO NOTHING
+                            """
+                        ),
+                        {"key": key, "body": body, "body_bytes": len(body), "mtime": mtime},
+                    )
+                stats["imported"] += 1
+            if remove_files:
+                path.unlink(missing_ok=True)
+        except Exception as exc:
+            stats["errors"] += 1
+            logger.debug("PAV legacy cache import error for {}: {}", path.name, exc)
+    logger.info("PAV legacy cache import: {}", stats)
+    return stats
+
+
+def reset_pav_cache_memory() -> None:
+    """Clear the in-process tier and counters (tests / long-lived workers)."""
+    with _LOCK:
+        _MEMORY.clear()
+        for name in _COUNTER_NAMES:
+            _COUNTERS[name] = 0
+
+
+def pav_cache_stats(*, include_disk: bool = True) -> dict[str, Any]:
+    """Return cache counters plus memory and (optionally) PG tier sizes."""
+    with _LOCK:
+        counters = dict(_COUNTERS)
+        memory_entries = _MEMORY.entries
+        memory_bytes = _MEMORY.size_bytes
+        memory_budget = _MEMORY.budget_bytes
+    lookups = counters["memory_hits"] + counters["disk_hits"] + counters["misses"]
+    hits = counters["memory_hits"] + counters["disk_hits"]
+    stats: dict[str, Any] = {
+        **counters,
+        "hit_rate": round(hits / lookups, 4) if lookups else None,
+        "memory_entries": memory_entries,
+        "memory_size_mb": round(memory_bytes / (1024 * 1024), 2),
+        "memory_budget_mb": round(memory_budget / (1024 * 1024), 2),
+        "disk_budget_mb": round(_DISK_BUDGET_BYTES / (1024 * 1024), 2),
     }
+    engine = _disk_engine() if include_disk else None
+    if engine is None:
+        stats.update(entries=None, expired=None, size_mb=None)
+        return stats
+    try:
+        with engine.connect() as conn:
+            row = conn.execute(
+                text(
+                    """
+                    SELECT COUNT(*),
+                           COALESCE(SUM(body_bytes), 0),
+                           COUNT(*) FILTER (
+                               WHERE created_at <= now() - make_interval(secs => :ttl)
+                           )
+                    FROM pav_response_cache
+                    """
+                ),
+                {"ttl": PAV_CACHE_TTL_SECONDS},
+            ).first()
+    except Exception as exc:
+        _disable_disk(exc)
+        stats.update(entries=None, expired=None, size_mb=None)
+        return stats
+    stats["entries"] = int(row[0] or 0)
+    stats["size_mb"] = round(int(row[1] or 0) / (1024 * 1024), 2)
+    stats["expired"] = int(row[2] or 0)
+    return stats
@@ -0,0 +1,218 @@
+"""In-memory PDF page rendering for OCR and vision extraction.
+
+Document extraction used to render every PDF page with PyMuPDF, save it as a
+temp PNG, then reopen the PNG with PIL for Tesseract or re-encode it to JPEG
+for ``VisionService``.  Every page paid a PNG encode, a disk write, a PNG
+decode and a cleanup ``unlink`` before the real work started, and crashed
+runs left page images behind in ``data/temp``.
+
+``iter_pdf_pages()`` yields ``RenderedPage`` objects instead: the raw pixel
+buffer straight out of the PyMuPDF pixmap plus its geometry.  Consumers turn a
+page into a PIL image with ``RenderedPage.to_image()`` (a zero-copy
+``Image.frombuffer`` view), so:
+
+- ``ocr_engine.ocr_pages()`` OCRs pages without touching disk (pages are
+  pickled to pool workers as raw bytes);
+- ``VisionService._encode_image()`` resizes and JPEG-encodes the buffer
+  directly.
+
+Pages are rendered RGB by default, matching the old PNGs.  OCR-only callers
+pass ``grayscale=True``: Tesseract binarizes internally and the rescue
+preprocessing converts to ``L`` first, so a one-channel buffer gives the same
+OCR input at a third of the memory.
+
+``PdfPages`` is the lazy form callers hand to OCR and vision: a sequence that
+knows the page count up front but renders a page only when it is indexed or
+iterated, and keeps nothing afterwards.  A 40-page judgment at 200 dpi is
+~150 MB of RGB buffers, so holding every page for the whole extraction (and a
+second copy for the rescue pass) is what sized the worker's memory; with
+``PdfPages`` only the pages currently being OCR'd or sent to the model are
+alive.  Fallback passes that revisit pages re-render them.
+
+``RenderedPage`` compares and hashes by identity (pages are deduplicated in
+sets by the judgment priority-page selector) and ``str(page)`` is a short
+label such as ``final_judgment_123.pdf page 3`` for log messages that used to
+print the temp PNG path.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, overload
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class RenderedPage:
+    """One rendered PDF page held as a raw pixel buffer (``page`` is 1-based)."""
+
+    page: int
+    width: int
+    height: int
+    mode: str
+    stride: int
+    samples: bytes
+    dpi: int
+    source: str = ""
+
+    @property
+    def label(self) -> str:
+        if self.source:
+            return f"{self.source} page {self.page}"
+        return f"page {self.page}"
+
+    def __str__(self) -> str:
+        return self.label
+
+    def to_image(self) -> Image.Image:
+        """Return a PIL image backed by ``samples`` (no copy, no decode)."""
+        return Image.frombuffer(
+            self.mode,
+            (self.width, self.height),
+            self.samples,
+            "raw",
+            self.mode,
+            self.stride,
+            1,
+        )
+
+
+def _render_page(
+    doc: fitz.Document,
+    page_num: int,
+    *,
+    dpi: int,
+    grayscale: bool,
+    source: str,
+) -> RenderedPage:
+    colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+    pix = doc[page_num].get_pixmap(dpi=dpi, colorspace=colorspace, alpha=False)
+    return RenderedPage(
+        page=page_num + 1,
+        width=pix.width,
+        height=pix.height,
+        mode="L" if grayscale else "RGB",
+        stride=pix.stride,
+        samples=pix.samples,
+        dpi=dpi,
+        source=source,
+    )
+
+
+def iter_pdf_pages(
+    pdf_path: str | Path,
+    *,
+    dpi: int,
+    grayscale: bool = False,
+    max_pages: int | None = None,
+) -> Iterator[RenderedPage]:
+    """Yield each page of ``pdf_path`` as a ``RenderedPage`` at ``dpi``.
+
+    The document stays open only while the generator is being consumed, so
+    callers that OCR page by page never hold more than one pixmap at a time.
+    """
+    source = Path(pdf_path).name
+    doc = fitz.open(str(pdf_path))
+    try:
+        total = len(doc)
+        if max_pages is not None:
+            total = min(total, max_pages)
+        for page_num in range(total):
+            yield _render_page(doc, page_num, dpi=dpi, grayscale=grayscale, source=source)
+    finally:
+        doc.close()
+
+
+def render_pdf_pages(
+    pdf_path: str | Path,
+    *,
+    dpi: int,
+    grayscale: bool = False,
+    max_pages: int | None = None,
+) -> list[RenderedPage]:
+    """Render every page (or the first ``max_pages``) into memory."""
+    return list(
+        iter_pdf_pages(pdf_path, dpi=dpi, grayscale=grayscale, max_pages=max_pages)
+    )
+
+
+class PdfPages(Sequence[RenderedPage]):
+    """Lazily rendered pages of one PDF (``len()`` without rendering).
+
+    Indexing renders that page; slicing renders just the sliced pages into a
+    list; iterating streams through ``iter_pdf_pages`` with the document open
+    once.  Rendered pages are never cached, so the caller decides how many
+    pixmaps are alive at a time.
+    """
+
+    def __init__(
+        self,
+        pdf_path: str | Path,
+        *,
+        dpi: int,
+        grayscale: bool = False,
+        max_pages: int | None = None,
+    ) -> None:
+        self.pdf_path = Path(pdf_path)
+        self.dpi = dpi
+        self.grayscale = grayscale
+        doc = fitz.open(str(pdf_path))
+        try:
+            total = len(doc)
+        finally:
+            doc.close()
+        self._count = total if max_pages is None else min(total, max_pages)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> RenderedPage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[RenderedPage]: ...
+
+    def __getitem__(self, index: int | slice) -> RenderedPage | list[RenderedPage]:
+        if isinstance(index, slice):
+            return self._render(range(self._count)[index])
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("page index out of range")
+        return self._render([index])[0]
+
+    def __iter__(self) -> Iterator[RenderedPage]:
+        return iter_pdf_pages(
+            self.pdf_path,
+            dpi=self.dpi,
+            grayscale=self.grayscale,
+            max_pages=self._count,
+        )
+
+    def __repr__(self) -> str:
+        return f"PdfPages({self.pdf_path.name!r}, pages={self._count}, dpi={self.dpi})"
+
+    def _render(self, indexes: Sequence[int]) -> list[RenderedPage]:
+        if not indexes:
+            return []
+        doc = fitz.open(str(self.pdf_path))
+        try:
+            return [
+                _render_page(
+                    doc,
+                    page_num,
+                    dpi=self.dpi,
+                    grayscale=self.grayscale,
+                    source=self.pdf_path.name,
+                )
+                for page_num in indexes
+            ]
+        finally:
+            doc.close()
@@ -39,17 +39,14 @@ import asyncio
 from copy import deepcopy
 from datetime import date, datetime
 import json
+import os
 import re
-import tempfile as _tempfile
 import time
 import urllib.parse
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, get_args, get_origin
 
-import fitz as _fitz
-import pytesseract
 from loguru import logger
-from PIL import Image
 from pydantic import ValidationError
 from pydantic.fields import PydanticUndefined
 from sqlalchemy import text
@@ -62,6 +59,9 @@ from src.models.lis_pendens_extraction import LisPendensExtraction
 from src.models.mortgage_extraction import MortgageExtraction
 from src.models.noc_extraction import NOCExtraction
 from src.models.satisfaction_extraction import SatisfactionExtraction
+from src.services.llm_result_cache import configure_llm_cache, llm_cache_stats
+from src.services.ocr_engine import ocr_pages
+from src.services.pdf_render import PdfPages
 from src.services.scraper_storage import ScraperStorage
 from src.services.vision_service import (
     ASSIGNMENT_PROMPT,
@@ -81,6 +81,8 @@ if TYPE_CHECKING:
 
     from playwright.async_api import Page
 
+    from src.services.pdf_render import RenderedPage
+
     from src.models.extraction_base import BaseDocumentExtraction
 
 # ---------------------------------------------------------------------------
@@ -535,11 +537,14 @@ class PgEncumbranceExtractionService:
     satisfactions, assignments, NOCs, deeds, and any future doc type.
     """
 
-    def __init__(self, dsn: str | None = None) -> None:
+    def __init__(self, dsn: str | None = None, *, concurrency: int | None = None) -> None:
         self.dsn = resolve_pg_dsn(dsn)
         self.engine = get_engine(self.dsn)
         self.storage = ScraperStorage()
+        configure_llm_cache(self.dsn)
         self.vision = VisionService()
+        # None sizes concurrency from VisionService.dispatch_capacity().
+        self.concurrency = concurrency
 
     # ------------------------------------------------------------------
     # Public API
@@ -577,6 +582,7 @@ class PgEncumbranceExtractionService:
         stats = asyncio.run(self._run_async(limit=limit, straps=straps, enc_types=enc_types))
         stats["ori_id_backfilled"] = int(backfill_stats.get("updated", 0))
         stats["ori_id_backfill_api_calls"] = int(backfill_stats.get("api_calls", 0))
+        stats["llm_cache"] = llm_cache_stats()
         elapsed = round(time.monotonic() - started, 2)
         stats["elapsed_seconds"] = elapsed
         logger.info(
@@ -623,7 +629,9 @@ class PgEncumbranceExtractionService:
                 wait_until="domcontentloaded",
             )
 
-            for row in rows:
+            semaphore = asyncio.Semaphore(self._resolve_concurrency(len(rows)))
+
+            async def _extract_row(row: dict[str, Any]) -> None:
                 enc_type = row["encumbrance_type"]
                 if enc_type not in EXTRACTION_DISPATCH:
                     logger.debug(
@@ -632,19 +640,30 @@ class PgEncumbranceExtractionService:
                         row["id"],
                     )
                     stats["skipped"] += 1
-                    continue
-                try:
-                    result = await self._process_one(page, row)
-                    self._tally_result(stats, result)
-                except Exception:
-                    logger.exception("Error extracting id={}", row["id"])
-                    stats["errors"] += 1
+                    return
+                async with semaphore:
+                    try:
+                        result = await self._process_one(page, row)
+                        self._tally_result(stats, result)
+                    except Exception:
+                        logger.exception("Error extracting id={}", row["id"])
+                        stats["errors"] += 1
+
+            await asyncio.gather(*(_extract_row(row) for row in rows))
 
             await browser.close()
 
         logger.info("Extraction complete: {}", stats)
         return stats
 
+    def _resolve_concurrency(self, row_count: int) -> int:
+        """Rows processed at once: explicit setting, else what Vision can absorb."""
+        workers = self.concurrency or min(VisionService.dispatch_capacity(), os.cpu_count() or 1)
+        workers = max(1, min(workers, row_count))
+        if workers > 1:
+            logger.info("Encumbrance extraction: processing up to {} rows concurrently", workers)
+        return workers
+
     @staticmethod
     def _tally_result(stats: dict[str, int], result: dict[str, Any] | None) -> None:
         """Map per-row outcome markers into controller-visible stats.
@@ -781,35 +800,30 @@ class PgEncumbranceExtractionService:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _render_pages(pdf_path: Path) -> list[str]:
-        """Render every PDF page to temp PNG files.
+    def _render_pages(pdf_path: Path) -> PdfPages:
+        """Open every PDF page for lazy rendering and OCR.
 
         Encumbrance documents routinely split critical facts across distant
         pages: page 1 may have parties / recording refs, middle pages may hold
         legal descriptions, and trailing riders often contain HOA names or other
         downstream-critical terms. Rendering only the first few pages defeats
         the whole "single combined OCR context" design.
+
+        Pages are only ever OCR'd here (never sent to the vision model), so
+        they are rendered grayscale to keep the buffers small, and only as the
+        OCR pool reaches them, so a long document is never held in full.
         """
-        doc = _fitz.open(str(pdf_path))
-        images: list[str] = []
-        try:
-            for i in range(len(doc)):
-                pg = doc[i]
-                pix = pg.get_pixmap(dpi=_RENDER_DPI)
-                with _tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                    pix.save(tmp.name)
-                    images.append(tmp.name)
-        finally:
-            doc.close()
-        return images
+        return PdfPages(pdf_path, dpi=_RENDER_DPI, grayscale=True)
 
     # ------------------------------------------------------------------
     # OCR + text-based LLM extraction
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _ocr_images_to_text(image_paths: list[str]) -> tuple[str, list[int]]:
-        """OCR all page images with pytesseract and combine into one string.
+    def _ocr_images_to_text(
+        image_paths: Sequence[str | RenderedPage],
+    ) -> tuple[str, list[int]]:
+        """OCR all page images via ``ocr_pages`` and combine into one string.
 
         Each page is prefixed with ``--- PAGE N ---`` for context, matching
         the same convention used by ``FinalJudgmentProcessor``.
@@ -821,28 +835,27 @@ class PgEncumbranceExtractionService:
         """
         page_texts: list[str] = []
         missing_pages: list[int] = []
-        for idx, image_path in enumerate(image_paths, start=1):
-            try:
-                with Image.open(image_path) as image:
-                    page_text = pytesseract.image_to_string(image).strip()
-            except Exception as exc:
+        results = ocr_pages(image_paths, label="encumbrance")
+        for result in results:
+            idx = result.page
+            if result.error is not None:
                 logger.warning(
                     "Tesseract OCR failed for page {} ({}): {}",
                     idx,
-                    image_path,
-                    exc,
+                    result.label,
+                    result.error,
                 )
                 missing_pages.append(idx)
                 continue
-            if not page_text:
+            if not result.text:
                 logger.warning(
                     "Tesseract OCR returned no text for page {} ({})",
                     idx,
-                    image_path,
+                    result.label,
                 )
                 missing_pages.append(idx)
                 continue
-            page_texts.append(f"--- PAGE {idx} ---\n{page_text}")
+            page_texts.append(f"--- PAGE {idx} ---\n{result.text}")
 
         return "\n\n".join(page_texts), missing_pages
 
@@ -1282,6 +1295,16 @@ class PgEncumbranceExtractionService:
                 "_reason": "download_failed",
             }
 
+        # Render/OCR/LLM are blocking; run them off the event loop so other
+        # rows keep downloading and dispatching to the vision endpoints.
+        return await asyncio.to_thread(self._extract_downloaded, row, downloaded)
+
+    def _extract_downloaded(
+        self, row: dict[str, Any], downloaded: Path
+    ) -> dict[str, Any] | None:
+        """Render -> OCR -> LLM -> validate -> cache -> save for one PDF."""
+        enc_type = row["encumbrance_type"]
+
         # 3. Render
         images = self._render_pages(downloaded)
         if not images:
@@ -1291,112 +1314,108 @@ class PgEncumbranceExtractionService:
                 "_reason": "render_failed",
             }
 
-        try:
-            # 4. OCR all pages → combined text → single LLM call
-            ocr_text, missing_pages = self._ocr_images_to_text(images)
-            if missing_pages:
-                logger.warning(
-                    "OCR missed {}/{} page(s) for id={} type={} inst={}: pages={}",
-                    len(missing_pages),
-                    len(images),
-                    row["id"],
-                    enc_type,
-                    row.get("instrument_number"),
-                    missing_pages,
-                )
-                return {
-                    "_status": "error",
-                    "_reason": "ocr_incomplete",
-                }
-            if not ocr_text.strip():
-                logger.warning(
-                    "OCR produced no text for id={} type={} inst={}",
-                    row["id"],
-                    enc_type,
-                    row.get("instrument_number"),
-                )
-                return {
-                    "_status": "error",
-                    "_reason": "ocr_empty",
-                }
+        # 4. OCR all pages → combined text → single LLM call
+        ocr_text, missing_pages = self._ocr_images_to_text(images)
+        page_count = len(images)
+        if missing_pages:
+            logger.warning(
+                "OCR missed {}/{} page(s) for id={} type={} inst={}: pages={}",
+                len(missing_pages),
+                page_count,
+                row["id"],
+                enc_type,
+                row.get("instrument_number"),
+                missing_pages,
+            )
+            return {
+                "_status": "error",
+                "_reason": "ocr_incomplete",
+            }
+        if not ocr_text.strip():
+            logger.warning(
+                "OCR produced no text for id={} type={} inst={}",
+                row["id"],
+                enc_type,
+                row.get("instrument_number"),
+            )
+            return {
+                "_status": "error",
+                "_reason": "ocr_empty",
+            }
 
-            # Persist raw OCR text before LLM call
-            self._save_raw_to_pg(row["id"], ocr_text)
+        # Persist raw OCR text before LLM call
+        self._save_raw_to_pg(row["id"], ocr_text)
 
-            raw = self._extract_from_ocr_text(ocr_text, enc_type)
-            if not raw:
-                logger.warning(
-                    "LLM returned no usable structured extraction for id={} type={} inst={}",
-                    row["id"],
-                    enc_type,
-                    row.get("instrument_number"),
-                )
-                return {
-                    "_status": "error",
-                    "_reason": "llm_no_structured_output",
-                }
-
-            # 5. Validate
-            validated, validation_errors = self._validate(
-                raw,
+        raw = self._extract_from_ocr_text(ocr_text, enc_type)
+        if not raw:
+            logger.warning(
+                "LLM returned no usable structured extraction for id={} type={} inst={}",
+                row["id"],
                 enc_type,
-                row_context=row,
-                source="fresh extraction",
+                row.get("instrument_number"),
             )
-            if not validated:
-                logger.warning(
-                    "Skipping persistence for invalid extraction id={} type={} inst={} because validation failed: {}",
-                    row["id"],
-                    enc_type,
-                    row.get("instrument_number"),
-                    "; ".join(validation_errors[:3]) if validation_errors else "unknown validation failure",
-                )
-                return {
-                    "_status": "error",
-                    "_reason": "validation_failed",
-                }
-
-            # 6. Enrich from metadata before spending another LLM round-trip
-            validated = self._enrich_from_metadata(validated, enc_type, row)
+            return {
+                "_status": "error",
+                "_reason": "llm_no_structured_output",
+            }
 
-            # 7. Repair only when a non-null address still does not resolve
-            address = validated.get("property_address")
-            if address and not self._address_resolves(address):
-                logger.info(
-                    "Address '{}' for id={} type={} inst={} does not resolve; attempting repair",
-                    address,
-                    row["id"],
-                    enc_type,
-                    row.get("instrument_number"),
-                )
-                repaired = self._attempt_repair(ocr_text, validated, enc_type)
-                if repaired and self._address_resolves(repaired.get("property_address")):
-                    logger.info(
-                        "Repair succeeded for id={}: '{}' -> '{}'",
-                        row["id"],
-                        address,
-                        repaired.get("property_address"),
-                    )
-                    validated = repaired
-                else:
-                    logger.info(
-                        "Repair did not improve address for id={}; keeping original",
-                        row["id"],
-                    )
+        # 5. Validate
+        validated, validation_errors = self._validate(
+            raw,
+            enc_type,
+            row_context=row,
+            source="fresh extraction",
+        )
+        if not validated:
+            logger.warning(
+                "Skipping persistence for invalid extraction id={} type={} inst={} because validation failed: {}",
+                row["id"],
+                enc_type,
+                row.get("instrument_number"),
+                "; ".join(validation_errors[:3]) if validation_errors else "unknown validation failure",
+            )
+            return {
+                "_status": "error",
+                "_reason": "validation_failed",
+            }
 
-            # 8. Cache
-            _write_cache(downloaded, validated)
+        # 6. Enrich from metadata before spending another LLM round-trip
+        validated = self._enrich_from_metadata(validated, enc_type, row)
 
-            # 9. Save to DB
-            self._save_to_pg(row["id"], validated)
+        # 7. Repair only when a non-null address still does not resolve
+        address = validated.get("property_address")
+        if address and not self._address_resolves(address):
             logger.info(
-                "Extracted id={} type={} inst={}",
+                "Address '{}' for id={} type={} inst={} does not resolve; attempting repair",
+                address,
                 row["id"],
                 enc_type,
                 row.get("instrument_number"),
             )
-            return {**validated, "_status": "extracted"}
+            repaired = self._attempt_repair(ocr_text, validated, enc_type)
+            if repaired and self._address_resolves(repaired.get("property_address")):
+                logger.info(
+                    "Repair succeeded for id={}: '{}' -> '{}'",
+                    row["id"],
+                    address,
+                    repaired.get("property_address"),
+                )
+                validated = repaired
+            else:
+                logger.info(
+                    "Repair did not improve address for id={}; keeping original",
+                    row["id"],
+                )
+
+        # 8. Cache
+        _write_cache(downloaded, validated)
 
-        finally:
-            for img in images:
-                Path(img).unlink(missing_ok=True)
+        # 9. Save to DB
+        self._save_to_pg(row["id"], validated)
+        logger.info(
+            "Extracted id={} type={} inst={}",
+            row["id"],
+            enc_type,
+            row.get("instrument_number"),
+        )
+        return {**validated, "_status": "extracted"}
@@ -25,7 +25,7 @@ from loguru import logger
 import requests
 from sqlalchemy import text
 
-from src.services.pav_cache import pav_cache_get, pav_cache_put
+from src.services.pav_cache import configure_pav_cache, pav_cache_get, pav_cache_put
 
 from src.utils.legal_description import legal_descriptions_match
 from src.utils.legal_description import parse_legal_description
@@ -65,6 +65,10 @@ _GENERIC_SUBDIVISION_TERMS = frozenset(
     }
 )
 
+# A lot/block/unit value of this shape is looked up in the legal index's key
+# arrays; anything else (e.g. "B-2") falls back to a regex on legal_text.
+_LEGAL_KEY_TOKEN_RE = re.compile(r"[A-Z0-9]+")
+
 _MAX_CANDIDATES_LEGAL = 300
 _MAX_CANDIDATES_ADDRESS = 60
 _IDENTIFIER_RETRY_COOLDOWN_DAYS = 14
@@ -358,13 +362,16 @@ class PgForeclosureIdentifierRecoveryService:
     def __init__(self, dsn: str | None = None) -> None:
         self._available = False
         self._run_stats: dict[str, int] = {}
+        self._legal_index_ready = False
         self._dsn = resolve_pg_dsn(dsn)
+        configure_pav_cache(self._dsn)
         try:
             self._engine = get_engine(self._dsn)
             with self._engine.connect() as conn:
                 conn.execute(text("SELECT 1 FROM foreclosures LIMIT 0"))
                 conn.execute(text("SELECT 1 FROM hcpa_bulk_parcels LIMIT 0"))
                 conn.execute(text("SELECT 1 FROM resolve_property_by_name('x', NULL, 0.3) LIMIT 0"))
+                self._legal_index_ready = self._probe_legal_index(conn)
             self._ori_session = requests.Session()
             self._ori_session.headers.update(_ORI_DOC_HEADERS)
             try:
@@ -394,6 +401,44 @@ class PgForeclosureIdentifierRecoveryService:
     def available(self) -> bool:
         return self._available
 
+    @staticmethod
+    def _probe_legal_index(conn: Connection) -> bool:
+        """Return whether ``hcpa_parcel_legal_index`` covers every parcel.
+
+        A partially built index (a ``limit_rows`` load, or parcels written
+        before the table existed) would silently miss candidates, so the
+        index is only used when no ``hcpa_bulk_parcels`` row lacks an index
+        row; otherwise lookups keep scanning ``hcpa_bulk_parcels``.
+        """
+        exists = conn.execute(
+            text("SELECT to_regclass('hcpa_parcel_legal_index') IS NOT NULL")
+        ).scalar()
+        if not exists:
+            logger.warning(
+                "hcpa_parcel_legal_index is missing; legal-description recovery "
+                "falls back to scanning hcpa_bulk_parcels until the next HCPA load"
+            )
+            return False
+        unindexed = conn.execute(
+            text(
+                """
+                SELECT COUNT(*)
+                FROM hcpa_bulk_parcels p
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM hcpa_parcel_legal_index li WHERE li.folio = p.folio
+                )
+                """
+            )
+        ).scalar()
+        if unindexed:
+            logger.warning(
+                "hcpa_parcel_legal_index is missing {} parcel(s); legal-description "
+                "recovery falls back to scanning hcpa_bulk_parcels until the next HCPA load",
+                unindexed,
+            )
+            return False
+        return True
+
     def run(self, *, limit: int | None = None) -> dict[str, Any]:
         if not self._available:
             return {"skipped": True, "reason": "service_unavailable"}
@@ -1373,44 +1418,104 @@ class PgForeclosureIdentifierRecoveryService:
         plat_book = _clean_text(row.get("jd_plat_book")) or _clean_text(parsed.plat_book)
         plat_page = _clean_text(row.get("jd_plat_page")) or _clean_text(parsed.plat_page)
 
+        if not self._legal_index_ready:
+            return self._scan_by_legal_description(
+                conn,
+                subdivision=subdivision,
+                lot=lot,
+                block=block,
+                unit=unit,
+                plat_book=plat_book,
+                plat_page=plat_page,
+            )
+
+        clauses: list[str] = []
+        params: dict[str, Any] = {"limit": _MAX_CANDIDATES_LEGAL}
+
+        for index, term in enumerate(_subdivision_terms(subdivision)):
+            key = f"sub_term_{index}"
+            clauses.append(f"li.legal_text LIKE :{key}")
+            params[key] = f"%{term}%"
+
+        for name, value, keywords in (
+            ("lot", lot, "LOT|L|LT"),
+            ("block", block, "BLOCK|BLK|B"),
+            ("unit", unit, "UNIT|U|UN"),
+        ):
+            if not value:
+                continue
+            token = value.upper()
+            if _LEGAL_KEY_TOKEN_RE.fullmatch(token):
+                clauses.append(f"li.{name}_keys @> CAST(:{name}_keys AS text[])")
+                params[f"{name}_keys"] = [token]
+            else:
+                clauses.append(f"li.legal_text ~* :{name}_regex")
+                params[f"{name}_regex"] = _legal_keyword_regex(keywords, token)
+
+        if plat_book and plat_page:
+            clauses.append(
+                "(li.legal_text ~* :plat_regex"
+                " OR (li.plat_book = :plat_book AND li.plat_page = :plat_page))"
+            )
+            params["plat_regex"] = _plat_regex(plat_book, plat_page)
+            params["plat_book"] = plat_book.upper()
+            params["plat_page"] = plat_page.upper()
+
+        if not clauses:
+            return []
+
+        sql = text(
+            f"""
+            SELECT
+                p.folio, p.strap, p.property_address,
+                p.raw_legal1, p.raw_legal2, p.raw_legal3, p.raw_legal4,
+                p.source_file_id
+            FROM hcpa_parcel_legal_index li
+            JOIN hcpa_bulk_parcels p ON p.folio = li.folio
+            WHERE {' AND '.join(clauses)}
+            ORDER BY p.source_file_id DESC NULLS LAST
+            LIMIT :limit
+            """
+        )
+
+        rows = conn.execute(sql, params).mappings().fetchall()
+        return [_row_to_candidate(row) for row in rows]
+
+    @staticmethod
+    def _scan_by_legal_description(
+        conn: Connection,
+        *,
+        subdivision: str | None,
+        lot: str | None,
+        block: str | None,
+        unit: str | None,
+        plat_book: str | None,
+        plat_page: str | None,
+    ) -> list[_ParcelCandidate]:
+        """Regex scan of ``hcpa_bulk_parcels`` used until the legal index is built."""
         clauses: list[str] = []
         params: dict[str, Any] = {"limit": _MAX_CANDIDATES_LEGAL}
 
-        subdiv_terms = _subdivision_terms(subdivision)
-        if subdiv_terms:
-            for index, term in enumerate(subdiv_terms):
-                key = f"sub_term_{index}"
-                clauses.append(f"{_LEGAL_EXPR} LIKE :{key}")
-                params[key] = f"%{term}%"
+        for index, term in enumerate(_subdivision_terms(subdivision)):
+            key = f"sub_term_{index}"
+            clauses.append(f"{_LEGAL_EXPR} LIKE :{key}")
+            params[key] = f"%{term}%"
 
         if lot:
             clauses.append(f"{_LEGAL_EXPR} ~* :lot_regex")
-            params["lot_regex"] = (
-                rf"(^|[^A-Z0-9])(LOT|L|LT)\s*{re.escape(lot.upper())}([^A-Z0-9]|$)"
-            )
+            params["lot_regex"] = _legal_keyword_regex("LOT|L|LT", lot.upper())
 
         if block:
             clauses.append(f"{_LEGAL_EXPR} ~* :block_regex")
-            params["block_regex"] = (
-                rf"(^|[^A-Z0-9])(BLOCK|BLK|B)\s*{re.escape(block.upper())}"
-                r"([^A-Z0-9]|$)"
-            )
+            params["block_regex"] = _legal_keyword_regex("BLOCK|BLK|B", block.upper())
 
         if unit:
             clauses.append(f"{_LEGAL_EXPR} ~* :unit_regex")
-            params["unit_regex"] = (
-                rf"(^|[^A-Z0-9])(UNIT|U|UN)\s*{re.escape(unit.upper())}"
-                r"([^A-Z0-9]|$)"
-            )
+            params["unit_regex"] = _legal_keyword_regex("UNIT|U|UN", unit.upper())
 
         if plat_book and plat_page:
             clauses.append(f"{_LEGAL_EXPR} ~* :plat_regex")
-            params["plat_regex"] = (
-                r"PLAT\s*(BOOK|BK)?\s*0*"
-                + re.escape(plat_book.upper())
-                + r"\s*(PAGE|PG|P)?\s*0*"
-                + re.escape(plat_page.upper())
-            )
+            params["plat_regex"] = _plat_regex(plat_book, plat_page)
 
         if not clauses:
             return []
@@ -1840,6 +1945,19 @@ def _subdivision_terms(subdivision: str | None) -> list[str]:
     return terms
 
 
+def _legal_keyword_regex(keywords: str, value: str) -> str:
+    return rf"(^|[^A-Z0-9])({keywords})\s*{re.escape(value)}([^A-Z0-9]|$)"
+
+
+def _plat_regex(plat_book: str, plat_page: str) -> str:
+    return (
+        r"PLAT\s*(BOOK|BK)?\s*0*"
+        + re.escape(plat_book.upper())
+        + r"\s*(PAGE|PG|P)?\s*0*"
+        + re.escape(plat_page.upper())
+    )
+
+
 def _row_to_candidate(row: Any) -> _ParcelCandidate:
     legal_description = " ".join(
         part.strip()
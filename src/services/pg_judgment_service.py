@@ -7,8 +7,10 @@ cache into PG via the refresh path.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 import json
+import os
 import re
 from pathlib import Path
 from typing import Any, get_args, get_origin
@@ -31,6 +33,7 @@ from src.models.judgment_extraction import (
     RedFlagType,
     Severity,
 )
+from src.services.llm_result_cache import configure_llm_cache, llm_cache_stats
 from sunbiz.db import get_engine, resolve_pg_dsn
 
 FORECLOSURE_DATA_DIR = Path("data/Foreclosure")
@@ -352,9 +355,12 @@ def _normalize_model_payload(
 class PgJudgmentService:
     """Process judgment PDFs and push extracted data to PG."""
 
-    def __init__(self, dsn: str | None = None) -> None:
+    def __init__(self, dsn: str | None = None, *, workers: int | None = None) -> None:
         self.dsn = resolve_pg_dsn(dsn)
         self.engine = get_engine(self.dsn)
+        configure_llm_cache(self.dsn)
+        # None sizes the pool from VisionService.dispatch_capacity().
+        self.workers = workers
 
     def run(self, *, limit: int | None = None) -> dict[str, Any]:
         """Find unprocessed PDFs, extract via Vision, push to PG."""
@@ -375,6 +381,7 @@ class PgJudgmentService:
             "pdfs_found": len(needs_extract),
             "pdfs_extracted": extracted,
             "judgments_loaded_to_pg": loaded,
+            "llm_cache": llm_cache_stats(),
         }
 
     def _find_unextracted_pdfs(self, limit: int | None) -> list[dict[str, Any]]:
@@ -453,31 +460,55 @@ class PgJudgmentService:
         return results
 
     def _extract_judgments(self, items: list[dict[str, Any]]) -> int:
-        """Run FinalJudgmentProcessor on each PDF."""
+        """Run FinalJudgmentProcessor on each PDF.
+
+        Cases are processed on a thread pool so VisionService can dispatch to
+        several endpoints at once.  PDFs of the same case stay on one worker
+        because the processor writes its per-case OCR debug text by case
+        number.
+        """
         from src.services.final_judgment_processor import FinalJudgmentProcessor
+        from src.services.vision_service import VisionService
 
         processor = FinalJudgmentProcessor()
 
-        extracted = 0
+        by_case: dict[str, list[dict[str, Any]]] = {}
         for item in items:
-            pdf_path = item["pdf_path"]
-            case_number = item["case_number"]
-            try:
-                result = processor.process_pdf(
-                    pdf_path=pdf_path,
-                    case_number=case_number,
-                )
-                if result:
-                    extracted += 1
-                    logger.info(
-                        f"Extracted judgment for {case_number} "
-                        f"(pdf={pdf_path}): "
-                        f"plaintiff={result.get('plaintiff', '?')}"
+            by_case.setdefault(item["case_number"], []).append(item)
+
+        def _extract_case(case_items: list[dict[str, Any]]) -> int:
+            case_extracted = 0
+            for item in case_items:
+                pdf_path = item["pdf_path"]
+                case_number = item["case_number"]
+                try:
+                    result = processor.process_pdf(
+                        pdf_path=pdf_path,
+                        case_number=case_number,
                     )
-            except Exception as exc:
-                logger.error(f"Judgment extraction failed for {case_number}: {exc}")
+                    if result:
+                        case_extracted += 1
+                        logger.info(
+                            f"Extracted judgment for {case_number} "
+                            f"(pdf={pdf_path}): "
+                            f"plaintiff={result.get('plaintiff', '?')}"
+                        )
+                except Exception as exc:
+                    logger.error(f"Judgment extraction failed for {case_number}: {exc}")
+            return case_extracted
+
+        workers = self.workers or min(VisionService.dispatch_capacity(), os.cpu_count() or 1)
+        workers = max(1, min(workers, len(by_case)))
+        if workers == 1:
+            return sum(_extract_case(case_items) for case_items in by_case.values())
 
-        return extracted
+        logger.info(
+            "judgment_extract: extracting {} case(s) with {} workers",
+            len(by_case),
+            workers,
+        )
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="judgment-extract") as pool:
+            return sum(pool.map(_extract_case, by_case.values()))
 
     @staticmethod
     def select_best_judgment(
@@ -51,6 +51,9 @@ from sqlalchemy import text as sa_text
 from sqlalchemy import update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
+from sunbiz.bulk_copy import coalesce_updates
+from sunbiz.bulk_copy import copy_upsert
+from sunbiz.bulk_copy import excluded_updates
 from sunbiz.db import get_engine
 from sunbiz.db import get_session_factory
 from sunbiz.db import resolve_pg_dsn
@@ -80,9 +83,11 @@ CLERK_CIVIL_ALPHA_CIRCUIT_URL = "https://publicrec.hillsclerk.com/Civil/alpha_in
 CLERK_CIVIL_ALPHA_COUNTY_URL = "https://publicrec.hillsclerk.com/Civil/alpha_index/County/"
 DEFAULT_CIVIL_ALPHA_DIR = Path("data/bulk_data/clerk_civil_alpha_index")
 CIVIL_ALPHA_FILE_PATTERN = re.compile(r"(?:Circuit|County)CivilNameIndex_[A-Z_]+\.txt", re.IGNORECASE)
-DEFAULT_BATCH_SIZE = 2000
+# Rows per COPY batch (and per commit).  Batches are staged with COPY by
+# sunbiz.bulk_copy, so they are no longer capped by the 65535 bind-parameter
+# limit of a single INSERT ... VALUES statement.
+DEFAULT_BATCH_SIZE = 20000
 LOADER_VERSION = "pg_loader_clerk_v1"
-PG_MAX_BIND_PARAMS = 65535
 
 # Filename patterns for each file type
 CASE_FILE_PATTERN = re.compile(
@@ -253,15 +258,6 @@ def _compute_sha256(path: Path) -> str:
     return digest.hexdigest()
 
 
-def _effective_batch_size(requested: int, columns_per_row: int) -> int:
-    if requested <= 0:
-        requested = 1
-    if columns_per_row <= 0:
-        return requested
-    max_rows = max(1, (PG_MAX_BIND_PARAMS - 512) // columns_per_row)
-    return max(1, min(requested, max_rows))
-
-
 def _chunked(items: list[dict], chunk_size: int):
     for i in range(0, len(items), chunk_size):
         yield items[i : i + chunk_size]
@@ -812,7 +808,6 @@ def load_clerk_cases(
             try:
                 rows: list[dict] = []
                 row_count = 0
-                eff_batch = batch_size
 
                 for csv_row in _iter_csv_with_bom(path):
                     case_number = _clean_text(csv_row.get("CaseNbr"))
@@ -838,13 +833,10 @@ def load_clerk_cases(
                         "loaded_at": _utc_now(),
                     }
 
-                    if row_count == 0:
-                        eff_batch = _effective_batch_size(batch_size, len(mapped))
-
                     rows.append(mapped)
                     row_count += 1
 
-                    if len(rows) >= eff_batch:
+                    if len(rows) >= batch_size:
                         _upsert_cases_batch(session, rows)
                         session.commit()
                         rows.clear()
@@ -883,17 +875,13 @@ def _upsert_cases_batch(session: Session, rows: list[dict]) -> None:
     if not rows:
         return
     rows = _dedup_by_key(rows, "case_number")
-    stmt = pg_insert(ClerkCivilCase).values(rows)
-    update_cols = {
-        col.name: getattr(stmt.excluded, col.name)
-        for col in ClerkCivilCase.__table__.columns
-        if col.name != "case_number"
-    }
-    stmt = stmt.on_conflict_do_update(
-        index_elements=[ClerkCivilCase.case_number],
-        set_=update_cols,
+    copy_upsert(
+        session,
+        ClerkCivilCase,
+        rows,
+        conflict_columns=["case_number"],
+        update=excluded_updates(ClerkCivilCase, exclude={"case_number"}),
     )
-    session.execute(stmt)
 
 
 # ---------------------------------------------------------------------------
@@ -958,7 +946,6 @@ def load_clerk_events(
             try:
                 rows: list[dict] = []
                 row_count = 0
-                eff_batch = batch_size
 
                 for csv_row in _iter_csv_with_bom(path):
                     case_number = _clean_text(csv_row.get("CaseNbr"))
@@ -977,13 +964,10 @@ def load_clerk_events(
                         "loaded_at": _utc_now(),
                     }
 
-                    if row_count == 0:
-                        eff_batch = _effective_batch_size(batch_size, len(mapped))
-
                     rows.append(mapped)
                     row_count += 1
 
-                    if len(rows) >= eff_batch:
+                    if len(rows) >= batch_size:
                         _insert_events_batch(session, rows)
                         session.commit()
                         rows.clear()
@@ -1028,11 +1012,12 @@ def _insert_events_batch(session: Session, rows: list[dict]) -> None:
     if not rows:
         return
     rows = _dedup_events(rows)
-    stmt = pg_insert(ClerkCivilEvent).values(rows)
-    stmt = stmt.on_conflict_do_nothing(
-        constraint="uq_clerk_events_case_code_date_party"
+    copy_upsert(
+        session,
+        ClerkCivilEvent,
+        rows,
+        conflict_constraint="uq_clerk_events_case_code_date_party",
     )
-    session.execute(stmt)
 
 
 # ---------------------------------------------------------------------------
@@ -1098,7 +1083,6 @@ def load_clerk_parties(
             try:
                 rows: list[dict] = []
                 row_count = 0
-                eff_batch = batch_size
 
                 for csv_row in _iter_csv_with_bom(path):
                     case_number = _clean_text(csv_row.get("CaseNbr"))
@@ -1127,13 +1111,10 @@ def load_clerk_parties(
                         "loaded_at": _utc_now(),
                     }
 
-                    if row_count == 0:
-                        eff_batch = _effective_batch_size(batch_size, len(mapped))
-
                     rows.append(mapped)
                     row_count += 1
 
-                    if len(rows) >= eff_batch:
+                    if len(rows) >= batch_size:
                         _upsert_parties_batch(session, rows)
                         session.commit()
                         rows.clear()
@@ -1173,17 +1154,16 @@ def _upsert_parties_batch(session: Session, rows: list[dict]) -> None:
     if not rows:
         return
     rows = _dedup_parties(rows)
-    stmt = pg_insert(ClerkCivilParty).values(rows)
-    update_cols = {
-        col.name: getattr(stmt.excluded, col.name)
-        for col in ClerkCivilParty.__table__.columns
-        if col.name not in ("id", "case_number", "party_type", "name")
-    }
-    stmt = stmt.on_conflict_do_update(
-        constraint="uq_clerk_parties_case_type_name",
-        set_=update_cols,
+    copy_upsert(
+        session,
+        ClerkCivilParty,
+        rows,
+        conflict_constraint="uq_clerk_parties_case_type_name",
+        update=excluded_updates(
+            ClerkCivilParty,
+            exclude={"id", "case_number", "party_type", "name"},
+        ),
     )
-    session.execute(stmt)
 
 
 # ---------------------------------------------------------------------------
@@ -1250,7 +1230,6 @@ def load_clerk_disposed(
             try:
                 rows: list[dict] = []
                 row_count = 0
-                eff_batch = batch_size
 
                 for csv_row in _iter_csv_with_bom(path):
                     case_number = _clean_text(
@@ -1293,13 +1272,10 @@ def load_clerk_disposed(
                         "loaded_at": _utc_now(),
                     }
 
-                    if row_count == 0:
-                        eff_batch = _effective_batch_size(batch_size, len(mapped))
-
                     rows.append(mapped)
                     row_count += 1
 
-                    if len(rows) >= eff_batch:
+                    if len(rows) >= batch_size:
                         _upsert_disposed_batch(session, rows)
                         session.commit()
                         rows.clear()
@@ -1330,17 +1306,13 @@ def _upsert_disposed_batch(session: Session, rows: list[dict]) -> None:
     if not rows:
         return
     rows = _dedup_by_key(rows, "case_number")
-    stmt = pg_insert(ClerkDisposedCase).values(rows)
-    update_cols = {
-        col.name: getattr(stmt.excluded, col.name)
-        for col in ClerkDisposedCase.__table__.columns
-        if col.name != "case_number"
-    }
-    stmt = stmt.on_conflict_do_update(
-        index_elements=[ClerkDisposedCase.case_number],
-        set_=update_cols,
+    copy_upsert(
+        session,
+        ClerkDisposedCase,
+        rows,
+        conflict_columns=["case_number"],
+        update=excluded_updates(ClerkDisposedCase, exclude={"case_number"}),
     )
-    session.execute(stmt)
 
 
 # ---------------------------------------------------------------------------
@@ -1408,7 +1380,6 @@ def load_clerk_garnishment(
             try:
                 rows: list[dict] = []
                 row_count = 0
-                eff_batch = batch_size
 
                 for csv_row in _iter_csv_with_bom(path):
                     case_number = _clean_text(
@@ -1494,13 +1465,10 @@ def load_clerk_garnishment(
                         "loaded_at": _utc_now(),
                     }
 
-                    if row_count == 0:
-                        eff_batch = _effective_batch_size(batch_size, len(mapped))
-
                     rows.append(mapped)
                     row_count += 1
 
-                    if len(rows) >= eff_batch:
+                    if len(rows) >= batch_size:
                         _insert_garnishment_batch(session, rows)
                         session.commit()
                         rows.clear()
@@ -1531,11 +1499,12 @@ def _insert_garnishment_batch(session: Session, rows: list[dict]) -> None:
     if not rows:
         return
     rows = _dedup_by_key(rows, "row_hash")
-    stmt = pg_insert(ClerkGarnishmentCase).values(rows)
-    stmt = stmt.on_conflict_do_nothing(
-        index_elements=[ClerkGarnishmentCase.row_hash],
+    copy_upsert(
+        session,
+        ClerkGarnishmentCase,
+        rows,
+        conflict_columns=["row_hash"],
     )
-    session.execute(stmt)
 
 
 # ---------------------------------------------------------------------------
@@ -1688,7 +1657,6 @@ def load_official_records_daily(
 
                 rows: list[dict] = []
                 row_count = 0
-                eff_batch = batch_size
                 with d_path.open("r", encoding="utf-8-sig", errors="replace") as f:
                     for raw in f:
                         line = raw.strip()
@@ -1733,12 +1701,9 @@ def load_official_records_daily(
                             "loaded_at": _utc_now(),
                         }
 
-                        if row_count == 0:
-                            eff_batch = _effective_batch_size(batch_size, len(mapped))
-
                         rows.append(mapped)
                         row_count += 1
-                        if len(rows) >= eff_batch:
+                        if len(rows) >= batch_size:
                             _upsert_official_records_batch(session, rows)
                             session.commit()
                             rows.clear()
@@ -1771,17 +1736,16 @@ def _upsert_official_records_batch(session: Session, rows: list[dict]) -> None:
     if not rows:
         return
     rows = _dedup_by_key(rows, "instrument_number")
-    stmt = pg_insert(OfficialRecordsDailyInstrument).values(rows)
-    update_cols = {
-        col.name: getattr(stmt.excluded, col.name)
-        for col in OfficialRecordsDailyInstrument.__table__.columns
-        if col.name not in {"id", "instrument_number"}
-    }
-    stmt = stmt.on_conflict_do_update(
-        constraint="uq_official_records_daily_instruments_instrument",
-        set_=update_cols,
+    copy_upsert(
+        session,
+        OfficialRecordsDailyInstrument,
+        rows,
+        conflict_constraint="uq_official_records_daily_instruments_instrument",
+        update=excluded_updates(
+            OfficialRecordsDailyInstrument,
+            exclude={"id", "instrument_number"},
+        ),
     )
-    session.execute(stmt)
 
 
 # ---------------------------------------------------------------------------
@@ -1866,9 +1830,6 @@ def load_civil_alpha_index(
                 party_rows: list[dict] = []
                 row_count = 0
                 skipped = 0
-                # Compute effective batch sizes once we see column counts
-                eff_case_batch = batch_size
-                eff_party_batch = batch_size
 
                 for pipe_row in _iter_pipe_delimited(path):
                     ucn = _clean_text(pipe_row.get("Uniform Case Number"))
@@ -1901,9 +1862,6 @@ def load_civil_alpha_index(
                         "loaded_at": _utc_now(),
                     }
 
-                    if row_count == 0:
-                        eff_case_batch = _effective_batch_size(batch_size, len(case_mapped))
-
                     case_rows.append(case_mapped)
 
                     # --- Party upsert row ---
@@ -1950,20 +1908,17 @@ def load_civil_alpha_index(
                         "loaded_at": _utc_now(),
                     }
 
-                    if row_count == 0:
-                        eff_party_batch = _effective_batch_size(batch_size, len(party_mapped))
-
                     party_rows.append(party_mapped)
                     row_count += 1
 
                     # Flush case batches
-                    if len(case_rows) >= eff_case_batch:
+                    if len(case_rows) >= batch_size:
                         _upsert_alpha_cases_batch(session, case_rows)
                         session.commit()
                         case_rows.clear()
 
                     # Flush party batches
-                    if len(party_rows) >= eff_party_batch:
+                    if len(party_rows) >= batch_size:
                         _upsert_alpha_parties_batch(session, party_rows)
                         session.commit()
                         party_rows.clear()
@@ -2017,23 +1972,29 @@ def _upsert_alpha_cases_batch(session: Session, rows: list[dict]) -> None:
     if not rows:
         return
     rows = _dedup_alpha_cases(rows)
-    stmt = pg_insert(ClerkCivilCase).values(rows)
-    stmt = stmt.on_conflict_do_update(
-        index_elements=[ClerkCivilCase.case_number],
-        set_={
-            "ucn": stmt.excluded.ucn,
-            "case_type": sa_text("COALESCE(clerk_civil_cases.case_type, EXCLUDED.case_type)"),
-            "division": sa_text("COALESCE(clerk_civil_cases.division, EXCLUDED.division)"),
-            "judge": sa_text("COALESCE(clerk_civil_cases.judge, EXCLUDED.judge)"),
-            "case_status": sa_text("COALESCE(clerk_civil_cases.case_status, EXCLUDED.case_status)"),
-            "filing_date": sa_text("COALESCE(clerk_civil_cases.filing_date, EXCLUDED.filing_date)"),
-            "is_foreclosure": sa_text("COALESCE(clerk_civil_cases.is_foreclosure, EXCLUDED.is_foreclosure)"),
-            "court_type": sa_text("COALESCE(clerk_civil_cases.court_type, EXCLUDED.court_type)"),
-            "status_date": sa_text("COALESCE(clerk_civil_cases.status_date, EXCLUDED.status_date)"),
-            "loaded_at": stmt.excluded.loaded_at,
+    copy_upsert(
+        session,
+        ClerkCivilCase,
+        rows,
+        conflict_columns=["case_number"],
+        update={
+            "ucn": 'EXCLUDED."ucn"',
+            **coalesce_updates(
+                ClerkCivilCase,
+                [
+                    "case_type",
+                    "division",
+                    "judge",
+                    "case_status",
+                    "filing_date",
+                    "is_foreclosure",
+                    "court_type",
+                    "status_date",
+                ],
+            ),
+            "loaded_at": 'EXCLUDED."loaded_at"',
         },
     )
-    session.execute(stmt)
 
 
 def _dedup_alpha_parties(rows: list[dict]) -> list[dict]:
@@ -2053,30 +2014,36 @@ def _upsert_alpha_parties_batch(session: Session, rows: list[dict]) -> None:
     if not rows:
         return
     rows = _dedup_alpha_parties(rows)
-    stmt = pg_insert(ClerkCivilParty).values(rows)
-    stmt = stmt.on_conflict_do_update(
-        constraint="uq_clerk_parties_case_type_name",
-        set_={
-            "first_name": sa_text("COALESCE(clerk_civil_parties.first_name, EXCLUDED.first_name)"),
-            "middle_name": sa_text("COALESCE(clerk_civil_parties.middle_name, EXCLUDED.middle_name)"),
-            "last_name": sa_text("COALESCE(clerk_civil_parties.last_name, EXCLUDED.last_name)"),
-            "suffix": sa_text("COALESCE(clerk_civil_parties.suffix, EXCLUDED.suffix)"),
-            "business_name": sa_text("COALESCE(clerk_civil_parties.business_name, EXCLUDED.business_name)"),
-            "address1": sa_text("COALESCE(clerk_civil_parties.address1, EXCLUDED.address1)"),
-            "address2": sa_text("COALESCE(clerk_civil_parties.address2, EXCLUDED.address2)"),
-            "city": sa_text("COALESCE(clerk_civil_parties.city, EXCLUDED.city)"),
-            "state": sa_text("COALESCE(clerk_civil_parties.state, EXCLUDED.state)"),
-            "zip": sa_text("COALESCE(clerk_civil_parties.zip, EXCLUDED.zip)"),
-            "disposition_code": sa_text("COALESCE(clerk_civil_parties.disposition_code, EXCLUDED.disposition_code)"),
-            "disposition_desc": sa_text("COALESCE(clerk_civil_parties.disposition_desc, EXCLUDED.disposition_desc)"),
-            "disposition_date": sa_text("COALESCE(clerk_civil_parties.disposition_date, EXCLUDED.disposition_date)"),
-            "amount_paid": sa_text("COALESCE(clerk_civil_parties.amount_paid, EXCLUDED.amount_paid)"),
-            "date_paid": sa_text("COALESCE(clerk_civil_parties.date_paid, EXCLUDED.date_paid)"),
-            "akas": sa_text("COALESCE(clerk_civil_parties.akas, EXCLUDED.akas)"),
-            "loaded_at": stmt.excluded.loaded_at,
+    copy_upsert(
+        session,
+        ClerkCivilParty,
+        rows,
+        conflict_constraint="uq_clerk_parties_case_type_name",
+        update={
+            **coalesce_updates(
+                ClerkCivilParty,
+                [
+                    "first_name",
+                    "middle_name",
+                    "last_name",
+                    "suffix",
+                    "business_name",
+                    "address1",
+                    "address2",
+                    "city",
+                    "state",
+                    "zip",
+                    "disposition_code",
+                    "disposition_desc",
+                    "disposition_date",
+                    "amount_paid",
+                    "date_paid",
+                    "akas",
+                ],
+            ),
+            "loaded_at": 'EXCLUDED."loaded_at"',
         },
     )
-    session.execute(stmt)
 
 
 # ---------------------------------------------------------------------------
@@ -2158,7 +2125,6 @@ def load_clerk_criminal_name_index(
                 rows: list[dict] = []
                 row_count = 0
                 skipped = 0
-                eff_batch = batch_size
 
                 for pipe_row in _iter_pipe_delimited(path):
                     ucn = _clean_text(pipe_row.get("Uniform Case Number"))
@@ -2218,13 +2184,10 @@ def load_clerk_criminal_name_index(
                         "loaded_at": _utc_now(),
                     }
 
-                    if row_count == 0:
-                        eff_batch = _effective_batch_size(batch_size, len(mapped))
-
                     rows.append(mapped)
                     row_count += 1
 
-                    if len(rows) >= eff_batch:
+                    if len(rows) >= batch_size:
                         _insert_criminal_name_index_batch(session, rows)
                         session.commit()
                         rows.clear()
@@ -2279,11 +2242,12 @@ def _insert_criminal_name_index_batch(session: Session, rows: list[dict]) -> Non
         }
         for row in _dedup_criminal_name_index(rows)
     ]
-    stmt = pg_insert(ClerkCriminalNameIndex).values(rows)
-    stmt = stmt.on_conflict_do_nothing(
-        constraint="uq_clerk_crim_ni_ucn_count_disp"
+    copy_upsert(
+        session,
+        ClerkCriminalNameIndex,
+        rows,
+        conflict_constraint="uq_clerk_crim_ni_ucn_count_disp",
     )
-    session.execute(stmt)
 
 
 # ---------------------------------------------------------------------------
@@ -19,6 +19,14 @@ Notes
 - Per-site delay profiles are defined in ``DELAY_PROFILES``.
 - Each site gets a random delay between requests (e.g. 15-55s for Realtor),
   with a longer backoff (3-5 min) after consecutive 429s.
+- ``site_lanes`` (``--site-lanes``) runs several fetch lanes per site, each
+  with its own pacing (and, for Redfin, its own browser profile); the backoff
+  is shared by a site's lanes and never touches the other sites.
+- A site that keeps failing through ``SITE_BAN_AFTER_BACKOFFS`` backoffs is
+  treated as banned: its loop stops so Phase 2 is not held up, and the ban is
+  checkpointed in ``SITE_STATE_PATH`` so later runs skip the site until
+  ``SITE_BAN_COOLDOWN`` has passed.  Per-site progress is checkpointed in the
+  same file; scraped rows themselves are committed per property.
 - If Scrapling is unavailable or a specific fetch fails, failures are surfaced in
   logs and reflected in the result payload rather than silently ignored.
 """
@@ -27,11 +35,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import datetime as dt
 import importlib
 import random
 import inspect
 import json
 import re
+from collections import deque
 from pathlib import Path
 from typing import Any
 import bs4
@@ -41,7 +51,7 @@ from sqlalchemy import text
 from src.services.market_data_service import MarketDataService
 from src.scripts.refresh_foreclosures import refresh as refresh_foreclosures
 from src.utils.step_result import is_failed_payload
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from sunbiz.db import get_engine, resolve_pg_dsn
 
@@ -50,6 +60,11 @@ _REALTOR_SOURCE = "realtor"
 _REDFIN_SOURCE = "redfin"
 _ZILLOW_SOURCE = "zillow"
 
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+SITE_STATE_PATH = _PROJECT_ROOT / "data" / "market_data" / "scrapling_sites.json"
+SITE_BAN_AFTER_BACKOFFS = 3
+SITE_BAN_COOLDOWN = dt.timedelta(hours=6)
+
 
 @dataclass(frozen=True)
 class SiteDelayProfile:
@@ -69,6 +84,27 @@ DELAY_PROFILES: dict[str, SiteDelayProfile] = {
 }
 
 
+@dataclass
+class _SiteRun:
+    """Shared progress and pacing state for one site's fetch lanes."""
+
+    site: str
+    profile: SiteDelayProfile
+    total: int
+    queue: deque[tuple[int, dict[str, Any]]] = field(default_factory=deque)
+    attempted: int = 0
+    matched: int = 0
+    save_errors: int = 0
+    consecutive_failures: int = 0
+    backoffs_without_success: int = 0
+    resume_at: float = 0.0
+    blocked: bool = False
+
+    @property
+    def label(self) -> str:
+        return self.site.capitalize()
+
+
 def _query_properties_needing_market(
     dsn: str,
     limit: int | None = None,
@@ -141,6 +177,10 @@ class _MissingScraplingError(RuntimeError):
 class PgMarketDataScraplingService(MarketDataService):
     """Market-data service that augments existing behavior with Scrapling."""
 
+    site_lanes: int = 1
+    _site_state_path: Path | None = None
+    _scrapling_blocked: dict[str, str] | None = None
+
     def __init__(
         self,
         dsn: str | None = None,
@@ -148,16 +188,19 @@ class PgMarketDataScraplingService(MarketDataService):
         use_windows_chrome: bool = False,
         headless: bool = False,
         force: bool = False,
+        site_lanes: int = 1,
+        site_state_path: Path | None = SITE_STATE_PATH,
     ) -> None:
         super().__init__(dsn=dsn, use_windows_chrome=use_windows_chrome)
         self._headless = headless
         self._force = force
+        self.site_lanes = max(1, int(site_lanes))
+        self._site_state_path = site_state_path
         self._enrichment_state_failures = 0
         self._enrichment_state_failure_straps: list[str] = []
 
         # Persistent Chrome profile (preserves cookies/login state for Redfin etc.)
-        _project_root = Path(__file__).resolve().parent.parent.parent
-        profile_path = _project_root / "data" / "browser_profiles" / "user_chrome"
+        profile_path = _PROJECT_ROOT / "data" / "browser_profiles" / "user_chrome"
         profile_path.mkdir(parents=True, exist_ok=True)
         self._redfin_profile_dir = str(profile_path)
 
@@ -1424,16 +1467,8 @@ class PgMarketDataScraplingService(MarketDataService):
         scroll: bool = False,
     ) -> tuple[int, int]:
         """Generic per-site scraping loop with delay profile and progress reporting."""
-        if not properties:
-            return 0, 0
-
-        profile = DELAY_PROFILES.get(site, DELAY_PROFILES["realtor"])
-        matched = 0
-        attempted = 0
-        consecutive_failures = 0
-        save_errors = 0
 
-        for i, prop in enumerate(properties):
+        async def scrape_one(prop: dict[str, Any], _lane: int) -> str:
             strap = prop.get("strap", "")
             folio = prop.get("folio")
             case_number = prop.get("case_number", "") or ""
@@ -1441,38 +1476,13 @@ class PgMarketDataScraplingService(MarketDataService):
             city = (prop.get("property_city") or "").strip()
             zip_code = (prop.get("property_zip") or "").strip()
 
-            if not strap or not address or address.lower() in {"unknown", "n/a", "none"}:
-                self._mark_source_attempted(strap, folio, case_number, site)
-                continue
-
-            # Delay between requests (skip first)
-            if i > 0:
-                if consecutive_failures >= profile.backoff_after:
-                    backoff = random.uniform(profile.backoff_min, profile.backoff_max)  # noqa: S311
-                    logger.warning(
-                        "{} scrapling: {} consecutive failures — backing off {:.0f}s",
-                        site.capitalize(), consecutive_failures, backoff,
-                    )
-                    await asyncio.sleep(backoff)
-                    consecutive_failures = 0
-                else:
-                    delay = random.uniform(profile.delay_min, profile.delay_max)  # noqa: S311
-                    logger.debug("{} scrapling: waiting {:.0f}s", site.capitalize(), delay)
-                    await asyncio.sleep(delay)
-
-            logger.info("{} scrapling [{}/{}]: '{}'", site.capitalize(), i + 1, len(properties), address)
-            attempted += 1
-
             try:
                 url = url_builder(address, city=city, zip_code=zip_code)
                 final_url, html = await self._fetch_site_html(url, scroll=scroll)
             except Exception:
                 logger.exception("{} scrapling fetch failed for {}", site.capitalize(), address)
                 self._mark_source_attempted(strap, folio, case_number, site)
-                consecutive_failures += 1
-                if attempted % 10 == 0:
-                    logger.info("{} scrapling progress: {}/{} attempted, {} matched", site.capitalize(), attempted, len(properties), matched)
-                continue
+                return "failed"
 
             # Detect homepage redirects — the site didn't block us, it just
             # couldn't resolve the address slug and bounced to the homepage.
@@ -1484,8 +1494,7 @@ class PgMarketDataScraplingService(MarketDataService):
                     url,
                 )
                 self._mark_source_attempted(strap, folio, case_number, site)
-                consecutive_failures += 1
-                continue
+                return "failed"
 
             if self._html_looks_blocked(html):
                 logger.warning(
@@ -1494,19 +1503,12 @@ class PgMarketDataScraplingService(MarketDataService):
                     address,
                 )
                 self._mark_source_attempted(strap, folio, case_number, site)
-                consecutive_failures += 1
-                if attempted % 10 == 0:
-                    logger.info("{} scrapling progress: {}/{} attempted, {} matched", site.capitalize(), attempted, len(properties), matched)
-                continue
-
-            consecutive_failures = 0
+                return "failed"
 
             payload = html_parser(html, address, url)
             if not payload or not is_useful_fn(payload):
                 self._mark_source_attempted(strap, folio, case_number, site)
-                if attempted % 10 == 0:
-                    logger.info("{} scrapling progress: {}/{} attempted, {} matched", site.capitalize(), attempted, len(properties), matched)
-                continue
+                return "missed"
 
             if not self._payload_matches_query(site, address, payload):
                 self._mark_source_attempted(strap, folio, case_number, site)
@@ -1517,22 +1519,185 @@ class PgMarketDataScraplingService(MarketDataService):
                     payload.get("detail_url"),
                     payload.get("address"),
                 )
-                if attempted % 10 == 0:
-                    logger.info("{} scrapling progress: {}/{} attempted, {} matched", site.capitalize(), attempted, len(properties), matched)
-                continue
+                return "missed"
 
             if upsert_fn(strap, folio, case_number, payload):
-                matched += 1
                 logger.success("{} scrapling: saved for {}", site.capitalize(), strap)
+                return "matched"
+            logger.warning("{} scrapling: persist failed for {}", site.capitalize(), strap)
+            return "save_error"
+
+        return await self._drive_site(site, properties, scrape_one)
+
+    async def _drive_site(self, site: str, properties: list[dict[str, Any]], scrape_one) -> tuple[int, int]:
+        """Run ``scrape_one`` over ``properties`` on ``site_lanes`` paced lanes.
+
+        ``scrape_one(prop, lane)`` returns ``"failed"`` (counts toward the
+        backoff), ``"missed"``, ``"matched"`` or ``"save_error"``.  Returns
+        ``(matched, save_errors)``.
+        """
+        if not properties:
+            return 0, 0
+
+        run = _SiteRun(
+            site=site,
+            profile=DELAY_PROFILES.get(site, DELAY_PROFILES["realtor"]),
+            total=len(properties),
+            queue=deque(enumerate(properties)),
+        )
+        lanes = max(1, min(int(self.site_lanes or 1), len(properties)))
+        if lanes > 1:
+            logger.info("{} scrapling: {} lanes for {} properties", run.label, lanes, run.total)
+        self._save_site_checkpoint(run, "running")
+        await asyncio.gather(*(self._site_lane(run, scrape_one, lane) for lane in range(lanes)))
+
+        if run.blocked:
+            until = dt.datetime.now(dt.UTC) + SITE_BAN_COOLDOWN
+            logger.error(
+                "{} scrapling: still failing after {} backoffs — stopping with {} properties left; "
+                "skipping {} until {}",
+                run.label,
+                SITE_BAN_AFTER_BACKOFFS,
+                len(run.queue),
+                site,
+                until.isoformat(timespec="seconds"),
+            )
+            self._save_site_checkpoint(run, "blocked", blocked_until=until)
+            if self._scrapling_blocked is not None:
+                self._scrapling_blocked[site] = until.isoformat(timespec="seconds")
+        else:
+            self._save_site_checkpoint(run, "complete")
+        logger.info("{} scrapling complete: {}/{} matched", run.label, run.matched, run.attempted)
+        return run.matched, run.save_errors
+
+    async def _site_lane(self, run: _SiteRun, scrape_one, lane: int) -> None:
+        """One fetch lane: pull properties off the site queue with its own pacing."""
+        paced = False
+        while run.queue and not run.blocked:
+            i, prop = run.queue.popleft()
+            strap = prop.get("strap", "")
+            address = (prop.get("property_address") or "").strip()
+            if not strap or not address or address.lower() in {"unknown", "n/a", "none"}:
+                self._mark_source_attempted(strap, prop.get("folio"), prop.get("case_number", "") or "", run.site)
+                continue
+
+            # Delay between requests (skip the lane's first)
+            if paced:
+                await self._site_pause(run)
+                if run.blocked:
+                    run.queue.appendleft((i, prop))
+                    return
+            paced = True
+
+            logger.info("{} scrapling [{}/{}]: '{}'", run.label, i + 1, run.total, address)
+            run.attempted += 1
+            outcome = await scrape_one(prop, lane)
+            if outcome == "failed":
+                run.consecutive_failures += 1
             else:
-                save_errors += 1
-                logger.warning("{} scrapling: persist failed for {}", site.capitalize(), strap)
+                run.consecutive_failures = 0
+                run.backoffs_without_success = 0
+                if outcome == "matched":
+                    run.matched += 1
+                elif outcome == "save_error":
+                    run.save_errors += 1
+
+            if run.attempted % 10 == 0:
+                logger.info(
+                    "{} scrapling progress: {}/{} attempted, {} matched",
+                    run.label,
+                    run.attempted,
+                    run.total,
+                    run.matched,
+                )
+                self._save_site_checkpoint(run, "running")
 
-            if attempted % 10 == 0:
-                logger.info("{} scrapling progress: {}/{} attempted, {} matched", site.capitalize(), attempted, len(properties), matched)
+    async def _site_pause(self, run: _SiteRun) -> None:
+        """Sleep before a lane's next request; back off (or trip the ban) on failures.
 
-        logger.info("{} scrapling complete: {}/{} matched", site.capitalize(), matched, attempted)
-        return matched, save_errors
+        The ban trips on the failure streak that would start backoff number
+        ``SITE_BAN_AFTER_BACKOFFS + 1``, i.e. after that many full backoffs
+        have passed without a single success.
+        """
+        profile = run.profile
+        loop = asyncio.get_running_loop()
+        if run.consecutive_failures >= profile.backoff_after:
+            run.backoffs_without_success += 1
+            if run.backoffs_without_success > SITE_BAN_AFTER_BACKOFFS:
+                run.blocked = True
+                return
+            backoff = random.uniform(profile.backoff_min, profile.backoff_max)  # noqa: S311
+            logger.warning(
+                "{} scrapling: {} consecutive failures — backing off {:.0f}s",
+                run.label,
+                run.consecutive_failures,
+                backoff,
+            )
+            run.consecutive_failures = 0
+            run.resume_at = loop.time() + backoff
+            await asyncio.sleep(backoff)
+            return
+        delay = random.uniform(profile.delay_min, profile.delay_max)  # noqa: S311
+        # Another lane's backoff holds every lane of this site.
+        delay = max(delay, run.resume_at - loop.time())
+        logger.debug("{} scrapling: waiting {:.0f}s", run.label, delay)
+        await asyncio.sleep(delay)
+
+    # ------------------------------------------------------------------
+    # Per-site checkpoint
+    # ------------------------------------------------------------------
+
+    def _load_site_state(self) -> dict[str, dict[str, Any]]:
+        path = self._site_state_path
+        if path is None or not path.exists():
+            return {}
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable scrapling site state {}: {}", path, exc)
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _save_site_checkpoint(
+        self,
+        run: _SiteRun,
+        status: str,
+        *,
+        blocked_until: dt.datetime | None = None,
+    ) -> None:
+        """Record one site's progress without touching the other sites' entries."""
+        path = self._site_state_path
+        if path is None:
+            return
+        state = self._load_site_state()
+        state[run.site] = {
+            "status": status,
+            "total": run.total,
+            "attempted": run.attempted,
+            "matched": run.matched,
+            "save_errors": run.save_errors,
+            "remaining": len(run.queue),
+            "blocked_until": blocked_until.isoformat() if blocked_until else None,
+            "updated_at": dt.datetime.now(dt.UTC).isoformat(),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(state, indent=2), encoding="utf-8")
+            tmp.replace(path)
+        except OSError as exc:
+            logger.warning("Failed to checkpoint scrapling site state for {}: {}", run.site, exc)
+
+    def _site_blocked_until(self, site: str) -> dt.datetime | None:
+        """Return the end of an active ban cooldown for ``site``, if any."""
+        raw = self._load_site_state().get(site, {}).get("blocked_until")
+        if not raw:
+            return None
+        try:
+            until = dt.datetime.fromisoformat(raw)
+        except (TypeError, ValueError):
+            return None
+        return until if until > dt.datetime.now(dt.UTC) else None
 
     # ------------------------------------------------------------------
     # Per-site runners (delegate to generic loop)
@@ -1553,51 +1718,32 @@ class PgMarketDataScraplingService(MarketDataService):
             is_useful_fn=self._is_useful_realtor_payload,
         )
 
+    def _redfin_profile_for_lane(self, lane: int) -> str | None:
+        """Chrome allows one browser per profile, so extra lanes get their own."""
+        base = getattr(self, "_redfin_profile_dir", None)
+        if not base or lane == 0:
+            return base
+        lane_dir = Path(f"{base}_lane{lane}")
+        lane_dir.mkdir(parents=True, exist_ok=True)
+        return str(lane_dir)
+
     async def _run_redfin_scrapling(self, properties: list[dict[str, Any]]) -> tuple[int, int]:
         """Redfin two-step scraping: Google lookup → fetch detail page.
 
         Redfin detail URLs require an internal home ID that cannot be
         constructed from address alone.  We resolve via Google search first.
         """
-        if not properties:
-            return 0, 0
 
-        profile = DELAY_PROFILES.get(_REDFIN_SOURCE, DELAY_PROFILES["realtor"])
-        matched = 0
-        attempted = 0
-        consecutive_failures = 0
-        save_errors = 0
         def is_useful(p: dict[str, Any]) -> bool:
             return any(p.get(k) for k in ("list_price", "zestimate", "beds", "sqft"))
 
-        for i, prop in enumerate(properties):
+        async def scrape_one(prop: dict[str, Any], lane: int) -> str:
             strap = prop.get("strap", "")
             folio = prop.get("folio")
             case_number = prop.get("case_number", "") or ""
             address = (prop.get("property_address") or "").strip()
             city = (prop.get("property_city") or "").strip()
 
-            if not strap or not address or address.lower() in {"unknown", "n/a", "none"}:
-                self._mark_source_attempted(strap, folio, case_number, _REDFIN_SOURCE)
-                continue
-
-            # Delay between requests (skip first)
-            if i > 0:
-                if consecutive_failures >= profile.backoff_after:
-                    backoff = random.uniform(profile.backoff_min, profile.backoff_max)  # noqa: S311
-                    logger.warning(
-                        "Redfin scrapling: {} consecutive failures — backing off {:.0f}s",
-                        consecutive_failures, backoff,
-                    )
-                    await asyncio.sleep(backoff)
-                    consecutive_failures = 0
-                else:
-                    delay = random.uniform(profile.delay_min, profile.delay_max)  # noqa: S311
-                    await asyncio.sleep(delay)
-
-            logger.info("Redfin scrapling [{}/{}]: '{}'", i + 1, len(properties), address)
-            attempted += 1
-
             # Step 1: Resolve real Redfin URL via Google
             try:
                 redfin_url = await self._resolve_redfin_url(address, city=city)
@@ -1608,10 +1754,7 @@ class PgMarketDataScraplingService(MarketDataService):
             if not redfin_url:
                 logger.debug("Redfin scrapling: no URL resolved for '{}'", address)
                 self._mark_source_attempted(strap, folio, case_number, _REDFIN_SOURCE)
-                consecutive_failures += 1
-                if attempted % 10 == 0:
-                    logger.info("Redfin scrapling progress: {}/{} attempted, {} matched", attempted, len(properties), matched)
-                continue
+                return "failed"
 
             # Brief pause between Google lookup and detail fetch
             await asyncio.sleep(random.uniform(2, 5))  # noqa: S311
@@ -1619,8 +1762,9 @@ class PgMarketDataScraplingService(MarketDataService):
             # Step 2: Fetch the real detail page.
             try:
                 fetch_kwargs: dict[str, Any] = {"scroll": True}
-                if getattr(self, "_redfin_profile_dir", None):
-                    fetch_kwargs["user_data_dir"] = self._redfin_profile_dir
+                profile_dir = self._redfin_profile_for_lane(lane)
+                if profile_dir:
+                    fetch_kwargs["user_data_dir"] = profile_dir
                 _, html = await self._fetch_site_html(
                     redfin_url,
                     **fetch_kwargs,
@@ -1628,19 +1772,12 @@ class PgMarketDataScraplingService(MarketDataService):
             except Exception:
                 logger.exception("Redfin scrapling: fetch failed for {}", redfin_url)
                 self._mark_source_attempted(strap, folio, case_number, _REDFIN_SOURCE)
-                consecutive_failures += 1
-                if attempted % 10 == 0:
-                    logger.info("Redfin scrapling progress: {}/{} attempted, {} matched", attempted, len(properties), matched)
-                continue
-
-            consecutive_failures = 0
+                return "failed"
 
             payload = self._parse_redfin_html(html, address, redfin_url)
             if not payload or not is_useful(payload):
                 self._mark_source_attempted(strap, folio, case_number, _REDFIN_SOURCE)
-                if attempted % 10 == 0:
-                    logger.info("Redfin scrapling progress: {}/{} attempted, {} matched", attempted, len(properties), matched)
-                continue
+                return "missed"
 
             if not self._payload_matches_query(_REDFIN_SOURCE, address, payload):
                 self._mark_source_attempted(strap, folio, case_number, _REDFIN_SOURCE)
@@ -1650,27 +1787,15 @@ class PgMarketDataScraplingService(MarketDataService):
                     payload.get("detail_url"),
                     payload.get("address"),
                 )
-                if attempted % 10 == 0:
-                    logger.info(
-                        "Redfin scrapling progress: {}/{} attempted, {} matched",
-                        attempted,
-                        len(properties),
-                        matched,
-                    )
-                continue
+                return "missed"
 
             if self._upsert_redfin(strap, folio, case_number, payload):
-                matched += 1
                 logger.success("Redfin scrapling: saved for {}", strap)
-            else:
-                save_errors += 1
-                logger.warning("Redfin scrapling: persist failed for {}", strap)
-
-            if attempted % 10 == 0:
-                logger.info("Redfin scrapling progress: {}/{} attempted, {} matched", attempted, len(properties), matched)
+                return "matched"
+            logger.warning("Redfin scrapling: persist failed for {}", strap)
+            return "save_error"
 
-        logger.info("Redfin scrapling complete: {}/{} matched", matched, attempted)
-        return matched, save_errors
+        return await self._drive_site(_REDFIN_SOURCE, properties, scrape_one)
 
     async def _run_zillow_scrapling(self, properties: list[dict[str, Any]]) -> tuple[int, int]:
         return await self._run_site_loop(
@@ -1727,6 +1852,7 @@ class PgMarketDataScraplingService(MarketDataService):
         scrapling_errors = 0
         self._enrichment_state_failures = 0
         self._enrichment_state_failure_straps = []
+        self._scrapling_blocked = {}
 
         # Phase 1: Run scrapling-backed enrichment for all supported sites
         # concurrently before the heavy browser phase.
@@ -1749,6 +1875,16 @@ class PgMarketDataScraplingService(MarketDataService):
             if not site_props:
                 logger.info("Scrapling {}: all properties already have data", site)
                 continue
+            blocked_until = None if self._force else self._site_blocked_until(site)
+            if blocked_until is not None:
+                logger.warning(
+                    "Scrapling {}: skipped, banned until {} ({} properties wait)",
+                    site,
+                    blocked_until.isoformat(timespec="seconds"),
+                    len(site_props),
+                )
+                self._scrapling_blocked[site] = blocked_until.isoformat(timespec="seconds")
+                continue
             logger.info("Scrapling {}: {} properties need data", site, len(site_props))
             tasks.append(asyncio.create_task(self._safe_site_run(site, runner, site_props)))
             task_sites.append(site)
@@ -1777,6 +1913,10 @@ class PgMarketDataScraplingService(MarketDataService):
             summary["scrapling_errors"] = scrapling_errors
             summary["degraded"] = True
             summary["status"] = "degraded"
+        if self._scrapling_blocked:
+            summary["scrapling_blocked"] = dict(self._scrapling_blocked)
+            summary["degraded"] = True
+            summary["status"] = "degraded"
         enrichment_state_failures = int(
             getattr(self, "_enrichment_state_failures", 0) or 0
         )
@@ -1812,6 +1952,7 @@ def run_market_data_update(
     limit: int | None = None,
     use_windows_chrome: bool = False,
     force: bool = False,
+    site_lanes: int = 1,
 ) -> dict[str, Any]:
     """Drop-in wrapper mirroring ``market_data_worker.run_market_data_update``."""
     resolved_dsn = resolve_pg_dsn(dsn)
@@ -1821,7 +1962,12 @@ def run_market_data_update(
 
     logger.info("Scrapling market worker: {} foreclosures need market data", len(properties))
 
-    service = PgMarketDataScraplingService(dsn=resolved_dsn, use_windows_chrome=use_windows_chrome, force=force)
+    service = PgMarketDataScraplingService(
+        dsn=resolved_dsn,
+        use_windows_chrome=use_windows_chrome,
+        force=force,
+        site_lanes=site_lanes,
+    )
     result = asyncio.run(service.run_batch(properties))
     if result.get("error"):
         return {
@@ -1854,9 +2000,20 @@ def main() -> None:
     parser.add_argument("--use-windows-chrome", action="store_true", help="Compat flag")
     parser.add_argument("--limit", type=int, default=None, help="Max properties to process")
     parser.add_argument("--force", action="store_true", help="Re-scrape even if data already exists")
+    parser.add_argument(
+        "--site-lanes",
+        type=int,
+        default=1,
+        help="Concurrent fetch lanes per site, each paced independently (default 1)",
+    )
     args = parser.parse_args()
 
-    result = run_market_data_update(limit=args.limit, use_windows_chrome=args.use_windows_chrome, force=args.force)
+    result = run_market_data_update(
+        limit=args.limit,
+        use_windows_chrome=args.use_windows_chrome,
+        force=args.force,
+        site_lanes=max(1, int(args.site_lanes)),
+    )
     logger.info("Scrapling market worker complete: {}", result)
     print(json.dumps(result, indent=2, default=str))
     if is_failed_payload(result):
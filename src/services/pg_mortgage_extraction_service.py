@@ -15,7 +15,6 @@ warnings.warn(
 )
 
 import asyncio
-import contextlib
 import json
 import time
 import urllib.parse
@@ -232,44 +231,29 @@ class PgMortgageExtractionService:
             except Exception as e:
                 logger.warning(f"Bad mortgage cache file {cache_path}, re-extracting: {e}")
 
-        # 4. Render PDF pages to images and extract via Vision
-        #    VisionService expects image paths, not PDF paths
+        # 4. Render PDF pages in memory and extract via Vision
         #    (same pattern as FinalJudgmentProcessor)
         logger.info(f"Extracting JSON via Vision for {instrument}...")
-        import fitz as _fitz
-        import tempfile as _tempfile
+        from src.services.pdf_render import iter_pdf_pages
 
-        page_images: list[str] = []
         result = None
-        try:
-            doc = _fitz.open(str(pdf_path))
-            num_pages = min(len(doc), 3)  # Mortgages: first 3 pages have the key data
-            for page_num in range(num_pages):
-                pg = doc[page_num]
-                pix = pg.get_pixmap(dpi=150)
-                with _tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                    pix.save(tmp.name)
-                    page_images.append(tmp.name)
-            doc.close()
-
-            # Extract from each page, merge results
-            for idx, img_path in enumerate(page_images):
-                if idx > 0:
-                    await asyncio.sleep(1)  # Pace API calls without blocking the event loop
-                page_result = self.vision.extract_json(img_path, MORTGAGE_PROMPT)
-                if page_result:
-                    if result is None:
-                        result = page_result
-                    else:
-                        # Fill in missing fields from subsequent pages
-                        for k, v in page_result.items():
-                            if v and not result.get(k):
-                                result[k] = v
-        finally:
-            # Clean up temp images
-            for img_path in page_images:
-                with contextlib.suppress(OSError):
-                    Path(img_path).unlink(missing_ok=True)
+        # Mortgages: first 3 pages have the key data; render each one only
+        # when its turn comes so a single pixmap is alive at a time.
+        page_images = iter_pdf_pages(pdf_path, dpi=150, max_pages=3)
+
+        # Extract from each page, merge results
+        for idx, page_image in enumerate(page_images):
+            if idx > 0:
+                await asyncio.sleep(1)  # Pace API calls without blocking the event loop
+            page_result = self.vision.extract_json(page_image, MORTGAGE_PROMPT)
+            if page_result:
+                if result is None:
+                    result = page_result
+                else:
+                    # Fill in missing fields from subsequent pages
+                    for k, v in page_result.items():
+                        if v and not result.get(k):
+                            result[k] = v
 
         if not result:
             logger.warning(f"Vision extraction failed or returned NULL for {instrument}")
@@ -25,19 +25,28 @@ See docs/NOC_PERMIT_LINKING.md and docs/external/HYLAND_PAV_NOC_DISCOVERY.md.
 from __future__ import annotations
 
 import asyncio
+import copy
 import json
 import re
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 import requests
 from loguru import logger
 from sqlalchemy import text
 
-from src.services.pav_cache import pav_cache_get, pav_cache_put
+from src.services.pav_cache import (
+    PAV_CACHE_TTL_SECONDS,
+    configure_pav_cache,
+    pav_cache_get,
+    pav_cache_put,
+    pav_cache_stats,
+)
 from src.utils.legal_description import combine_legal_fields
 from src.utils.legal_description import legal_descriptions_match
 from src.utils.legal_description import parse_legal_description
@@ -52,6 +61,9 @@ from src.db.type_normalizer import (
 )
 from sunbiz.db import get_engine, resolve_pg_dsn
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 # Valid PG encumbrance_type_enum values
 _PG_ENCUMBRANCE_TYPES = frozenset({
     "mortgage",
@@ -169,6 +181,18 @@ _PAV_SPLIT_DEPTH = 6
 _PAV_TIMEOUT_SECONDS = 30
 _PAV_FULL_TEXT_TIMEOUT_SECONDS = 60
 _PAV_FULL_TEXT_RETRIES = 1
+# Process-wide PAV pacing shared by every PgOriService instance and thread.
+# Sequential runs rarely hit it; concurrent target workers queue behind it.
+_PAV_MAX_REQUESTS_PER_SECOND = 8.0
+# Default number of foreclosures discovered concurrently by ``run()``.
+_DEFAULT_TARGET_CONCURRENCY = 1
+# Approximate serialized size of the date-window results remembered for
+# sub-range reuse; least recently used (query, keywords) keys are dropped
+# beyond it.  A single window larger than the per-window cap is not kept.
+_PAV_RANGE_INDEX_BUDGET_BYTES = 64 * 1024 * 1024
+_PAV_RANGE_INDEX_MAX_WINDOW_BYTES = 4 * 1024 * 1024
+# Flat charge per truncated window and per key for tuple/dict overhead.
+_PAV_RANGE_INDEX_OVERHEAD_BYTES = 128
 
 _PAV_NOC_DOC_TYPE = "(NOC) NOTICE OF COMMENCEMENT"
 _PAV_NOC_DOC_TYPE_ID = 1138
@@ -383,6 +407,280 @@ def _format_mm_dd_yyyy(iso_date: str | None) -> str | None:
     return None
 
 
+# ------------------------------------------------------------------
+# PAV rate limiting
+# ------------------------------------------------------------------
+
+
+class _PavRateLimiter:
+    """Thread-safe minimum-interval pacing for outbound PAV requests."""
+
+    def __init__(self, max_per_second: float) -> None:
+        self._interval = 1.0 / max_per_second if max_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> float:
+        """Block until the caller may send one request; return seconds waited."""
+        if self._interval <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return max(wait, 0.0)
+
+
+_PAV_RATE_LIMITER = _PavRateLimiter(_PAV_MAX_REQUESTS_PER_SECOND)
+
+
+# ------------------------------------------------------------------
+# PAV request deduplication
+# ------------------------------------------------------------------
+
+
+@dataclass
+class _InFlightCall:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: dict[str, Any] | None = None
+
+
+class _PavSingleFlight:
+    """Share one in-flight PAV HTTP call between identical concurrent requests.
+
+    The first caller for a key (the leader) performs the request; callers that
+    arrive while it is running block on its event and receive a deep copy of
+    its result.  A leader that raises hands ``None`` to its followers, which
+    is what ``_post_pav`` returns after exhausted retries anyway.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, _InFlightCall] = {}
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], dict[str, Any] | None],
+    ) -> tuple[dict[str, Any] | None, bool]:
+        """Return ``(result, shared)``; ``shared`` is True for followers."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _InFlightCall()
+                self._calls[key] = call
+        if not leader:
+            call.done.wait()
+            return copy.deepcopy(call.result), True
+        try:
+            call.result = fn()
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+
+# ``(from, to, dated_docs, stored_at, size_bytes)``
+_PavWindow = tuple[date, date, list[tuple[str | None, dict[str, Any]]], float, int]
+
+
+@dataclass
+class _PavRangeEntry:
+    # ``(from, to, stored_at)`` for truncated windows
+    complete: list[_PavWindow] = field(default_factory=list)
+    truncated: list[tuple[date, date, float]] = field(default_factory=list)
+    size_bytes: int = 0
+
+
+class _PavRangeIndex:
+    """Remember date-window results per ``(QueryID, Keywords)`` for reuse.
+
+    A non-truncated response for ``[from, to]`` holds every matching document
+    in that window, so any narrower window can be answered by filtering its
+    docs on ``RecordDate``; several adjacent complete windows can be stitched
+    together the same way.  A truncated window also tells us that every
+    window containing it is truncated, so ``_pav_search`` can split straight
+    away instead of spending a call to rediscover that.
+
+    Docs are stored as ``(record_date_iso, doc)`` pairs.  A window containing
+    a doc without a parseable date is only reused when it lies entirely
+    inside the requested range, since the doc cannot be filtered safely.
+
+    Windows expire after ``ttl_seconds`` (the PAV response cache TTL), so a
+    long-lived worker never answers from results older than the cache
+    itself would serve.
+
+    Result sets vary from a handful of docs to thousands, so the index is
+    bounded by ``budget_bytes`` of approximate size (compact JSON length of
+    each window's docs) rather than by key count.  Windows larger than
+    ``max_window_bytes`` are not remembered at all.
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int,
+        max_window_bytes: int = _PAV_RANGE_INDEX_MAX_WINDOW_BYTES,
+        ttl_seconds: float = PAV_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._budget_bytes = budget_bytes
+        self._max_window_bytes = max_window_bytes
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _PavRangeEntry] = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def _resize(self, key: str, entry: _PavRangeEntry) -> None:
+        size = (
+            len(key)
+            + _PAV_RANGE_INDEX_OVERHEAD_BYTES * (1 + len(entry.truncated))
+            + sum(item[4] for item in entry.complete)
+        )
+        self._bytes += size - entry.size_bytes
+        entry.size_bytes = size
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size_bytes
+
+    def _evict(self) -> None:
+        while self._bytes > self._budget_bytes and self._entries:
+            self._drop(next(iter(self._entries)))
+
+    def _live_entry(self, key: str) -> _PavRangeEntry | None:
+        """Return the entry for ``key`` with expired windows dropped."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        cutoff = self._clock() - self._ttl_seconds
+        entry.complete = [item for item in entry.complete if item[3] > cutoff]
+        entry.truncated = [item for item in entry.truncated if item[2] > cutoff]
+        if not entry.complete and not entry.truncated:
+            self._drop(key)
+            return None
+        self._resize(key, entry)
+        return entry
+
+    def _entry(self, key: str) -> _PavRangeEntry:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _PavRangeEntry()
+            self._entries[key] = entry
+        else:
+            self._entries.move_to_end(key)
+        return entry
+
+    def record_complete(
+        self,
+        key: str,
+        from_date: date,
+        to_date: date,
+        dated_docs: list[tuple[str | None, dict[str, Any]]],
+    ) -> None:
+        size = len(json.dumps([doc for _, doc in dated_docs], separators=(",", ":"), default=str))
+        if size > self._max_window_bytes:
+            return
+        with self._lock:
+            self._live_entry(key)
+            entry = self._entry(key)
+            entry.complete = [
+                item
+                for item in entry.complete
+                if not (from_date <= item[0] and item[1] <= to_date)
+            ]
+            entry.complete.append(
+                (from_date, to_date, copy.deepcopy(dated_docs), self._clock(), size)
+            )
+            self._resize(key, entry)
+            self._evict()
+
+    def record_truncated(self, key: str, from_date: date, to_date: date) -> None:
+        with self._lock:
+            self._live_entry(key)
+            entry = self._entry(key)
+            if any(lo >= from_date and hi <= to_date for lo, hi, _ in entry.truncated):
+                return
+            entry.truncated = [
+                item for item in entry.truncated if not (from_date <= item[0] and item[1] <= to_date)
+            ]
+            entry.truncated.append((from_date, to_date, self._clock()))
+            self._resize(key, entry)
+            self._evict()
+
+    def known_truncated(self, key: str, from_date: date, to_date: date) -> bool:
+        """True when a previously truncated window lies inside ``[from, to]``."""
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None:
+                return False
+            return any(from_date <= lo and hi <= to_date for lo, hi, _ in entry.truncated)
+
+    def lookup(
+        self,
+        key: str,
+        from_date: date,
+        to_date: date,
+    ) -> list[dict[str, Any]] | None:
+        """Return docs for ``[from, to]`` if complete windows cover it, else None."""
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is None or not entry.complete:
+                return None
+            self._entries.move_to_end(key)
+            windows = sorted(entry.complete, key=lambda item: (item[0], -item[1].toordinal()))
+            lo_iso = from_date.isoformat()
+            hi_iso = to_date.isoformat()
+            cursor = from_date
+            chosen: list[_PavWindow] = []
+            idx = 0
+            while cursor <= to_date:
+                best: _PavWindow | None = None
+                while idx < len(windows) and windows[idx][0] <= cursor:
+                    if windows[idx][1] >= cursor and (best is None or windows[idx][1] > best[1]):
+                        best = windows[idx]
+                    idx += 1
+                if best is None:
+                    return None
+                chosen.append(best)
+                cursor = best[1] + timedelta(days=1)
+
+            docs: list[dict[str, Any]] = []
+            for win_from, win_to, dated_docs, _, _ in chosen:
+                inside = from_date <= win_from and win_to <= to_date
+                for record_iso, doc in dated_docs:
+                    if record_iso is None:
+                        if not inside:
+                            return None
+                    elif not lo_iso <= record_iso <= hi_iso:
+                        continue
+                    docs.append(doc)
+            return copy.deepcopy(docs)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_PAV_SINGLE_FLIGHT = _PavSingleFlight()
+_PAV_RANGE_INDEX = _PavRangeIndex(_PAV_RANGE_INDEX_BUDGET_BYTES)
+
+
+def _pav_request_key(endpoint: str, payload: dict[str, Any]) -> str:
+    return endpoint + ":" + json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
 # ------------------------------------------------------------------
 # Search queue item
 # ------------------------------------------------------------------
@@ -454,30 +752,77 @@ class _DiscoveryState:
 class PgOriService:
     """Search ORI for encumbrances, write to PG ori_encumbrances."""
 
-    def __init__(self, dsn: str | None = None) -> None:
+    def __init__(
+        self,
+        dsn: str | None = None,
+        *,
+        target_concurrency: int = _DEFAULT_TARGET_CONCURRENCY,
+    ) -> None:
         self.dsn = resolve_pg_dsn(dsn)
         self.engine = get_engine(self.dsn)
-        self._pav_session = requests.Session()
-        self._pav_session.headers.update(_PAV_HEADERS)
+        self.target_concurrency = max(1, int(target_concurrency))
+        configure_pav_cache(self.dsn)
+        # Per-thread state: the PAV session and the "last call" stats that
+        # _save_documents/_infer_from_judgment hand back to _process_target.
+        # Keeping them thread-local lets several targets run concurrently
+        # without reading each other's stats.
+        self._thread_state = threading.local()
         self._official_noc_coverage_start_cache: date | None = None
-        self._last_save_documents_stats = {
-            "saved": 0,
-            "skipped": 0,
-            "eligible": 0,
-        }
-        self._last_infer_from_judgment_stats = {
-            "saved": 0,
-            "reason": "not_run",
-        }
 
-    def run(self, *, limit: int | None = None) -> dict[str, Any]:
-        """Find foreclosures needing ORI search, run searches, save to PG."""
+    @property
+    def _pav_session(self) -> requests.Session:
+        session = getattr(self._thread_state, "pav_session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(_PAV_HEADERS)
+            self._thread_state.pav_session = session
+        return session
+
+    @_pav_session.setter
+    def _pav_session(self, session: requests.Session) -> None:
+        self._thread_state.pav_session = session
+
+    @property
+    def _last_save_documents_stats(self) -> dict[str, int]:
+        stats = getattr(self._thread_state, "last_save_documents_stats", None)
+        if stats is None:
+            stats = {"saved": 0, "skipped": 0, "eligible": 0}
+            self._thread_state.last_save_documents_stats = stats
+        return stats
+
+    @_last_save_documents_stats.setter
+    def _last_save_documents_stats(self, stats: dict[str, int]) -> None:
+        self._thread_state.last_save_documents_stats = stats
+
+    @property
+    def _last_infer_from_judgment_stats(self) -> dict[str, Any]:
+        stats = getattr(self._thread_state, "last_infer_from_judgment_stats", None)
+        if stats is None:
+            stats = {"saved": 0, "reason": "not_run"}
+            self._thread_state.last_infer_from_judgment_stats = stats
+        return stats
+
+    @_last_infer_from_judgment_stats.setter
+    def _last_infer_from_judgment_stats(self, stats: dict[str, Any]) -> None:
+        self._thread_state.last_infer_from_judgment_stats = stats
+
+    def run(
+        self,
+        *,
+        limit: int | None = None,
+        concurrency: int | None = None,
+    ) -> dict[str, Any]:
+        """Find foreclosures needing ORI search, run searches, save to PG.
+
+        ``concurrency`` overrides ``target_concurrency`` for this run; values
+        above 1 discover that many foreclosures at once on worker threads.
+        """
         targets = self._find_targets(limit)
         if not targets:
             return {"skipped": True, "reason": "no_foreclosures_need_ori"}
 
         logger.info(f"ORI search: {len(targets)} foreclosures to process")
-        return asyncio.run(self._search_all(targets))
+        return asyncio.run(self._search_all(targets, concurrency=concurrency))
 
     def run_lis_pendens_backfill(
         self,
@@ -2133,43 +2478,53 @@ class PgOriService:
     # Search orchestration
     # ------------------------------------------------------------------
 
-    async def _search_all(self, targets: list[dict]) -> dict[str, Any]:
-        total_docs = 0
-        total_saved = 0
-        total_inferred = 0
-        errors = 0
-        total_api_calls = 0
-        total_retries = 0
-        total_truncated = 0
-        total_unresolved_truncations = 0
-        total_official_seed_docs = 0
-        total_save_skips = 0
-        total_staged_targets = 0
-        total_search_marks = 0
+    async def _search_all(
+        self,
+        targets: list[dict],
+        *,
+        concurrency: int | None = None,
+    ) -> dict[str, Any]:
+        """Run ``_process_target`` for every target and aggregate the stats.
+
+        With ``concurrency == 1`` targets run inline, one after another.  With
+        a higher value each target runs on a worker thread via
+        ``asyncio.to_thread`` behind a semaphore, so one slow PAV party search
+        no longer stalls the whole step.  Every target builds its own
+        ``_DiscoveryState`` inside ``_discover_property``; the only shared
+        pieces are the DB engine pool and the PAV access layer
+        (``_PAV_RATE_LIMITER``, ``_PAV_SINGLE_FLIGHT``, ``_PAV_RANGE_INDEX``
+        and the response cache).
+        """
+        workers = max(1, int(concurrency or self.target_concurrency))
+        totals = {
+            "total_documents_found": 0,
+            "encumbrances_saved": 0,
+            "inferred_saved": 0,
+            "errors": 0,
+            "api_calls": 0,
+            "retries": 0,
+            "truncated_responses": 0,
+            "unresolved_truncations": 0,
+            "coalesced_calls": 0,
+            "range_reuse_hits": 0,
+            "truncation_skips": 0,
+            "official_seed_docs": 0,
+            "save_skips": 0,
+            "staged_targets": 0,
+            "targets_marked_searched": 0,
+        }
 
-        for i, target in enumerate(targets):
+        def _search_one(index: int, target: dict) -> dict[str, Any] | None:
             fid = target["foreclosure_id"]
             case = target["case_number"]
             strap = target["strap"]
 
-            logger.info(f"[{i + 1}/{len(targets)}] ORI search for {case} (strap={strap})")
+            logger.info(f"[{index + 1}/{len(targets)}] ORI search for {case} (strap={strap})")
 
             try:
                 scoped_target = dict(target)
                 scoped_target.setdefault("ori_run_context", "standard_search")
-                result = self._process_target(scoped_target, persist=True)
-                total_docs += result["docs_found"]
-                total_saved += result["saved"]
-                total_inferred += result["inferred"]
-                total_api_calls += result["api_calls"]
-                total_retries += result["retries"]
-                total_truncated += result["truncated"]
-                total_unresolved_truncations += result["unresolved_truncations"]
-                total_official_seed_docs += result["official_seed_docs"]
-                total_save_skips += result["save_skips"]
-                total_staged_targets += int(bool(result["case_only_stage_path"]))
-                total_search_marks += int(bool(result["marked_ori_searched"]))
-
+                return self._process_target(scoped_target, persist=True)
             except Exception:
                 logger.exception(
                     "ORI search error for case={} strap={} foreclosure_id={}",
@@ -2177,22 +2532,50 @@ class PgOriService:
                     strap,
                     fid,
                 )
-                errors += 1
+                return None
+
+        if workers == 1:
+            results = [_search_one(i, target) for i, target in enumerate(targets)]
+        else:
+            logger.info(
+                "ORI search: running {} targets with concurrency={}",
+                len(targets),
+                workers,
+            )
+            semaphore = asyncio.Semaphore(workers)
+
+            async def _bounded(index: int, target: dict) -> dict[str, Any] | None:
+                async with semaphore:
+                    return await asyncio.to_thread(_search_one, index, target)
+
+            results = await asyncio.gather(
+                *(_bounded(i, target) for i, target in enumerate(targets))
+            )
+
+        for result in results:
+            if result is None:
+                totals["errors"] += 1
+                continue
+            totals["total_documents_found"] += result["docs_found"]
+            totals["encumbrances_saved"] += result["saved"]
+            totals["inferred_saved"] += result["inferred"]
+            totals["api_calls"] += result["api_calls"]
+            totals["retries"] += result["retries"]
+            totals["truncated_responses"] += result["truncated"]
+            totals["unresolved_truncations"] += result["unresolved_truncations"]
+            totals["coalesced_calls"] += result.get("coalesced_calls", 0)
+            totals["range_reuse_hits"] += result.get("range_reuse_hits", 0)
+            totals["truncation_skips"] += result.get("truncation_skips", 0)
+            totals["official_seed_docs"] += result["official_seed_docs"]
+            totals["save_skips"] += result["save_skips"]
+            totals["staged_targets"] += int(bool(result["case_only_stage_path"]))
+            totals["targets_marked_searched"] += int(bool(result["marked_ori_searched"]))
 
         return {
             "targets": len(targets),
-            "total_documents_found": total_docs,
-            "encumbrances_saved": total_saved,
-            "inferred_saved": total_inferred,
-            "errors": errors,
-            "api_calls": total_api_calls,
-            "retries": total_retries,
-            "truncated_responses": total_truncated,
-            "unresolved_truncations": total_unresolved_truncations,
-            "official_seed_docs": total_official_seed_docs,
-            "save_skips": total_save_skips,
-            "staged_targets": total_staged_targets,
-            "targets_marked_searched": total_search_marks,
+            "concurrency": workers,
+            **totals,
+            "pav_cache": pav_cache_stats(include_disk=False),
         }
 
     def _process_target(
@@ -2216,12 +2599,16 @@ class PgOriService:
         docs, metrics = self._discover_property(target)
         logger.info(
             "  Discovery complete: docs={} api_calls={} retries={} "
-            "truncated={} unresolved_trunc={} seeds=(deeds={}, clerk_cases={}, official={})",
+            "truncated={} unresolved_trunc={} dedup=(coalesced={}, range_reuse={}, trunc_skips={}) "
+            "seeds=(deeds={}, clerk_cases={}, official={})",
             len(docs),
             metrics["api_calls"],
             metrics["retries"],
             metrics["truncated"],
             metrics["unresolved_truncations"],
+            metrics.get("coalesced", 0),
+            metrics.get("range_reuse", 0),
+            metrics.get("truncation_skips", 0),
             metrics["deed_count"],
             metrics["clerk_case_count"],
             metrics["official_seed_docs"],
@@ -2325,6 +2712,9 @@ class PgOriService:
             "retries": metrics["retries"],
             "truncated": metrics["truncated"],
             "unresolved_truncations": metrics["unresolved_truncations"],
+            "coalesced_calls": metrics.get("coalesced", 0),
+            "range_reuse_hits": metrics.get("range_reuse", 0),
+            "truncation_skips": metrics.get("truncation_skips", 0),
             "official_seed_docs": metrics["official_seed_docs"],
             "deed_count": metrics["deed_count"],
             "clerk_case_count": metrics["clerk_case_count"],
@@ -2359,6 +2749,9 @@ class PgOriService:
             "clerk_case_count": 0,
             "official_seed_docs": 0,
             "live_noc_docs": 0,
+            "coalesced": 0,
+            "range_reuse": 0,
+            "truncation_skips": 0,
         }
 
         docs_by_inst: dict[str, dict[str, Any]] = {}
@@ -3881,28 +4274,68 @@ class PgOriService:
         if to_date is not None:
             payload["ToDate"] = to_date.strftime("%m/%d/%Y")
 
-        data = self._post_pav(
-            payload,
-            query_label,
-            stats,
-            bypass_cache=bypass_cache,
-        )
-        if data is None:
-            return []
-
-        docs = self._parse_pav_rows(data.get("Data") or [])
-        truncated = bool(data.get("Truncated"))
-        if truncated:
-            stats["truncated"] += 1
-
-        if (
-            truncated
-            and split_on_truncated
+        can_split = (
+            split_on_truncated
             and from_date is not None
             and to_date is not None
             and from_date < to_date
             and depth < _PAV_SPLIT_DEPTH
-        ):
+        )
+        range_key: str | None = None
+        known_truncated = False
+        if from_date is not None and to_date is not None and not bypass_cache:
+            # Windows already answered for this query/keyword (by this target
+            # or another one) are reused instead of re-fetched.
+            range_key = _pav_request_key(
+                _PAV_KEYWORD_URL,
+                {"QueryID": query_id, "Keywords": payload["Keywords"]},
+            )
+            reused = _PAV_RANGE_INDEX.lookup(range_key, from_date, to_date)
+            if reused is not None:
+                stats.setdefault("range_reuse", 0)
+                stats["range_reuse"] += 1
+                merged_reuse: dict[str, dict[str, Any]] = {}
+                self._merge_docs(merged_reuse, reused)
+                return list(merged_reuse.values())
+            known_truncated = bool(can_split) and _PAV_RANGE_INDEX.known_truncated(
+                range_key,
+                from_date,
+                to_date,
+            )
+
+        if known_truncated:
+            # A narrower window already came back truncated, so this one would
+            # too; skip straight to the split.
+            stats.setdefault("truncation_skips", 0)
+            stats["truncation_skips"] += 1
+            truncated = True
+            docs: list[dict[str, Any]] = []
+        else:
+            data = self._post_pav(
+                payload,
+                query_label,
+                stats,
+                bypass_cache=bypass_cache,
+            )
+            if data is None:
+                return []
+
+            docs = self._parse_pav_rows(data.get("Data") or [])
+            truncated = bool(data.get("Truncated"))
+            if truncated:
+                stats["truncated"] += 1
+            if range_key is not None and from_date is not None and to_date is not None:
+                if truncated:
+                    _PAV_RANGE_INDEX.record_truncated(range_key, from_date, to_date)
+                else:
+                    _PAV_RANGE_INDEX.record_complete(
+                        range_key,
+                        from_date,
+                        to_date,
+                        [(self._parse_date(doc.get("RecordDate")), doc) for doc in docs],
+                    )
+
+        if truncated and can_split and from_date is not None and to_date is not None:
             midpoint = from_date + timedelta(days=(to_date - from_date).days // 2)
             left = self._pav_search(
                 query_id=query_id,
@@ -3913,6 +4346,7 @@ class PgOriService:
                 to_date=midpoint,
                 split_on_truncated=split_on_truncated,
                 depth=depth + 1,
+                bypass_cache=bypass_cache,
             )
             right = self._pav_search(
                 query_id=query_id,
@@ -3923,6 +4357,7 @@ class PgOriService:
                 to_date=to_date,
                 split_on_truncated=split_on_truncated,
                 depth=depth + 1,
+                bypass_cache=bypass_cache,
             )
             merged: dict[str, dict[str, Any]] = {}
             self._merge_docs(merged, left)
@@ -3958,8 +4393,33 @@ class PgOriService:
                 stats["cache_hits"] += 1
                 return cached
 
+        # Identical requests already in flight on another worker share its
+        # HTTP call instead of issuing their own.
+        data, shared = _PAV_SINGLE_FLIGHT.do(
+            _pav_request_key(_PAV_KEYWORD_URL, payload),
+            lambda: self._post_pav_uncached(
+                payload,
+                query_label,
+                stats,
+                bypass_cache=bypass_cache,
+            ),
+        )
+        if shared:
+            stats.setdefault("coalesced", 0)
+            stats["coalesced"] += 1
+        return data
+
+    def _post_pav_uncached(
+        self,
+        payload: dict[str, Any],
+        query_label: str,
+        stats: dict[str, int],
+        *,
+        bypass_cache: bool,
+    ) -> dict[str, Any] | None:
         for attempt in range(1, _PAV_MAX_RETRIES + 1):
             stats["api_calls"] += 1
+            _PAV_RATE_LIMITER.acquire()
             try:
                 response = self._pav_session.post(
                     _PAV_KEYWORD_URL,
@@ -4034,8 +4494,25 @@ class PgOriService:
             stats["cache_hits"] += 1
             return cached
 
+        data, shared = _PAV_SINGLE_FLIGHT.do(
+            _pav_request_key(_PAV_FULL_TEXT_URL, payload),
+            lambda: self._post_pav_full_text_uncached(payload, cache_payload, query_label, stats),
+        )
+        if shared:
+            stats.setdefault("coalesced", 0)
+            stats["coalesced"] += 1
+        return data
+
+    def _post_pav_full_text_uncached(
+        self,
+        payload: dict[str, Any],
+        cache_payload: dict[str, Any],
+        query_label: str,
+        stats: dict[str, int],
+    ) -> dict[str, Any] | None:
         for attempt in range(1, _PAV_FULL_TEXT_RETRIES + 1):
             stats["api_calls"] += 1
+            _PAV_RATE_LIMITER.acquire()
             try:
                 response = self._pav_session.post(
                     _PAV_FULL_TEXT_URL,
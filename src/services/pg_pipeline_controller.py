@@ -19,6 +19,12 @@ from loguru import logger
 from sqlalchemy import text
 
 from src.utils.step_result import StepResult, is_failed_payload
+from src.services.pg_step_scheduler import (
+    ALL_RESOURCES,
+    StepScheduler,
+    StepSpec,
+    critical_path_ms,
+)
 
 from src.services.CountyPermit import CountyPermitService
 from src.services.TampaPermit import TampaPermitService
@@ -44,6 +50,88 @@ SUNBIZ_ENTITY_FILE_PATTERN = (
 _TITLE_BREAK_MIN_PASSES = 2
 _TITLE_BREAK_MAX_EXTRA_CYCLES = 5
 
+# Logical resources each step reads / writes, used by ``StepScheduler`` to
+# derive the step DAG when ``--step-workers`` > 1.  Resources are coarse table
+# groups, not individual tables: two steps only run concurrently when neither
+# writes anything the other touches.  Steps missing from this map are treated
+# as touching everything and therefore always run alone.
+_PHASE_A_SOURCES = frozenset({
+    "hcpa",
+    "clerk_civil",
+    "clerk_criminal",
+    "dor_nal",
+    "sunbiz_flr",
+    "sunbiz_entity",
+    "county_permits",
+    "tampa_permits",
+})
+_FORECLOSURE_INPUTS = _PHASE_A_SOURCES | {
+    "ori_documents",
+    "survival",
+    "market",
+}
+STEP_RESOURCES: dict[str, tuple[frozenset[str], frozenset[str]]] = {
+    # Phase A bulk loads touch disjoint table groups.
+    "hcpa_suite": (frozenset(), frozenset({"hcpa"})),
+    "clerk_bulk": (frozenset(), frozenset({"clerk_civil"})),
+    "clerk_criminal": (frozenset(), frozenset({"clerk_criminal"})),
+    # Civil alpha upserts into the same clerk_civil_* tables as clerk_bulk.
+    "clerk_civil_alpha": (frozenset(), frozenset({"clerk_civil"})),
+    "dor_nal": (frozenset(), frozenset({"dor_nal"})),
+    # Both Sunbiz steps sync through SunbizMirror, which rewrites the shared
+    # manifest JSON, so they must not overlap.
+    "sunbiz_flr": (frozenset(), frozenset({"sunbiz_flr", "sunbiz_mirror"})),
+    "sunbiz_entity": (frozenset(), frozenset({"sunbiz_entity", "sunbiz_mirror"})),
+    "county_permits": (frozenset(), frozenset({"county_permits"})),
+    "tampa_permits": (frozenset(), frozenset({"tampa_permits"})),
+    "single_pin_permits": (
+        frozenset({"foreclosures", "hcpa"}),
+        frozenset({"county_permits", "tampa_permits"}),
+    ),
+    "foreclosure_refresh": (_FORECLOSURE_INPUTS, frozenset({"foreclosures"})),
+    "trust_accounts": (
+        frozenset({"foreclosures", "clerk_civil"}),
+        frozenset({"trust_accounts"}),
+    ),
+    "title_chain": (
+        frozenset({"foreclosures", "hcpa", "ori_documents", "county_permits", "tampa_permits"}),
+        frozenset({"title_chain"}),
+    ),
+    "title_breaks": (
+        frozenset({"foreclosures", "hcpa"}),
+        frozenset({"ori_documents", "title_chain"}),
+    ),
+    # Phase B: every step reads or writes the foreclosures hub table, so this
+    # part of the pipeline stays effectively sequential.
+    "auction_scrape": (frozenset(), frozenset({"foreclosures"})),
+    "judgment_extract": (frozenset(), frozenset({"foreclosures"})),
+    "identifier_recovery": (frozenset({"hcpa"}), frozenset({"foreclosures"})),
+    "ori_search": (frozenset({"foreclosures", "hcpa"}), frozenset({"ori_documents"})),
+    "municipal_liens_phase0": (
+        frozenset({"foreclosures", "ori_documents"}),
+        frozenset({"municipal_liens"}),
+    ),
+    "ori_id_backfill": (frozenset({"foreclosures"}), frozenset({"ori_documents"})),
+    "resolve_inferred": (frozenset({"foreclosures"}), frozenset({"ori_documents"})),
+    "encumbrance_extraction": (frozenset({"foreclosures"}), frozenset({"ori_documents"})),
+    "encumbrance_relationships": (frozenset({"foreclosures"}), frozenset({"ori_documents"})),
+    # Audit hands its report to recovery through controller state.
+    "encumbrance_audit": (
+        frozenset({"foreclosures", "ori_documents", "survival"}),
+        frozenset({"encumbrance_audit_report"}),
+    ),
+    "encumbrance_recovery": (
+        frozenset(),
+        frozenset({"encumbrance_audit_report", "ori_documents", "foreclosures"}),
+    ),
+    "survival_analysis": (
+        frozenset({"ori_documents", "title_chain"}),
+        frozenset({"survival", "foreclosures"}),
+    ),
+    "final_refresh": (_FORECLOSURE_INPUTS, frozenset({"foreclosures"})),
+    "market_data": (frozenset({"foreclosures"}), frozenset({"market"})),
+}
+
 
 @dataclass(slots=True)
 class ControllerSettings:
@@ -52,6 +140,8 @@ class ControllerSettings:
     fail_fast: bool = False
     background_bulk_steps: bool = False
     background_market_data: bool = False
+    # Max concurrently running steps; 1 keeps the legacy sequential order.
+    step_workers: int = 1
     # Step toggles
     skip_hcpa: bool = False
     skip_clerk_bulk: bool = False
@@ -117,14 +207,25 @@ class ControllerSettings:
     active_only: bool = True
     limit: int | None = None
     similarity_threshold: float = 0.68
+    # Rebuild every title chain instead of only those with changed sources.
+    title_chain_full_rebuild: bool = False
+    # Hash partitions of the title-chain scope built on parallel connections.
+    title_chain_partitions: int = 1
     # Phase B limits
     auction_limit: int | None = None
     judgment_limit: int | None = None
     identifier_recovery_limit: int | None = None
     ori_limit: int | None = None
+    ori_concurrency: int = 1
     extraction_limit: int | None = None
     survival_limit: int | None = None
+    # Processes for survival analysis (1 = inline).
+    survival_workers: int = 1
     title_breaks_limit: int | None = None
+    # Worker threads for title-break gap loading and deed searches.
+    title_breaks_concurrency: int = 1
+    # Paced fetch lanes per market site (Realtor/Redfin/Zillow scrapling).
+    market_site_lanes: int = 1
 
 
 class PgPipelineController:
@@ -257,15 +358,29 @@ class PgPipelineController:
             ("market_data", self.settings.skip_market_data, self._run_market_data),
         ]
 
+        specs: list[StepSpec] = []
         for name, skip, fn in steps:
-            result = self._execute_step(name=name, skip=skip, fn=fn)
+            reads, writes = STEP_RESOURCES.get(name, (frozenset(), ALL_RESOURCES))
+            specs.append(
+                StepSpec(name=name, skip=skip, fn=fn, reads=reads, writes=writes)
+            )
+        scheduler = StepScheduler(
+            specs,
+            lambda spec: self._execute_step(name=spec.name, skip=spec.skip, fn=spec.fn),
+            max_workers=self.settings.step_workers,
+            fail_fast=self.settings.fail_fast,
+        )
+        results = scheduler.run()
+        for result in results:
             summary["steps"].append(result.to_summary_dict())
             if result.status == "failed":
                 summary["failed_steps"] += 1
-                if self.settings.fail_fast:
-                    break
             elif result.status == "degraded":
                 summary["degraded_steps"] += 1
+        summary["step_workers"] = scheduler.max_workers
+        summary["critical_path_seconds"] = round(
+            critical_path_ms(specs, results) / 1000, 2,
+        )
 
         summary["elapsed_seconds"] = round(time.monotonic() - started, 2)
         summary["completed_at"] = dt.datetime.now(dt.UTC).isoformat()
@@ -972,13 +1087,21 @@ class PgPipelineController:
             active_only=self.settings.active_only,
             limit=self.settings.limit,
             similarity_threshold=self.settings.similarity_threshold,
+            incremental=not self.settings.title_chain_full_rebuild,
+            partitions=self.settings.title_chain_partitions,
         )
         return TitleChainController(config).run()
 
     def _run_title_breaks(self) -> StepResult:
         from src.services.pg_title_break_service import PgTitleBreakService
 
-        svc = PgTitleBreakService(dsn=self.dsn)
+        svc = PgTitleBreakService(
+            dsn=self.dsn,
+            concurrency=self.settings.title_breaks_concurrency,
+        )
+        # After the first full pass, only foreclosures whose chains changed
+        # (or whose search errored) in the previous pass are revisited.
+        dirty_ids: list[int] | None = None
         pass_results: list[dict[str, Any]] = []
         rebuilds: list[dict[str, Any]] = []
         total_repairs = 0
@@ -996,7 +1119,10 @@ class PgPipelineController:
                 limit=self.settings.title_breaks_limit,
                 foreclosure_id=self.settings.foreclosure_id,
                 case_number=self.settings.case_number,
+                foreclosure_ids=dirty_ids,
             )
+            next_dirty = result.get("dirty_foreclosure_ids")
+            dirty_ids = None if next_dirty is None else [int(fid) for fid in next_dirty]
             repairs = int(result.get("deeds_inserted", 0)) + int(result.get("backfilled", 0))
             sentinels = int(result.get("sentinels_inserted", 0))
             errors = int(result.get("errors", 0))
@@ -1099,6 +1225,7 @@ class PgPipelineController:
                     dsn=resolved_dsn,
                     use_windows_chrome=self.settings.use_windows_chrome,
                     force=self.settings.force_all,
+                    site_lanes=self.settings.market_site_lanes,
                 )
                 scrapling_result = asyncio.run(
                     svc.run_batch(props, sources=["realtor"]),
@@ -1256,7 +1383,10 @@ class PgPipelineController:
     def _run_ori_search(self) -> StepResult:
         from src.services.pg_ori_service import PgOriService
 
-        svc = PgOriService(dsn=self.dsn)
+        svc = PgOriService(
+            dsn=self.dsn,
+            target_concurrency=self.settings.ori_concurrency,
+        )
         result = svc.run(limit=self.settings.ori_limit)
         searched = self._int_from_paths(
             result,
@@ -1404,6 +1534,7 @@ class PgPipelineController:
         result = svc.run(
             limit=self.settings.survival_limit,
             force_reanalysis=True,
+            workers=self.settings.survival_workers,
         )
         analyzed = int(result.get("analyzed", 0))
         errs = int(result.get("errors", 0))
@@ -2016,6 +2147,12 @@ def parse_args() -> ControllerSettings:
         default=False,
         help="Run market-data step in a detached worker process (default: inline).",
     )
+    parser.add_argument(
+        "--step-workers",
+        type=int,
+        default=1,
+        help="Max pipeline steps to run concurrently when their declared resources do not conflict (default: 1 = sequential).",
+    )
 
     parser.add_argument("--skip-hcpa", action="store_true")
     parser.add_argument("--skip-clerk-bulk", action="store_true")
@@ -2101,6 +2238,17 @@ def parse_args() -> ControllerSettings:
     )
     parser.add_argument("--limit", type=int)
     parser.add_argument("--similarity-threshold", type=float, default=0.68)
+    parser.add_argument(
+        "--title-chain-full-rebuild",
+        action="store_true",
+        help="Rebuild every title chain (truncates the chain tables) instead of only chains with changed sources",
+    )
+    parser.add_argument(
+        "--title-chain-partitions",
+        type=int,
+        default=1,
+        help="Split title_chain into N foreclosure_id hash partitions built on parallel connections (default: 1)",
+    )
 
     # Phase B limits
     parser.add_argument("--auction-limit", type=int, help="Max auctions per date to scrape")
@@ -2111,9 +2259,33 @@ def parse_args() -> ControllerSettings:
         help="Max unresolved foreclosures for identifier recovery (<=0 means all)",
     )
     parser.add_argument("--ori-limit", type=int, help="Max foreclosures for ORI search")
+    parser.add_argument(
+        "--ori-concurrency",
+        type=int,
+        default=1,
+        help="Foreclosures searched concurrently during ORI discovery (PAV calls stay rate-limited).",
+    )
     parser.add_argument("--extraction-limit", type=int, help="Max encumbrance PDFs to extract")
     parser.add_argument("--survival-limit", type=int, help="Max foreclosures for survival analysis")
+    parser.add_argument(
+        "--survival-workers",
+        type=int,
+        default=1,
+        help="Processes for batched survival analysis (default: 1, inline).",
+    )
     parser.add_argument("--title-breaks-limit", type=int, help="Max foreclosures for title break resolution")
+    parser.add_argument(
+        "--title-breaks-concurrency",
+        type=int,
+        default=1,
+        help="Worker threads for title-break gap searches (PAV calls stay rate-limited; default: 1).",
+    )
+    parser.add_argument(
+        "--market-site-lanes",
+        type=int,
+        default=1,
+        help="Concurrent fetch lanes per market-data site, each paced independently (default: 1).",
+    )
 
     args = parser.parse_args()
 
@@ -2123,6 +2295,7 @@ def parse_args() -> ControllerSettings:
         fail_fast=bool(args.fail_fast),
         background_bulk_steps=bool(args.background_bulk_steps),
         background_market_data=bool(args.background_market_data),
+        step_workers=max(1, int(args.step_workers)),
         skip_hcpa=bool(args.skip_hcpa),
         skip_clerk_bulk=bool(args.skip_clerk_bulk),
         skip_clerk_criminal=bool(args.skip_clerk_criminal),
@@ -2169,11 +2342,17 @@ def parse_args() -> ControllerSettings:
         active_only=bool(args.active_only),
         limit=args.limit,
         similarity_threshold=args.similarity_threshold,
+        title_chain_full_rebuild=bool(args.title_chain_full_rebuild),
+        title_chain_partitions=max(1, int(args.title_chain_partitions)),
         auction_limit=args.auction_limit,
         judgment_limit=args.judgment_limit,
         identifier_recovery_limit=args.identifier_recovery_limit,
         ori_limit=args.ori_limit,
+        ori_concurrency=max(1, int(args.ori_concurrency)),
         extraction_limit=args.extraction_limit,
         survival_limit=args.survival_limit,
+        survival_workers=max(1, int(args.survival_workers)),
         title_breaks_limit=args.title_breaks_limit,
+        title_breaks_concurrency=max(1, int(args.title_breaks_concurrency)),
+        market_site_lanes=max(1, int(args.market_site_lanes)),
     )
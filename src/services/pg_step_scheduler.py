@@ -0,0 +1,194 @@
+"""Dependency-graph scheduler for ``PgPipelineController`` steps.
+
+The controller declares its steps in a fixed order (Phase A bulk loads, then
+the refresh/title-chain steps, then Phase B enrichment).  Historically that
+list was executed strictly in sequence, so independent bulk loads such as
+``hcpa_suite``, ``clerk_bulk`` and ``dor_nal`` waited on each other even
+though they touch disjoint tables.
+
+Each step is now described by a ``StepSpec`` that declares the logical
+resources it ``reads`` and ``writes`` (coarse table groups such as ``hcpa``,
+``clerk_civil`` or ``foreclosures``).  ``build_step_dependencies()`` derives a
+DAG from those declarations using the declared order as the tie-breaker:
+
+- read-after-write: a later step reading a resource waits for every earlier
+  step that writes it;
+- write-after-read / write-after-write: a later step writing a resource waits
+  for every earlier step that reads or writes it.
+
+Steps with no conflicting resources have no edge between them and may run
+concurrently.  ``StepScheduler`` executes the DAG on a bounded thread pool:
+
+- ``max_workers <= 1`` runs the steps inline in declared order, which is
+  byte-for-byte the legacy sequential behaviour;
+- skipped steps (``--skip-*`` flags) complete immediately and release their
+  dependents, exactly as they did in the sequential loop;
+- a failed step does not block its dependents (the sequential loop never
+  did either) unless ``fail_fast`` is set, in which case no new steps are
+  started and only the already-running ones are allowed to finish;
+- results are always returned in declared order so ``summary["steps"]`` and
+  ``pipeline_job_runs.summary_json`` look the same regardless of scheduling.
+
+The step callables themselves are unchanged; they only need to be safe to run
+on a worker thread (every step opens its own engine/session, and
+``asyncio.run`` is per-thread).
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from src.utils.step_result import StepResult
+
+
+# Wildcard resource: a step that writes it conflicts with every other step.
+ALL_RESOURCE = "*"
+ALL_RESOURCES = frozenset({ALL_RESOURCE})
+
+
+@dataclass(slots=True, frozen=True)
+class StepSpec:
+    """One controller step plus the resources it touches."""
+
+    name: str
+    skip: bool
+    fn: Callable[[], Any]
+    reads: frozenset[str] = field(default_factory=frozenset)
+    writes: frozenset[str] = field(default_factory=frozenset)
+
+
+def build_step_dependencies(specs: Iterable[StepSpec]) -> dict[str, set[str]]:
+    """Return ``{step_name: {names of earlier steps it must wait for}}``."""
+    ordered = list(specs)
+    deps: dict[str, set[str]] = {spec.name: set() for spec in ordered}
+    for idx, later in enumerate(ordered):
+        later_touches = later.reads | later.writes
+        for earlier in ordered[:idx]:
+            if (
+                ALL_RESOURCE in earlier.writes
+                or ALL_RESOURCE in later.writes
+                or earlier.writes & later_touches
+                or earlier.reads & later.writes
+            ):
+                deps[later.name].add(earlier.name)
+    return deps
+
+
+def critical_path_ms(
+    specs: Iterable[StepSpec],
+    results: Iterable[StepResult],
+) -> int:
+    """Longest dependency chain (by measured ``duration_ms``) through the DAG."""
+    ordered = list(specs)
+    durations = {r.step_name: int(r.duration_ms or 0) for r in results}
+    deps = build_step_dependencies(ordered)
+    finish: dict[str, int] = {}
+    for spec in ordered:
+        start = max((finish.get(dep, 0) for dep in deps[spec.name]), default=0)
+        finish[spec.name] = start + durations.get(spec.name, 0)
+    return max(finish.values(), default=0)
+
+
+class StepScheduler:
+    """Run ``StepSpec`` items on a bounded pool while honouring dependencies."""
+
+    def __init__(
+        self,
+        specs: Iterable[StepSpec],
+        execute: Callable[[StepSpec], StepResult],
+        *,
+        max_workers: int = 1,
+        fail_fast: bool = False,
+    ) -> None:
+        self.specs = list(specs)
+        names = [spec.name for spec in self.specs]
+        if len(names) != len(set(names)):
+            raise ValueError(f"Duplicate step names in scheduler: {names}")
+        self.execute = execute
+        self.max_workers = max(1, int(max_workers))
+        self.fail_fast = fail_fast
+        self.dependencies = build_step_dependencies(self.specs)
+
+    def run(self) -> list[StepResult]:
+        if self.max_workers <= 1:
+            return self._run_sequential()
+        return self._run_parallel()
+
+    def _run_sequential(self) -> list[StepResult]:
+        results: list[StepResult] = []
+        for spec in self.specs:
+            result = self.execute(spec)
+            results.append(result)
+            if result.status == "failed" and self.fail_fast:
+                break
+        return results
+
+    def _run_parallel(self) -> list[StepResult]:
+        pending: dict[str, set[str]] = {
+            name: set(deps) for name, deps in self.dependencies.items()
+        }
+        by_name = {spec.name: spec for spec in self.specs}
+        results: dict[str, StepResult] = {}
+        running: dict[Future[StepResult], str] = {}
+        stop_launching = False
+        started = time.monotonic()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="pipeline-step",
+        ) as pool:
+            while True:
+                if not stop_launching:
+                    # Launch in declared order so ties resolve the same way
+                    # every run and the log reads naturally.
+                    for spec in self.specs:
+                        if len(running) >= self.max_workers:
+                            break
+                        name = spec.name
+                        if name in results or name in running.values():
+                            continue
+                        if pending[name]:
+                            continue
+                        running[pool.submit(self.execute, by_name[name])] = name
+                        logger.debug(
+                            "Scheduler launched step {} (running={})",
+                            name,
+                            sorted(running.values()),
+                        )
+
+                if not running:
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    result = future.result()
+                    results[name] = result
+                    for deps in pending.values():
+                        deps.discard(name)
+                    if result.status == "failed" and self.fail_fast:
+                        stop_launching = True
+
+        if stop_launching:
+            not_started = [spec.name for spec in self.specs if spec.name not in results]
+            if not_started:
+                logger.warning(
+                    "fail_fast: {} step(s) not started after failure: {}",
+                    len(not_started),
+                    ", ".join(not_started),
+                )
+        logger.info(
+            "Scheduler finished {} step(s) in {:.1f}s with max_workers={}",
+            len(results),
+            time.monotonic() - started,
+            self.max_workers,
+        )
+        return [results[spec.name] for spec in self.specs if spec.name in results]
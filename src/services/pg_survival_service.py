@@ -13,6 +13,13 @@ legacy row-level status columns for compatibility, but correctness-sensitive
 reads should prefer ``foreclosure_encumbrance_survival`` and fall back to the
 legacy columns only when no per-foreclosure row exists.
 
+Targets are processed in pages of ``batch_size``: one query loads every
+page target's encumbrances, one loads their title chains, the pure-Python
+analysis runs inline or on a ``workers``-process pool, and a single
+transaction writes the page's survival rows (batched executemany) and marks
+the page analyzed.  If that bulk write fails, the page falls back to
+per-foreclosure writes so one bad row cannot sink its neighbours.
+
 NOCs (encumbrance_type='noc') are excluded from both target selection and
 encumbrance loading — they are administrative notices, not liens.
 See docs/NOC_PERMIT_LINKING.md for the full exclusion map and
@@ -22,6 +29,8 @@ docs/domain/PER_FORECLOSURE_SURVIVAL.md for the persistence model.
 from __future__ import annotations
 
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
@@ -30,7 +39,78 @@ from sqlalchemy import text
 from sunbiz.db import get_engine, resolve_pg_dsn
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy.engine import Connection
+
+SURVIVAL_BATCH_SIZE = 200
+
+_SURVIVAL_CATEGORIES = (
+    "survived",
+    "extinguished",
+    "expired",
+    "satisfied",
+    "historical",
+    "foreclosing",
+    "uncertain",
+)
+
+_ENCUMBRANCE_COLUMNS = """
+    id, strap, encumbrance_type, party1, party2,
+    amount, recording_date, instrument_number,
+    book, page, is_satisfied,
+    satisfaction_instrument, satisfaction_date,
+    survival_status, case_number, current_holder
+"""
+
+_UPSERT_SURVIVAL_SQL = """
+    INSERT INTO foreclosure_encumbrance_survival (
+        foreclosure_id,
+        encumbrance_id,
+        survival_status,
+        survival_reason,
+        survival_case_number,
+        analyzed_at,
+        updated_at
+    ) VALUES (
+        :foreclosure_id,
+        :encumbrance_id,
+        :status,
+        :reason,
+        :case_number,
+        now(),
+        now()
+    )
+    ON CONFLICT (foreclosure_id, encumbrance_id) DO UPDATE SET
+        survival_status = EXCLUDED.survival_status,
+        survival_reason = EXCLUDED.survival_reason,
+        survival_case_number = EXCLUDED.survival_case_number,
+        analyzed_at = EXCLUDED.analyzed_at,
+        updated_at = EXCLUDED.updated_at
+"""
+
+_UPDATE_LEGACY_SURVIVAL_SQL = """
+    UPDATE ori_encumbrances SET
+        survival_status = :status,
+        survival_reason = :reason,
+        survival_analyzed_at = now(),
+        survival_case_number = :case_number
+    WHERE id = :id
+"""
+
+
+def _analyze_survival(job: dict[str, Any]) -> dict[str, Any]:
+    """Run ``SurvivalService.analyze`` for one target (process-pool entry point)."""
+    from src.services.lien_survival.survival_service import SurvivalService
+
+    svc = SurvivalService(property_id=job["strap"])
+    return svc.analyze(
+        encumbrances=job["encumbrances"],
+        judgment_data=job["judgment_data"],
+        chain_of_title=job["chain_of_title"],
+        current_period_id=job["current_period_id"],
+        is_homestead=job["is_homestead"],
+    )
 
 
 class PgSurvivalService:
@@ -61,8 +141,13 @@ class PgSurvivalService:
         limit: int | None = None,
         foreclosure_ids: Sequence[int] | None = None,
         force_reanalysis: bool = False,
+        batch_size: int = SURVIVAL_BATCH_SIZE,
+        workers: int = 1,
     ) -> dict[str, Any]:
-        """Analyze survival for foreclosures with unanalyzed encumbrances."""
+        """Analyze survival for foreclosures with unanalyzed encumbrances.
+
+        ``workers`` > 1 runs the analysis on a spawn-context process pool.
+        """
         parsed_ids: set[int] = set()
         for foreclosure_id in foreclosure_ids or []:
             try:
@@ -82,64 +167,157 @@ class PgSurvivalService:
         )
         if not targets:
             return {"skipped": True, "reason": "no_foreclosures_need_survival"}
-
-        logger.info(f"Survival analysis: {len(targets)} foreclosures")
-
-        from src.services.lien_survival.survival_service import SurvivalService
+        batch_size = max(1, batch_size)
+        workers = max(1, workers)
+        logger.info(
+            f"Survival analysis: {len(targets)} foreclosures "
+            f"(batch_size={batch_size}, workers={workers})"
+        )
 
         analyzed = 0
         errors = 0
+        pool = (
+            ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            if workers > 1
+            else None
+        )
+        try:
+            for start in range(0, len(targets), batch_size):
+                page_analyzed, page_errors = self._run_page(
+                    targets[start : start + batch_size], pool
+                )
+                analyzed += page_analyzed
+                errors += page_errors
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
 
-        for target in targets:
-            fid = target["foreclosure_id"]
-            strap = target["strap"]
-            case = target["case_number"]
-
-            try:
-                # Load encumbrances from PG
-                encumbrances = self._load_encumbrances(strap)
-                if not encumbrances:
-                    self._mark_analyzed(fid)
-                    continue
+        return {
+            "targets": len(targets),
+            "analyzed": analyzed,
+            "errors": errors,
+        }
 
-                # Load judgment data
-                jdata = target.get("judgment_data") or {}
+    def _run_page(
+        self,
+        page: list[dict[str, Any]],
+        pool: ProcessPoolExecutor | None,
+    ) -> tuple[int, int]:
+        """Load, analyze and persist one page of targets; return (analyzed, errors)."""
+        try:
+            encumbrance_rows = self._load_encumbrances_batch(t["strap"] for t in page)
+            chains = self._load_chains_batch(t["foreclosure_id"] for t in page)
+        except Exception as exc:
+            logger.error(f"Survival batch load failed for {len(page)} foreclosures: {exc}")
+            return 0, len(page)
+
+        empty_ids: list[int] = []
+        jobs: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        for target in page:
+            fid = target["foreclosure_id"]
+            # Fresh dicts per target: the analysis annotates encumbrances in
+            # place, and two foreclosures can share a strap.
+            encumbrances = [
+                self._encumbrance_from_row(row)
+                for row in encumbrance_rows.get(target["strap"], [])
+            ]
+            if not encumbrances:
+                empty_ids.append(fid)
+                continue
+            chain = chains.get(fid, [])
+            jobs.append((
+                target,
+                {
+                    "strap": target["strap"],
+                    "encumbrances": encumbrances,
+                    "judgment_data": target.get("judgment_data") or {},
+                    "chain_of_title": chain,
+                    "current_period_id": chain[-1]["id"] if chain else None,
+                    "is_homestead": target.get("homestead_exempt", False),
+                },
+            ))
 
-                # Load chain of title from PG
-                chain = self._load_chain(fid)
-                current_period_id = chain[-1]["id"] if chain else None
+        errors = 0
+        completed: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        if pool is None:
+            outcomes = []
+            for target, job in jobs:
+                try:
+                    outcomes.append((target, _analyze_survival(job)))
+                except Exception as exc:
+                    outcomes.append((target, exc))
+        else:
+            futures = [(target, pool.submit(_analyze_survival, job)) for target, job in jobs]
+            outcomes = []
+            for target, future in futures:
+                try:
+                    outcomes.append((target, future.result()))
+                except Exception as exc:
+                    outcomes.append((target, exc))
+        for target, outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error(f"Survival analysis error for {target['case_number']}: {outcome}")
+                errors += 1
+            else:
+                completed.append((target, outcome))
+
+        analyzed, write_errors = self._persist_page(completed, empty_ids)
+        for target, result in completed:
+            survived = len(result["results"]["survived"])
+            extinguished = len(result["results"]["extinguished"])
+            logger.info(
+                f"Survival for {target['case_number']}: "
+                f"{survived} survived, {extinguished} extinguished"
+            )
+        return analyzed, errors + write_errors
 
-                # Check homestead
-                is_homestead = target.get("homestead_exempt", False)
+    def _persist_page(
+        self,
+        completed: list[tuple[dict[str, Any], dict[str, Any]]],
+        empty_ids: list[int],
+    ) -> tuple[int, int]:
+        """Write a page's results and marks in one transaction.
 
-                # Run survival analysis
-                svc = SurvivalService(property_id=strap)
-                result = svc.analyze(
-                    encumbrances=encumbrances,
-                    judgment_data=jdata,
-                    chain_of_title=chain,
-                    current_period_id=current_period_id,
-                    is_homestead=is_homestead,
+        Falls back to per-foreclosure writes when the bulk transaction fails.
+        """
+        if not completed and not empty_ids:
+            return 0, 0
+        try:
+            with self.engine.begin() as conn:
+                self._save_survival_batch(conn, completed)
+                self._mark_analyzed_batch(
+                    conn,
+                    [t["foreclosure_id"] for t, _result in completed] + empty_ids,
                 )
+        except Exception as exc:
+            logger.warning(
+                f"Bulk survival write failed for {len(completed) + len(empty_ids)} "
+                f"foreclosures ({exc}); retrying per foreclosure"
+            )
+        else:
+            return len(completed), 0
 
-                # Write results back to PG
-                self._save_survival_results(fid, case, strap, result)
+        analyzed = 0
+        errors = 0
+        for fid in empty_ids:
+            try:
+                self._mark_analyzed(fid)
+            except Exception as exc:
+                logger.error(f"Survival mark failed for foreclosure {fid}: {exc}")
+                errors += 1
+        for target, result in completed:
+            fid = target["foreclosure_id"]
+            try:
+                self._save_survival_results(fid, target["case_number"], target["strap"], result)
                 self._mark_analyzed(fid)
                 analyzed += 1
-
-                survived = len(result["results"]["survived"])
-                extinguished = len(result["results"]["extinguished"])
-                logger.info(f"Survival for {case}: {survived} survived, {extinguished} extinguished")
-
             except Exception as exc:
-                logger.error(f"Survival analysis error for {case}: {exc}")
+                logger.error(f"Survival analysis error for {target['case_number']}: {exc}")
                 errors += 1
-
-        return {
-            "targets": len(targets),
-            "analyzed": analyzed,
-            "errors": errors,
-        }
+        return analyzed, errors
 
     # ------------------------------------------------------------------
     # Target selection
@@ -250,16 +428,38 @@ class PgSurvivalService:
     # Data loading
     # ------------------------------------------------------------------
 
+    @classmethod
+    def _encumbrance_from_row(cls, r: Any) -> dict[str, Any]:
+        """Map an ``ori_encumbrances`` row into the SurvivalService shape."""
+        creditor, debtor = cls._encumbrance_parties(
+            str(r["encumbrance_type"] or ""),
+            str(r["party1"] or ""),
+            str(r["party2"] or ""),
+            str(r["current_holder"] or ""),
+        )
+        return {
+            "id": r["id"],
+            "encumbrance_type": r["encumbrance_type"] or "other",
+            "creditor": creditor,
+            "debtor": debtor,
+            "amount": float(r["amount"]) if r["amount"] else 0.0,
+            "recording_date": str(r["recording_date"]) if r["recording_date"] else None,
+            "instrument": r["instrument_number"] or "",
+            "book": r["book"] or "",
+            "page": r["page"] or "",
+            "is_satisfied": bool(r["is_satisfied"]),
+            "satisfaction_instrument": r["satisfaction_instrument"] or "",
+            "satisfaction_date": str(r["satisfaction_date"]) if r["satisfaction_date"] else None,
+            "survival_status": r["survival_status"],
+            "case_number": r["case_number"] or "",
+        }
+
     def _load_encumbrances(self, strap: str) -> list[dict[str, Any]]:
         """Load encumbrances from PG ori_encumbrances as dicts for SurvivalService."""
         with self.engine.connect() as conn:
             result = conn.execute(
-                text("""
-                    SELECT id, encumbrance_type, party1, party2,
-                           amount, recording_date, instrument_number,
-                           book, page, is_satisfied,
-                           satisfaction_instrument, satisfaction_date,
-                           survival_status, case_number, current_holder
+                text(f"""
+                    SELECT {_ENCUMBRANCE_COLUMNS}
                     FROM ori_encumbrances
                     WHERE strap = :strap
                       AND encumbrance_type != 'noc'
@@ -269,32 +469,37 @@ class PgSurvivalService:
             )
             rows = result.mappings().fetchall()
 
-        encumbrances = []
+        return [self._encumbrance_from_row(r) for r in rows]
+
+    def _load_encumbrances_batch(self, straps: Iterable[str]) -> dict[str, list[Any]]:
+        """Load raw encumbrance rows for many straps in one query, keyed by strap."""
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text(f"""
+                    SELECT {_ENCUMBRANCE_COLUMNS}
+                    FROM ori_encumbrances
+                    WHERE strap = ANY(:straps)
+                      AND encumbrance_type != 'noc'
+                    ORDER BY strap, recording_date NULLS LAST
+                """),
+                {"straps": sorted(set(straps))},
+            ).mappings().fetchall()
+
+        by_strap: dict[str, list[Any]] = {}
         for r in rows:
-            creditor, debtor = self._encumbrance_parties(
-                str(r["encumbrance_type"] or ""),
-                str(r["party1"] or ""),
-                str(r["party2"] or ""),
-                str(r["current_holder"] or ""),
-            )
-            encumbrances.append({
-                "id": r["id"],
-                "encumbrance_type": r["encumbrance_type"] or "other",
-                "creditor": creditor,
-                "debtor": debtor,
-                "amount": float(r["amount"]) if r["amount"] else 0.0,
-                "recording_date": str(r["recording_date"]) if r["recording_date"] else None,
-                "instrument": r["instrument_number"] or "",
-                "book": r["book"] or "",
-                "page": r["page"] or "",
-                "is_satisfied": bool(r["is_satisfied"]),
-                "satisfaction_instrument": r["satisfaction_instrument"] or "",
-                "satisfaction_date": str(r["satisfaction_date"]) if r["satisfaction_date"] else None,
-                "survival_status": r["survival_status"],
-                "case_number": r["case_number"] or "",
-            })
+            by_strap.setdefault(r["strap"], []).append(r)
+        return by_strap
 
-        return encumbrances
+    @staticmethod
+    def _chain_link_from_row(r: Any) -> dict[str, Any]:
+        return {
+            "id": r[0],
+            "owner_name": r[1] or "",
+            "acquisition_date": str(r[2]) if r[2] else None,
+            "disposition_date": str(r[3]) if r[3] else None,
+            "acquired_from": r[4] or "",
+            "link_status": r[6] or "unknown",
+        }
 
     def _load_chain(self, foreclosure_id: int) -> list[dict[str, Any]]:
         """Load title chain from PG foreclosure_title_chain."""
@@ -310,23 +515,66 @@ class PgSurvivalService:
                 {"fid": foreclosure_id},
             ).fetchall()
 
-        chain = []
-        for r in rows:
-            chain.append({
-                "id": r[0],
-                "owner_name": r[1] or "",
-                "acquisition_date": str(r[2]) if r[2] else None,
-                "disposition_date": str(r[3]) if r[3] else None,
-                "acquired_from": r[4] or "",
-                "link_status": r[6] or "unknown",
-            })
+        return [self._chain_link_from_row(r) for r in rows]
+
+    def _load_chains_batch(self, foreclosure_ids: Iterable[int]) -> dict[int, list[dict[str, Any]]]:
+        """Load title chains for many foreclosures in one query, keyed by id."""
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                text("""
+                    SELECT chain_id, owner_name, acquired_date, disposed_date,
+                           grantor, grantee, link_status, foreclosure_id
+                    FROM foreclosure_title_chain
+                    WHERE foreclosure_id = ANY(:fids)
+                    ORDER BY foreclosure_id, sequence_no
+                """),
+                {"fids": sorted(set(foreclosure_ids))},
+            ).fetchall()
 
-        return chain
+        chains: dict[int, list[dict[str, Any]]] = {}
+        for r in rows:
+            chains.setdefault(r[7], []).append(self._chain_link_from_row(r))
+        return chains
 
     # ------------------------------------------------------------------
     # Result saving
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _survival_params(
+        foreclosure_id: int,
+        foreclosure_case_number: str,
+        result: dict[str, Any],
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Return (survival upsert params, legacy ori_encumbrances update params)."""
+        upserts: list[dict[str, Any]] = []
+        legacy: list[dict[str, Any]] = []
+        for category in _SURVIVAL_CATEGORIES:
+            for enc in result["results"].get(category, []):
+                enc_id = enc.get("id")
+                status = enc.get("survival_status")
+                reason = enc.get("survival_reason")
+                if not enc_id or not status:
+                    continue
+                upserts.append({
+                    "foreclosure_id": foreclosure_id,
+                    "encumbrance_id": enc_id,
+                    "status": status,
+                    "reason": reason,
+                    "case_number": foreclosure_case_number,
+                })
+                legacy.append({
+                    "id": enc_id,
+                    "status": status,
+                    "reason": reason,
+                    "case_number": foreclosure_case_number,
+                })
+        return upserts, legacy
+
+    @staticmethod
+    def _has_results(result: dict[str, Any]) -> bool:
+        return any(result["results"].get(category) for category in _SURVIVAL_CATEGORIES)
+
     def _save_survival_results(
         self,
         foreclosure_id: int,
@@ -335,21 +583,10 @@ class PgSurvivalService:
         result: dict[str, Any],
     ) -> None:
         """Persist survival results per foreclosure and update legacy row fields."""
-        all_encs = []
-        for category in (
-            "survived",
-            "extinguished",
-            "expired",
-            "satisfied",
-            "historical",
-            "foreclosing",
-            "uncertain",
-        ):
-            all_encs.extend(result["results"].get(category, []))
-
-        if not all_encs:
+        if not self._has_results(result):
             return
 
+        upserts, legacy = self._survival_params(foreclosure_id, foreclosure_case_number, result)
         with self.engine.begin() as conn:
             conn.execute(
                 text("""
@@ -358,65 +595,44 @@ class PgSurvivalService:
                 """),
                 {"foreclosure_id": foreclosure_id},
             )
-            for enc in all_encs:
-                enc_id = enc.get("id")
-                status = enc.get("survival_status")
-                reason = enc.get("survival_reason")
-
-                if not enc_id or not status:
-                    continue
+            for upsert_params, legacy_params in zip(upserts, legacy, strict=True):
+                conn.execute(text(_UPSERT_SURVIVAL_SQL), upsert_params)
+                conn.execute(text(_UPDATE_LEGACY_SURVIVAL_SQL), legacy_params)
 
-                conn.execute(
-                    text("""
-                        INSERT INTO foreclosure_encumbrance_survival (
-                            foreclosure_id,
-                            encumbrance_id,
-                            survival_status,
-                            survival_reason,
-                            survival_case_number,
-                            analyzed_at,
-                            updated_at
-                        ) VALUES (
-                            :foreclosure_id,
-                            :encumbrance_id,
-                            :status,
-                            :reason,
-                            :case_number,
-                            now(),
-                            now()
-                        )
-                        ON CONFLICT (foreclosure_id, encumbrance_id) DO UPDATE SET
-                            survival_status = EXCLUDED.survival_status,
-                            survival_reason = EXCLUDED.survival_reason,
-                            survival_case_number = EXCLUDED.survival_case_number,
-                            analyzed_at = EXCLUDED.analyzed_at,
-                            updated_at = EXCLUDED.updated_at
-                    """),
-                    {
-                        "foreclosure_id": foreclosure_id,
-                        "encumbrance_id": enc_id,
-                        "status": status,
-                        "reason": reason,
-                        "case_number": foreclosure_case_number,
-                    },
-                )
+    def _save_survival_batch(
+        self,
+        conn: Connection,
+        completed: list[tuple[dict[str, Any], dict[str, Any]]],
+    ) -> None:
+        """Replace survival rows for a page of foreclosures with batched statements.
 
-                conn.execute(
-                    text("""
-                        UPDATE ori_encumbrances SET
-                            survival_status = :status,
-                            survival_reason = :reason,
-                            survival_analyzed_at = now(),
-                            survival_case_number = :case_number
-                        WHERE id = :id
-                    """),
-                    {
-                        "id": enc_id,
-                        "status": status,
-                        "reason": reason,
-                        "case_number": foreclosure_case_number,
-                    },
-                )
+        Rows keep target order, so when foreclosures share an encumbrance the
+        legacy ``ori_encumbrances`` columns end up with the last target's
+        verdict, exactly as the per-foreclosure path leaves them.
+        """
+        replaced: list[int] = []
+        upserts: list[dict[str, Any]] = []
+        legacy: list[dict[str, Any]] = []
+        for target, result in completed:
+            if not self._has_results(result):
+                continue
+            fid = target["foreclosure_id"]
+            replaced.append(fid)
+            target_upserts, target_legacy = self._survival_params(fid, target["case_number"], result)
+            upserts.extend(target_upserts)
+            legacy.extend(target_legacy)
+        if not replaced:
+            return
+        conn.execute(
+            text("""
+                DELETE FROM foreclosure_encumbrance_survival
+                WHERE foreclosure_id = ANY(:foreclosure_ids)
+            """),
+            {"foreclosure_ids": replaced},
+        )
+        if upserts:
+            conn.execute(text(_UPSERT_SURVIVAL_SQL), upserts)
+            conn.execute(text(_UPDATE_LEGACY_SURVIVAL_SQL), legacy)
 
     def _mark_analyzed(self, foreclosure_id: int) -> None:
         """Mark foreclosure as survival-analyzed."""
@@ -425,3 +641,16 @@ class PgSurvivalService:
                 text("UPDATE foreclosures SET step_survival_analyzed = now() WHERE foreclosure_id = :fid"),
                 {"fid": foreclosure_id},
             )
+
+    @staticmethod
+    def _mark_analyzed_batch(conn: Connection, foreclosure_ids: list[int]) -> None:
+        """Mark a page of foreclosures survival-analyzed in one statement."""
+        if not foreclosure_ids:
+            return
+        conn.execute(
+            text(
+                "UPDATE foreclosures SET step_survival_analyzed = now() "
+                "WHERE foreclosure_id = ANY(:fids)"
+            ),
+            {"fids": foreclosure_ids},
+        )
@@ -15,6 +15,15 @@ This service currently performs 2 main gap-fillers:
    and searches the Clerk's Official Records to insert the missing links.
 2. ORI_DEED_BACKFILL: Queries HCPA deeds that exist but are missing their
    party names (grantor/grantee) and retrieves them from the Clerk API.
+
+With ``concurrency`` > 1, gap loading and every per-gap deed search run on a
+bounded thread pool; deed/sentinel writes stay on the calling thread in
+target order.  All PAV traffic goes through the owned ``PgOriService``, so
+the process-wide PAV rate limiter, single-flight coalescing and response
+cache are shared by every worker.  ``run`` reports the foreclosures whose
+chains it changed (or that errored) as ``dirty_foreclosure_ids``; callers
+looping over rebuild cycles pass that back as ``foreclosure_ids`` so later
+cycles only revisit those.
 """
 
 from __future__ import annotations
@@ -23,8 +32,9 @@ import datetime as dt
 import html
 import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import date
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 from scourgify import normalize_address_record
@@ -34,6 +44,9 @@ from src.db.type_normalizer import normalize_document_type
 from src.services.pg_ori_service import PgOriService
 from sunbiz.db import get_engine, resolve_pg_dsn
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
 # Document types that represent ownership transfers
 _DEED_TYPES = frozenset({
     "warranty_deed",
@@ -66,6 +79,8 @@ _HIGH_VOLUME_BUILDER_TOKENS = (
 )
 
 _SEARCH_NO_RESULT_RETRY_DAYS = 14
+# Worker threads for gap loading and per-gap deed searches (1 = sequential).
+_DEFAULT_CONCURRENCY = 1
 _MAX_CONTEXT_SEARCH_NAMES = 6
 _HISTORICAL_CONTEXT_LIMIT = 8
 _ADDRESS_SUFFIX_TOKENS = frozenset({
@@ -106,9 +121,17 @@ _ADDRESS_DIRECTION_TOKENS = frozenset({
 class PgTitleBreakService:
     """Service to search ORI/PAV for title gap-fills and party backfills."""
 
-    def __init__(self, dsn: str | None = None) -> None:
+    concurrency: int = _DEFAULT_CONCURRENCY
+
+    def __init__(
+        self,
+        dsn: str | None = None,
+        *,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+    ) -> None:
         self.dsn = resolve_pg_dsn(dsn)
         self.engine = get_engine(self.dsn)
+        self.concurrency = max(1, int(concurrency))
         self._ori = PgOriService(dsn=self.dsn)
         self._case_party_context_cache: dict[tuple[str, str], list[dict[str, Any]]] = {}
         self._historical_party_context_cache: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
@@ -119,10 +142,21 @@ class PgTitleBreakService:
         limit: int | None = None,
         foreclosure_id: int | None = None,
         case_number: str | None = None,
+        foreclosure_ids: Collection[int] | None = None,
     ) -> dict[str, Any]:
+        """Search gap deeds and backfill deed parties.
+
+        ``foreclosure_ids`` restricts the run to a dirty set (an empty
+        collection means nothing changed, so nothing is searched).
+        """
+        scope_ids = sorted({int(fid) for fid in foreclosure_ids}) if foreclosure_ids is not None else None
+        if scope_ids == []:
+            return {"skipped": True, "reason": "no_dirty_foreclosures", "dirty_foreclosure_ids": []}
+
         sentinel_skips = self._find_recent_sentinel_skips(
             foreclosure_id=foreclosure_id,
             case_number=case_number,
+            foreclosure_ids=scope_ids,
         )
         self._log_recent_sentinel_skips(sentinel_skips)
 
@@ -130,6 +164,7 @@ class PgTitleBreakService:
             limit,
             foreclosure_id=foreclosure_id,
             case_number=case_number,
+            foreclosure_ids=scope_ids,
         )
         if not targets:
             if sentinel_skips:
@@ -140,27 +175,37 @@ class PgTitleBreakService:
                 }
             return {"skipped": True, "reason": "no_targets"}
 
-        logger.info(f"title_breaks: {len(targets)} foreclosures to process")
+        workers = max(1, int(self.concurrency))
+        logger.info(f"title_breaks: {len(targets)} foreclosures to process (concurrency={workers})")
 
         total_gaps = 0
         total_inserted = 0
         total_sentinels = 0
         errors = 0
+        dirty: set[int] = set()
 
-        for t in targets:
-            try:
-                gaps_found, inserted, sentinels = self._process_one(t)
-                total_gaps += gaps_found
-                total_inserted += inserted
-                total_sentinels += sentinels
-            except Exception as exc:
+        if workers == 1:
+            outcomes = [self._process_one_safely(t) for t in targets]
+        else:
+            outcomes = self._process_concurrently(targets, workers)
+
+        for t, outcome in zip(targets, outcomes, strict=True):
+            if isinstance(outcome, Exception):
                 errors += 1
+                dirty.add(int(t["foreclosure_id"]))
                 logger.error(
                     "title_breaks: error on foreclosure_id={} folio={}: {}",
                     t["foreclosure_id"],
                     t["folio"],
-                    exc,
+                    outcome,
                 )
+                continue
+            gaps_found, inserted, sentinels = outcome
+            total_gaps += gaps_found
+            total_inserted += inserted
+            total_sentinels += sentinels
+            if inserted:
+                dirty.add(int(t["foreclosure_id"]))
 
         result = {
             "targets": len(targets),
@@ -172,12 +217,58 @@ class PgTitleBreakService:
                 limit,
                 foreclosure_id=foreclosure_id,
                 case_number=case_number,
+                foreclosure_ids=scope_ids,
+                changed=dirty,
             ),
             "errors": errors,
         }
         logger.info(f"title_breaks: {result}")
+        result["dirty_foreclosure_ids"] = sorted(dirty)
         return result
 
+    def _process_one_safely(self, target: dict[str, Any]) -> tuple[int, int, int] | Exception:
+        try:
+            return self._process_one(target)
+        except Exception as exc:
+            return exc
+
+    def _process_concurrently(
+        self,
+        targets: list[dict[str, Any]],
+        workers: int,
+    ) -> list[tuple[int, int, int] | Exception]:
+        """Run gap loads and per-gap searches on ``workers`` threads.
+
+        Searches for a target are submitted as soon as its gaps are loaded, so
+        one target's slow PAV party search never idles the pool.  Each target's
+        results are then written on this thread, in target order; a failed gap
+        search fails only its own target.
+        """
+        outcomes: list[tuple[int, int, int] | Exception] = [(0, 0, 0)] * len(targets)
+        pending: dict[int, tuple[int, list[Future[list[dict[str, Any]]]]]] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="title-breaks") as pool:
+            gap_loads = {pool.submit(self._load_gaps, t["folio"]): i for i, t in enumerate(targets)}
+            for future in as_completed(gap_loads):
+                index = gap_loads[future]
+                try:
+                    gaps = future.result()
+                except Exception as exc:
+                    outcomes[index] = exc
+                    continue
+                if gaps:
+                    pending[index] = (
+                        len(gaps),
+                        [pool.submit(self._search_gap, targets[index], gap) for gap in gaps],
+                    )
+            for index in sorted(pending):
+                gap_count, searches = pending[index]
+                try:
+                    deeds = [doc for search in searches for doc in search.result()]
+                    outcomes[index] = self._record_gap_results(targets[index], gap_count, deeds)
+                except Exception as exc:
+                    outcomes[index] = exc
+        return outcomes
+
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
@@ -188,6 +279,7 @@ class PgTitleBreakService:
         *,
         foreclosure_id: int | None = None,
         case_number: str | None = None,
+        foreclosure_ids: Collection[int] | None = None,
     ) -> list[dict[str, Any]]:
         """Broken or gap-bearing active foreclosures that still need deed retries."""
         params: dict[str, Any] = {"retry_ttl_days": _SEARCH_NO_RESULT_RETRY_DAYS}
@@ -235,6 +327,9 @@ class PgTitleBreakService:
         if case_number:
             sql += " AND f.case_number_raw = :case_number"
             params["case_number"] = case_number
+        if foreclosure_ids is not None:
+            sql += " AND f.foreclosure_id = ANY(:foreclosure_ids)"
+            params["foreclosure_ids"] = list(foreclosure_ids)
         sql += " ORDER BY f.foreclosure_id"
         if limit:
             sql += f" LIMIT {int(limit)}"
@@ -248,6 +343,7 @@ class PgTitleBreakService:
         *,
         foreclosure_id: int | None = None,
         case_number: str | None = None,
+        foreclosure_ids: Collection[int] | None = None,
     ) -> list[dict[str, Any]]:
         """Foreclosures currently skipped because a recent no-result sentinel is active."""
         params: dict[str, Any] = {"retry_ttl_days": _SEARCH_NO_RESULT_RETRY_DAYS}
@@ -305,6 +401,9 @@ class PgTitleBreakService:
         if case_number:
             sql += " AND f.case_number_raw = :case_number"
             params["case_number"] = case_number
+        if foreclosure_ids is not None:
+            sql += " AND f.foreclosure_id = ANY(:foreclosure_ids)"
+            params["foreclosure_ids"] = list(foreclosure_ids)
         sql += " ORDER BY sentinel.retry_eligible_on, f.foreclosure_id"
 
         with self.engine.connect() as conn:
@@ -341,10 +440,18 @@ class PgTitleBreakService:
 
         Returns (gaps_found, deeds_inserted, sentinels_inserted).
         """
-        folio = target["folio"]
+        gaps = self._load_gaps(target["folio"])
+        if not gaps:
+            return 0, 0, 0
+
+        all_deeds: list[dict[str, Any]] = []
+        for gap in gaps:
+            all_deeds.extend(self._search_gap(target, gap))
+        return self._record_gap_results(target, len(gaps), all_deeds)
 
+    def _load_gaps(self, folio: str) -> list[Any]:
         with self.engine.connect() as conn:
-            gaps = (
+            return (
                 conn.execute(
                     text("""
                     SELECT gap_type, expected_from_party, observed_to_party,
@@ -357,37 +464,34 @@ class PgTitleBreakService:
                 .fetchall()
             )
 
-        if not gaps:
-            return 0, 0, 0
-
-        all_deeds: list[dict[str, Any]] = []
-
-        for gap in gaps:
-            from_date = gap["missing_from_date"] or date(1970, 1, 1)
-            import datetime as dt
-
-            to_date = gap["missing_to_date"] or dt.datetime.now(dt.UTC).date()
-            # Ensure date types (PG may return date objects already)
-            if isinstance(from_date, str):
-                from_date = date.fromisoformat(from_date)
-            if isinstance(to_date, str):
-                to_date = date.fromisoformat(to_date)
-
-            all_deeds.extend(
-                self._search_gap_deeds(
-                    target,
-                    gap,
-                    from_date=from_date,
-                    to_date=to_date,
-                )
-            )
+    def _search_gap(self, target: dict[str, Any], gap: Any) -> list[dict[str, Any]]:
+        from_date = gap["missing_from_date"] or date(1970, 1, 1)
+        to_date = gap["missing_to_date"] or dt.datetime.now(dt.UTC).date()
+        # Ensure date types (PG may return date objects already)
+        if isinstance(from_date, str):
+            from_date = date.fromisoformat(from_date)
+        if isinstance(to_date, str):
+            to_date = date.fromisoformat(to_date)
+
+        return self._search_gap_deeds(
+            target,
+            gap,
+            from_date=from_date,
+            to_date=to_date,
+        )
 
-        if not all_deeds:
+    def _record_gap_results(
+        self,
+        target: dict[str, Any],
+        gap_count: int,
+        deeds: list[dict[str, Any]],
+    ) -> tuple[int, int, int]:
+        if not deeds:
             sentinels = self._insert_search_sentinel(target)
-            return len(gaps), 0, sentinels
+            return gap_count, 0, sentinels
 
-        inserted = self._insert_deeds(target, all_deeds)
-        return len(gaps), inserted, 0
+        inserted = self._insert_deeds(target, deeds)
+        return gap_count, inserted, 0
 
     def _search_gap_deeds(
         self,
@@ -1321,13 +1425,16 @@ class PgTitleBreakService:
         *,
         foreclosure_id: int | None = None,
         case_number: str | None = None,
+        foreclosure_ids: Collection[int] | None = None,
+        changed: set[int] | None = None,
     ) -> int:
         """Fetch missing grantor/grantee from PAV for active-foreclosure deeds.
 
         Queries hcpa_allsales rows tied to active foreclosures that have a
         doc_num but NULL grantor/grantee. It hits the PAV instrument search API
         and inserts results into foreclosure_title_events so fn_title_chain
-        can resolve party names.
+        can resolve party names.  Foreclosures that gain a backfill row are
+        added to ``changed``.
         """
         params: dict[str, Any] = {}
         # First, find foreclosure folks missing a deed party...
@@ -1358,6 +1465,9 @@ class PgTitleBreakService:
         if case_number:
             sql += " AND f.case_number_raw = :case_number"
             params["case_number"] = case_number
+        if foreclosure_ids is not None:
+            sql += " AND f.foreclosure_id = ANY(:foreclosure_ids)"
+            params["foreclosure_ids"] = list(foreclosure_ids)
         sql += """
                     GROUP BY s.doc_num
                     ORDER BY MAX(s.sale_date) DESC NULLS LAST
@@ -1417,6 +1527,8 @@ class PgTitleBreakService:
                 )
             if (result.rowcount or 0) > 0:
                 success += 1
+                if changed is not None:
+                    changed.add(int(row.foreclosure_id))
             time.sleep(1.0)
 
         return success
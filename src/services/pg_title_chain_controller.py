@@ -8,17 +8,39 @@ Architectural role:
   rebuild can incorporate repaired deed parties and missing deeds;
 - keep the materialized tables aligned with the ``fn_title_chain`` SQL view,
   which also treats ORI deed recovery rows as first-class chain inputs.
+
+Rebuild modes:
+- full (default): every in-scope chain is rebuilt; the chain and summary
+  tables are truncated, which blocks readers until the transaction commits;
+- incremental (``ControllerConfig.incremental``): only foreclosures touched by
+  source rows newer than the per-source high-water marks stored in
+  ``title_chain_watermarks`` (plus foreclosures that have no summary yet) are
+  rebuilt, using row-level deletes.  The first incremental run with no stored
+  marks falls back to a full rebuild.  Marks advance in the same transaction
+  as the rebuild, and change scans re-read a trailing overlap window so rows
+  committed late by long-running loaders are not skipped.  Source rows that
+  are deleted outright are not detected; run a full rebuild to pick those up.
+
+Either mode can be split into ``ControllerConfig.partitions`` hash partitions
+of ``foreclosure_id``.  Each partition builds its slice of the scope on its own
+connection and commits independently (with row-level deletes), so the SQL
+stages use several backends instead of one.
 """
 
 from __future__ import annotations
 
+import datetime as dt
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
 from difflib import SequenceMatcher
 from typing import Any
 
+from loguru import logger
 from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 
 from sunbiz.db import get_engine, resolve_pg_dsn
 
@@ -31,6 +53,14 @@ class ControllerConfig:
     active_only: bool = False
     limit: int | None = None
     similarity_threshold: float = 0.68
+    # Rebuild only foreclosures whose source rows changed since the last run.
+    incremental: bool = False
+    # Trailing window re-scanned below each stored watermark.
+    watermark_overlap_minutes: int = 60
+    # Hash partitions of the scope built in parallel on separate connections.
+    partitions: int = 1
+    # Attempts per partition before the run fails (operational errors only).
+    partition_attempts: int = 3
 
 
 DDL_STATEMENTS: list[str] = [
@@ -231,8 +261,40 @@ DDL_STATEMENTS: list[str] = [
     "CREATE INDEX IF NOT EXISTS idx_ftc_foreclosure ON foreclosure_title_chain(foreclosure_id);",
     "CREATE INDEX IF NOT EXISTS idx_ftc_gap ON foreclosure_title_chain(is_gap);",
     "CREATE INDEX IF NOT EXISTS idx_fts_status ON foreclosure_title_summary(chain_status);",
+    # Per-source high-water marks for incremental rebuilds
+    """
+    CREATE TABLE IF NOT EXISTS title_chain_watermarks (
+        source      TEXT PRIMARY KEY,
+        high_water  TIMESTAMPTZ,
+        updated_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+    );
+    """,
+    # Change-timestamp indexes backing the incremental dirty scans
+    "CREATE INDEX IF NOT EXISTS idx_hcpa_bulk_parcels_updated_at ON hcpa_bulk_parcels(updated_at);",
+    "CREATE INDEX IF NOT EXISTS idx_hcpa_allsales_loaded_at ON hcpa_allsales(loaded_at);",
+    "CREATE INDEX IF NOT EXISTS idx_ori_daily_loaded_at ON official_records_daily_instruments(loaded_at);",
+    "CREATE INDEX IF NOT EXISTS idx_clerk_events_loaded_at ON clerk_civil_events(loaded_at);",
+    "CREATE INDEX IF NOT EXISTS idx_dor_nal_parcels_loaded_at ON dor_nal_parcels(loaded_at);",
+    "CREATE INDEX IF NOT EXISTS idx_county_permits_updated_at ON county_permits(updated_at);",
+    "CREATE INDEX IF NOT EXISTS idx_tampa_accela_records_updated_at ON tampa_accela_records(updated_at);",
+    "CREATE INDEX IF NOT EXISTS idx_property_market_updated_at ON property_market(updated_at);",
 ]
 
+# Trailing unit token after a street suffix ("449 S 12TH ST 2703"); mirrors
+# the permit event SQL.
+_STREET_UNIT_SQL_RE = (
+    "( (AVE|AVENUE|ST|STREET|RD|ROAD|DR|DRIVE|LN|LANE|BLVD|BOULEVARD|PL|PLACE|CT|COURT|CIR|CIRCLE"
+    "|TRL|TRAIL|TER|TERRACE|WAY|PKWY|PARKWAY|IS|ISLE)) [A-Z0-9/-]+$"
+)
+# Single leading directional token after the house number.
+_STREET_DIRECTIONAL_SQL_RE = "^([0-9]+)[[:space:]]+(N|S|E|W)[[:space:]]+"
+# Stored watermark stand-in for a source that had no rows at the last run.
+_WATERMARK_FLOOR = dt.datetime(1970, 1, 1, tzinfo=dt.UTC)
+# Concurrent partition connections; SQLAlchemy's default QueuePool allows
+# pool_size (5) + max_overflow (10).
+_PARTITION_POOL_LIMIT = 15
+_PARTITION_RETRY_BACKOFF_SECONDS = 2.0
+
 _PARTY_NOISE_TOKENS: frozenset[str] = frozenset({
     "A",
     "AN",
@@ -280,6 +342,23 @@ class TitleChainController:
 
     GAP_STATUSES: tuple[str, ...] = ("MISSING_PARTY", "CHAINED_BY_FOLIO")
     OVERLAY_EVENT_SOURCES: tuple[str, ...] = ("ORI_DEED_SEARCH", "ORI_DEED_BACKFILL")
+    # Incremental mode: watermark key -> (table, change-timestamp column, row filter).
+    WATERMARK_SOURCES: dict[str, tuple[str, str, str]] = {
+        "foreclosures": ("foreclosures", "updated_at", ""),
+        "hcpa_bulk_parcels": ("hcpa_bulk_parcels", "updated_at", ""),
+        "hcpa_allsales": ("hcpa_allsales", "loaded_at", ""),
+        "ori_instruments": ("official_records_daily_instruments", "loaded_at", ""),
+        "clerk_civil_events": ("clerk_civil_events", "loaded_at", ""),
+        "dor_nal_parcels": ("dor_nal_parcels", "loaded_at", ""),
+        "county_permits": ("county_permits", "updated_at", ""),
+        "tampa_permits": ("tampa_accela_records", "updated_at", ""),
+        "property_market": ("property_market", "updated_at", ""),
+        "title_overlays": (
+            "foreclosure_title_events",
+            "created_at",
+            "event_source IN ('ORI_DEED_SEARCH', 'ORI_DEED_BACKFILL')",
+        ),
+    }
 
     def __init__(self, config: ControllerConfig) -> None:
         self._config = config
@@ -423,42 +502,141 @@ class TitleChainController:
 
     def run(self) -> dict[str, Any]:
         t0 = time.monotonic()
+        partitions = max(1, self._config.partitions)
+        if partitions > 1 and self._covers_all_candidates():
+            result = self._run_partitioned(partitions)
+        else:
+            with self._engine.begin() as conn:
+                self._ensure_schema(conn)
+                high_water, stored = self._watermark_state(conn)
+                result = self._merge_partition_results([self._build(conn, stored)])
+                self._save_watermarks(conn, high_water)
+        result["elapsed_seconds"] = round(time.monotonic() - t0, 2)
+        return result
+
+    def _run_partitioned(self, partitions: int) -> dict[str, Any]:
+        """Build hash partitions of the scope on separate connections.
+
+        Each partition runs the full insert/rank/score/build sequence in its
+        own transaction and commits independently, retrying on operational
+        errors (deadlocks, dropped connections).  Watermarks advance only once
+        every partition has committed, so a failed partition is picked up again
+        by the next incremental run.
+
+        A full rebuild of every foreclosure first clears the rows of
+        foreclosures that no longer exist, which the sequential path drops
+        with its TRUNCATE and the per-partition scoped deletes never reach.
+        Partial runs (``active_only``) keep rows outside their scope, as the
+        sequential path does.
+        """
         with self._engine.begin() as conn:
             self._ensure_schema(conn)
-            scope_count = self._create_scope(conn)
-            if scope_count == 0:
-                return {
-                    "scope_count": 0,
-                    "events_inserted": 0,
-                    "chain_rows": 0,
-                    "summary_rows": 0,
-                    "elapsed_seconds": round(time.monotonic() - t0, 2),
-                }
-
-            self._reset_outputs(conn)
-
-            inserted_sales = conn.execute(text(self._insert_sales_events_sql())).rowcount
-            inserted_case = conn.execute(text(self._insert_case_events_sql())).rowcount
-            inserted_judgment = conn.execute(text(self._insert_judgment_events_sql())).rowcount
-            inserted_auction = conn.execute(text(self._insert_auction_events_sql())).rowcount
-            inserted_history_auction = conn.execute(text(self._insert_history_auction_events_sql())).rowcount
-            inserted_tax = conn.execute(text(self._insert_tax_events_sql())).rowcount
-            inserted_county_permits = conn.execute(text(self._insert_county_permit_events_sql())).rowcount
-            inserted_tampa_permits = conn.execute(text(self._insert_tampa_permit_events_sql())).rowcount
-            inserted_market = conn.execute(text(self._insert_market_events_sql())).rowcount
-
-            conn.execute(text(self._rank_events_sql()))
-            conn.execute(
-                text(self._score_sales_links_sql()),
-                {"threshold": self._config.similarity_threshold},
+            high_water, stored = self._watermark_state(conn)
+            if not self._is_incremental(stored) and not self._is_partial_run():
+                self._reset_removed_foreclosures(conn)
+
+        results: list[dict[str, Any]] = []
+        failed: list[int] = []
+        workers = min(partitions, _PARTITION_POOL_LIMIT)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="title-chain") as pool:
+            futures = {
+                pool.submit(self._build_partition, stored, (index, partitions)): index
+                for index in range(partitions)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    logger.error("title_chain partition {}/{} failed: {}", index, partitions, exc)
+                    failed.append(index)
+
+        if failed:
+            raise RuntimeError(
+                f"title_chain partitions {sorted(failed)} of {partitions} failed; "
+                f"{len(results)} partition(s) committed"
             )
+        with self._engine.begin() as conn:
+            self._save_watermarks(conn, high_water)
+
+        result = self._merge_partition_results(results)
+        result["partitions"] = partitions
+        return result
+
+    def _build_partition(
+        self,
+        stored: dict[str, dt.datetime | None],
+        partition: tuple[int, int],
+    ) -> dict[str, Any]:
+        attempts = max(1, self._config.partition_attempts)
+        for attempt in range(1, attempts + 1):
+            try:
+                with self._engine.begin() as conn:
+                    return self._build(conn, stored, partition)
+            except OperationalError as exc:
+                if attempt == attempts:
+                    raise
+                logger.warning(
+                    "title_chain partition {}/{} attempt {}/{} failed; retrying: {}",
+                    partition[0],
+                    partition[1],
+                    attempt,
+                    attempts,
+                    exc,
+                )
+                time.sleep(_PARTITION_RETRY_BACKOFF_SECONDS * attempt)
+        raise AssertionError("unreachable")
+
+    def _build(
+        self,
+        conn: Any,
+        stored: dict[str, dt.datetime | None],
+        partition: tuple[int, int] | None = None,
+    ) -> dict[str, Any]:
+        """Materialize one scope (the whole run, or one hash partition) on ``conn``."""
+        incremental = self._is_incremental(stored)
+        dirty_by_source: dict[str, int] = {}
+        if incremental:
+            scope_count, dirty_by_source = self._create_incremental_scope(conn, stored, partition)
+        else:
+            scope_count = self._create_scope(conn, partition)
+        mode_stats: dict[str, Any] = {"mode": "incremental" if incremental else "full"}
+        if incremental:
+            mode_stats["dirty_by_source"] = dirty_by_source
 
-            chain_rows = conn.execute(text(self._build_chain_sql())).rowcount
-            summary_rows = conn.execute(text(self._build_summary_sql())).rowcount
+        if scope_count == 0:
+            return {
+                "scope_count": 0,
+                "events_inserted": 0,
+                "chain_rows": 0,
+                "summary_rows": 0,
+                **mode_stats,
+            }
 
-            stats = conn.execute(text(self._summary_stats_sql())).mappings().one()
+        # Partitions cannot truncate shared tables, so they always delete by scope.
+        self._reset_outputs(conn, scoped=incremental or partition is not None)
+
+        inserted_sales = conn.execute(text(self._insert_sales_events_sql())).rowcount
+        inserted_case = conn.execute(text(self._insert_case_events_sql())).rowcount
+        inserted_judgment = conn.execute(text(self._insert_judgment_events_sql())).rowcount
+        inserted_auction = conn.execute(text(self._insert_auction_events_sql())).rowcount
+        inserted_history_auction = conn.execute(text(self._insert_history_auction_events_sql())).rowcount
+        inserted_tax = conn.execute(text(self._insert_tax_events_sql())).rowcount
+        inserted_county_permits = conn.execute(text(self._insert_county_permit_events_sql())).rowcount
+        inserted_tampa_permits = conn.execute(text(self._insert_tampa_permit_events_sql())).rowcount
+        inserted_market = conn.execute(text(self._insert_market_events_sql())).rowcount
+
+        conn.execute(text(self._rank_events_sql()))
+        conn.execute(
+            text(self._score_sales_links_sql()),
+            {"threshold": self._config.similarity_threshold},
+        )
+
+        chain_rows = conn.execute(text(self._build_chain_sql())).rowcount
+        summary_rows = conn.execute(text(self._build_summary_sql())).rowcount
+
+        stats = conn.execute(text(self._summary_stats_sql())).mappings().one()
 
-        elapsed = round(time.monotonic() - t0, 2)
         result = {
             "scope_count": scope_count,
             "events_inserted": (
@@ -483,19 +661,63 @@ class TitleChainController:
             "market_events_inserted": inserted_market or 0,
             "chain_rows": chain_rows or 0,
             "summary_rows": summary_rows or 0,
-            "elapsed_seconds": elapsed,
+            **mode_stats,
         }
         result.update(dict(stats))
         return result
 
+    @staticmethod
+    def _merge_partition_results(results: list[dict[str, Any]]) -> dict[str, Any]:
+        """Sum per-partition counters; recompute the average from partial sums."""
+        if len(results) == 1:
+            merged = dict(results[0])
+            merged.pop("years_covered_sum", None)
+            merged.pop("years_covered_count", None)
+            return merged
+
+        merged: dict[str, Any] = {"mode": results[0]["mode"] if results else "full"}
+        dirty_by_source: dict[str, int] = {}
+        years_sum = Decimal(0)
+        years_count = 0
+        for result in results:
+            for key, value in result.items():
+                if key == "dirty_by_source":
+                    for source, count in value.items():
+                        dirty_by_source[source] = dirty_by_source.get(source, 0) + count
+                elif key == "years_covered_sum":
+                    years_sum += Decimal(value or 0)
+                elif key == "years_covered_count":
+                    years_count += int(value or 0)
+                elif isinstance(value, int):
+                    merged[key] = merged.get(key, 0) + value
+        if merged["mode"] == "incremental":
+            merged["dirty_by_source"] = dirty_by_source
+        if any("total_foreclosures" in result for result in results):
+            merged["avg_years_covered"] = (
+                (years_sum / years_count).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+                if years_count
+                else None
+            )
+        return merged
+
     def _ensure_schema(self, conn: Any) -> None:
         for stmt in DDL_STATEMENTS:
             conn.execute(text(stmt))
 
-    def _create_scope(self, conn: Any) -> int:
+    def _scope_filters(
+        self,
+        partition: tuple[int, int] | None = None,
+    ) -> tuple[list[str], dict[str, Any], str]:
         where_clauses = ["1=1"]
         params: dict[str, Any] = {}
 
+        if partition is not None:
+            # hashint8 is signed int4; shift it non-negative before the modulo.
+            where_clauses.append(
+                "mod(hashint8(f.foreclosure_id)::bigint + 2147483648, :partition_count) = :partition_index"
+            )
+            params["partition_index"], params["partition_count"] = partition
+
         if self._config.foreclosure_id is not None:
             where_clauses.append("f.foreclosure_id = :foreclosure_id")
             params["foreclosure_id"] = self._config.foreclosure_id
@@ -508,11 +730,11 @@ class TitleChainController:
         limit_clause = ""
         if self._config.limit and self._config.limit > 0:
             limit_clause = f"LIMIT {int(self._config.limit)}"
+        return where_clauses, params, limit_clause
 
-        conn.execute(text("DROP TABLE IF EXISTS controller_scope"))
-        conn.execute(
-            text(f"""
-                CREATE TEMP TABLE controller_scope ON COMMIT DROP AS
+    @staticmethod
+    def _scope_select_sql(where_clauses: list[str]) -> str:
+        return f"""
                 SELECT
                     f.foreclosure_id,
                     f.case_number_raw,
@@ -536,6 +758,16 @@ class TitleChainController:
                     LIMIT 1
                 ) bp ON TRUE
                 WHERE {" AND ".join(where_clauses)}
+        """
+
+    def _create_scope(self, conn: Any, partition: tuple[int, int] | None = None) -> int:
+        where_clauses, params, limit_clause = self._scope_filters(partition)
+
+        conn.execute(text("DROP TABLE IF EXISTS controller_scope"))
+        conn.execute(
+            text(f"""
+                CREATE TEMP TABLE controller_scope ON COMMIT DROP AS
+                {self._scope_select_sql(where_clauses)}
                 ORDER BY f.foreclosure_id
                 {limit_clause}
             """),
@@ -544,6 +776,245 @@ class TitleChainController:
 
         return conn.execute(text("SELECT COUNT(*) FROM controller_scope")).scalar() or 0
 
+    def _create_incremental_scope(
+        self,
+        conn: Any,
+        stored: dict[str, dt.datetime | None],
+        partition: tuple[int, int] | None = None,
+    ) -> tuple[int, dict[str, int]]:
+        """Scope the run to candidates dirtied by rows newer than the ``stored`` marks."""
+        where_clauses, params, limit_clause = self._scope_filters(partition)
+        street = self._street_key_sql("s.property_address")
+        base_street = self._street_key_sql("s.property_address", strip_unit=True)
+
+        conn.execute(text("DROP TABLE IF EXISTS controller_candidates"))
+        conn.execute(
+            text(f"""
+                CREATE TEMP TABLE controller_candidates ON COMMIT DROP AS
+                SELECT
+                    s.*,
+                    regexp_replace(s.folio, '[^0-9]', '', 'g') AS folio_digits,
+                    CASE WHEN btrim(coalesce(s.property_address, '')) <> ''
+                         THEN {street} END AS street_key,
+                    CASE WHEN btrim(coalesce(s.property_address, '')) <> ''
+                         THEN {base_street} END AS base_street_key
+                FROM ({self._scope_select_sql(where_clauses)}) s
+            """),
+            params,
+        )
+        conn.execute(text("DROP TABLE IF EXISTS controller_dirty"))
+        conn.execute(
+            text("""
+                CREATE TEMP TABLE controller_dirty (
+                    foreclosure_id BIGINT NOT NULL,
+                    source TEXT NOT NULL
+                ) ON COMMIT DROP
+            """)
+        )
+
+        overlap = dt.timedelta(minutes=max(0, self._config.watermark_overlap_minutes))
+        dirty_by_source: dict[str, int] = {}
+        for source, select_sql in self._dirty_sources_sql().items():
+            mark = stored.get(source)
+            since = mark - overlap if mark is not None else _WATERMARK_FLOOR
+            dirty_by_source[source] = (
+                conn.execute(
+                    text(f"""
+                        INSERT INTO controller_dirty (foreclosure_id, source)
+                        SELECT DISTINCT d.foreclosure_id, :source
+                        FROM ({select_sql}
+                        ) d
+                    """),
+                    {"source": source, "since": since},
+                ).rowcount
+                or 0
+            )
+
+        conn.execute(text("DROP TABLE IF EXISTS controller_scope"))
+        conn.execute(
+            text(f"""
+                CREATE TEMP TABLE controller_scope ON COMMIT DROP AS
+                SELECT
+                    c.foreclosure_id,
+                    c.case_number_raw,
+                    c.case_number_norm,
+                    c.auction_date,
+                    c.auction_status,
+                    c.folio,
+                    c.strap,
+                    c.property_address,
+                    c.winning_bid,
+                    c.final_judgment_amount,
+                    c.judgment_date,
+                    c.sold_to
+                FROM controller_candidates c
+                WHERE EXISTS (
+                    SELECT 1 FROM controller_dirty d
+                    WHERE d.foreclosure_id = c.foreclosure_id
+                )
+                ORDER BY c.foreclosure_id
+                {limit_clause}
+            """)
+        )
+
+        scope_count = conn.execute(text("SELECT COUNT(*) FROM controller_scope")).scalar() or 0
+        return scope_count, dirty_by_source
+
+    @staticmethod
+    def _street_key_sql(value_expr: str, *, strip_unit: bool = False) -> str:
+        """Street-line key with a leading directional dropped.
+
+        Any address pair the permit event SQL matches has equal keys on the
+        permit side and one of the two foreclosure-side keys (plain or with
+        the unit token stripped), so the dirty scan is a superset of it.
+        """
+        key = f"upper(trim(split_part(replace({value_expr}, E'\\t', ' '), ',', 1)))"
+        if strip_unit:
+            key = f"regexp_replace({key}, '{_STREET_UNIT_SQL_RE}', '\\1', 'g')"
+        return f"regexp_replace({key}, '{_STREET_DIRECTIONAL_SQL_RE}', '\\1 ', 'g')"
+
+    @classmethod
+    def _dirty_sources_sql(cls) -> dict[str, str]:
+        """Per-source SELECTs of candidate ids touched by rows newer than ``:since``.
+
+        Join keys mirror the event SQL (resolved folio/strap, case numbers,
+        street keys) so a changed source row dirties every chain it can feed.
+        ``unbuilt`` has no watermark; it picks up candidates never materialized.
+        """
+
+        def changed(table: str, ts_column: str, conditions: tuple[str, ...], row_filter: str = "") -> str:
+            extra = f" AND x.{row_filter}" if row_filter else ""
+            return "\n                UNION".join(
+                f"""
+                SELECT c.foreclosure_id
+                FROM controller_candidates c
+                JOIN {table} x ON {condition}
+                WHERE x.{ts_column} > :since{extra}"""
+                for condition in conditions
+            )
+
+        county_street = cls._street_key_sql("x.address")
+        tampa_street = cls._street_key_sql("coalesce(x.address_normalized, x.address_raw, '')")
+        return {
+            "unbuilt": """
+                SELECT c.foreclosure_id
+                FROM controller_candidates c
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM foreclosure_title_summary s
+                    WHERE s.foreclosure_id = c.foreclosure_id
+                )""",
+            "foreclosures": changed(
+                "foreclosures",
+                "updated_at",
+                (
+                    "x.foreclosure_id = c.foreclosure_id",
+                    # Historical auctions join on case number, folio and strap.
+                    "x.case_number_raw = c.case_number_raw",
+                    "x.folio = c.folio",
+                    "x.strap = c.strap",
+                ),
+            ),
+            "hcpa_bulk_parcels": changed(
+                "hcpa_bulk_parcels",
+                "updated_at",
+                ("x.folio = c.folio", "x.strap = c.strap"),
+            ),
+            "hcpa_allsales": changed("hcpa_allsales", "loaded_at", ("x.folio = c.folio",)),
+            "ori_instruments": """
+                SELECT c.foreclosure_id
+                FROM official_records_daily_instruments x
+                JOIN hcpa_allsales s ON s.doc_num = x.instrument_number
+                JOIN controller_candidates c ON c.folio = s.folio
+                WHERE x.loaded_at > :since""",
+            "clerk_civil_events": changed(
+                "clerk_civil_events",
+                "loaded_at",
+                ("x.case_number = c.case_number_norm",),
+            ),
+            "dor_nal_parcels": changed(
+                "dor_nal_parcels",
+                "loaded_at",
+                ("x.folio = c.folio", "x.strap = c.strap"),
+            ),
+            "county_permits": changed(
+                "county_permits",
+                "updated_at",
+                (
+                    "regexp_replace(coalesce(x.folio_clean, x.folio_raw, ''), '[^0-9]', '', 'g') = c.folio_digits",
+                    f"{county_street} = c.street_key",
+                    f"{county_street} = c.base_street_key",
+                ),
+            ),
+            "tampa_permits": changed(
+                "tampa_accela_records",
+                "updated_at",
+                (f"{tampa_street} = c.street_key", f"{tampa_street} = c.base_street_key"),
+            ),
+            "property_market": changed(
+                "property_market",
+                "updated_at",
+                (
+                    "x.strap = c.strap",
+                    "x.folio = c.folio",
+                    "x.case_number = c.case_number_raw",
+                ),
+            ),
+            "title_overlays": changed(
+                "foreclosure_title_events",
+                "created_at",
+                ("x.foreclosure_id = c.foreclosure_id",),
+                cls.WATERMARK_SOURCES["title_overlays"][2],
+            ),
+        }
+
+    def _covers_all_candidates(self) -> bool:
+        """False when the run is narrowed by foreclosure id, case number or limit.
+
+        Only such runs may advance the watermarks or be split into partitions.
+        """
+        return self._config.foreclosure_id is None and self._config.case_number is None and not self._config.limit
+
+    def _watermark_state(
+        self,
+        conn: Any,
+    ) -> tuple[dict[str, dt.datetime | None], dict[str, dt.datetime | None]]:
+        """Return (current high-water marks to save, stored marks to scan from)."""
+        high_water: dict[str, dt.datetime | None] = {}
+        stored: dict[str, dt.datetime | None] = {}
+        if self._covers_all_candidates():
+            high_water = self._read_high_water(conn)
+        if self._config.incremental and self._config.foreclosure_id is None and self._config.case_number is None:
+            stored = self._load_watermarks(conn)
+        return high_water, stored
+
+    def _read_high_water(self, conn: Any) -> dict[str, dt.datetime | None]:
+        columns = []
+        for source, (table, ts_column, row_filter) in self.WATERMARK_SOURCES.items():
+            where = f" WHERE {row_filter}" if row_filter else ""
+            columns.append(f"(SELECT max({ts_column}) FROM {table}{where}) AS {source}")
+        row = conn.execute(text("SELECT " + ", ".join(columns))).mappings().one()
+        return {source: row[source] for source in self.WATERMARK_SOURCES}
+
+    @staticmethod
+    def _load_watermarks(conn: Any) -> dict[str, dt.datetime | None]:
+        rows = conn.execute(text("SELECT source, high_water FROM title_chain_watermarks")).all()
+        return {str(source): high_water for source, high_water in rows}
+
+    @staticmethod
+    def _save_watermarks(conn: Any, high_water: dict[str, dt.datetime | None]) -> None:
+        if not high_water:
+            return
+        conn.execute(
+            text("""
+                INSERT INTO title_chain_watermarks (source, high_water, updated_at)
+                VALUES (:source, :high_water, now())
+                ON CONFLICT (source) DO UPDATE
+                SET high_water = EXCLUDED.high_water,
+                    updated_at = EXCLUDED.updated_at
+            """),
+            [{"source": source, "high_water": mark} for source, mark in high_water.items()],
+        )
+
     def _is_partial_run(self) -> bool:
         return any([
             self._config.foreclosure_id is not None,
@@ -552,9 +1023,25 @@ class TitleChainController:
             self._config.limit is not None,
         ])
 
-    def _reset_outputs(self, conn: Any) -> None:
+    def _is_incremental(self, stored: dict[str, dt.datetime | None]) -> bool:
+        return bool(stored) and set(self.WATERMARK_SOURCES) <= set(stored)
+
+    def _reset_removed_foreclosures(self, conn: Any) -> None:
+        """Delete derived rows of foreclosures that no longer exist."""
+        existing_sql = "SELECT 1 FROM foreclosures f WHERE f.foreclosure_id = t.foreclosure_id"
+        overlay_sql = self._overlay_source_sql("t.event_source")
+        for table, extra in (
+            ("foreclosure_title_summary", ""),
+            ("foreclosure_title_chain", ""),
+            ("foreclosure_title_events", f" AND NOT ({overlay_sql})"),
+        ):
+            conn.execute(
+                text(f"DELETE FROM {table} t WHERE NOT EXISTS ({existing_sql}){extra}")
+            )
+
+    def _reset_outputs(self, conn: Any, *, scoped: bool = False) -> None:
         overlay_sql = self._overlay_source_sql("event_source")
-        if self._is_partial_run():
+        if scoped or self._is_partial_run():
             conn.execute(
                 text("""
                 DELETE FROM foreclosure_title_summary
@@ -1380,7 +1867,9 @@ class TitleChainController:
                 ROUND(
                     AVG(years_covered) FILTER (WHERE years_covered IS NOT NULL),
                     2
-                ) AS avg_years_covered
+                ) AS avg_years_covered,
+                SUM(years_covered) AS years_covered_sum,
+                COUNT(years_covered) AS years_covered_count
             FROM foreclosure_title_summary
             WHERE foreclosure_id IN (SELECT foreclosure_id FROM controller_scope)
         """
@@ -0,0 +1,202 @@
+"""Async listing-photo downloader with per-CDN-host limits.
+
+Used by ``MarketDataService`` to backfill ``data/Foreclosure/{case}/photos/``
+from ``property_market.photo_cdn_urls``.
+
+- every CDN host gets its own ``requests.Session`` (keep-alive pool sized to
+  the host's concurrency), an ``asyncio.Semaphore`` and a token bucket, so a
+  slow or strict host never holds back the others;
+- bodies stream to ``<name>.part`` and are renamed into place when complete,
+  so an interrupted download is never mistaken for a finished photo;
+- blocking HTTP runs on a small dedicated thread pool; the event loop only
+  schedules and paces.
+
+Configuration (environment):
+
+| Variable | Default | Meaning |
+|---|---|---|
+| ``MARKET_PHOTO_HOST_CONCURRENCY`` | 4 | simultaneous downloads per CDN host |
+| ``MARKET_PHOTO_HOST_RATE`` | 4 | sustained requests per second per host (0 = unpaced) |
+| ``MARKET_PHOTO_HOST_BURST`` | 4 | requests a host may receive back-to-back |
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Self
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+MAX_PHOTOS = 15
+DOWNLOAD_TIMEOUT = 15
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+IMAGE_EXTENSIONS: dict[str, str] = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+}
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+)
+DEFAULT_HOST_CONCURRENCY = max(1, int(os.getenv("MARKET_PHOTO_HOST_CONCURRENCY", "4")))
+DEFAULT_HOST_RATE = max(0.0, float(os.getenv("MARKET_PHOTO_HOST_RATE", "4")))
+DEFAULT_HOST_BURST = max(1, int(os.getenv("MARKET_PHOTO_HOST_BURST", "4")))
+
+
+def photo_index(photos_dir: Path) -> dict[str, Path]:
+    """Map ``{idx:03d}_{hash}`` stems to the finished files in ``photos_dir``.
+
+    One directory listing per property replaces a ``glob()`` per photo.
+    Partial ``.part`` files are ignored.
+    """
+    index: dict[str, Path] = {}
+    with contextlib.suppress(FileNotFoundError):
+        for path in sorted(photos_dir.iterdir()):
+            if path.suffix == ".part" or not path.is_file():
+                continue
+            index.setdefault(path.name.split(".", 1)[0], path)
+    return index
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second, up to ``burst`` banked."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = rate
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """Wait for one token; return seconds waited."""
+        if self._rate <= 0:
+            return 0.0
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) / self._rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+
+class _HostLane:
+    """Session, concurrency slot and pacing for one CDN host."""
+
+    def __init__(self, concurrency: int, rate: float, burst: int) -> None:
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.slots = asyncio.Semaphore(concurrency)
+        self.bucket = TokenBucket(rate, burst)
+
+
+class PhotoDownloader:
+    """Download photos concurrently, bounded and paced per CDN host.
+
+    Use as an ``async with`` block inside one event loop; the lanes, sessions
+    and worker threads are released on exit.
+    """
+
+    def __init__(
+        self,
+        host_concurrency: int = DEFAULT_HOST_CONCURRENCY,
+        host_rate: float = DEFAULT_HOST_RATE,
+        host_burst: int = DEFAULT_HOST_BURST,
+        max_workers: int = 16,
+    ) -> None:
+        self.host_concurrency = max(1, host_concurrency)
+        self.host_rate = max(0.0, host_rate)
+        self.host_burst = max(1, host_burst)
+        self._lanes: dict[str, _HostLane] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="market-photos"
+        )
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for lane in self._lanes.values():
+            lane.session.close()
+        self._lanes.clear()
+
+    def _lane(self, url: str) -> _HostLane:
+        host = urlsplit(url).netloc.lower()
+        lane = self._lanes.get(host)
+        if lane is None:
+            lane = _HostLane(self.host_concurrency, self.host_rate, self.host_burst)
+            self._lanes[host] = lane
+        return lane
+
+    async def fetch(self, url: str, photos_dir: Path, stem: str) -> Path | None:
+        """Download ``url`` to ``photos_dir/stem<ext>``.
+
+        Returns the written path, or ``None`` when the CDN answered with a
+        non-200 status or a non-image body.  Transport errors propagate.
+        """
+        lane = self._lane(url)
+        async with lane.slots:
+            await lane.bucket.acquire()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, _stream_to_disk, lane.session, url, photos_dir, stem
+            )
+
+
+def _stream_to_disk(
+    session: requests.Session, url: str, photos_dir: Path, stem: str
+) -> Path | None:
+    with session.get(url, timeout=DOWNLOAD_TIMEOUT, stream=True) as resp:
+        if resp.status_code != 200:
+            return None
+        content_type = (
+            resp.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        )
+        ext = IMAGE_EXTENSIONS.get(content_type)
+        if ext is None:
+            return None
+        target = photos_dir / f"{stem}{ext}"
+        part = target.with_name(f"{target.name}.part")
+        try:
+            with part.open("wb") as fh:
+                for chunk in resp.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        fh.write(chunk)
+            part.replace(target)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+    return target
@@ -5,6 +5,18 @@ service so the pipeline can extract OCR and structured JSON from clerk PDFs and
 rendered images. The service is used in high-volume enrichment flows, so response
 parsing needs to tolerate provider-specific edge cases such as content-filtered
 responses that omit ``message.content`` entirely.
+
+Requests are dispatched across every healthy endpoint at once rather than one
+at a time.  Each endpoint URL has a concurrency limit (``max_concurrency`` on
+the endpoint dict, ``VISION_ENDPOINT_CONCURRENCY``, or a local/cloud default);
+each request picks the unsuspended endpoint with the fewest outstanding
+requests relative to its limit, breaking ties by latency EWMA and then by the
+configured priority order.  Failover, suspension and single-endpoint backoff
+behave as before.  See docs/guides/VISION_DISPATCH.md.
+
+``analyze_image`` / ``analyze_images`` / ``analyze_text`` consult the
+content-addressed result cache in ``src.services.llm_result_cache`` before
+dispatching, so an identical page/text + prompt is only sent once.
 """
 
 import asyncio
@@ -14,15 +26,22 @@ import io
 import json
 import os
 import re
+import threading
 import time
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from json_repair import repair_json
 from loguru import logger
 from PIL import Image
 
+from src.services.llm_result_cache import llm_cache_get, llm_cache_put, note_bypass
+from src.services.pdf_render import RenderedPage
+
 
 def _extract_json_candidate(text: str) -> Optional[str]:
     start = text.find("{")
@@ -1113,6 +1132,21 @@ Include the following sections if visible:
 """
 
 
+@dataclass
+class _EndpointLoad:
+    """Live dispatch state for one endpoint URL (shared by all instances)."""
+
+    limit: int
+    outstanding: int = 0
+    requests: int = 0
+    failures: int = 0
+    latency_ewma: float | None = None
+
+    @property
+    def load(self) -> float:
+        return self.outstanding / self.limit
+
+
 class VisionService:
     """
     Service for interacting with Qwen Vision API for image analysis and OCR.
@@ -1210,6 +1244,21 @@ class VisionService:
     _CONNECT_TIMEOUT = 10  # seconds
     _CLOUD_READ_TIMEOUT = 60  # seconds — cloud endpoints are fast
 
+    # Per-endpoint concurrency.  A local vLLM box batches a couple of requests
+    # well; cloud endpoints take more.  Override per endpoint with
+    # ``max_concurrency`` or globally with VISION_ENDPOINT_CONCURRENCY.
+    _LOCAL_ENDPOINT_CONCURRENCY = 2
+    _CLOUD_ENDPOINT_CONCURRENCY = 4
+    _LATENCY_EWMA_ALPHA = 0.3
+    # How long a caller waits for a free endpoint slot before re-checking
+    # suspensions (the wait itself is unbounded while endpoints are busy).
+    _SLOT_WAIT_SECONDS = 1.0
+
+    # Dispatch state keyed by endpoint URL (several models may share a URL,
+    # and they share the same GPU).
+    _endpoint_loads: dict[str, _EndpointLoad] = {}
+    _dispatch_cond = threading.Condition()
+
     @classmethod
     def _ensure_endpoints_built(cls):
         """Build endpoint list once (includes cloud fallbacks if API keys are set)."""
@@ -1233,10 +1282,17 @@ class VisionService:
 
         self.session = requests.Session()
         self.session.headers.update({"Connection": "keep-alive"})
+        # Concurrent dispatch shares this session across worker threads; size
+        # the connection pool so requests are not serialized on it.
+        pool_size = max(10, VisionService.dispatch_capacity())
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self._active_endpoint = None
-        if not hasattr(VisionService, "_global_semaphore"):
-            VisionService._global_semaphore = asyncio.Semaphore(1)
-        self._semaphore = VisionService._global_semaphore
+        self._semaphore = VisionService.global_semaphore()
+        # Endpoint that answered the last request on this thread, so the
+        # result cache can key by the model that actually produced it.
+        self._thread_state = threading.local()
 
     @classmethod
     def health_check_endpoints(cls, timeout: int = 15) -> list[dict]:
@@ -1344,10 +1400,138 @@ class VisionService:
 
     @classmethod
     def global_semaphore(cls) -> asyncio.Semaphore:
-        """Expose the shared semaphore for cross-service throttling."""
-        if not hasattr(cls, "_global_semaphore"):
-            cls._global_semaphore = asyncio.Semaphore(1)
-        return cls._global_semaphore
+        """Expose the shared semaphore for cross-service throttling.
+
+        Sized to ``dispatch_capacity()`` so async callers can keep every
+        endpoint busy; per-endpoint limits are enforced by the dispatcher.
+        """
+        if not hasattr(VisionService, "_global_semaphore"):
+            VisionService._global_semaphore = asyncio.Semaphore(cls.dispatch_capacity())
+        return VisionService._global_semaphore
+
+    @classmethod
+    def _endpoint_limit(cls, endpoint: dict) -> int:
+        explicit = endpoint.get("max_concurrency")
+        if explicit:
+            return max(1, int(explicit))
+        raw = os.getenv("VISION_ENDPOINT_CONCURRENCY", "").strip()
+        if raw:
+            try:
+                return max(1, int(raw))
+            except ValueError:
+                logger.warning("Ignoring invalid VISION_ENDPOINT_CONCURRENCY={!r}", raw)
+        if endpoint.get("api_key"):
+            return cls._CLOUD_ENDPOINT_CONCURRENCY
+        return cls._LOCAL_ENDPOINT_CONCURRENCY
+
+    @classmethod
+    def _load_for(cls, endpoint: dict) -> _EndpointLoad:
+        """Return (creating if needed) the dispatch state for ``endpoint``.
+
+        Caller must hold ``_dispatch_cond``.
+        """
+        url = endpoint["url"]
+        state = VisionService._endpoint_loads.get(url)
+        if state is None:
+            state = _EndpointLoad(limit=cls._endpoint_limit(endpoint))
+            VisionService._endpoint_loads[url] = state
+        return state
+
+    @classmethod
+    def dispatch_capacity(cls) -> int:
+        """Total concurrent requests the available endpoints accept."""
+        cls._ensure_endpoints_built()
+        endpoints = cls._healthy_endpoints if cls._health_check_done and cls._healthy_endpoints else cls.API_ENDPOINTS
+        limits: dict[str, int] = {}
+        for endpoint in endpoints:
+            limits[endpoint["url"]] = max(limits.get(endpoint["url"], 0), cls._endpoint_limit(endpoint))
+        return max(1, sum(limits.values()))
+
+    @classmethod
+    def endpoint_stats(cls) -> dict[str, dict[str, Any]]:
+        """Snapshot of per-endpoint dispatch counters for run summaries."""
+        with VisionService._dispatch_cond:
+            return {
+                url: {
+                    "limit": state.limit,
+                    "outstanding": state.outstanding,
+                    "requests": state.requests,
+                    "failures": state.failures,
+                    "latency_ewma_s": round(state.latency_ewma, 2) if state.latency_ewma is not None else None,
+                }
+                for url, state in VisionService._endpoint_loads.items()
+            }
+
+    @classmethod
+    def _reserve_endpoint(
+        cls,
+        endpoints: list[dict],
+        tried: set[tuple[str, str]],
+        skipped_suspended: list[tuple[float, dict[str, Any]]],
+    ) -> dict | None:
+        """Reserve a slot on the least-loaded eligible endpoint.
+
+        Eligible means not yet tried by this call and not suspended.  When
+        every eligible endpoint is at its limit the caller blocks until a slot
+        frees up.  Returns ``None`` once nothing eligible is left.
+        """
+        with VisionService._dispatch_cond:
+            while True:
+                now = time.monotonic()
+                candidates: list[tuple[int, dict]] = []
+                for index, endpoint in enumerate(endpoints):
+                    url = endpoint["url"]
+                    model = endpoint["model"]
+                    if (url, model) in tried:
+                        continue
+                    resume_at = VisionService._suspended_endpoints.get(url)
+                    if resume_at is not None:
+                        if now < resume_at:
+                            if not any(ep is endpoint for _, ep in skipped_suspended):
+                                skipped_suspended.append((resume_at, endpoint))
+                                logger.debug(
+                                    "Skipping suspended endpoint {} (model: {}) ({:.0f}s remaining)",
+                                    url,
+                                    model,
+                                    resume_at - now,
+                                )
+                            continue
+                        # Suspension expired, allow retry
+                        VisionService._suspended_endpoints.pop(url, None)
+                    candidates.append((index, endpoint))
+                if not candidates:
+                    return None
+
+                best: tuple[tuple[float, float, int], dict] | None = None
+                for index, endpoint in candidates:
+                    state = cls._load_for(endpoint)
+                    if state.outstanding >= state.limit:
+                        continue
+                    # Unmeasured endpoints sort as fast so they get tried.
+                    rank = (state.load, state.latency_ewma or 0.0, index)
+                    if best is None or rank < best[0]:
+                        best = (rank, endpoint)
+                if best is not None:
+                    state = cls._load_for(best[1])
+                    state.outstanding += 1
+                    state.requests += 1
+                    return best[1]
+                VisionService._dispatch_cond.wait(timeout=cls._SLOT_WAIT_SECONDS)
+
+    @classmethod
+    def _release_endpoint(cls, endpoint: dict, *, latency: float | None) -> None:
+        """Free a reserved slot; ``latency`` is set only for successful calls."""
+        with VisionService._dispatch_cond:
+            state = cls._load_for(endpoint)
+            state.outstanding = max(0, state.outstanding - 1)
+            if latency is None:
+                state.failures += 1
+            elif state.latency_ewma is None:
+                state.latency_ewma = latency
+            else:
+                alpha = cls._LATENCY_EWMA_ALPHA
+                state.latency_ewma = alpha * latency + (1 - alpha) * state.latency_ewma
+            VisionService._dispatch_cond.notify_all()
 
     @property
     def API_URL(self) -> str:  # noqa: N802
@@ -1398,6 +1582,10 @@ class VisionService:
         On timeout or connection error, try the next endpoint.
 
         Uses pre-filtered healthy endpoints from startup health check if available.
+        Each attempt goes to the least-loaded untried endpoint (see
+        ``_reserve_endpoint``), so concurrent callers spread across endpoints
+        instead of all starting on the first one.  Safe to call from many
+        threads at once.
         """
         available = self.get_available_endpoints()
         if not available:
@@ -1411,33 +1599,18 @@ class VisionService:
 
         def _attempt(endpoints: list[dict], read_timeout: int) -> Optional[requests.Response]:
             nonlocal _single_ep_retries
-            now = time.monotonic()
-            for endpoint in endpoints:
+            while True:
+                endpoint = VisionService._reserve_endpoint(endpoints, tried_endpoints, skipped_suspended)
+                if endpoint is None:
+                    return None
                 url = endpoint["url"]
                 model = endpoint["model"]
                 endpoint_key = (url, model)
-                if endpoint_key in tried_endpoints:
-                    logger.debug(
-                        "Skipping already-tried endpoint {} (model: {})",
-                        url,
-                        model,
-                    )
-                    continue
-                # Skip endpoints that are temporarily suspended (recently timed out)
-                resume_at = VisionService._suspended_endpoints.get(url)
-                if resume_at is not None:
-                    if now < resume_at:
-                        skipped_suspended.append((resume_at, endpoint))
-                        logger.debug(
-                            "Skipping suspended endpoint {} (model: {}) ({:.0f}s remaining)",
-                            url,
-                            model,
-                            resume_at - now,
-                        )
-                        continue
-                    # Suspension expired, allow retry
-                    del VisionService._suspended_endpoints[url]
                 tried_endpoints.add(endpoint_key)
+                started = time.monotonic()
+                latency: float | None = None
+                retry_same = False
+                retry_wait = 0
                 try:
                     is_cloud = bool(endpoint.get("api_key"))
                     label = "cloud" if is_cloud else "local"
@@ -1464,7 +1637,9 @@ class VisionService:
                         timeout=(VisionService._CONNECT_TIMEOUT, ep_read_timeout),
                     )
                     if response.ok:
+                        latency = time.monotonic() - started
                         self._active_endpoint = endpoint
+                        self._thread_state.last_endpoint = endpoint
                         return response
                     try:
                         err_body = response.text[:300]
@@ -1498,17 +1673,18 @@ class VisionService:
                                     _single_ep_retries,
                                     response.status_code,
                                 )
-                                time.sleep(wait)
+                                retry_wait = wait
                                 tried_endpoints.discard(endpoint_key)
-                                return _attempt(endpoints, read_timeout)
-                        suspend_secs = VisionService._SUSPEND_HTTP_ERROR
-                        VisionService._suspended_endpoints[url] = time.monotonic() + suspend_secs
-                        logger.info(
-                            "Suspended endpoint {} for {}s after HTTP {}",
-                            url,
-                            suspend_secs,
-                            response.status_code,
-                        )
+                                retry_same = True
+                        if not retry_same:
+                            suspend_secs = VisionService._SUSPEND_HTTP_ERROR
+                            VisionService._suspended_endpoints[url] = time.monotonic() + suspend_secs
+                            logger.info(
+                                "Suspended endpoint {} for {}s after HTTP {}",
+                                url,
+                                suspend_secs,
+                                response.status_code,
+                            )
                 except requests.exceptions.Timeout as e:
                     logger.warning("Timeout on endpoint {} (model: {}): {}", url, model, e)
                     errors.append(f"{url} ({model}): Timeout")
@@ -1525,17 +1701,19 @@ class VisionService:
                         suspend_secs,
                         is_connect_timeout,
                     )
-                    continue
                 except requests.exceptions.ConnectionError as e:
                     logger.warning("Connection error on endpoint {} (model: {}): {}", url, model, e)
                     errors.append(f"{url} ({model}): Connection error")
                     VisionService._suspended_endpoints[url] = time.monotonic() + VisionService._SUSPEND_CONN_REFUSED
-                    continue
                 except Exception as e:
                     logger.warning("Error on endpoint {} (model: {}): {}", url, model, e)
                     errors.append(f"{url} ({model}): {e}")
-                    continue
-            return None
+                finally:
+                    VisionService._release_endpoint(endpoint, latency=latency)
+                if retry_wait:
+                    # Sleep after releasing the slot so other callers can use
+                    # the endpoint meanwhile; the retry reserves a fresh one.
+                    time.sleep(retry_wait)
 
         response = _attempt(available, timeout)
         if response is not None:
@@ -1582,6 +1760,28 @@ class VisionService:
         logger.error("All vision endpoints failed: {}", errors)
         return None
 
+    def _cached_text(self, payload: dict, *, use_cache: bool) -> Optional[str]:
+        """Return a cached completion for ``payload`` from any available model."""
+        if not use_cache:
+            note_bypass()
+            return None
+        # Every configured model, not just healthy ones: no health probe on
+        # the hot path, and an answer from a model that is down right now is
+        # still the answer that model gave.
+        models = [endpoint["model"] for endpoint in self.API_ENDPOINTS]
+        return llm_cache_get(payload, models)
+
+    def _store_text(self, payload: dict, response_text: Optional[str], *, use_cache: bool) -> None:
+        if not use_cache or not response_text:
+            return
+        # Never pin a malformed structured answer: a re-run should get a
+        # fresh attempt rather than the same unparseable output.
+        if payload.get("response_format") is not None and robust_json_parse(response_text, "llm_result_cache") is None:
+            return
+        endpoint = getattr(self._thread_state, "last_endpoint", None)
+        if endpoint is not None:
+            llm_cache_put(payload, endpoint["model"], response_text)
+
     def reset_active_url(self):
         """Reset cached URL to force re-check on next request."""
         self._active_endpoint = None
@@ -1625,33 +1825,23 @@ class VisionService:
                 logger.debug(f"Vision health check fallback failed: {e2}")
                 return False
 
-    def _encode_image(self, image_path: str, max_dimension: int = 1024) -> str:
+    def _encode_image(self, image_path: str | RenderedPage, max_dimension: int = 1024) -> str:
         """
         Encode image to base64 string, resizing if necessary.
 
+        ``image_path`` may also be an in-memory ``RenderedPage``; its pixel
+        buffer is encoded directly with no PNG round-trip through disk.
+
         Qwen2-VL Recommendation:
         - 1024-1280px balances document legibility and token usage.
         - Higher resolutions exponentially increase token count and VRAM usage.
         - 1024px is a safe default for most document pages.
         """
+        if isinstance(image_path, RenderedPage):
+            return self._encode_pil_image(image_path.to_image(), max_dimension)
         try:
             with Image.open(image_path) as img:
-                # Convert to RGB if needed (e.g. for RGBA or P modes)
-                if img.mode not in ("RGB", "L"):
-                    img = img.convert("RGB")
-
-                # Resize if too large
-                width, height = img.size
-                if width > max_dimension or height > max_dimension:
-                    ratio = min(max_dimension / width, max_dimension / height)
-                    new_size = (int(width * ratio), int(height * ratio))
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-                    # logger.debug(f"Resized image {image_path} from {width}x{height} to {new_size[0]}x{new_size[1]}")
-
-                # Save to buffer
-                buffer = io.BytesIO()
-                img.save(buffer, format="JPEG", quality=85)
-                return base64.b64encode(buffer.getvalue()).decode()
+                return self._encode_pil_image(img, max_dimension)
         except Exception as e:
             logger.warning(f"Failed to process image {image_path} with PIL: {e}. Falling back to raw read.")
             # Try rasterizing PDFs via pymupdf before sending raw bytes
@@ -1670,21 +1860,43 @@ class VisionService:
             with open(image_path, "rb") as f:
                 return base64.b64encode(f.read()).decode()
 
+    @staticmethod
+    def _encode_pil_image(img: Image.Image, max_dimension: int) -> str:
+        """Resize ``img`` to fit ``max_dimension`` and return base64 JPEG."""
+        # Convert to RGB if needed (e.g. for RGBA or P modes)
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+
+        # Resize if too large
+        width, height = img.size
+        if width > max_dimension or height > max_dimension:
+            ratio = min(max_dimension / width, max_dimension / height)
+            new_size = (int(width * ratio), int(height * ratio))
+            img = img.resize(new_size, Image.Resampling.LANCZOS)
+
+        # Save to buffer
+        buffer = io.BytesIO()
+        img.save(buffer, format="JPEG", quality=85)
+        return base64.b64encode(buffer.getvalue()).decode()
+
     def analyze_image(
         self,
-        image_path: str,
+        image_path: str | RenderedPage,
         prompt: str,
         max_tokens: int = 1024,
         response_format: dict[str, Any] | None = None,
+        *,
+        use_cache: bool = True,
     ) -> Optional[str]:
         """
         Analyze an image with a text prompt.
         Tries all available endpoints on failure.
 
         Args:
-            image_path: Path to the image file.
+            image_path: Path to the image file, or an in-memory rendered page.
             prompt: Text prompt for the model.
             max_tokens: Max tokens for response.
+            use_cache: Set False to skip the LLM result cache for this call.
 
         Returns:
             The text response from the model, or None if failed.
@@ -1710,13 +1922,19 @@ class VisionService:
             if response_format is not None:
                 payload["response_format"] = response_format
 
+            cached = self._cached_text(payload, use_cache=use_cache)
+            if cached is not None:
+                return cached
+
             response = self._try_all_endpoints(payload, timeout=120)
             if response is None:
                 logger.error("All vision endpoints failed for {}", image_path)
                 return None
 
             result = response.json()
-            return _extract_response_text(result, context=image_path)
+            response_text = _extract_response_text(result, context=image_path)
+            self._store_text(payload, response_text, use_cache=use_cache)
+            return response_text
 
         except Exception as e:
             logger.exception("Vision API error while analyzing {}: {}", image_path, e)
@@ -1728,19 +1946,22 @@ class VisionService:
 
     def analyze_images(
         self,
-        image_paths: list[str],
+        image_paths: Sequence[str | RenderedPage],
         prompt: str,
         max_tokens: int = 4000,
         response_format: dict[str, Any] | None = None,
+        *,
+        use_cache: bool = True,
     ) -> Optional[str]:
         """
         Analyze multiple images with a single text prompt in one request.
         Tries all available endpoints on failure.
 
         Args:
-            image_paths: List of image file paths.
+            image_paths: Image file paths and/or in-memory rendered pages.
             prompt: Text prompt for the model.
             max_tokens: Max tokens for response.
+            use_cache: Set False to skip the LLM result cache for this call.
 
         Returns:
             The text response from the model, or None if failed.
@@ -1763,6 +1984,10 @@ class VisionService:
             if response_format is not None:
                 payload["response_format"] = response_format
 
+            cached = self._cached_text(payload, use_cache=use_cache)
+            if cached is not None:
+                return cached
+
             # Scale timeout with page count: 60s base + 60s per image (local GLM is slow)
             timeout = 60 + 60 * len(image_paths)
             response = self._try_all_endpoints(payload, timeout=timeout)
@@ -1771,10 +1996,12 @@ class VisionService:
                 return None
 
             result = response.json()
-            return _extract_response_text(
+            response_text = _extract_response_text(
                 result,
                 context=f"{len(image_paths)}-image request",
             )
+            self._store_text(payload, response_text, use_cache=use_cache)
+            return response_text
 
         except Exception as e:
             logger.exception("Vision API Error (multi-image): {}", e)
@@ -1785,6 +2012,8 @@ class VisionService:
         prompt: str,
         max_tokens: int = 4000,
         response_format: dict[str, Any] | None = None,
+        *,
+        use_cache: bool = True,
     ) -> Optional[str]:
         """Analyze text-only input with the configured chat-completions endpoints."""
         try:
@@ -1797,13 +2026,19 @@ class VisionService:
             if response_format is not None:
                 payload["response_format"] = response_format
 
+            cached = self._cached_text(payload, use_cache=use_cache)
+            if cached is not None:
+                return cached
+
             response = self._try_all_endpoints(payload, timeout=120)
             if response is None:
                 logger.error("All vision endpoints failed for text-only request")
                 return None
 
             result = response.json()
-            return _extract_response_text(result, context="text-only request")
+            response_text = _extract_response_text(result, context="text-only request")
+            self._store_text(payload, response_text, use_cache=use_cache)
+            return response_text
 
         except Exception as e:
             logger.exception("Vision API Error (text-only): {}", e)
@@ -1817,7 +2052,7 @@ class VisionService:
         result = self.analyze_image(image_path, prompt)
         return result or ""
 
-    def extract_json(self, image_path: str, prompt: str) -> Optional[Dict[str, Any]]:
+    def extract_json(self, image_path: str | RenderedPage, prompt: str) -> Optional[Dict[str, Any]]:
         """
         Extract structured data as JSON.
         """
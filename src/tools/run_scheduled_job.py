@@ -142,6 +142,7 @@ def _run_sunbiz_daily_job(dsn: str, args_json: dict[str, Any]) -> dict[str, Any]
             args_json.get("no_skip_unchanged"),
             default=False,
         ),
+        workers=_int_or_none(args_json.get("workers")),
     )
     if int(load_stats.get("files_discovered") or 0) <= 0:
         raise RuntimeError("sunbiz_daily discovered no daily files to load into PG")
@@ -187,6 +188,7 @@ def _run_sunbiz_entity_quarterly_job(dsn: str, args_json: dict[str, Any]) -> dic
         limit_files=_int_or_none(args_json.get("limit_files")),
         limit_lines=_int_or_none(args_json.get("limit_lines")),
         batch_size=max(1, _int_or_default(args_json.get("batch_size"), _DEFAULT_BATCH_SIZE)),
+        workers=_int_or_none(args_json.get("workers")),
     )
     if int(load_stats.get("files_scanned") or 0) <= 0:
         raise RuntimeError("sunbiz_entity_quarterly scanned no entity files after the quarterly sync")
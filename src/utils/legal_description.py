@@ -13,10 +13,13 @@ ORI search is picky about format. The same property might be recorded as:
 This module generates search permutations to find the right match.
 """
 
+import dataclasses
 import re
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from dataclasses import dataclass, field
 from loguru import logger
+import polars as pl
 from rapidfuzz import fuzz
 
 
@@ -68,6 +71,14 @@ ABBREVIATIONS = {
 
 _BLOCK_STOPWORDS = {"OF", "IN", "AT", "TO", "BY"}
 
+# Bound on memoized parses/permutation lists.  The ORI, identifier-recovery
+# and audit passes re-parse the same HCPA legal strings many times per run;
+# bulk loads bypass the cache so they do not evict that working set.
+LEGAL_PARSE_CACHE_SIZE = 65536
+
+# LegalDescription fields persisted per parcel by parse_legal_column.
+LEGAL_COLUMN_FIELDS = ("lot", "block", "subdivision", "plat_book", "plat_page")
+
 
 def combine_legal_fields(legal1: str, legal2: str | None = None,
                          legal3: str | None = None, legal4: str | None = None) -> str:
@@ -91,12 +102,60 @@ def parse_legal_description(raw_text: str) -> LegalDescription:
     """
     Parse a legal description into its components.
 
+    Parses are memoized on the normalized (upper-cased, stripped) text; each
+    call returns its own copy, so callers may mutate the result.
+
     Args:
         raw_text: Raw legal description text
 
     Returns:
         LegalDescription with parsed components
     """
+    if not raw_text:
+        return LegalDescription(raw_text="")
+    key = raw_text.upper().strip()
+    if not key:
+        return _parse_legal_text(raw_text)
+    parsed = _parse_legal_cached(key)
+    return dataclasses.replace(parsed, raw_text=raw_text, lots=list(parsed.lots))
+
+
+@lru_cache(maxsize=LEGAL_PARSE_CACHE_SIZE)
+def _parse_legal_cached(key: str) -> LegalDescription:
+    return _parse_legal_text(key)
+
+
+def parse_legal_column(legal: pl.Series) -> pl.DataFrame:
+    """
+    Parse a whole column of legal descriptions.
+
+    Each distinct value is parsed once, without touching the
+    ``parse_legal_description`` cache.
+
+    Args:
+        legal: Legal description text (nulls and blanks parse to nulls)
+
+    Returns:
+        Frame aligned row-for-row with ``legal`` holding one Utf8
+        ``legal_<field>`` column per ``LEGAL_COLUMN_FIELDS`` entry
+    """
+    text = legal.cast(pl.Utf8).fill_null("").rename("_legal")
+    distinct = text.unique(maintain_order=True)
+    parsed = [_parse_legal_text(value) for value in distinct]
+    lookup = pl.DataFrame(
+        {
+            "_legal": distinct,
+            **{
+                f"legal_{name}": pl.Series([getattr(p, name) for p in parsed], dtype=pl.Utf8)
+                for name in LEGAL_COLUMN_FIELDS
+            },
+        }
+    )
+    return text.to_frame().join(lookup, on="_legal", how="left", maintain_order="left").drop("_legal")
+
+
+def _parse_legal_text(raw_text: str) -> LegalDescription:
+    """Uncached parse behind ``parse_legal_description``."""
     if not raw_text:
         return LegalDescription(raw_text="")
 
@@ -373,6 +432,18 @@ def generate_search_permutations(legal: LegalDescription, raw_legal: str = "", m
         - First: exact matches (no wildcard)
         - Then: wildcard matches
     """
+    key = tuple(tuple(value) if isinstance(value, list) else value for value in vars(legal).values())
+    return list(_search_permutations_cached(key, raw_legal, max_permutations))
+
+
+@lru_cache(maxsize=LEGAL_PARSE_CACHE_SIZE)
+def _search_permutations_cached(key: tuple, raw_legal: str, max_permutations: int) -> Tuple[str, ...]:
+    legal = LegalDescription(*(list(value) if isinstance(value, tuple) else value for value in key))
+    return tuple(_search_permutations(legal, raw_legal, max_permutations))
+
+
+def _search_permutations(legal: LegalDescription, raw_legal: str, max_permutations: int) -> List[str]:
+    """Uncached body of ``generate_search_permutations``."""
     exact_terms = []      # No wildcard - exact match
     wildcard_terms = []   # With wildcard - broader search
 
@@ -703,7 +774,16 @@ def build_ori_search_terms(folio: str, legal1: str | None, legal2: str | None =
 
     Returns:
         List of search terms to try, ordered by likelihood of success
+        (memoized on the legal text; ``folio`` only labels the log line)
     """
+    specific_terms, candidate_count = _ori_search_terms_cached(legal1, legal2, legal3, legal4, judgment_legal)
+    logger.debug(f"Generated {len(specific_terms)} search terms for folio {folio} (filtered from {candidate_count})")
+    return list(specific_terms)
+
+
+@lru_cache(maxsize=LEGAL_PARSE_CACHE_SIZE)
+def _ori_search_terms_cached(legal1: str | None, legal2: str | None, legal3: str | None, legal4: str | None,
+                             judgment_legal: str | None) -> Tuple[Tuple[str, ...], int]:
     search_terms = []
 
     # Priority 1: Final Judgment legal description (most authoritative)
@@ -814,8 +894,7 @@ def build_ori_search_terms(folio: str, legal1: str | None, legal2: str | None =
         if has_specific:
             specific_terms.append(term)
 
-    logger.debug(f"Generated {len(specific_terms)} search terms for folio {folio} (filtered from {len(search_terms)})")
-    return specific_terms
+    return tuple(specific_terms), len(search_terms)
 
 
 def match_legal_descriptions(desc1: str, desc2: str, threshold: float = 0.8) -> Tuple[bool, float]:
@@ -3,11 +3,33 @@ Name Matcher Utility.
 
 Handles robust name comparison for Chain of Title construction.
 Implements Token-Set logic, Superset/Subset detection, and Fuzzy matching.
+
+Batch matching: ``NameIndex`` normalizes a corpus once (cached, interned token
+sets), keeps an inverted index over alias-mapped tokens and a length-sorted
+view, and only scores pairs that can match: token-based match types need a
+shared (alias-mapped) token, and the string-similarity fallback needs
+comparable lengths.  Every score equals ``NameMatcher.match`` for the pair.
 """
 
 import re
+import sys
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from difflib import SequenceMatcher
-from typing import Set, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# FUZZY_STRING requires SequenceMatcher.ratio() above this.
+_STRING_RATIO_THRESHOLD = 0.88
+
+
+class PreparedName(NamedTuple):
+    """A name normalized once for repeated matching."""
+
+    upper: str
+    tokens: FrozenSet[str]
+    aliased: FrozenSet[str]
+
 
 class NameMatcher:
 
@@ -113,6 +135,11 @@ class NameMatcher:
         # For title chains, initials add noise and create false matches.
         return {t for t in tokens if t not in cls.STOPWORDS and len(t) > 1}
 
+    @classmethod
+    def prepare(cls, name: str) -> PreparedName:
+        """Return the cached normalized form of ``name`` (see ``normalize``)."""
+        return _prepare_name(name or "")
+
     @classmethod
     def match(cls, name1: str, name2: str) -> Tuple[str, float]:
         """
@@ -129,8 +156,13 @@ class NameMatcher:
         if not name1 or not name2:
             return "NONE", 0.0
 
-        set1 = cls.normalize(name1)
-        set2 = cls.normalize(name2)
+        return cls.match_prepared(cls.prepare(name1), cls.prepare(name2))
+
+    @classmethod
+    def match_prepared(cls, name1: PreparedName, name2: PreparedName) -> Tuple[str, float]:
+        """``match`` on names already passed through ``prepare``."""
+        set1 = name1.tokens
+        set2 = name2.tokens
         
         if not set1 or not set2:
             return "NONE", 0.0
@@ -155,11 +187,7 @@ class NameMatcher:
         # 3. Alias / Nickname Check
         # If sets are disjoint or low overlap, check if one token maps to another via Alias
         # e.g. {BOB, SMITH} vs {ROBERT, SMITH} -> Intersection {SMITH}
-        # Map set1 aliases
-        set1_mapped = {cls.ALIASES.get(t, t) for t in set1}
-        set2_mapped = {cls.ALIASES.get(t, t) for t in set2}
-        
-        if set1_mapped == set2_mapped:
+        if name1.aliased == name2.aliased:
             return "ALIAS", 0.90
 
         # 4. Fuzzy / Jaccard Similarity
@@ -171,12 +199,25 @@ class NameMatcher:
 
         # 5. String Similarity (Levenshtein via SequenceMatcher)
         # Good for typos: "Steven" vs "Stephen"
-        ratio = SequenceMatcher(None, name1.upper(), name2.upper()).ratio()
-        if ratio > 0.88:
+        # The length bound and quick_ratio() are upper bounds on ratio(), so
+        # pairs they rule out could never clear the threshold.
+        len1, len2 = len(name1.upper), len(name2.upper)
+        if 2.0 * min(len1, len2) / (len1 + len2) <= _STRING_RATIO_THRESHOLD:
+            return "NONE", 0.0
+        matcher = SequenceMatcher(None, name1.upper, name2.upper)
+        if matcher.quick_ratio() <= _STRING_RATIO_THRESHOLD:
+            return "NONE", 0.0
+        ratio = matcher.ratio()
+        if ratio > _STRING_RATIO_THRESHOLD:
             return "FUZZY_STRING", round(ratio, 2)
 
         return "NONE", 0.0
 
+    @classmethod
+    def match_many(cls, name: str, candidates: Iterable[str]) -> List[Tuple[str, float]]:
+        """``match(name, candidate)`` for every candidate, in order."""
+        return NameIndex(candidates).match(name)
+
     @classmethod
     def are_linked(cls, name1: str, name2: str, threshold: float = 0.8) -> bool:
         """
@@ -188,6 +229,70 @@ class NameMatcher:
 
         return match_type in valid_types and score >= threshold
 
+@lru_cache(maxsize=65536)
+def _prepare_name(name: str) -> PreparedName:
+    tokens = frozenset(sys.intern(t) for t in NameMatcher.normalize(name))
+    aliased = frozenset(sys.intern(NameMatcher.ALIASES.get(t, t)) for t in tokens)
+    return PreparedName(upper=name.upper(), tokens=tokens, aliased=aliased)
+
+
+class NameIndex:
+    """Match query names against a fixed corpus normalized once.
+
+    ``match`` returns exactly ``[NameMatcher.match(query, n) for n in names]``;
+    the inverted token index and the length window only skip pairs that are
+    guaranteed to score ``("NONE", 0.0)``.
+    """
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names: List[str] = [name or "" for name in names]
+        self._prepared = [NameMatcher.prepare(name) for name in self.names]
+        self._by_token: Dict[str, List[int]] = defaultdict(list)
+        by_length: List[Tuple[int, int]] = []
+        for position, prepared in enumerate(self._prepared):
+            if not prepared.tokens:
+                continue
+            for token in prepared.aliased:
+                self._by_token[token].append(position)
+            by_length.append((len(prepared.upper), position))
+        by_length.sort()
+        self._lengths = [length for length, _ in by_length]
+        self._length_positions = [position for _, position in by_length]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _candidates(self, query: PreparedName) -> Set[int]:
+        # Token match types (EXACT .. FUZZY_JACCARD) share an alias-mapped token.
+        positions = {p for token in query.aliased for p in self._by_token.get(token, ())}
+        # FUZZY_STRING needs 2 * min(len) / (len1 + len2) > threshold.
+        length = len(query.upper)
+        factor = _STRING_RATIO_THRESHOLD / (2.0 - _STRING_RATIO_THRESHOLD)
+        lo = bisect_left(self._lengths, int(length * factor))
+        hi = bisect_right(self._lengths, int(length / factor) + 1)
+        positions.update(self._length_positions[lo:hi])
+        return positions
+
+    def match(self, name: str) -> List[Tuple[str, float]]:
+        results: List[Tuple[str, float]] = [("NONE", 0.0)] * len(self.names)
+        if not name:
+            return results
+        query = NameMatcher.prepare(name)
+        if not query.tokens:
+            return results
+        for position in self._candidates(query):
+            results[position] = NameMatcher.match_prepared(query, self._prepared[position])
+        return results
+
+    def best(self, name: str) -> Tuple[Optional[int], str, float]:
+        """First corpus position with the highest positive score, or ``None``."""
+        best: Tuple[Optional[int], str, float] = (None, "NONE", 0.0)
+        for position, (match_type, score) in enumerate(self.match(name)):
+            if score > best[2]:
+                best = (position, match_type, score)
+        return best
+
+
 if __name__ == "__main__":
     # Test cases
     cases = [
@@ -0,0 +1,538 @@
+"""COPY-based bulk upsert engine shared by the Sunbiz, HCPA and Clerk loaders.
+
+The bulk loaders used to write every batch as one
+``INSERT ... VALUES (...), (...) ... ON CONFLICT`` statement built by
+``pg_insert(Model).values(rows)``.  Every value became a bind parameter, so a
+batch was capped at ``PG_MAX_BIND_PARAMS`` (65535) values and loading the
+weekly HCPA parcel file (~480k rows x ~40 columns) or a quarterly Sunbiz
+entity dump spent most of its time in SQLAlchemy compilation, parameter
+binding and server-side parsing of giant statements.
+
+``copy_upsert()`` replaces that with three set-based statements per batch on
+the session's own connection and transaction:
+
+1. ``CREATE TEMP TABLE ... ON COMMIT DROP AS SELECT <cols> FROM <target>
+   WITH NO DATA`` -- a staging table with exactly the target's column types
+   and no constraints or indexes.  Temp tables are never WAL-logged, so this
+   is the session-private equivalent of an ``UNLOGGED`` staging table.
+2. ``COPY <stage> (<cols>) FROM STDIN`` streamed row by row through psycopg's
+   ``Cursor.copy()`` (no bind parameters, no statement size limit).
+3. ``INSERT INTO <target> (<cols>) SELECT <cols> FROM <stage>
+   ON CONFLICT ... DO UPDATE SET ... | DO NOTHING`` -- the same conflict
+   target and update expressions the loaders already used.
+
+The staging table is dropped right after the merge so one transaction can
+run several batches (``load_sunbiz_entity`` writes a whole file in one
+transaction).
+
+Semantics the callers rely on are unchanged:
+
+- In-batch dedup stays in the loaders' ``_dedup_*`` helpers and runs before
+  the rows are staged; ``DO UPDATE`` still requires conflict keys to be
+  unique within one call.
+- Columns missing from the row dicts behave exactly as they did with
+  ``pg_insert().values()``: Python-side column defaults (e.g. ``updated_at``
+  lambdas) are filled in here, server defaults apply on insert, and
+  ``EXCLUDED.<col>`` carries the default on conflict.
+- ``JSON``/``JSONB`` columns accept Python ``dict``/``list`` values.
+- ``ingest_files`` bookkeeping is untouched; it stays with the loaders.
+
+``copy_upsert_frame()`` is the same merge for a Polars ``DataFrame`` (the
+columnar Sunbiz parsers, the HCPA parcel/LatLon loads and the DOR NAL load)
+and ``copy_insert_frame()`` COPYs a frame straight into an append-only
+snapshot table (HCPA allsales/subdivisions).  Fixed per-load values such as
+``source_file_id`` and ``updated_at`` are passed as ``constants`` and become
+Polars literal columns instead of being written into every row.  Frames are
+streamed to ``COPY ... (FORMAT csv)`` as ``write_csv`` text in
+``_CSV_CHUNK_ROWS``-row slices, so no Python object is built per row or per
+value; frames bound for JSON columns (or carrying nested dtypes) fall back to
+``iter_rows()`` tuples and ``write_row``.
+
+``StagedUpsert`` splits the same flow in two: many COPY batches into one
+per-target staging table, then a single ordered merge.  The parallel Sunbiz
+ingest workers use it to stage files concurrently and merge them in order.
+
+``copy_upsert`` needs the psycopg 3 driver (``postgresql+psycopg://``, the
+repo default DSN) because it uses ``Cursor.copy()``; every entry point checks
+the session's driver before touching the database and raises
+``UnsupportedDriverError`` for anything else (e.g. a bare ``postgresql://``
+DSN, which SQLAlchemy maps to psycopg2).
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import time
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+from loguru import logger
+from sqlalchemy import text as sa_text
+from sqlalchemy.types import JSON
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
+    from sqlalchemy import Table
+    from sqlalchemy.orm import Session
+
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_CSV_CHUNK_ROWS = 50_000
+# Unquoted \N is NULL; the CSV writer quotes every string, so a literal "\N"
+# value (and the empty string) survive as text.
+_CSV_NULL = "\\N"
+_CSV_COPY_OPTIONS = f"(FORMAT csv, NULL '{_CSV_NULL}')"
+
+
+class UnsupportedDriverError(RuntimeError):
+    """The session's DBAPI driver cannot run ``Cursor.copy()``."""
+
+
+def _require_psycopg(session: Session) -> None:
+    """Fail before the first statement unless the session runs on psycopg 3."""
+    bind = session.get_bind() if hasattr(session, "get_bind") else None
+    driver = getattr(getattr(bind, "dialect", None), "driver", None)
+    if driver is not None and driver != "psycopg":
+        raise UnsupportedDriverError(
+            f"COPY bulk loads need the psycopg 3 driver, but this DSN uses {driver!r}; "
+            "use a postgresql+psycopg:// DSN."
+        )
+
+
+def _ident(name: str) -> str:
+    if not _IDENTIFIER_RE.match(name):
+        raise ValueError(f"Unsafe SQL identifier: {name!r}")
+    return f'"{name}"'
+
+
+def _as_table(model_or_table: Any) -> Table:
+    return getattr(model_or_table, "__table__", model_or_table)
+
+
+def excluded_updates(
+    model_or_table: Any,
+    exclude: Iterable[str] = (),
+) -> dict[str, str]:
+    """``{col: "EXCLUDED.col"}`` for every column not in ``exclude``.
+
+    Mirrors the ``{col.name: stmt.excluded.<col>}`` dicts the loaders used to
+    build for ``on_conflict_do_update``.
+    """
+    skip = set(exclude)
+    return {
+        col.name: f"EXCLUDED.{_ident(col.name)}"
+        for col in _as_table(model_or_table).columns
+        if col.name not in skip
+    }
+
+
+def coalesce_updates(
+    model_or_table: Any,
+    columns: Iterable[str],
+) -> dict[str, str]:
+    """``{col: "COALESCE(<table>.col, EXCLUDED.col)"}`` -- keep existing non-nulls."""
+    table_name = _ident(_as_table(model_or_table).name)
+    return {
+        name: f"COALESCE({table_name}.{_ident(name)}, EXCLUDED.{_ident(name)})"
+        for name in columns
+    }
+
+
+def _python_defaults(table: Table, provided: set[str]) -> dict[str, Any]:
+    """Evaluate client-side column defaults for columns the rows do not carry."""
+    defaults: dict[str, Any] = {}
+    for col in table.columns:
+        if col.name in provided or col.default is None:
+            continue
+        default = col.default
+        if getattr(default, "is_scalar", False):
+            defaults[col.name] = default.arg
+        elif getattr(default, "is_callable", False):
+            defaults[col.name] = default.arg(None)
+    return defaults
+
+
+def _row_adapter(
+    table: Table,
+    columns: Sequence[str],
+) -> Callable[[list[Any]], list[Any]] | None:
+    json_positions: list[int] = [
+        idx for idx, name in enumerate(columns) if isinstance(table.columns[name].type, JSON)
+    ]
+    if not json_positions:
+        return None
+    from psycopg.types.json import Jsonb
+
+    def adapt(values: list[Any]) -> list[Any]:
+        for idx in json_positions:
+            if values[idx] is not None:
+                values[idx] = Jsonb(values[idx])
+        return values
+
+    return adapt
+
+
+def copy_upsert(
+    session: Session,
+    model_or_table: Any,
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    conflict_columns: Sequence[str] | None = None,
+    conflict_constraint: str | None = None,
+    update: Mapping[str, str] | None = None,
+) -> int:
+    """Stage ``rows`` with COPY and merge them into the target in one statement.
+
+    ``update`` maps column -> SQL expression for ``DO UPDATE SET`` (see
+    ``excluded_updates`` / ``coalesce_updates``); ``None`` means
+    ``DO NOTHING``.  Returns the merge statement's rowcount.
+    """
+    if not rows:
+        return 0
+    _require_psycopg(session)
+    table = _as_table(model_or_table)
+    columns, values = _row_values(table, rows)
+    return _stage_and_merge(
+        session,
+        table,
+        columns,
+        lambda stage: _copy_rows(session, table, stage, columns, values),
+        len(rows),
+        conflict_columns=conflict_columns,
+        conflict_constraint=conflict_constraint,
+        update=update,
+    )
+
+
+def copy_upsert_frame(
+    session: Session,
+    model_or_table: Any,
+    frame: pl.DataFrame,
+    *,
+    conflict_columns: Sequence[str] | None = None,
+    conflict_constraint: str | None = None,
+    update: Mapping[str, str] | None = None,
+    constants: Mapping[str, Any] | None = None,
+) -> int:
+    """``copy_upsert`` for a Polars frame.
+
+    Frame columns must be target column names; ``constants`` adds columns
+    with one value for every row (and wins over a frame column of the same
+    name).  The frame is streamed as CSV text, or as ``iter_rows()`` tuples
+    when it feeds a JSON column (struct columns arrive as dicts and are
+    adapted).
+    """
+    if frame.height == 0:
+        return 0
+    _require_psycopg(session)
+    table = _as_table(model_or_table)
+    columns, write = _frame_writer(session, table, frame, constants)
+    return _stage_and_merge(
+        session,
+        table,
+        columns,
+        write,
+        frame.height,
+        conflict_columns=conflict_columns,
+        conflict_constraint=conflict_constraint,
+        update=update,
+    )
+
+
+def copy_insert_frame(
+    session: Session,
+    model_or_table: Any,
+    frame: pl.DataFrame,
+    *,
+    constants: Mapping[str, Any] | None = None,
+) -> int:
+    """COPY ``frame`` directly into the target: no staging table, no conflict handling.
+
+    For append-only snapshot tables whose loaders clear the previous
+    snapshot first.  Returns the number of rows copied.
+    """
+    if frame.height == 0:
+        return 0
+    _require_psycopg(session)
+    table = _as_table(model_or_table)
+    started = time.perf_counter()
+    _columns, write = _frame_writer(session, table, frame, constants)
+    write(_ident(table.name))
+    logger.debug("COPY insert {}: {} row(s) in {:.2f}s", table.name, frame.height, time.perf_counter() - started)
+    return frame.height
+
+
+class StagedUpsert:
+    """Stage many batches for one target with COPY, then merge them once.
+
+    ``copy_upsert`` merges every batch as soon as it is staged.  The parallel
+    Sunbiz ingest workers instead COPY a whole file into one staging table
+    while other workers do the same, and only merge when it is their file's
+    turn (see ``sunbiz/parallel_ingest.py``), so upserts reach the target in
+    file order and never contend for the same rows.
+
+    The staging table carries a ``_stage_seq`` identity column.  A
+    ``DO UPDATE`` merge keeps the *last* staged row per conflict key, matching
+    the "later batch wins" result of merging batch by batch; a ``DO NOTHING``
+    merge inserts in staging order so the first row wins as before.  Every
+    batch must carry the same columns.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        model_or_table: Any,
+        *,
+        conflict_columns: Sequence[str] | None = None,
+        conflict_constraint: str | None = None,
+        update: Mapping[str, str] | None = None,
+    ) -> None:
+        _check_conflict_target(conflict_columns, conflict_constraint)
+        _require_psycopg(session)
+        self.session = session
+        self.table = _as_table(model_or_table)
+        self.conflict_columns = conflict_columns
+        self.conflict_constraint = conflict_constraint
+        self.update = update
+        self.columns: list[str] | None = None
+        self.staged = 0
+        self._stage = _ident(f"_staged_{self.table.name}")
+
+    def stage_rows(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        if rows:
+            columns, values = _row_values(self.table, rows)
+            self._copy(
+                columns,
+                lambda stage: _copy_rows(self.session, self.table, stage, columns, values),
+                len(rows),
+            )
+
+    def stage_frame(self, frame: pl.DataFrame, constants: Mapping[str, Any] | None = None) -> None:
+        if frame.height:
+            columns, write = _frame_writer(self.session, self.table, frame, constants)
+            self._copy(columns, write, frame.height)
+
+    def _copy(self, columns: list[str], write: Callable[[str], None], count: int) -> None:
+        if self.columns is None:
+            self.columns = columns
+            col_sql = ", ".join(_ident(name) for name in columns)
+            self.session.execute(
+                sa_text(
+                    f"CREATE TEMP TABLE {self._stage} ON COMMIT DROP AS "
+                    f"SELECT {col_sql} FROM {_ident(self.table.name)} WITH NO DATA"
+                )
+            )
+            self.session.execute(
+                sa_text(f'ALTER TABLE {self._stage} ADD COLUMN "_stage_seq" bigint GENERATED ALWAYS AS IDENTITY')
+            )
+        elif columns != self.columns:
+            raise ValueError(
+                f"StagedUpsert {self.table.name}: batch columns {columns} differ from staged columns {self.columns}"
+            )
+        write(self._stage)
+        self.staged += count
+
+    def merge(self) -> int:
+        """Merge everything staged so far into the target and drop the staging table."""
+        if self.columns is None:
+            return 0
+        started = time.perf_counter()
+        col_sql = ", ".join(_ident(name) for name in self.columns)
+        keys = _conflict_key_columns(self.table, self.conflict_columns, self.conflict_constraint)
+        if self.update and keys:
+            key_sql = ", ".join(_ident(name) for name in keys)
+            source_sql = (
+                f"SELECT DISTINCT ON ({key_sql}) {col_sql} FROM {self._stage} "
+                f'ORDER BY {key_sql}, "_stage_seq" DESC'
+            )
+        else:
+            source_sql = f'SELECT {col_sql} FROM {self._stage} ORDER BY "_stage_seq"'
+        result = self.session.execute(
+            sa_text(
+                f"INSERT INTO {_ident(self.table.name)} ({col_sql}) {source_sql} "
+                f"{_conflict_sql(self.conflict_columns, self.conflict_constraint, self.update)}"
+            )
+        )
+        self.session.execute(sa_text(f"DROP TABLE {self._stage}"))
+        merged = int(result.rowcount or 0)
+        logger.debug(
+            "Staged merge {}: {} staged row(s), merged {} in {:.2f}s",
+            self.table.name,
+            self.staged,
+            merged,
+            time.perf_counter() - started,
+        )
+        self.columns = None
+        self.staged = 0
+        return merged
+
+
+def _check_columns(table: Table, provided: set[str]) -> None:
+    unknown = provided - set(table.columns.keys())
+    if unknown:
+        raise ValueError(f"Unknown columns for {table.name}: {sorted(unknown)}")
+
+
+def _check_conflict_target(conflict_columns: Sequence[str] | None, conflict_constraint: str | None) -> None:
+    if (conflict_columns is None) == (conflict_constraint is None):
+        raise ValueError("copy_upsert needs exactly one of conflict_columns / conflict_constraint")
+
+
+def _row_values(table: Table, rows: Sequence[Mapping[str, Any]]) -> tuple[list[str], Iterator[list[Any]]]:
+    provided: set[str] = set()
+    for row in rows:
+        provided.update(row.keys())
+    _check_columns(table, provided)
+    defaults = _python_defaults(table, provided)
+    columns = [col.name for col in table.columns if col.name in provided or col.name in defaults]
+
+    def values() -> Iterator[list[Any]]:
+        for row in rows:
+            yield [row[name] if name in row else defaults.get(name) for name in columns]
+
+    return columns, values()
+
+
+def _frame_writer(
+    session: Session,
+    table: Table,
+    frame: pl.DataFrame,
+    constants: Mapping[str, Any] | None,
+) -> tuple[list[str], Callable[[str], None]]:
+    """Return the COPY column list and a ``write(stage)`` for ``frame``.
+
+    Python-side column defaults are filled like ``constants``.
+    """
+    fixed = dict(constants or {})
+    provided = set(frame.columns) | set(fixed)
+    _check_columns(table, provided)
+    fixed = {**_python_defaults(table, provided), **fixed}
+    frame_columns = [col.name for col in table.columns if col.name in frame.columns and col.name not in fixed]
+    fixed_columns = [col.name for col in table.columns if col.name in fixed]
+    columns = frame_columns + fixed_columns
+
+    if _csv_copyable(table, frame, columns):
+        out = frame.select(frame_columns).with_columns(pl.lit(fixed[name]).alias(name) for name in fixed_columns)
+        return columns, lambda stage: _copy_frame_csv(session, stage, columns, out)
+
+    fixed_values = [fixed[name] for name in fixed_columns]
+
+    def values() -> Iterator[list[Any]]:
+        for row in frame.select(frame_columns).iter_rows():
+            yield [*row, *fixed_values]
+
+    return columns, lambda stage: _copy_rows(session, table, stage, columns, values())
+
+
+def _csv_copyable(table: Table, frame: pl.DataFrame, columns: Sequence[str]) -> bool:
+    if any(isinstance(table.columns[name].type, JSON) for name in columns):
+        return False
+    return not any(
+        dtype.is_nested() or dtype in {pl.Binary, pl.Object}
+        for name, dtype in frame.schema.items()
+        if name in columns
+    )
+
+
+def _conflict_sql(
+    conflict_columns: Sequence[str] | None,
+    conflict_constraint: str | None,
+    update: Mapping[str, str] | None,
+) -> str:
+    if conflict_constraint is not None:
+        conflict_sql = f"ON CONFLICT ON CONSTRAINT {_ident(conflict_constraint)}"
+    else:
+        conflict_sql = f"ON CONFLICT ({', '.join(_ident(c) for c in conflict_columns or ())})"
+    if update:
+        set_sql = ", ".join(f"{_ident(name)} = {expr}" for name, expr in update.items())
+        return f"{conflict_sql} DO UPDATE SET {set_sql}"
+    return f"{conflict_sql} DO NOTHING"
+
+
+def _conflict_key_columns(
+    table: Table,
+    conflict_columns: Sequence[str] | None,
+    conflict_constraint: str | None,
+) -> list[str]:
+    if conflict_columns is not None:
+        return list(conflict_columns)
+    for constraint in table.constraints:
+        if constraint.name == conflict_constraint:
+            return [col.name for col in getattr(constraint, "columns", ())]
+    return []
+
+
+def _copy_rows(
+    session: Session,
+    table: Table,
+    stage: str,
+    columns: Sequence[str],
+    values: Iterable[list[Any]],
+) -> None:
+    col_sql = ", ".join(_ident(name) for name in columns)
+    adapt = _row_adapter(table, columns)
+    dbapi_conn = session.connection().connection.dbapi_connection
+    with dbapi_conn.cursor() as cur, cur.copy(f"COPY {stage} ({col_sql}) FROM STDIN") as copy:
+        for row_values in values:
+            copy.write_row(adapt(row_values) if adapt else row_values)
+
+
+def _copy_frame_csv(session: Session, stage: str, columns: Sequence[str], frame: pl.DataFrame) -> None:
+    col_sql = ", ".join(_ident(name) for name in columns)
+    dbapi_conn = session.connection().connection.dbapi_connection
+    with dbapi_conn.cursor() as cur, cur.copy(f"COPY {stage} ({col_sql}) FROM STDIN {_CSV_COPY_OPTIONS}") as copy:
+        for offset in range(0, frame.height, _CSV_CHUNK_ROWS):
+            buffer = io.BytesIO()
+            frame.slice(offset, _CSV_CHUNK_ROWS).write_csv(
+                buffer,
+                include_header=False,
+                null_value=_CSV_NULL,
+                quote_style="non_numeric",
+            )
+            copy.write(buffer.getbuffer())
+
+
+def _stage_and_merge(
+    session: Session,
+    table: Table,
+    columns: Sequence[str],
+    write: Callable[[str], None],
+    staged: int,
+    *,
+    conflict_columns: Sequence[str] | None,
+    conflict_constraint: str | None,
+    update: Mapping[str, str] | None,
+) -> int:
+    _check_conflict_target(conflict_columns, conflict_constraint)
+    if not columns:
+        return 0
+
+    target = _ident(table.name)
+    stage = _ident(f"_stage_{table.name}")
+    col_sql = ", ".join(_ident(name) for name in columns)
+
+    started = time.perf_counter()
+    session.execute(
+        sa_text(
+            f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+            f"SELECT {col_sql} FROM {target} WITH NO DATA"
+        )
+    )
+    write(stage)
+    result = session.execute(
+        sa_text(
+            f"INSERT INTO {target} ({col_sql}) SELECT {col_sql} FROM {stage} "
+            f"{_conflict_sql(conflict_columns, conflict_constraint, update)}"
+        )
+    )
+    session.execute(sa_text(f"DROP TABLE {stage}"))
+    merged = int(result.rowcount or 0)
+    logger.debug(
+        "COPY upsert {}: staged {} row(s), merged {} in {:.2f}s",
+        table.name,
+        staged,
+        merged,
+        time.perf_counter() - started,
+    )
+    return merged
@@ -15,6 +15,7 @@ from sqlalchemy import String
 from sqlalchemy import Text
 from sqlalchemy import UniqueConstraint
 from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import Mapped
@@ -358,8 +359,17 @@ class HcpaBulkParcel(Base):
     raw_legal2: Mapped[str | None] = mapped_column(Text, nullable=True)
     raw_legal3: Mapped[str | None] = mapped_column(Text, nullable=True)
     raw_legal4: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # raw_legal1..4 parsed once at load time (src.utils.legal_description).
+    legal_lot: Mapped[str | None] = mapped_column(Text, nullable=True)
+    legal_block: Mapped[str | None] = mapped_column(Text, nullable=True)
+    legal_subdivision: Mapped[str | None] = mapped_column(Text, nullable=True)
+    legal_plat_book: Mapped[str | None] = mapped_column(Text, nullable=True)
+    legal_plat_page: Mapped[str | None] = mapped_column(Text, nullable=True)
     latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
     longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    # Content hash of the loaded columns; load_hcpa_bulk only rewrites a row
+    # (and bumps updated_at) when this changes between weekly dumps.
+    row_hash: Mapped[str | None] = mapped_column(String(32), nullable=True)
     source_file_id: Mapped[int] = mapped_column(ForeignKey("ingest_files.id", ondelete="CASCADE"), nullable=False)
     updated_at: Mapped[dt.datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: dt.datetime.now(dt.UTC)
@@ -372,6 +382,48 @@ class HcpaBulkParcel(Base):
     )
 
 
+class HcpaParcelLegalIndex(Base):
+    """Pre-parsed legal-description keys per parcel, refreshed by ``load_hcpa_bulk``.
+
+    ``legal_text`` is the upper-cased ``raw_legal1..4`` join that identifier
+    recovery matches with LIKE / regex (trigram-indexed).  The ``*_keys``
+    arrays hold every token written after a LOT/LT/L, BLOCK/BLK/B or UNIT/UN/U
+    keyword, so a lot/block/unit lookup is an indexed array containment.
+    ``subdivision`` and ``plat_book`` / ``plat_page`` are the parsed
+    ``hcpa_bulk_parcels.legal_*`` values.
+    """
+
+    __tablename__ = "hcpa_parcel_legal_index"
+
+    folio: Mapped[str] = mapped_column(
+        String(32), ForeignKey("hcpa_bulk_parcels.folio", ondelete="CASCADE"), primary_key=True
+    )
+    legal_text: Mapped[str] = mapped_column(Text, nullable=False)
+    subdivision: Mapped[str | None] = mapped_column(Text, nullable=True)
+    lot_keys: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False)
+    block_keys: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False)
+    unit_keys: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False)
+    plat_book: Mapped[str | None] = mapped_column(Text, nullable=True)
+    plat_page: Mapped[str | None] = mapped_column(Text, nullable=True)
+    updated_at: Mapped[dt.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: dt.datetime.now(dt.UTC)
+    )
+
+    __table_args__ = (
+        # GIN trigram index (requires pg_trgm) serves the LIKE '%term%' / ~* lookups.
+        Index(
+            "idx_hcpa_parcel_legal_index_text_trgm",
+            "legal_text",
+            postgresql_using="gin",
+            postgresql_ops={"legal_text": "gin_trgm_ops"},
+        ),
+        Index("idx_hcpa_parcel_legal_index_lot_keys", "lot_keys", postgresql_using="gin"),
+        Index("idx_hcpa_parcel_legal_index_block_keys", "block_keys", postgresql_using="gin"),
+        Index("idx_hcpa_parcel_legal_index_unit_keys", "unit_keys", postgresql_using="gin"),
+        Index("idx_hcpa_parcel_legal_index_plat", "plat_book", "plat_page"),
+    )
+
+
 class HcpaParcelDorName(Base):
     __tablename__ = "hcpa_parcel_dor_names"
 
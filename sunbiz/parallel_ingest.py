@@ -0,0 +1,133 @@
+"""Process-pool runner for the per-file Sunbiz loaders.
+
+``load_sunbiz_raw``, ``load_sunbiz_flr`` and ``load_sunbiz_entity`` process
+their input files one at a time on one session.  Each file already has its own
+``ingest_files`` row and its own transaction, so files are independent units of
+work; after an outage the daily backlog is dozens of files that only wait on
+each other because of the loop.
+
+``run_file_workers()`` runs one job per file on a spawn-context
+``ProcessPoolExecutor`` (parsing is CPU-bound, so threads would serialize on
+the GIL).  Every worker process opens its own engine and session, so a file's
+transaction never shares a connection with another file.
+
+Ordering
+--------
+Raw loads write rows keyed by their own ``file_id`` and need no ordering
+(``ordered=False``).
+
+Entity and FLR loads upsert into shared tables where a later file must win
+(daily ``YYYYMMDDc.txt`` files replace quarterly rows in date order).  With
+``ordered=True`` the jobs share a ``MergeGate``:
+
+1. every worker parses its file and COPYs the rows into private staging tables
+   (``bulk_copy.StagedUpsert``) concurrently -- this is the expensive part;
+2. before merging into the target tables, the worker for file ``n`` waits in
+   ``MergeGate.acquire(n)`` until files ``0..n-1`` have merged or failed;
+3. it merges, marks its ``ingest_files`` row, commits, and
+   ``MergeGate.release(n)`` hands the turn on.
+
+Merges therefore run in exactly the sequential loader's order and never
+contend for the same rows (no deadlocks, deterministic "last file wins").
+Jobs are submitted in file order and the pool hands them out FIFO, so the file
+holding the turn has always been started.  If a file fails, the gate records
+it; later files abort at their turn instead of merging past the gap (the
+sequential loader stops at the first failure too).
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from multiprocessing.managers import SyncManager
+    from pathlib import Path
+
+_GATE_POLL_SECONDS = 5.0
+
+
+class EarlierFileFailedError(RuntimeError):
+    """Raised at a file's merge turn when an earlier file in the run failed."""
+
+
+class MergeGate:
+    """Cross-process turnstile: file ``seq`` merges only after ``0..seq-1``."""
+
+    def __init__(self, manager: SyncManager) -> None:
+        self._cond = manager.Condition()
+        self._turn = manager.Value("i", 0)
+        self._failed = manager.Value("b", 0)
+
+    def wait(self, seq: int) -> None:
+        """Block until every file before ``seq`` has merged or failed."""
+        with self._cond:
+            while self._turn.value < seq:
+                self._cond.wait(timeout=_GATE_POLL_SECONDS)
+
+    def acquire(self, seq: int) -> None:
+        """``wait`` for the turn, then refuse it if an earlier file failed."""
+        self.wait(seq)
+        if self._failed.value:
+            raise EarlierFileFailedError("an earlier file in this ordered load failed; not merging past it")
+
+    def release(self, seq: int, *, failed: bool) -> None:
+        with self._cond:
+            if failed:
+                self._failed.value = 1
+            if self._turn.value <= seq:
+                self._turn.value = seq + 1
+            self._cond.notify_all()
+
+
+def merge_file_stats(total: dict[str, Any], file_stats: dict[str, Any]) -> None:
+    """Add one file's counters into ``total`` (``peak_rss_mb`` takes the max)."""
+    for key, value in file_stats.items():
+        if key == "peak_rss_mb":
+            total[key] = max(float(total.get(key) or 0.0), float(value or 0.0))
+        elif isinstance(value, int | float) and not isinstance(value, bool):
+            total[key] = total.get(key, 0) + value
+
+
+def run_file_workers(
+    job: Callable[..., dict[str, Any]],
+    paths: Sequence[Path],
+    *,
+    workers: int,
+    ordered: bool,
+    label: str,
+) -> tuple[list[dict[str, Any]], list[tuple[Path, BaseException]]]:
+    """Run ``job(seq, path, gate)`` for every path on ``workers`` processes.
+
+    ``job`` must be picklable (a module-level function or a
+    ``functools.partial`` of one).  Returns the per-file stats of the files
+    that succeeded and ``(path, exception)`` for the ones that failed.
+    """
+    results: list[dict[str, Any]] = []
+    failures: list[tuple[Path, BaseException]] = []
+    started = time.monotonic()
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Manager() as manager, ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        gate = MergeGate(manager) if ordered else None
+        futures = {pool.submit(job, seq, path, gate): path for seq, path in enumerate(paths)}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                results.append(future.result())
+            except Exception as exc:  # collected and re-raised by the loader
+                logger.error("{}: {} failed: {}", label, path.name, exc)
+                failures.append((path, exc))
+    logger.info(
+        "{}: {} file(s) on {} worker(s) in {:.1f}s ({} failed)",
+        label,
+        len(paths),
+        workers,
+        time.monotonic() - started,
+        len(failures),
+    )
+    return results, failures
@@ -12,11 +12,18 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import contextlib
 import datetime as dt
+import functools
 import hashlib
 import json
 import html
+import io
+import os
 import re
+import resource
+import shutil
+import struct
 import sys
 import tempfile
 import urllib.parse
@@ -39,8 +46,18 @@ if __package__ in {None, ""}:
     sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
     from sqlalchemy.orm import Session
 
+    from sunbiz.parallel_ingest import MergeGate
+
+from sunbiz.bulk_copy import copy_insert_frame
+from sunbiz.bulk_copy import copy_upsert
+from sunbiz.bulk_copy import copy_upsert_frame
+from sunbiz.bulk_copy import StagedUpsert
+from sunbiz.bulk_copy import excluded_updates
 from sunbiz.db import get_engine
 from sunbiz.db import get_session_factory
 from sunbiz.db import resolve_pg_dsn
@@ -49,6 +66,7 @@ from sunbiz.models import HcpaAllSale
 from sunbiz.models import HcpaBulkParcel
 from sunbiz.models import HcpaLatLon
 from sunbiz.models import HcpaParcelDorName
+from sunbiz.models import HcpaParcelLegalIndex
 from sunbiz.models import HcpaParcelSubName
 from sunbiz.models import HcpaSpecialDistrictCdd
 from sunbiz.models import HcpaSpecialDistrictLd
@@ -65,6 +83,8 @@ from sunbiz.models import SunbizEntityEvent
 from sunbiz.models import SunbizEntityFiling
 from sunbiz.models import SunbizEntityParty
 from sunbiz.models import SunbizRawRecord
+from sunbiz.parallel_ingest import merge_file_stats
+from sunbiz.parallel_ingest import run_file_workers
 
 
 SUNBIZ_TEXT_SUFFIXES = {".txt", ".dat"}
@@ -74,6 +94,15 @@ LOADER_VERSION = "pg_loader_v1"
 DEFAULT_HCPA_DOWNLOADS_DIR = Path("data/bulk_data/hcpa")
 HCPA_DOWNLOADS_URL = "https://downloads.hcpafl.org/"
 PG_MAX_BIND_PARAMS = 65535
+ZIP_DEFLATE64 = 9
+DEFLATE64_READ_CHUNK_BYTES = 1 << 20
+# Process RSS ceiling for the structured Sunbiz loaders. Above it, pending
+# rows are flushed early and the per-table batch size is halved. 0 disables.
+DEFAULT_SUNBIZ_MAX_RSS_MB = int(os.environ.get("SUNBIZ_LOADER_MAX_RSS_MB", "2048"))
+RSS_CHECK_INTERVAL_LINES = 10_000
+# Worker processes for the per-file Sunbiz loaders (1 = sequential loop).
+DEFAULT_SUNBIZ_LOAD_WORKERS = int(os.environ.get("SUNBIZ_LOAD_WORKERS", "1"))
+MIN_STREAMING_BATCH_SIZE = 250
 
 HCPA_DATASET_PATTERNS = {
     "hcparcel": re.compile(r"^HCparcel_4_public_\d{2}_\d{2}_\d{4}\.zip$", re.IGNORECASE),
@@ -152,6 +181,19 @@ HILLSBOROUGH_MILLAGE_2025: dict[str, dict[str, float]] = {
     "U": {"total_millage": 18.2515, "county_millage": 10.6958, "school_millage": 6.3400, "city_millage": 0.0},
 }
 
+# DorNalParcel value fields parsed as floats after the NAL_COLUMN_MAP copy.
+DOR_NAL_NUMERIC_FIELDS: tuple[str, ...] = (
+    "just_value",
+    "just_value_homestead",
+    "assessed_value_school",
+    "assessed_value_nonschool",
+    "assessed_value_homestead",
+    "taxable_value_school",
+    "taxable_value_nonschool",
+    "homestead_exempt_value",
+    "widow_exempt_value",
+)
+
 DOR_EXEMPTION_FIELDS: dict[str, tuple[str, str]] = {
     "01": ("homestead_exempt", "homestead_exempt_value"),
     "03": ("widow_exempt", "widow_exempt_value"),
@@ -414,11 +456,6 @@ def _parse_date_yyyymmdd(value: str) -> dt.date | None:
             return None
 
 
-def _chunked(items: list[dict], chunk_size: int):
-    for i in range(0, len(items), chunk_size):
-        yield items[i : i + chunk_size]
-
-
 def _effective_batch_size(requested_batch_size: int, columns_per_row: int) -> int:
     if requested_batch_size <= 0:
         requested_batch_size = 1
@@ -429,6 +466,119 @@ def _effective_batch_size(requested_batch_size: int, columns_per_row: int) -> in
     return max(1, min(requested_batch_size, max_rows))
 
 
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _current_rss_mb() -> float:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as fh:
+            resident_pages = int(fh.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return _peak_rss_mb()
+
+
+class _RowSink:
+    """Buffer parsed rows for one table and COPY-upsert them every ``batch_size`` rows.
+
+    Used by the structured Sunbiz loaders so a file is written in bounded
+    chunks as it is parsed instead of being accumulated whole.  All flushes
+    run on the caller's session, so the per-file transaction is unchanged.
+    With ``staged=True`` (parallel workers) chunks are only COPYed into a
+    ``StagedUpsert`` staging table and reach the target on ``merge()``.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        model: Any,
+        batch_size: int,
+        *,
+        staged: bool = False,
+        **upsert_kwargs: Any,
+    ) -> None:
+        self.session = session
+        self.model = model
+        self.batch_size = max(1, batch_size)
+        self.upsert_kwargs = upsert_kwargs
+        self.staging = StagedUpsert(session, model, **upsert_kwargs) if staged else None
+        self.rows: list[dict] = []
+        self.count = 0
+
+    def add(self, row: dict) -> None:
+        self.rows.append(row)
+        self.count += 1
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def extend(self, rows: list[dict]) -> None:
+        for row in rows:
+            self.add(row)
+
+    def add_frame(self, frame: pl.DataFrame) -> None:
+        """Write a parsed block (already bounded by the block size) straight through."""
+        if frame.height == 0:
+            return
+        self.flush()
+        if self.staging is not None:
+            self.staging.stage_frame(frame)
+        else:
+            copy_upsert_frame(self.session, self.model, frame, **self.upsert_kwargs)
+        self.count += frame.height
+
+    def flush(self) -> None:
+        if self.rows:
+            if self.staging is not None:
+                self.staging.stage_rows(self.rows)
+            else:
+                copy_upsert(self.session, self.model, self.rows, **self.upsert_kwargs)
+            self.rows = []
+
+    def merge(self) -> None:
+        """Write everything still pending to the target table."""
+        self.flush()
+        if self.staging is not None:
+            self.staging.merge()
+
+
+class _RssGuard:
+    """Keep a streaming load under ``max_rss_mb`` by flushing early and shrinking batches.
+
+    Every ``RSS_CHECK_INTERVAL_LINES`` input lines the current RSS is sampled;
+    above the ceiling, every sink is flushed and its batch size halved (down
+    to ``MIN_STREAMING_BATCH_SIZE``).  The guard never aborts a load: RSS is
+    process-wide and may be held by other pipeline steps.
+    """
+
+    def __init__(self, max_rss_mb: int | None, label: str) -> None:
+        self.max_rss_mb = DEFAULT_SUNBIZ_MAX_RSS_MB if max_rss_mb is None else max_rss_mb
+        self.label = label
+        self.lines = 0
+
+    def tick(self, sinks: Sequence[_RowSink], lines: int = 1) -> None:
+        before = self.lines
+        self.lines += lines
+        if self.max_rss_mb <= 0 or before // RSS_CHECK_INTERVAL_LINES == self.lines // RSS_CHECK_INTERVAL_LINES:
+            return
+        rss_mb = _current_rss_mb()
+        if rss_mb <= self.max_rss_mb:
+            return
+        for sink in sinks:
+            sink.flush()
+            sink.batch_size = max(MIN_STREAMING_BATCH_SIZE, sink.batch_size // 2)
+        logger.warning(
+            "{}: RSS {:.0f} MiB above ceiling {} MiB at line {}; flushed early, batch sizes now {}",
+            self.label,
+            rss_mb,
+            self.max_rss_mb,
+            self.lines,
+            [sink.batch_size for sink in sinks],
+        )
+
+
 def _compute_sha256(path: Path) -> str:
     digest = hashlib.sha256()
     with path.open("rb") as f:
@@ -477,6 +627,87 @@ def _collect_input_files(
     return files
 
 
+def _resolve_workers(workers: int | None, file_count: int) -> int:
+    requested = DEFAULT_SUNBIZ_LOAD_WORKERS if workers is None else workers
+    return max(1, min(requested, file_count))
+
+
+def _file_job(
+    ingest: Any,
+    dsn: str,
+    root: Path,
+    options: dict[str, Any],
+    seq: int,
+    path: Path,
+    gate: MergeGate | None,
+) -> dict[str, Any]:
+    """Worker-process entry point: one file, one session, one transaction.
+
+    The ingest function hands the merge turn on itself; a failure before it
+    runs (engine or session setup) releases the turn here as failed, so later
+    ordered files abort instead of waiting on ``seq`` forever.
+    """
+    turn: dict[str, Any] = {"seq": seq, "gate": gate} if gate is not None else {}
+    try:
+        with get_session_factory(dsn)() as session:
+            return ingest(session, path, root, **options, **turn)
+    except Exception:
+        if gate is not None:
+            gate.wait(seq)
+            gate.release(seq, failed=True)
+        raise
+
+
+def _raise_worker_failures(label: str, failures: list[tuple[Path, BaseException]]) -> None:
+    if not failures:
+        return
+    names = ", ".join(sorted(path.name for path, _exc in failures))
+    raise RuntimeError(f"{label}: {len(failures)} file(s) failed: {names}") from failures[0][1]
+
+
+def _decode_line(raw_line: bytes) -> str:
+    return raw_line.decode("latin-1", errors="replace").replace("\x00", "").rstrip("\r\n")
+
+
+def _iter_deflate64_lines(path: Path, info: zipfile.ZipInfo) -> Iterator[bytes]:
+    """Stream the lines of a DEFLATE64 zip member that ``zf.open()`` cannot decode.
+
+    The raw compressed stream is read in ``DEFLATE64_READ_CHUNK_BYTES`` pieces
+    and fed through one ``inflate64.Inflater``, so memory stays at one chunk
+    plus one partial line regardless of member size.  Line splitting matches
+    ``bytes.splitlines`` (``\n``, ``\r\n`` and bare ``\r``); a chunk that
+    ends on ``\r`` is held back so a ``\r\n`` straddling two chunks is not
+    split into an extra empty line.
+    """
+    import inflate64
+
+    with path.open("rb") as raw:
+        raw.seek(info.header_offset)
+        header = raw.read(30)
+        if len(header) < 30:
+            raise EOFError(f"Truncated local header for {info.filename}")
+        fname_len, extra_len = struct.unpack("<HH", header[26:30])
+        raw.seek(fname_len + extra_len, 1)
+
+        inflater = inflate64.Inflater()
+        remaining = info.compress_size
+        pending = b""
+        while remaining > 0:
+            chunk = raw.read(min(DEFLATE64_READ_CHUNK_BYTES, remaining))
+            if not chunk:
+                raise EOFError(f"Unexpected end of compressed data for {info.filename}")
+            remaining -= len(chunk)
+            lines = (pending + inflater.inflate(chunk)).splitlines(keepends=True)
+            pending = b""
+            if lines and remaining > 0 and (
+                lines[-1].endswith(b"\r") or not lines[-1].endswith(b"\n")
+            ):
+                pending = lines.pop()
+            yield from lines
+        if pending:
+            yield pending
+
+
 def _iter_text_records(path: Path):
     if path.suffix.lower() == ".zip":
         with zipfile.ZipFile(path) as zf:
@@ -487,39 +718,31 @@ def _iter_text_records(path: Path):
                     continue
 
                 info = zf.getinfo(member)
-                if info.compress_type == 9:  # DEFLATE64 — zf.open() cannot decode this
+                if info.compress_type == ZIP_DEFLATE64:  # zf.open() cannot decode this
+                    line_no = 0
                     try:
-                        import inflate64
-                        import struct as _struct
-
-                        # Read raw compressed bytes by seeking past the local file header
-                        with open(path, "rb") as _raw:
-                            _raw.seek(info.header_offset)
-                            _raw.read(26)  # skip first 26 bytes of local header
-                            fname_len = _struct.unpack("<H", _raw.read(2))[0]
-                            extra_len = _struct.unpack("<H", _raw.read(2))[0]
-                            _raw.read(fname_len + extra_len)
-                            compressed = _raw.read(info.compress_size)
-                        decompressed = inflate64.Inflater().inflate(compressed)
-                        for line_no, raw_line in enumerate(decompressed.splitlines(keepends=True), start=1):
-                            text = raw_line.decode("latin-1", errors="replace").replace("\x00", "").rstrip("\r\n")
-                            yield member, line_no, text
+                        for line_no, raw_line in enumerate(_iter_deflate64_lines(path, info), start=1):
+                            yield member, line_no, _decode_line(raw_line)
                     except ImportError:
                         logger.error(f"DEFLATE64 file {member} in {path.name}: install 'inflate64' (uv add inflate64). Skipping.")
                         continue
                     except Exception as exc:
+                        if line_no:
+                            # Rows already streamed out; a silent skip would
+                            # mark a truncated member as fully loaded.
+                            raise RuntimeError(
+                                f"DEFLATE64 decode failed for {member} in {path.name} after line {line_no}: {exc}"
+                            ) from exc
                         logger.error(f"DEFLATE64 decode failed for {member} in {path.name}: {exc}. Skipping.")
                         continue
                 else:
                     with zf.open(member) as fp:
                         for line_no, raw_line in enumerate(fp, start=1):
-                            text = raw_line.decode("latin-1", errors="replace").replace("\x00", "").rstrip("\r\n")
-                            yield member, line_no, text
+                            yield member, line_no, _decode_line(raw_line)
     else:
         with path.open("rb") as fp:
             for line_no, raw_line in enumerate(fp, start=1):
-                text = raw_line.decode("latin-1", errors="replace").replace("\x00", "").rstrip("\r\n")
-                yield path.name, line_no, text
+                yield path.name, line_no, _decode_line(raw_line)
 
 
 def _get_existing_ingest_file(
@@ -601,9 +824,94 @@ def _mark_ingest_file(
 
 def _init_db(dsn: str) -> None:
     engine = get_engine(dsn)
+    # hcpa_parcel_legal_index carries a GIN trigram index.
+    with engine.begin() as conn:
+        conn.execute(sa_text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
 
 
+def _ingest_raw_file(
+    session: Session,
+    path: Path,
+    root: Path,
+    *,
+    limit_lines: int | None,
+    batch_size: int,
+    skip_unchanged: bool,
+) -> dict[str, Any]:
+    """Load one file's raw lines in its own transaction and return its counters."""
+    rel = path.relative_to(root).as_posix()
+    sha = _compute_sha256(path)
+    st = path.stat()
+    modified_at = dt.datetime.fromtimestamp(st.st_mtime, tz=dt.UTC)
+
+    existing = _get_existing_ingest_file(session, "sunbiz", rel)
+    if (
+        skip_unchanged
+        and existing
+        and existing.status == "loaded"
+        and existing.file_sha256 == sha
+        and existing.file_size_bytes == st.st_size
+    ):
+        return {"files_skipped": 1}
+
+    file_id = _upsert_ingest_file(
+        session=session,
+        source_system="sunbiz",
+        category="raw",
+        relative_path=rel,
+        file_sha256=sha,
+        file_size_bytes=st.st_size,
+        file_modified_at=modified_at,
+        status="loading",
+    )
+    session.commit()
+
+    try:
+        # Delete + reload + mark commit together, so a file's raw rows are
+        # never visible half-loaded and concurrent workers stay isolated.
+        session.execute(delete(SunbizRawRecord).where(SunbizRawRecord.file_id == file_id))
+
+        loaded_rows = 0
+        batch: list[dict] = []
+        for source_member, line_no, line in _iter_text_records(path):
+            if limit_lines is not None and loaded_rows >= limit_lines:
+                break
+            record = {
+                "file_id": file_id,
+                "source_member": source_member,
+                "line_number": line_no,
+                "record_type": _clean_text(_slice(line, 0, 1)),
+                "doc_number": _clean_text(_slice(line, 0, 12)),
+                "raw_line": line,
+                "loaded_at": _utc_now(),
+            }
+            batch.append(record)
+            loaded_rows += 1
+            if len(batch) >= batch_size:
+                session.execute(pg_insert(SunbizRawRecord), batch)
+                batch.clear()
+
+        if batch:
+            session.execute(pg_insert(SunbizRawRecord), batch)
+
+        _mark_ingest_file(session, file_id, "loaded", row_count=loaded_rows)
+        session.commit()
+    except Exception as exc:
+        session.rollback()
+        _mark_ingest_file(
+            session,
+            file_id,
+            "failed",
+            row_count=None,
+            error_message=str(exc)[:4000],
+        )
+        session.commit()
+        raise
+
+    return {"files_loaded": 1, "raw_rows_loaded": loaded_rows}
+
+
 def load_sunbiz_raw(
     dsn: str,
     root: Path,
@@ -612,7 +920,13 @@ def load_sunbiz_raw(
     limit_lines: int | None,
     batch_size: int,
     skip_unchanged: bool,
+    workers: int | None = None,
 ) -> dict:
+    """Load raw Sunbiz text lines, one transaction per file.
+
+    ``workers`` > 1 (default ``SUNBIZ_LOAD_WORKERS``) loads files on a process
+    pool; raw rows are keyed by ``file_id``, so files need no merge ordering.
+    """
     files = _collect_input_files(root=root, pattern=pattern, limit_files=limit_files)
     session_factory = get_session_factory(dsn)
 
@@ -622,81 +936,21 @@ def load_sunbiz_raw(
         "files_skipped": 0,
         "raw_rows_loaded": 0,
     }
+    options = {"limit_lines": limit_lines, "batch_size": batch_size, "skip_unchanged": skip_unchanged}
+
+    workers = _resolve_workers(workers, len(files))
+    stats["workers"] = workers
+    if workers > 1:
+        job = functools.partial(_file_job, _ingest_raw_file, dsn, root, options)
+        results, failures = run_file_workers(job, files, workers=workers, ordered=False, label="load_sunbiz_raw")
+        for file_stats in results:
+            merge_file_stats(stats, file_stats)
+        _raise_worker_failures("load_sunbiz_raw", failures)
+        return stats
 
     with session_factory() as session:
         for path in files:
-            rel = path.relative_to(root).as_posix()
-            sha = _compute_sha256(path)
-            st = path.stat()
-            modified_at = dt.datetime.fromtimestamp(st.st_mtime, tz=dt.UTC)
-
-            existing = _get_existing_ingest_file(session, "sunbiz", rel)
-            if (
-                skip_unchanged
-                and existing
-                and existing.status == "loaded"
-                and existing.file_sha256 == sha
-                and existing.file_size_bytes == st.st_size
-            ):
-                stats["files_skipped"] += 1
-                continue
-
-            file_id = _upsert_ingest_file(
-                session=session,
-                source_system="sunbiz",
-                category="raw",
-                relative_path=rel,
-                file_sha256=sha,
-                file_size_bytes=st.st_size,
-                file_modified_at=modified_at,
-                status="loading",
-            )
-            session.commit()
-
-            try:
-                session.execute(delete(SunbizRawRecord).where(SunbizRawRecord.file_id == file_id))
-                session.commit()
-
-                loaded_rows = 0
-                batch: list[dict] = []
-                for source_member, line_no, line in _iter_text_records(path):
-                    if limit_lines is not None and loaded_rows >= limit_lines:
-                        break
-                    record = {
-                        "file_id": file_id,
-                        "source_member": source_member,
-                        "line_number": line_no,
-                        "record_type": _clean_text(_slice(line, 0, 1)),
-                        "doc_number": _clean_text(_slice(line, 0, 12)),
-                        "raw_line": line,
-                        "loaded_at": _utc_now(),
-                    }
-                    batch.append(record)
-                    loaded_rows += 1
-                    if len(batch) >= batch_size:
-                        session.execute(pg_insert(SunbizRawRecord), batch)
-                        session.commit()
-                        batch.clear()
-
-                if batch:
-                    session.execute(pg_insert(SunbizRawRecord), batch)
-                    session.commit()
-
-                _mark_ingest_file(session, file_id, "loaded", row_count=loaded_rows)
-                session.commit()
-                stats["files_loaded"] += 1
-                stats["raw_rows_loaded"] += loaded_rows
-            except Exception as exc:
-                session.rollback()
-                _mark_ingest_file(
-                    session,
-                    file_id,
-                    "failed",
-                    row_count=None,
-                    error_message=str(exc)[:4000],
-                )
-                session.commit()
-                raise
+            merge_file_stats(stats, _ingest_raw_file(session, path, root, **options))
 
     return stats
 
@@ -797,6 +1051,174 @@ def _parse_flre_line(
     }
 
 
+def _ingest_flr_file(
+    session: Session,
+    path: Path,
+    root: Path,
+    *,
+    limit_lines: int | None,
+    batch_size: int,
+    max_rss_mb: int | None,
+    columnar: bool,
+    seq: int = 0,
+    gate: MergeGate | None = None,
+) -> dict[str, Any]:
+    """Load one FLR file in its own transaction and return its counters.
+
+    With a ``gate`` (parallel mode) rows are staged and only merged into the
+    target tables at this file's turn; see ``sunbiz/parallel_ingest.py``.
+    """
+    rel = path.relative_to(root).as_posix()
+    file_id: int | None = None
+    file_stats: dict[str, Any] = {
+        "filings_upserted": 0,
+        "parties_inserted": 0,
+        "events_inserted": 0,
+    }
+    # Everything, including the ingest_files bookkeeping, runs inside the
+    # try: a file that fails before its turn must still hand the turn on.
+    try:
+        sha = _compute_sha256(path)
+        st = path.stat()
+        modified_at = dt.datetime.fromtimestamp(st.st_mtime, tz=dt.UTC)
+        file_id = _upsert_ingest_file(
+            session=session,
+            source_system="sunbiz",
+            category="flr_structured",
+            relative_path=rel,
+            file_sha256=sha,
+            file_size_bytes=st.st_size,
+            file_modified_at=modified_at,
+            status="loading",
+        )
+        session.commit()
+
+        filings = _RowSink(
+            session,
+            SunbizFlrFiling,
+            batch_size,
+            staged=gate is not None,
+            conflict_columns=["doc_number"],
+            update=excluded_updates(SunbizFlrFiling, exclude={"doc_number"}),
+        )
+        parties = _RowSink(
+            session,
+            SunbizFlrParty,
+            batch_size,
+            staged=gate is not None,
+            conflict_constraint="uq_sunbiz_flr_parties_doc_role_seq_name",
+        )
+        events = _RowSink(
+            session,
+            SunbizFlrEvent,
+            batch_size,
+            staged=gate is not None,
+            conflict_constraint="uq_sunbiz_flr_events_identity",
+        )
+        sinks = (filings, parties, events)
+        guard = _RssGuard(max_rss_mb, label=f"FLR {rel}")
+
+        if columnar:
+            for source_member, line_nos, lines in _iter_text_blocks(path, filings):
+                parsed_rows = filings.count + parties.count + events.count
+                if limit_lines is not None:
+                    if parsed_rows >= limit_lines:
+                        break
+                    lines = lines[: limit_lines - parsed_rows]
+                    line_nos = line_nos[: len(lines)]
+
+                member = Path(source_member).name.lower()
+                if member == "flrf.txt":
+                    filings.add_frame(_frame_flrf(lines, line_nos, file_id, source_member))
+                elif member == "flrd.txt":
+                    parties.add_frame(
+                        _frame_flr_party(lines, line_nos, file_id, source_member, party_role="debtor")
+                    )
+                elif member == "flrs.txt":
+                    parties.add_frame(
+                        _frame_flr_party(lines, line_nos, file_id, source_member, party_role="secured")
+                    )
+                elif member == "flre.txt":
+                    events.add_frame(_frame_flre(lines, line_nos, file_id, source_member))
+                guard.tick(sinks, len(lines))
+
+        else:
+            for source_member, line_no, line in _iter_text_records(path):
+                member = Path(source_member).name.lower()
+                if limit_lines is not None and (filings.count + parties.count + events.count >= limit_lines):
+                    break
+
+                if member == "flrf.txt":
+                    parsed = _parse_flrf_line(line, file_id, source_member, line_no)
+                    if parsed:
+                        filings.add(parsed)
+                elif member == "flrd.txt":
+                    parsed = _parse_flr_party_line(line, file_id, source_member, line_no, party_role="debtor")
+                    if parsed:
+                        parties.add(parsed)
+                elif member == "flrs.txt":
+                    parsed = _parse_flr_party_line(line, file_id, source_member, line_no, party_role="secured")
+                    if parsed:
+                        parties.add(parsed)
+                elif member == "flre.txt":
+                    parsed = _parse_flre_line(line, file_id, source_member, line_no)
+                    if parsed:
+                        events.add(parsed)
+                guard.tick(sinks)
+
+        row_count = filings.count + parties.count + events.count
+        # Only enforce non-empty guard for actual FLR data zips, not readme/ancillary files
+        flr_data_zips = {"flrf.zip", "flrd.zip", "flrs.zip", "flre.zip"}
+        if row_count <= 0 and path.name.lower() in flr_data_zips:
+            raise RuntimeError(f"No FLR records parsed from {rel}; refusing to mark empty load as current")
+
+        if gate is not None:
+            gate.acquire(seq)
+        for sink in sinks:
+            sink.merge()
+        file_stats["filings_upserted"] += filings.count
+        file_stats["parties_inserted"] += parties.count
+        file_stats["events_inserted"] += events.count
+        file_stats["peak_rss_mb"] = round(_peak_rss_mb(), 1)
+        logger.info(
+            "FLR {}: {} filings, {} parties, {} events; peak RSS {:.0f} MiB",
+            rel,
+            filings.count,
+            parties.count,
+            events.count,
+            file_stats["peak_rss_mb"],
+        )
+
+        _mark_ingest_file(
+            session=session,
+            file_id=file_id,
+            status="loaded",
+            row_count=row_count,
+        )
+        session.commit()
+        if gate is not None:
+            gate.release(seq, failed=False)
+    except Exception as exc:
+        try:
+            session.rollback()
+            if file_id is not None:
+                _mark_ingest_file(
+                    session=session,
+                    file_id=file_id,
+                    status="failed",
+                    row_count=None,
+                    error_message=str(exc)[:4000],
+                )
+                session.commit()
+        finally:
+            if gate is not None:
+                gate.wait(seq)
+                gate.release(seq, failed=True)
+        raise
+
+    return file_stats
+
+
 def load_sunbiz_flr(
     dsn: str,
     root: Path,
@@ -804,6 +1226,9 @@ def load_sunbiz_flr(
     limit_files: int | None,
     limit_lines: int | None,
     batch_size: int,
+    max_rss_mb: int | None = None,
+    columnar: bool = True,
+    workers: int | None = None,
 ) -> dict:
     """Parse FLR bulk files (flrf/flrd/flrs/flre) into structured PostgreSQL tables.
 
@@ -816,6 +1241,14 @@ def load_sunbiz_flr(
     All 4 must be present for complete data. If only flrf.zip is available,
     filings load but party/event tables remain empty.
 
+    Files are streamed: rows are COPY-upserted every ``batch_size`` rows per
+    table while parsing (still one transaction per file), and ``max_rss_mb``
+    (default ``SUNBIZ_LOADER_MAX_RSS_MB``) caps process RSS by flushing early.
+    Records are parsed a block at a time with the Polars columnar parsers
+    unless ``columnar=False`` (the per-line ``_parse_*_line`` path).
+    ``workers`` > 1 (default ``SUNBIZ_LOAD_WORKERS``) loads files on a process
+    pool with ordered merges (``sunbiz/parallel_ingest.py``).
+
     To sync all FLR files from SFTP::
 
         uv run python sunbiz/sync.py sync --mode quarterly --pattern "FLR/flr"
@@ -844,106 +1277,39 @@ def load_sunbiz_flr(
         "events_inserted": 0,
     }
 
+    workers = _resolve_workers(workers, len(files))
+    stats["workers"] = workers
+    if workers > 1:
+        job = functools.partial(
+            _file_job,
+            _ingest_flr_file,
+            dsn,
+            root,
+            {
+                "limit_lines": limit_lines,
+                "batch_size": batch_size,
+                "max_rss_mb": max_rss_mb,
+                "columnar": columnar,
+            },
+        )
+        results, failures = run_file_workers(job, files, workers=workers, ordered=True, label="load_sunbiz_flr")
+        for file_stats in results:
+            merge_file_stats(stats, file_stats)
+        _raise_worker_failures("load_sunbiz_flr", failures)
+        return stats
+
     with session_factory() as session:
         for path in files:
-            rel = path.relative_to(root).as_posix()
-            sha = _compute_sha256(path)
-            st = path.stat()
-            modified_at = dt.datetime.fromtimestamp(st.st_mtime, tz=dt.UTC)
-
-            file_id = _upsert_ingest_file(
-                session=session,
-                source_system="sunbiz",
-                category="flr_structured",
-                relative_path=rel,
-                file_sha256=sha,
-                file_size_bytes=st.st_size,
-                file_modified_at=modified_at,
-                status="loading",
+            file_stats = _ingest_flr_file(
+                session,
+                path,
+                root,
+                limit_lines=limit_lines,
+                batch_size=batch_size,
+                max_rss_mb=max_rss_mb,
+                columnar=columnar,
             )
-            session.commit()
-
-            try:
-                filings: list[dict] = []
-                parties: list[dict] = []
-                events: list[dict] = []
-
-                for source_member, line_no, line in _iter_text_records(path):
-                    member = Path(source_member).name.lower()
-                    if limit_lines is not None and (len(filings) + len(parties) + len(events) >= limit_lines):
-                        break
-
-                    if member == "flrf.txt":
-                        parsed = _parse_flrf_line(line, file_id, source_member, line_no)
-                        if parsed:
-                            filings.append(parsed)
-                    elif member == "flrd.txt":
-                        parsed = _parse_flr_party_line(line, file_id, source_member, line_no, party_role="debtor")
-                        if parsed:
-                            parties.append(parsed)
-                    elif member == "flrs.txt":
-                        parsed = _parse_flr_party_line(line, file_id, source_member, line_no, party_role="secured")
-                        if parsed:
-                            parties.append(parsed)
-                    elif member == "flre.txt":
-                        parsed = _parse_flre_line(line, file_id, source_member, line_no)
-                        if parsed:
-                            events.append(parsed)
-
-                row_count = len(filings) + len(parties) + len(events)
-                # Only enforce non-empty guard for actual FLR data zips, not readme/ancillary files
-                flr_data_zips = {"flrf.zip", "flrd.zip", "flrs.zip", "flre.zip"}
-                if row_count <= 0 and path.name.lower() in flr_data_zips:
-                    raise RuntimeError(f"No FLR records parsed from {rel}; refusing to mark empty load as current")
-
-                if filings:
-                    for chunk in _chunked(filings, batch_size):
-                        stmt = pg_insert(SunbizFlrFiling).values(chunk)
-                        update_cols = {
-                            col.name: getattr(stmt.excluded, col.name)
-                            for col in SunbizFlrFiling.__table__.columns
-                            if col.name != "doc_number"
-                        }
-                        stmt = stmt.on_conflict_do_update(
-                            index_elements=[SunbizFlrFiling.doc_number],
-                            set_=update_cols,
-                        )
-                        session.execute(stmt)
-                    stats["filings_upserted"] += len(filings)
-
-                if parties:
-                    for chunk in _chunked(parties, batch_size):
-                        stmt = pg_insert(SunbizFlrParty).values(chunk)
-                        stmt = stmt.on_conflict_do_nothing(constraint="uq_sunbiz_flr_parties_doc_role_seq_name")
-                        session.execute(stmt)
-                    stats["parties_inserted"] += len(parties)
-
-                if events:
-                    for chunk in _chunked(events, batch_size):
-                        stmt = pg_insert(SunbizFlrEvent).values(chunk)
-                        stmt = stmt.on_conflict_do_nothing(constraint="uq_sunbiz_flr_events_identity")
-                        session.execute(stmt)
-                    stats["events_inserted"] += len(events)
-
-                _mark_ingest_file(
-                    session=session,
-                    file_id=file_id,
-                    status="loaded",
-                    row_count=row_count,
-                )
-                session.commit()
-            except Exception as exc:
-                session.rollback()
-                _mark_ingest_file(
-                    session=session,
-                    file_id=file_id,
-                    status="failed",
-                    row_count=None,
-                    error_message=str(exc)[:4000],
-                )
-                session.commit()
-                raise
-
+            merge_file_stats(stats, file_stats)
     return stats
 
 
@@ -1148,6 +1514,550 @@ def _classify_entity_member(source_member: str) -> str | None:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Columnar fixed-width parsing
+#
+# Polars equivalents of the ``_parse_*_line`` functions above.  A block of
+# lines from one member becomes a one-column frame; every field is a vectorized
+# ``str.slice`` + strip, and the result goes to ``copy_upsert_frame`` without a
+# dict per record.  Text fields strip exactly the characters ``str.strip()``
+# does for latin-1 input.  Integer and date fields are parsed once per
+# *distinct* raw value with the scalar ``_parse_int`` /
+# ``_parse_date_yyyymmdd`` and mapped back, so edge cases (``00000000``,
+# MMDDYYYY vs YYYYMMDD, junk) match the row parsers exactly.  The row parsers
+# stay as the reference implementation and the ``--row-parser`` fallback.
+# ---------------------------------------------------------------------------
+
+_LATIN1_WHITESPACE = "".join(ch for ch in map(chr, range(256)) if ch.isspace())
+
+# (column, start, end, kind) with 0-based [start, end) offsets; kind is
+# "text", "int" or "date".
+FixedWidthField = tuple[str, int, int, str]
+
+
+def _pos(start_pos: int, length: int) -> tuple[int, int]:
+    """1-based Sunbiz position/length -> 0-based [start, end), like ``_slice_pos``."""
+    return start_pos - 1, start_pos - 1 + length
+
+
+_FLRF_FIELDS: tuple[FixedWidthField, ...] = (
+    ("doc_number", 0, 12, "text"),
+    ("filing_date", 12, 20, "date"),
+    ("pages", 20, 25, "int"),
+    ("total_pages", 25, 30, "int"),
+    ("filing_status", 30, 31, "text"),
+    ("filing_type", 31, 32, "text"),
+    ("assessment_date", 32, 40, "date"),
+    ("cancellation_date", 40, 48, "date"),
+    ("expiration_date", 48, 56, "date"),
+    ("trans_utility", 56, 57, "text"),
+    ("filing_event_count", 57, 62, "int"),
+    ("total_debtor_count", 62, 67, "int"),
+    ("total_secured_count", 67, 72, "int"),
+    ("current_debtor_count", 72, 77, "int"),
+    ("current_secured_count", 77, 82, "int"),
+)
+
+_FLR_PARTY_FIELDS: tuple[FixedWidthField, ...] = (
+    ("doc_number", 1, 13, "text"),
+    ("filing_type", 0, 1, "text"),
+    ("name", 13, 68, "text"),
+    ("name_format", 68, 69, "text"),
+    ("address1", 69, 113, "text"),
+    ("address2", 113, 157, "text"),
+    ("city", 157, 185, "text"),
+    ("state", 185, 187, "text"),
+    ("zip_code", 187, 196, "text"),
+    ("country", 196, 198, "text"),
+    ("sequence_number", 198, 203, "int"),
+    ("relation_to_filing", 203, 204, "text"),
+    ("original_party", 204, 205, "text"),
+    ("filing_status", 205, 206, "text"),
+)
+
+_FLRE_FIELDS: tuple[FixedWidthField, ...] = (
+    ("event_doc_number", 0, 12, "text"),
+    ("event_orig_doc_number", 12, 24, "text"),
+    ("event_action_count", 24, 29, "int"),
+    ("event_sequence_number", 29, 34, "int"),
+    ("event_pages", 34, 39, "int"),
+    ("event_date", 39, 47, "date"),
+    ("action_sequence_number", 47, 52, "int"),
+    ("action_code", 52, 55, "text"),
+    ("action_verbage", 55, 125, "text"),
+    ("action_name", 125, 180, "text"),
+    ("action_address1", 180, 224, "text"),
+    ("action_address2", 224, 268, "text"),
+    ("action_city", 268, 296, "text"),
+    ("action_state", 296, 298, "text"),
+    ("action_zip", 298, 307, "text"),
+    ("action_country", 307, 309, "text"),
+    ("action_old_name_seq", 309, 314, "int"),
+    ("action_new_name_seq", 314, 319, "int"),
+    ("action_name_type", 319, 320, "text"),
+)
+
+_COR_DATA_FIELDS: tuple[FixedWidthField, ...] = (
+    ("doc_number", *_pos(1, 12), "text"),
+    ("entity_name", *_pos(13, 192), "text"),
+    ("status", *_pos(205, 1), "text"),
+    ("filing_type", *_pos(206, 15), "text"),
+    ("filed_date", *_pos(473, 8), "date"),
+    ("fei_number", *_pos(481, 14), "text"),
+    ("state_country", *_pos(504, 2), "text"),
+    ("principal_address1", *_pos(221, 42), "text"),
+    ("principal_address2", *_pos(263, 42), "text"),
+    ("principal_city", *_pos(305, 28), "text"),
+    ("principal_state", *_pos(333, 2), "text"),
+    ("principal_zip", *_pos(335, 10), "text"),
+    ("principal_country", *_pos(345, 2), "text"),
+    ("mailing_address1", *_pos(347, 42), "text"),
+    ("mailing_address2", *_pos(389, 42), "text"),
+    ("mailing_city", *_pos(431, 28), "text"),
+    ("mailing_state", *_pos(459, 2), "text"),
+    ("mailing_zip", *_pos(461, 10), "text"),
+    ("mailing_country", *_pos(471, 2), "text"),
+    ("more_than_six_officers", *_pos(495, 1), "text"),
+    ("last_transaction_date", *_pos(496, 8), "text"),
+)
+
+_COR_OFFICER_BASE = 669
+_COR_OFFICER_BLOCK = 128
+_COR_OFFICER_COUNT = 6
+
+
+def _cor_officer_fields(base: int) -> tuple[FixedWidthField, ...]:
+    return (
+        ("party_title", *_pos(base, 4), "text"),
+        ("party_name", *_pos(base + 5, 42), "text"),
+        ("party_name_format", *_pos(base + 4, 1), "text"),
+        ("address1", *_pos(base + 47, 42), "text"),
+        ("city", *_pos(base + 89, 28), "text"),
+        ("state", *_pos(base + 117, 2), "text"),
+        ("zip_code", *_pos(base + 119, 9), "text"),
+    )
+
+
+_COR_EVENT_FIELDS: tuple[FixedWidthField, ...] = (
+    ("event_doc_number", *_pos(1, 12), "text"),
+    ("event_sequence_number", *_pos(13, 5), "int"),
+    ("event_code", *_pos(18, 20), "text"),
+    ("event_description", *_pos(38, 40), "text"),
+    ("event_effective_date", *_pos(78, 8), "date"),
+    ("event_filing_date", *_pos(86, 8), "date"),
+    ("event_name", *_pos(211, 192), "text"),
+)
+
+_GEN_DATA_FIELDS: tuple[FixedWidthField, ...] = (
+    ("doc_number", *_pos(1, 12), "text"),
+    ("entity_name", *_pos(14, 192), "text"),
+    ("status", *_pos(13, 1), "text"),
+    ("filed_date", *_pos(206, 8), "date"),
+    ("effective_date", *_pos(214, 8), "date"),
+    ("cancellation_date", *_pos(222, 8), "date"),
+    ("expiration_date", *_pos(752, 8), "date"),
+    ("fei_number", *_pos(230, 9), "text"),
+    ("state_country", *_pos(239, 2), "text"),
+    ("principal_address1", *_pos(241, 44), "text"),
+    ("principal_address2", *_pos(285, 44), "text"),
+    ("principal_city", *_pos(329, 28), "text"),
+    ("principal_state", *_pos(357, 2), "text"),
+    ("principal_zip", *_pos(359, 9), "text"),
+    ("principal_country", *_pos(368, 2), "text"),
+    ("mailing_address1", *_pos(371, 44), "text"),
+    ("mailing_address2", *_pos(415, 44), "text"),
+    ("mailing_city", *_pos(459, 28), "text"),
+    ("mailing_state", *_pos(487, 2), "text"),
+    ("mailing_zip", *_pos(489, 9), "text"),
+    ("mailing_country", *_pos(498, 2), "text"),
+    ("gr_part_type", *_pos(501, 1), "text"),
+    ("gr_part_seq", *_pos(570, 5), "text"),
+)
+
+_GEN_PARTNER_FIELDS: tuple[FixedWidthField, ...] = (
+    ("party_title", *_pos(501, 1), "text"),
+    ("party_name", *_pos(515, 55), "text"),
+    ("party_name_format", *_pos(502, 1), "text"),
+    ("party_corp_number", *_pos(503, 12), "text"),
+    ("party_sequence", *_pos(570, 5), "int"),
+    ("address1", *_pos(575, 44), "text"),
+    ("address2", *_pos(619, 44), "text"),
+    ("city", *_pos(663, 28), "text"),
+    ("state", *_pos(691, 2), "text"),
+    ("zip_code", *_pos(693, 9), "text"),
+    ("country", *_pos(702, 2), "text"),
+)
+
+_GEN_EVENT_FIELDS: tuple[FixedWidthField, ...] = (
+    ("event_doc_number", *_pos(1, 12), "text"),
+    ("event_orig_doc_number", *_pos(13, 12), "text"),
+    ("event_sequence_number", *_pos(25, 5), "int"),
+    ("event_code", *_pos(30, 20), "text"),
+    ("event_description", *_pos(50, 40), "text"),
+    ("event_effective_date", *_pos(95, 8), "date"),
+    ("event_filing_date", *_pos(103, 8), "date"),
+    ("event_cancellation_date", *_pos(111, 8), "date"),
+    ("event_expiration_date", *_pos(119, 8), "date"),
+    ("event_name", *_pos(249, 192), "text"),
+)
+
+
+def _map_unique(raw: pl.Series, parse: Any, dtype: Any) -> pl.Series:
+    """Apply a scalar parser once per distinct value and map the results back."""
+    mapping = {value: parse(value) for value in raw.unique().to_list()}
+    return raw.replace_strict(mapping, return_dtype=dtype)
+
+
+def _parse_fixed_width(block: pl.DataFrame, fields: Sequence[FixedWidthField]) -> pl.DataFrame:
+    """Slice ``fields`` out of ``block["line"]``; keeps ``source_line_number``."""
+    line = pl.col("line")
+    raw = block.select(
+        pl.col("source_line_number"),
+        *(line.str.slice(start, end - start).alias(name) for name, start, end, _ in fields),
+    )
+    columns = [raw.get_column("source_line_number")]
+    for name, _start, _end, kind in fields:
+        values = raw.get_column(name)
+        if kind == "text":
+            columns.append(values.str.strip_chars(_LATIN1_WHITESPACE).replace("", None))
+        elif kind == "int":
+            columns.append(_map_unique(values, _parse_int, pl.Int64))
+        elif kind == "date":
+            columns.append(_map_unique(values, _parse_date_yyyymmdd, pl.Date))
+        else:
+            raise ValueError(f"Unknown fixed-width field kind {kind!r} for {name}")
+    return pl.DataFrame(columns)
+
+
+def _keyed_block(lines: list[str], line_nos: list[int], key_start: int, key_end: int) -> pl.DataFrame:
+    """Lines whose record key is not blank (the row parsers return ``None`` for the rest)."""
+    block = pl.DataFrame(
+        {"line": lines, "source_line_number": line_nos},
+        schema={"line": pl.String, "source_line_number": pl.Int64},
+    )
+    key = pl.col("line").str.slice(key_start, key_end - key_start).str.strip_chars(_LATIN1_WHITESPACE)
+    return block.filter(key != "")
+
+
+def _with_source(frame: pl.DataFrame, file_id: int, source_member: str, stamp_column: str, **constants: Any) -> pl.DataFrame:
+    return frame.with_columns(
+        *(pl.lit(value[0], dtype=value[1]).alias(name) for name, value in constants.items()),
+        pl.lit(file_id, dtype=pl.Int64).alias("source_file_id"),
+        pl.lit(source_member, dtype=pl.String).alias("source_member"),
+        pl.lit(_utc_now()).alias(stamp_column),
+    )
+
+
+def _frame_flrf(lines: list[str], line_nos: list[int], file_id: int, source_member: str) -> pl.DataFrame:
+    frame = _parse_fixed_width(_keyed_block(lines, line_nos, 0, 12), _FLRF_FIELDS)
+    frame = frame.with_columns(pl.col("trans_utility").eq("Y").fill_null(value=False))
+    return _with_source(frame, file_id, source_member, "updated_at")
+
+
+def _frame_flr_party(
+    lines: list[str],
+    line_nos: list[int],
+    file_id: int,
+    source_member: str,
+    party_role: str,
+) -> pl.DataFrame:
+    frame = _parse_fixed_width(_keyed_block(lines, line_nos, 1, 13), _FLR_PARTY_FIELDS)
+    return _with_source(frame, file_id, source_member, "loaded_at", party_role=(party_role, pl.String))
+
+
+def _frame_flre(lines: list[str], line_nos: list[int], file_id: int, source_member: str) -> pl.DataFrame:
+    frame = _parse_fixed_width(_keyed_block(lines, line_nos, 0, 12), _FLRE_FIELDS)
+    return _with_source(frame, file_id, source_member, "loaded_at")
+
+
+def _frame_cor_data(
+    lines: list[str],
+    line_nos: list[int],
+    file_id: int,
+    source_member: str,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    block = _keyed_block(lines, line_nos, *_pos(1, 12))
+    filings = _parse_fixed_width(block, _COR_DATA_FIELDS).with_columns(
+        pl.struct("more_than_six_officers", "last_transaction_date").alias("raw_fields"),
+    ).drop("more_than_six_officers", "last_transaction_date")
+    filings = _with_source(
+        filings,
+        file_id,
+        source_member,
+        "updated_at",
+        dataset_type=("cor", pl.String),
+        effective_date=(None, pl.Date),
+        cancellation_date=(None, pl.Date),
+        expiration_date=(None, pl.Date),
+    )
+
+    doc_numbers = filings.get_column("doc_number")
+    officer_frames = []
+    for idx in range(_COR_OFFICER_COUNT):
+        base = _COR_OFFICER_BASE + (idx * _COR_OFFICER_BLOCK)
+        officers = (
+            _parse_fixed_width(block, _cor_officer_fields(base))
+            .with_columns(doc_numbers, pl.lit(idx + 1, dtype=pl.Int64).alias("party_sequence"))
+            .filter(pl.col("party_title").is_not_null() | pl.col("party_name").is_not_null())
+        )
+        officer_frames.append(officers)
+    parties = pl.concat(officer_frames).sort("source_line_number", "party_sequence", maintain_order=True)
+    parties = _with_source(
+        parties,
+        file_id,
+        source_member,
+        "loaded_at",
+        dataset_type=("cor", pl.String),
+        party_role=("officer", pl.String),
+        party_corp_number=(None, pl.String),
+        address2=(None, pl.String),
+        country=(None, pl.String),
+    )
+    return filings, parties
+
+
+def _frame_cor_event(lines: list[str], line_nos: list[int], file_id: int, source_member: str) -> pl.DataFrame:
+    frame = _parse_fixed_width(_keyed_block(lines, line_nos, *_pos(1, 12)), _COR_EVENT_FIELDS)
+    return _with_source(
+        frame,
+        file_id,
+        source_member,
+        "loaded_at",
+        dataset_type=("cor", pl.String),
+        event_orig_doc_number=(None, pl.String),
+        event_cancellation_date=(None, pl.Date),
+        event_expiration_date=(None, pl.Date),
+    )
+
+
+def _frame_gen_data(
+    lines: list[str],
+    line_nos: list[int],
+    file_id: int,
+    source_member: str,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    block = _keyed_block(lines, line_nos, *_pos(1, 12))
+    filings = _parse_fixed_width(block, _GEN_DATA_FIELDS).with_columns(
+        pl.struct("gr_part_type", "gr_part_seq").alias("raw_fields"),
+    ).drop("gr_part_type", "gr_part_seq")
+    filings = _with_source(
+        filings,
+        file_id,
+        source_member,
+        "updated_at",
+        dataset_type=("gen", pl.String),
+        filing_type=("GEN", pl.String),
+    )
+
+    parties = (
+        _parse_fixed_width(block, _GEN_PARTNER_FIELDS)
+        .with_columns(filings.get_column("doc_number"))
+        .filter(pl.col("party_name").is_not_null())
+    )
+    parties = _with_source(
+        parties,
+        file_id,
+        source_member,
+        "loaded_at",
+        dataset_type=("gen", pl.String),
+        party_role=("partner", pl.String),
+    )
+    return filings, parties
+
+
+def _frame_gen_event(lines: list[str], line_nos: list[int], file_id: int, source_member: str) -> pl.DataFrame:
+    frame = _parse_fixed_width(_keyed_block(lines, line_nos, *_pos(1, 12)), _GEN_EVENT_FIELDS)
+    return _with_source(frame, file_id, source_member, "loaded_at", dataset_type=("gen", pl.String))
+
+
+def _iter_text_blocks(path: Path, sizer: _RowSink) -> Iterator[tuple[str, list[int], list[str]]]:
+    """Group ``_iter_text_records`` into ``(member, line_nos, lines)`` blocks.
+
+    A block never spans two members and holds at most ``sizer.batch_size``
+    lines; the size is re-read per block so ``_RssGuard`` can shrink it.
+    """
+    member: str | None = None
+    line_nos: list[int] = []
+    lines: list[str] = []
+    for source_member, line_no, line in _iter_text_records(path):
+        if lines and (source_member != member or len(lines) >= sizer.batch_size):
+            yield member or "", line_nos, lines
+            line_nos, lines = [], []
+        member = source_member
+        line_nos.append(line_no)
+        lines.append(line)
+    if lines:
+        yield member or "", line_nos, lines
+
+
+def _ingest_entity_file(
+    session: Session,
+    path: Path,
+    root: Path,
+    *,
+    limit_lines: int | None,
+    batch_size: int,
+    max_rss_mb: int | None,
+    columnar: bool,
+    seq: int = 0,
+    gate: MergeGate | None = None,
+) -> dict[str, Any]:
+    """Load one entity file in its own transaction and return its counters.
+
+    With a ``gate`` (parallel mode) rows are staged and only merged into the
+    target tables at this file's turn; see ``sunbiz/parallel_ingest.py``.
+    """
+    rel = path.relative_to(root).as_posix()
+    file_id: int | None = None
+    file_stats: dict[str, Any] = {
+        "filings_upserted": 0,
+        "parties_inserted": 0,
+        "events_inserted": 0,
+    }
+    # Everything, including the ingest_files bookkeeping, runs inside the
+    # try: a file that fails before its turn must still hand the turn on.
+    try:
+        sha = _compute_sha256(path)
+        st = path.stat()
+        modified_at = dt.datetime.fromtimestamp(st.st_mtime, tz=dt.UTC)
+        file_id = _upsert_ingest_file(
+            session=session,
+            source_system="sunbiz",
+            category="entity_structured",
+            relative_path=rel,
+            file_sha256=sha,
+            file_size_bytes=st.st_size,
+            file_modified_at=modified_at,
+            status="loading",
+        )
+        session.commit()
+
+        filings = _RowSink(
+            session,
+            SunbizEntityFiling,
+            batch_size,
+            staged=gate is not None,
+            conflict_constraint="uq_sunbiz_entity_filings_dataset_doc",
+            update=excluded_updates(SunbizEntityFiling, exclude={"id"}),
+        )
+        parties = _RowSink(
+            session,
+            SunbizEntityParty,
+            batch_size,
+            staged=gate is not None,
+            conflict_constraint="uq_sunbiz_entity_parties_identity",
+        )
+        events = _RowSink(
+            session,
+            SunbizEntityEvent,
+            batch_size,
+            staged=gate is not None,
+            conflict_constraint="uq_sunbiz_entity_events_identity",
+        )
+        sinks = (filings, parties, events)
+        guard = _RssGuard(max_rss_mb, label=f"Entity {rel}")
+
+        if columnar:
+            for source_member, line_nos, lines in _iter_text_blocks(path, filings):
+                parsed_rows = filings.count + parties.count + events.count
+                if limit_lines is not None:
+                    if parsed_rows >= limit_lines:
+                        break
+                    lines = lines[: limit_lines - parsed_rows]
+                    line_nos = line_nos[: len(lines)]
+
+                kind = _classify_entity_member(source_member)
+                if kind == "cor_data":
+                    filing_frame, party_frame = _frame_cor_data(lines, line_nos, file_id, source_member)
+                    filings.add_frame(filing_frame)
+                    parties.add_frame(party_frame)
+                elif kind == "cor_event":
+                    events.add_frame(_frame_cor_event(lines, line_nos, file_id, source_member))
+                elif kind == "gen_data":
+                    filing_frame, party_frame = _frame_gen_data(lines, line_nos, file_id, source_member)
+                    filings.add_frame(filing_frame)
+                    parties.add_frame(party_frame)
+                elif kind == "gen_event":
+                    events.add_frame(_frame_gen_event(lines, line_nos, file_id, source_member))
+                guard.tick(sinks, len(lines))
+
+        else:
+            for source_member, line_no, line in _iter_text_records(path):
+                if limit_lines is not None and (filings.count + parties.count + events.count >= limit_lines):
+                    break
+
+                kind = _classify_entity_member(source_member)
+                if kind == "cor_data":
+                    filing, parsed_parties = _parse_cor_data_line(line, file_id, source_member, line_no)
+                    if filing:
+                        filings.add(filing)
+                    parties.extend(parsed_parties)
+                elif kind == "cor_event":
+                    event = _parse_cor_event_line(line, file_id, source_member, line_no)
+                    if event:
+                        events.add(event)
+                elif kind == "gen_data":
+                    filing, parsed_parties = _parse_gen_data_line(line, file_id, source_member, line_no)
+                    if filing:
+                        filings.add(filing)
+                    parties.extend(parsed_parties)
+                elif kind == "gen_event":
+                    event = _parse_gen_event_line(line, file_id, source_member, line_no)
+                    if event:
+                        events.add(event)
+                guard.tick(sinks)
+
+        row_count = filings.count + parties.count + events.count
+        if row_count <= 0:
+            raise RuntimeError(f"No entity records parsed from {rel}; refusing to mark empty load as current")
+
+        if gate is not None:
+            gate.acquire(seq)
+        for sink in sinks:
+            sink.merge()
+        file_stats["filings_upserted"] += filings.count
+        file_stats["parties_inserted"] += parties.count
+        file_stats["events_inserted"] += events.count
+        file_stats["peak_rss_mb"] = round(_peak_rss_mb(), 1)
+        logger.info(
+            "Entity {}: {} filings, {} parties, {} events; peak RSS {:.0f} MiB",
+            rel,
+            filings.count,
+            parties.count,
+            events.count,
+            file_stats["peak_rss_mb"],
+        )
+
+        _mark_ingest_file(
+            session=session,
+            file_id=file_id,
+            status="loaded",
+            row_count=row_count,
+        )
+        session.commit()
+        if gate is not None:
+            gate.release(seq, failed=False)
+    except Exception as exc:
+        try:
+            session.rollback()
+            if file_id is not None:
+                _mark_ingest_file(
+                    session=session,
+                    file_id=file_id,
+                    status="failed",
+                    row_count=None,
+                    error_message=str(exc)[:4000],
+                )
+                session.commit()
+        finally:
+            if gate is not None:
+                gate.wait(seq)
+                gate.release(seq, failed=True)
+        raise
+
+    return file_stats
+
+
 def load_sunbiz_entity(
     dsn: str,
     root: Path,
@@ -1155,7 +2065,18 @@ def load_sunbiz_entity(
     limit_files: int | None,
     limit_lines: int | None,
     batch_size: int,
+    max_rss_mb: int | None = None,
+    columnar: bool = True,
+    workers: int | None = None,
 ) -> dict:
+    """Parse COR/GEN entity data and event files into structured tables.
+
+    Streams like ``load_sunbiz_flr``: rows are COPY-upserted every
+    ``batch_size`` rows per table inside the per-file transaction, and
+    ``max_rss_mb`` (default ``SUNBIZ_LOADER_MAX_RSS_MB``) caps process RSS.
+    ``columnar`` selects the Polars block parsers over the per-line ones.
+    ``workers`` > 1 loads files in parallel like ``load_sunbiz_flr``.
+    """
     files = _collect_input_files(root=root, pattern=pattern, limit_files=limit_files)
     session_factory = get_session_factory(dsn)
 
@@ -1166,106 +2087,39 @@ def load_sunbiz_entity(
         "events_inserted": 0,
     }
 
+    workers = _resolve_workers(workers, len(files))
+    stats["workers"] = workers
+    if workers > 1:
+        job = functools.partial(
+            _file_job,
+            _ingest_entity_file,
+            dsn,
+            root,
+            {
+                "limit_lines": limit_lines,
+                "batch_size": batch_size,
+                "max_rss_mb": max_rss_mb,
+                "columnar": columnar,
+            },
+        )
+        results, failures = run_file_workers(job, files, workers=workers, ordered=True, label="load_sunbiz_entity")
+        for file_stats in results:
+            merge_file_stats(stats, file_stats)
+        _raise_worker_failures("load_sunbiz_entity", failures)
+        return stats
+
     with session_factory() as session:
         for path in files:
-            rel = path.relative_to(root).as_posix()
-            sha = _compute_sha256(path)
-            st = path.stat()
-            modified_at = dt.datetime.fromtimestamp(st.st_mtime, tz=dt.UTC)
-
-            file_id = _upsert_ingest_file(
-                session=session,
-                source_system="sunbiz",
-                category="entity_structured",
-                relative_path=rel,
-                file_sha256=sha,
-                file_size_bytes=st.st_size,
-                file_modified_at=modified_at,
-                status="loading",
+            file_stats = _ingest_entity_file(
+                session,
+                path,
+                root,
+                limit_lines=limit_lines,
+                batch_size=batch_size,
+                max_rss_mb=max_rss_mb,
+                columnar=columnar,
             )
-            session.commit()
-
-            try:
-                filings: list[dict] = []
-                parties: list[dict] = []
-                events: list[dict] = []
-
-                for source_member, line_no, line in _iter_text_records(path):
-                    if limit_lines is not None and (len(filings) + len(parties) + len(events) >= limit_lines):
-                        break
-
-                    kind = _classify_entity_member(source_member)
-                    if kind == "cor_data":
-                        filing, parsed_parties = _parse_cor_data_line(line, file_id, source_member, line_no)
-                        if filing:
-                            filings.append(filing)
-                        parties.extend(parsed_parties)
-                    elif kind == "cor_event":
-                        event = _parse_cor_event_line(line, file_id, source_member, line_no)
-                        if event:
-                            events.append(event)
-                    elif kind == "gen_data":
-                        filing, parsed_parties = _parse_gen_data_line(line, file_id, source_member, line_no)
-                        if filing:
-                            filings.append(filing)
-                        parties.extend(parsed_parties)
-                    elif kind == "gen_event":
-                        event = _parse_gen_event_line(line, file_id, source_member, line_no)
-                        if event:
-                            events.append(event)
-
-                row_count = len(filings) + len(parties) + len(events)
-                if row_count <= 0:
-                    raise RuntimeError(f"No entity records parsed from {rel}; refusing to mark empty load as current")
-
-                if filings:
-                    for chunk in _chunked(filings, batch_size):
-                        stmt = pg_insert(SunbizEntityFiling).values(chunk)
-                        update_cols = {
-                            col.name: getattr(stmt.excluded, col.name)
-                            for col in SunbizEntityFiling.__table__.columns
-                            if col.name not in {"id"}
-                        }
-                        stmt = stmt.on_conflict_do_update(
-                            constraint="uq_sunbiz_entity_filings_dataset_doc",
-                            set_=update_cols,
-                        )
-                        session.execute(stmt)
-                    stats["filings_upserted"] += len(filings)
-
-                if parties:
-                    for chunk in _chunked(parties, batch_size):
-                        stmt = pg_insert(SunbizEntityParty).values(chunk)
-                        stmt = stmt.on_conflict_do_nothing(constraint="uq_sunbiz_entity_parties_identity")
-                        session.execute(stmt)
-                    stats["parties_inserted"] += len(parties)
-
-                if events:
-                    for chunk in _chunked(events, batch_size):
-                        stmt = pg_insert(SunbizEntityEvent).values(chunk)
-                        stmt = stmt.on_conflict_do_nothing(constraint="uq_sunbiz_entity_events_identity")
-                        session.execute(stmt)
-                    stats["events_inserted"] += len(events)
-
-                _mark_ingest_file(
-                    session=session,
-                    file_id=file_id,
-                    status="loaded",
-                    row_count=row_count,
-                )
-                session.commit()
-            except Exception as exc:
-                session.rollback()
-                _mark_ingest_file(
-                    session=session,
-                    file_id=file_id,
-                    status="failed",
-                    row_count=None,
-                    error_message=str(exc)[:4000],
-                )
-                session.commit()
-                raise
-
+            merge_file_stats(stats, file_stats)
     return stats
 
 
@@ -1507,6 +2361,84 @@ def load_hcpa_parcel_sidecars(
     return stats
 
 
+# (column, DBF field, scalar parser, Polars dtype) for the snapshot DBF loaders.
+DbfField = tuple[str, str, Any, Any]
+
+_HCPA_ALLSALES_FIELDS: tuple[DbfField, ...] = (
+    ("pin", "pin", _as_text, pl.String),
+    ("folio", "folio", _as_text, pl.String),
+    ("dor_code", "dor_code", _as_text, pl.String),
+    ("nbhc", "nbhc", _as_text, pl.String),
+    ("sale_date", "s_date", _parse_date_mdy, pl.Date),
+    ("vacant_improved", "vi", _as_text, pl.String),
+    ("qualification_code", "qu", _as_text, pl.String),
+    ("reason_code", "rea_cd", _as_text, pl.String),
+    ("sale_amount", "s_amt", _parse_float_value, pl.Float64),
+    ("sub_code", "sub", _as_text, pl.String),
+    ("street_code", "str", _as_text, pl.String),
+    ("sale_type", "s_type", _as_text, pl.String),
+    ("or_book", "or_bk", _as_text, pl.String),
+    ("or_page", "or_pg", _as_text, pl.String),
+    ("grantor", "grantor", _as_text, pl.String),
+    ("grantee", "grantee", _as_text, pl.String),
+    ("doc_num", "doc_num", _as_text, pl.String),
+)
+
+_HCPA_SUBDIVISION_FIELDS: tuple[DbfField, ...] = (
+    ("object_id", "objectid", _parse_int_value, pl.Int64),
+    ("legal1", "legal1", _as_text, pl.String),
+    ("sub_code", "subcode", _as_text, pl.String),
+    ("plat_bk", "plat_bk", _as_text, pl.String),
+    ("page", "page", _as_text, pl.String),
+    ("area", "area", _parse_float_value, pl.Float64),
+    ("shape_star", "shape_star", _parse_float_value, pl.Float64),
+    ("shape_stle", "shape_stle", _parse_float_value, pl.Float64),
+)
+
+
+def _load_hcpa_dbf_snapshot(
+    session: Session,
+    model: Any,
+    source_zip: Path,
+    member: str,
+    fields: Sequence[DbfField],
+    file_id: int,
+    batch_size: int,
+    limit_rows: int | None,
+) -> int:
+    """COPY a DBF member into an append-only snapshot table and return the row count.
+
+    dbfread hands out one dict per record, so fields are still parsed per
+    record, but each batch is collected as tuples and COPYed as one Polars
+    frame with ``source_file_id`` / ``loaded_at`` added as constants.
+    """
+    schema = {name: dtype for name, _field, _parse, dtype in fields} | {"source_line_number": pl.Int64}
+    step = max(1, batch_size)
+    batch: list[tuple] = []
+    inserted = 0
+
+    def flush() -> None:
+        copy_insert_frame(
+            session,
+            model,
+            pl.DataFrame(batch, schema=schema, orient="row"),
+            constants={"source_file_id": file_id, "loaded_at": _utc_now()},
+        )
+        session.commit()
+        batch.clear()
+
+    for line_no, row in _iter_dbf_rows_from_zip(source_zip, member):
+        if limit_rows is not None and inserted >= limit_rows:
+            break
+        batch.append((*(parse(row.get(field)) for _name, field, parse, _dtype in fields), line_no))
+        inserted += 1
+        if len(batch) >= step:
+            flush()
+    if batch:
+        flush()
+    return inserted
+
+
 def load_hcpa_allsales(
     dsn: str,
     allsales_zip: Path,
@@ -1515,7 +2447,6 @@ def load_hcpa_allsales(
 ) -> dict:
     member = _find_zip_dbf_member(allsales_zip, pattern=r"allsales.*\.dbf$")
     session_factory = get_session_factory(dsn)
-    inserted = 0
 
     with session_factory() as session:
         file_id = _start_hcpa_ingest_file(
@@ -1528,45 +2459,16 @@ def load_hcpa_allsales(
         _clear_previous_source_rows(session, HcpaAllSale, file_id)
         session.commit()
 
-        batch: list[dict] = []
-        effective_batch = batch_size
-        for line_no, row in _iter_dbf_rows_from_zip(allsales_zip, member):
-            if limit_rows is not None and inserted >= limit_rows:
-                break
-            mapped = {
-                "pin": _as_text(row.get("pin")),
-                "folio": _as_text(row.get("folio")),
-                "dor_code": _as_text(row.get("dor_code")),
-                "nbhc": _as_text(row.get("nbhc")),
-                "sale_date": _parse_date_mdy(row.get("s_date")),
-                "vacant_improved": _as_text(row.get("vi")),
-                "qualification_code": _as_text(row.get("qu")),
-                "reason_code": _as_text(row.get("rea_cd")),
-                "sale_amount": _parse_float_value(row.get("s_amt")),
-                "sub_code": _as_text(row.get("sub")),
-                "street_code": _as_text(row.get("str")),
-                "sale_type": _as_text(row.get("s_type")),
-                "or_book": _as_text(row.get("or_bk")),
-                "or_page": _as_text(row.get("or_pg")),
-                "grantor": _as_text(row.get("grantor")),
-                "grantee": _as_text(row.get("grantee")),
-                "doc_num": _as_text(row.get("doc_num")),
-                "source_file_id": file_id,
-                "source_line_number": line_no,
-                "loaded_at": _utc_now(),
-            }
-            if inserted == 0:
-                effective_batch = _effective_batch_size(batch_size, len(mapped))
-            batch.append(mapped)
-            inserted += 1
-            if len(batch) >= effective_batch:
-                session.execute(pg_insert(HcpaAllSale), batch)
-                session.commit()
-                batch.clear()
-
-        if batch:
-            session.execute(pg_insert(HcpaAllSale), batch)
-            session.commit()
+        inserted = _load_hcpa_dbf_snapshot(
+            session,
+            HcpaAllSale,
+            allsales_zip,
+            member,
+            _HCPA_ALLSALES_FIELDS,
+            file_id,
+            batch_size,
+            limit_rows,
+        )
 
         _mark_ingest_file(
             session=session,
@@ -1588,7 +2490,6 @@ def load_hcpa_subdivisions(
 ) -> dict:
     member = _find_zip_dbf_member(subdivisions_zip, pattern=r"subdivisions.*\.dbf$")
     session_factory = get_session_factory(dsn)
-    inserted = 0
 
     with session_factory() as session:
         file_id = _start_hcpa_ingest_file(
@@ -1601,36 +2502,16 @@ def load_hcpa_subdivisions(
         _clear_previous_source_rows(session, HcpaSubdivision, file_id)
         session.commit()
 
-        batch: list[dict] = []
-        effective_batch = batch_size
-        for line_no, row in _iter_dbf_rows_from_zip(subdivisions_zip, member):
-            if limit_rows is not None and inserted >= limit_rows:
-                break
-            mapped = {
-                "object_id": _parse_int_value(row.get("objectid")),
-                "legal1": _as_text(row.get("legal1")),
-                "sub_code": _as_text(row.get("subcode")),
-                "plat_bk": _as_text(row.get("plat_bk")),
-                "page": _as_text(row.get("page")),
-                "area": _parse_float_value(row.get("area")),
-                "shape_star": _parse_float_value(row.get("shape_star")),
-                "shape_stle": _parse_float_value(row.get("shape_stle")),
-                "source_file_id": file_id,
-                "source_line_number": line_no,
-                "loaded_at": _utc_now(),
-            }
-            if inserted == 0:
-                effective_batch = _effective_batch_size(batch_size, len(mapped))
-            batch.append(mapped)
-            inserted += 1
-            if len(batch) >= effective_batch:
-                session.execute(pg_insert(HcpaSubdivision), batch)
-                session.commit()
-                batch.clear()
-
-        if batch:
-            session.execute(pg_insert(HcpaSubdivision), batch)
-            session.commit()
+        inserted = _load_hcpa_dbf_snapshot(
+            session,
+            HcpaSubdivision,
+            subdivisions_zip,
+            member,
+            _HCPA_SUBDIVISION_FIELDS,
+            file_id,
+            batch_size,
+            limit_rows,
+        )
 
         _mark_ingest_file(
             session=session,
@@ -1873,7 +2754,82 @@ def _load_latlon_dataframe(latlon_file: Path) -> pl.DataFrame:
     return deduped
 
 
-def _normalize_hcpa_parcels(df: pl.DataFrame) -> pl.DataFrame:
+HCPA_PARCEL_COLUMNS = (
+    "folio",
+    "pin",
+    "strap",
+    "owner_name",
+    "property_address",
+    "city",
+    "zip_code",
+    "land_use",
+    "land_use_desc",
+    "year_built",
+    "beds",
+    "baths",
+    "stories",
+    "units",
+    "buildings",
+    "heated_area",
+    "lot_size",
+    "assessed_value",
+    "market_value",
+    "just_value",
+    "land_value",
+    "building_value",
+    "extra_features_value",
+    "taxable_value",
+    "last_sale_date",
+    "last_sale_price",
+    "raw_type",
+    "raw_sub",
+    "raw_taxdist",
+    "raw_muni",
+    "raw_legal1",
+    "raw_legal2",
+    "raw_legal3",
+    "raw_legal4",
+    "legal_lot",
+    "legal_block",
+    "legal_subdivision",
+    "legal_plat_book",
+    "legal_plat_page",
+    "latitude",
+    "longitude",
+)
+_ROW_HASH_NULL = "\x00"
+_ROW_HASH_SEPARATOR = "\x1f"
+
+
+def _hcpa_parcel_row_hash(df: pl.DataFrame) -> pl.Series:
+    """Return a stable 32-char hex content hash per row of ``df``.
+
+    Every column of ``HCPA_PARCEL_COLUMNS`` is rendered as text (absent columns
+    as NULL, so a dump that drops a column hashes like one where it is empty)
+    and the joined string is hashed with BLAKE2b.  Polars' own ``hash_rows`` is
+    not stable across Polars versions, and a library upgrade must not make
+    every stored hash look changed.
+    """
+    parts = [
+        (pl.col(col).cast(pl.Utf8) if col in df.columns else pl.lit(None, dtype=pl.Utf8)).fill_null(_ROW_HASH_NULL)
+        for col in HCPA_PARCEL_COLUMNS
+    ]
+    joined = df.select(pl.concat_str(parts, separator=_ROW_HASH_SEPARATOR).alias("row")).to_series()
+    return pl.Series(
+        "row_hash",
+        [hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest() for value in joined],
+        dtype=pl.Utf8,
+    )
+
+
+def _normalize_hcpa_parcels(df: pl.DataFrame, latlon_df: pl.DataFrame | None = None) -> pl.DataFrame:
+    """Rename, cast and dedupe a parcel dump into ``hcpa_bulk_parcels`` columns.
+
+    ``latlon_df`` (folio, latitude, longitude) fills coordinates the parcel
+    file lacks.  The result holds the present ``HCPA_PARCEL_COLUMNS`` (the
+    ``legal_*`` columns parsed from ``raw_legal1..4``) plus ``row_hash`` over
+    the final values, coordinates included.
+    """
     aliases = {
         "owner": "owner_name",
         "site_addr": "property_address",
@@ -1947,39 +2903,181 @@ def _normalize_hcpa_parcels(df: pl.DataFrame) -> pl.DataFrame:
                 dtype = pl.Int64
             df = df.with_columns(pl.col(col).cast(dtype, strict=False))
 
-    return (
+    df = (
         df.with_columns(pl.col("folio").cast(pl.Utf8).str.strip_chars())
         .filter(pl.col("folio").is_not_null() & (pl.col("folio") != ""))
-        .unique(subset=["folio"], keep="first")
+        .unique(subset=["folio"], keep="first", maintain_order=True)
     )
 
+    if latlon_df is not None:
+        df = df.join(latlon_df, on="folio", how="left", suffix="_latlon", maintain_order="left")
+        if "latitude_latlon" in df.columns:
+            df = df.with_columns(
+                pl.coalesce("latitude", "latitude_latlon").alias("latitude"),
+                pl.coalesce("longitude", "longitude_latlon").alias("longitude"),
+            ).drop("latitude_latlon", "longitude_latlon")
 
-def _upsert_hcpa_latlon(session: Session, rows: list[dict]) -> None:
-    if not rows:
-        return
-    stmt = pg_insert(HcpaLatLon).values(rows)
-    stmt = stmt.on_conflict_do_update(
-        index_elements=[HcpaLatLon.folio],
-        set_={
-            "latitude": stmt.excluded.latitude,
-            "longitude": stmt.excluded.longitude,
-            "source_file_id": stmt.excluded.source_file_id,
-            "updated_at": stmt.excluded.updated_at,
-        },
+    df = _with_parsed_legal(df)
+    df = df.select([c for c in HCPA_PARCEL_COLUMNS if c in df.columns])
+    return df.with_columns(_hcpa_parcel_row_hash(df))
+
+
+def _with_parsed_legal(df: pl.DataFrame) -> pl.DataFrame:
+    """Add the ``legal_*`` columns parsed from ``raw_legal1..4``.
+
+    The four fields are joined the way ``combine_legal_fields`` joins them and
+    parsed once per distinct text.  The parsed columns are part of
+    ``row_hash``, so a parser change rewrites the parcels whose parse moved.
+    """
+    legal_cols = [c for c in ("raw_legal1", "raw_legal2", "raw_legal3", "raw_legal4") if c in df.columns]
+    if not legal_cols:
+        return df
+    from src.utils.legal_description import parse_legal_column
+
+    combined = df.select(
+        pl.concat_str(
+            [pl.col(c).cast(pl.Utf8).str.strip_chars().replace("", None) for c in legal_cols],
+            separator=" ",
+            ignore_nulls=True,
+        )
+    ).to_series()
+    return pl.concat([df, parse_legal_column(combined)], how="horizontal")
+
+
+# Keywords whose following token names a lot / block / unit.  For a plain
+# alphanumeric value V, "V in lot_keys" holds exactly when the legal text
+# matches (^|[^A-Z0-9])(LOT|L|LT)\s*V([^A-Z0-9]|$) (likewise for blocks and
+# units), the regexes identifier recovery used to scan with.
+_LEGAL_KEY_KEYWORDS = {
+    "lot_keys": ("LOT", "LT", "L"),
+    "block_keys": ("BLOCK", "BLK", "B"),
+    "unit_keys": ("UNIT", "UN", "U"),
+}
+_LEGAL_KEY_PATTERNS = {
+    column: tuple(re.compile(rf"(?<![A-Z0-9])(?={keyword}\s*([A-Z0-9]+))") for keyword in keywords)
+    for column, keywords in _LEGAL_KEY_KEYWORDS.items()
+}
+
+
+def _legal_keys(legal_text: str) -> dict[str, list[str]]:
+    """Return the distinct lot/block/unit tokens of an upper-cased legal text."""
+    keys: dict[str, list[str]] = {}
+    for column, patterns in _LEGAL_KEY_PATTERNS.items():
+        found = dict.fromkeys(match.group(1) for pattern in patterns for match in pattern.finditer(legal_text))
+        keys[column] = list(found)
+    return keys
+
+
+def _hcpa_legal_index_frame(parcels: pl.DataFrame) -> pl.DataFrame:
+    """Build ``hcpa_parcel_legal_index`` rows from normalized parcels.
+
+    ``legal_text`` is built like identifier recovery's SQL expression
+    ``UPPER(COALESCE(raw_legal1, '') || ' ' || ... raw_legal4)``.
+    """
+    legal_parts = [
+        pl.col(c).fill_null("") if c in parcels.columns else pl.lit("")
+        for c in ("raw_legal1", "raw_legal2", "raw_legal3", "raw_legal4")
+    ]
+    parsed = [
+        (pl.col(f"legal_{name}") if f"legal_{name}" in parcels.columns else pl.lit(None, dtype=pl.Utf8)).alias(name)
+        for name in ("subdivision", "plat_book", "plat_page")
+    ]
+    frame = parcels.select(
+        "folio",
+        pl.concat_str(legal_parts, separator=" ").str.to_uppercase().alias("legal_text"),
+        *parsed,
+    )
+    keys: dict[str, list[list[str]]] = {column: [] for column in _LEGAL_KEY_PATTERNS}
+    for legal_text in frame.get_column("legal_text"):
+        for column, values in _legal_keys(legal_text).items():
+            keys[column].append(values)
+    return frame.with_columns(
+        pl.Series(column, values, dtype=pl.List(pl.Utf8)) for column, values in keys.items()
     )
-    session.execute(stmt)
 
 
-def _upsert_hcpa_parcels(session: Session, rows: list[dict]) -> None:
-    if not rows:
-        return
-    stmt = pg_insert(HcpaBulkParcel).values(rows)
-    update_cols = {col.name: getattr(stmt.excluded, col.name) for col in HcpaBulkParcel.__table__.columns if col.name != "folio"}
-    stmt = stmt.on_conflict_do_update(
-        index_elements=[HcpaBulkParcel.folio],
-        set_=update_cols,
+def _upsert_hcpa_legal_index(session: Session, parcels: pl.DataFrame) -> None:
+    copy_upsert_frame(
+        session,
+        HcpaParcelLegalIndex,
+        _hcpa_legal_index_frame(parcels),
+        conflict_columns=["folio"],
+        update=excluded_updates(HcpaParcelLegalIndex, exclude={"folio"}),
+    )
+
+
+def _hcpa_legal_index_targets(session: Session, parcels: pl.DataFrame, written: pl.DataFrame) -> pl.DataFrame:
+    """Parcels whose legal index row must be (re)built: rewritten or never indexed."""
+    rows = session.execute(select(HcpaParcelLegalIndex.folio)).all()
+    indexed = pl.DataFrame([tuple(row) for row in rows], schema={"folio": pl.Utf8}, orient="row")
+    unindexed = parcels.select("folio").join(indexed, on="folio", how="anti")
+    stale = pl.concat([written.select("folio"), unindexed]).unique()
+    return parcels.join(stale, on="folio", how="semi", maintain_order="left")
+
+
+def _existing_hcpa_row_hashes(session: Session) -> pl.DataFrame:
+    rows = session.execute(select(HcpaBulkParcel.folio, HcpaBulkParcel.row_hash)).all()
+    return pl.DataFrame(
+        [tuple(row) for row in rows],
+        schema={"folio": pl.Utf8, "stored_hash": pl.Utf8},
+        orient="row",
+    )
+
+
+def _diff_hcpa_parcels(
+    parcels_df: pl.DataFrame,
+    existing: pl.DataFrame,
+) -> tuple[pl.DataFrame, list[str], dict[str, int]]:
+    """Split a normalized dump against the stored ``(folio, stored_hash)`` pairs.
+
+    Returns the rows to write (new folios and folios whose hash differs, a
+    NULL stored hash counting as changed), the stored folios absent from the
+    dump, and the inserted/changed/unchanged/missing counts.
+    """
+    joined = parcels_df.join(existing, on="folio", how="left", maintain_order="left")
+    is_new = ~pl.col("folio").is_in(existing.get_column("folio").implode())
+    is_changed = ~is_new & pl.col("stored_hash").ne_missing(pl.col("row_hash"))
+    flagged = joined.with_columns(is_new.alias("_new"), is_changed.alias("_changed"))
+    to_write = flagged.filter(pl.col("_new") | pl.col("_changed")).drop("stored_hash", "_new", "_changed")
+    inserted = int(flagged.get_column("_new").sum())
+    changed = int(flagged.get_column("_changed").sum())
+    missing = existing.join(parcels_df.select("folio"), on="folio", how="anti").get_column("folio").to_list()
+    counts = {
+        "inserted": inserted,
+        "changed": changed,
+        "unchanged": parcels_df.height - inserted - changed,
+        "missing": len(missing),
+    }
+    return to_write, missing, counts
+
+
+def _upsert_hcpa_latlon(session: Session, frame: pl.DataFrame, source_file_id: int) -> None:
+    copy_upsert_frame(
+        session,
+        HcpaLatLon,
+        frame,
+        conflict_columns=["folio"],
+        update=excluded_updates(HcpaLatLon, exclude={"folio"}),
+        constants={"source_file_id": source_file_id, "updated_at": _utc_now()},
     )
-    session.execute(stmt)
+
+
+def _upsert_hcpa_parcels(session: Session, frame: pl.DataFrame, source_file_id: int) -> None:
+    copy_upsert_frame(
+        session,
+        HcpaBulkParcel,
+        frame,
+        conflict_columns=["folio"],
+        update=excluded_updates(HcpaBulkParcel, exclude={"folio"}),
+        constants={"source_file_id": source_file_id, "updated_at": _utc_now()},
+    )
+
+
+def _frame_slices(frame: pl.DataFrame, batch_size: int) -> Iterator[pl.DataFrame]:
+    """Zero-copy ``batch_size``-row slices of ``frame`` (COPY batches are not bound by PG_MAX_BIND_PARAMS)."""
+    step = max(1, batch_size)
+    for offset in range(0, frame.height, step):
+        yield frame.slice(offset, step)
 
 
 def load_hcpa_bulk(
@@ -1988,19 +3086,26 @@ def load_hcpa_bulk(
     latlon_file: Path | None,
     batch_size: int,
     limit_rows: int | None = None,
+    prune_missing: bool = False,
 ) -> dict:
-    parcels_df = _normalize_hcpa_parcels(_load_parcel_dataframe(parcel_file))
+    """Load a weekly parcel dump into ``hcpa_bulk_parcels``, writing only changes.
+
+    Each normalized row carries a ``row_hash``; rows whose folio is new or
+    whose hash differs from the stored one are upserted (and get a fresh
+    ``updated_at`` / ``source_file_id``), unchanged rows are not touched.
+    Folios stored but absent from the dump are counted as missing and kept
+    unless ``prune_missing`` is set.  Pruning is refused with ``limit_rows``,
+    since a truncated dump would make most parcels look missing.
+    ``hcpa_parcel_legal_index`` is refreshed for every rewritten parcel and any
+    parcel not indexed yet; pruned parcels drop out via its foreign key.
+    """
+    if prune_missing and limit_rows is not None:
+        raise ValueError("prune_missing requires a full parcel load (no limit_rows).")
+    latlon_df = _load_latlon_dataframe(latlon_file) if latlon_file else None
+    parcels_df = _load_parcel_dataframe(parcel_file)
+    parcels_df = _normalize_hcpa_parcels(parcels_df, latlon_df)
     if limit_rows is not None:
         parcels_df = parcels_df.head(limit_rows)
-    latlon_df = _load_latlon_dataframe(latlon_file) if latlon_file else None
-
-    if latlon_df is not None:
-        parcels_df = parcels_df.join(latlon_df, on="folio", how="left", suffix="_latlon")
-        if "latitude_latlon" in parcels_df.columns:
-            parcels_df = parcels_df.with_columns(
-                pl.coalesce("latitude", "latitude_latlon").alias("latitude"),
-                pl.coalesce("longitude", "longitude_latlon").alias("longitude"),
-            ).drop("latitude_latlon", "longitude_latlon")
 
     session_factory = get_session_factory(dsn)
     parcel_size = parcel_file.stat().st_size
@@ -2037,91 +3142,60 @@ def load_hcpa_bulk(
                 session.commit()
 
             if latlon_df is not None and latlon_file_id is not None:
-                latlon_rows = [
-                    {
-                        "folio": row["folio"],
-                        "latitude": row["latitude"],
-                        "longitude": row["longitude"],
-                        "source_file_id": latlon_file_id,
-                        "updated_at": _utc_now(),
-                    }
-                    for row in latlon_df.iter_rows(named=True)
-                ]
-                effective_batch = batch_size
-                if latlon_rows:
-                    effective_batch = _effective_batch_size(batch_size, len(latlon_rows[0]))
-                for chunk in _chunked(latlon_rows, effective_batch):
-                    _upsert_hcpa_latlon(session, chunk)
+                for chunk in _frame_slices(latlon_df, batch_size):
+                    _upsert_hcpa_latlon(session, chunk, latlon_file_id)
                     session.commit()
                 _mark_ingest_file(
                     session,
                     latlon_file_id,
                     status="loaded",
-                    row_count=len(latlon_rows),
+                    row_count=latlon_df.height,
                     error_message=None,
                 )
                 latlon_marked_loaded = True
                 session.commit()
 
-            keep_cols = [
-                "folio",
-                "pin",
-                "strap",
-                "owner_name",
-                "property_address",
-                "city",
-                "zip_code",
-                "land_use",
-                "land_use_desc",
-                "year_built",
-                "beds",
-                "baths",
-                "stories",
-                "units",
-                "buildings",
-                "heated_area",
-                "lot_size",
-                "assessed_value",
-                "market_value",
-                "just_value",
-                "land_value",
-                "building_value",
-                "extra_features_value",
-                "taxable_value",
-                "last_sale_date",
-                "last_sale_price",
-                "raw_type",
-                "raw_sub",
-                "raw_taxdist",
-                "raw_muni",
-                "raw_legal1",
-                "raw_legal2",
-                "raw_legal3",
-                "raw_legal4",
-                "latitude",
-                "longitude",
-            ]
-            present_cols = [c for c in keep_cols if c in parcels_df.columns]
-            parcels_df = parcels_df.select(present_cols)
-
-            parcel_rows = []
-            for row in parcels_df.iter_rows(named=True):
-                row["source_file_id"] = parcel_file_id
-                row["updated_at"] = _utc_now()
-                parcel_rows.append(row)
+            existing = _existing_hcpa_row_hashes(session)
+            if limit_rows is not None:
+                # A partial load cannot tell a retired parcel from one past the limit.
+                existing = existing.join(parcels_df.select("folio"), on="folio", how="semi")
+            to_write, missing_folios, diff = _diff_hcpa_parcels(parcels_df, existing)
+            del existing
 
-            effective_batch = batch_size
-            if parcel_rows:
-                effective_batch = _effective_batch_size(batch_size, len(parcel_rows[0]))
-            for chunk in _chunked(parcel_rows, effective_batch):
-                _upsert_hcpa_parcels(session, chunk)
+            for chunk in _frame_slices(to_write, batch_size):
+                _upsert_hcpa_parcels(session, chunk, parcel_file_id)
                 session.commit()
 
+            index_rows = _hcpa_legal_index_targets(session, parcels_df, to_write)
+            for chunk in _frame_slices(index_rows, batch_size):
+                _upsert_hcpa_legal_index(session, chunk)
+                session.commit()
+
+            deleted = 0
+            if prune_missing:
+                for start in range(0, len(missing_folios), max(1, batch_size)):
+                    folios = missing_folios[start : start + max(1, batch_size)]
+                    session.execute(delete(HcpaBulkParcel).where(HcpaBulkParcel.folio.in_(folios)))
+                    session.commit()
+                    deleted += len(folios)
+
+            logger.info(
+                "hcpa_bulk_parcels: {} rows in dump, {} inserted, {} changed, {} unchanged, {} missing ({} deleted), "
+                "{} legal index rows refreshed",
+                parcels_df.height,
+                diff["inserted"],
+                diff["changed"],
+                diff["unchanged"],
+                diff["missing"],
+                deleted,
+                index_rows.height,
+            )
+
             _mark_ingest_file(
                 session=session,
                 file_id=parcel_file_id,
                 status="loaded",
-                row_count=len(parcel_rows),
+                row_count=parcels_df.height,
                 error_message=None,
             )
             session.commit()
@@ -2146,7 +3220,13 @@ def load_hcpa_bulk(
             raise
 
     return {
-        "parcels_upserted": len(parcels_df),
+        "parcels_upserted": to_write.height,
+        "parcels_inserted": diff["inserted"],
+        "parcels_changed": diff["changed"],
+        "parcels_unchanged": diff["unchanged"],
+        "parcels_missing": diff["missing"],
+        "parcels_deleted": deleted,
+        "legal_index_refreshed": index_rows.height,
         "latlon_upserted": 0 if latlon_df is None else len(latlon_df),
     }
 
@@ -2403,18 +3483,7 @@ def _parse_nal_csv_row(
         mapped[model_field] = val
 
     # Parse numeric value fields
-    numeric_fields = [
-        "just_value",
-        "just_value_homestead",
-        "assessed_value_school",
-        "assessed_value_nonschool",
-        "assessed_value_homestead",
-        "taxable_value_school",
-        "taxable_value_nonschool",
-        "homestead_exempt_value",
-        "widow_exempt_value",
-    ]
-    for field in numeric_fields:
+    for field in DOR_NAL_NUMERIC_FIELDS:
         mapped[field] = _parse_float_value(mapped.get(field))
 
     # Parse exemption fields from EXMPT_nn_VAL columns
@@ -2503,17 +3572,162 @@ def _build_folio_lookup(session: Session) -> dict[str, tuple[str, str]]:
     return lookup
 
 
-def _upsert_dor_nal_parcels(session: Session, rows: list[dict]) -> None:
+NAL_READ_BATCH_ROWS = 50_000
+
+
+@contextlib.contextmanager
+def _nal_utf8_member(zip_path: Path, member: str) -> Iterator[Path]:
+    """Stream the latin-1 NAL member into a temporary UTF-8 copy for Polars."""
+    with tempfile.TemporaryDirectory(prefix="dor_nal_") as tmp_dir:
+        path = Path(tmp_dir) / "nal.csv"
+        with zipfile.ZipFile(zip_path) as zf, zf.open(member) as src, path.open("w", encoding="utf-8", newline="") as dst:
+            shutil.copyfileobj(io.TextIOWrapper(src, encoding="latin-1", newline=""), dst, 1 << 20)
+        yield path
+
+
+def _nal_column_batches(
+    zip_path: Path,
+    member: str,
+    *,
+    batch_rows: int = NAL_READ_BATCH_ROWS,
+) -> Iterator[pl.DataFrame]:
+    """Yield the NAL CSV member in batches of all-text, lowercase-named columns.
+
+    Only the columns ``_frame_dor_nal`` uses are materialized (the file has
+    ~200), and only one batch is held at a time; a consumer that stops early
+    stops the read.
+    """
+    wanted = {
+        *NAL_COLUMN_MAP,
+        *(f"exmpt_{code}" for code in (*DOR_EXEMPTION_FIELDS, "02")),
+        "tot_mill",
+        "co_mill",
+        "schl_mill",
+        "muni_mill",
+        "lgl_2",
+        "lgl_3",
+        "lgl_4",
+    }
+    with _nal_utf8_member(zip_path, member) as path:
+        header = pl.read_csv(path, n_rows=0, infer_schema=False).columns
+        names = {name: name.strip().lower() for name in header}
+        selected = [name for name, lower in names.items() if lower in wanted]
+        lazy = pl.scan_csv(path, infer_schema=False, truncate_ragged_lines=True).select(selected)
+        for frame in lazy.collect_batches(chunk_size=batch_rows):
+            yield frame.rename({name: names[name] for name in frame.columns})
+
+
+def _nal_text(raw: pl.DataFrame, column: str) -> pl.Expr:
+    if column not in raw.columns:
+        return pl.lit(None, dtype=pl.String)
+    value = pl.col(column).str.strip_chars()
+    return pl.when(value != "").then(value)
+
+
+def _nal_float(text: pl.Expr) -> pl.Expr:
+    return text.str.replace_all(",", "", literal=True).cast(pl.Float64, strict=False)
+
+
+def _frame_dor_nal(
+    raw: pl.DataFrame,
+    *,
+    tax_year: int,
+    source_file: str,
+    folio_lookup: dict[str, tuple[str, str]],
+) -> pl.DataFrame:
+    """Columnar ``_parse_nal_csv_row`` over rows already filtered to a county.
+
+    ``raw`` comes from ``_nal_column_batches``; rows without ``co_no`` or
+    ``parcel_id`` must already be dropped.  ``source_file_id`` and
+    ``loaded_at`` are left to the writer's constants.
+    """
+    cols: dict[str, pl.Expr] = {
+        "county_code": _nal_text(raw, "co_no"),
+        "parcel_id": _nal_text(raw, "parcel_id"),
+        "tax_year": pl.lit(tax_year, dtype=pl.Int64),
+        "source_file": pl.lit(source_file, dtype=pl.String),
+    }
+    for csv_col, model_field in NAL_COLUMN_MAP.items():
+        if csv_col not in ("co_no", "parcel_id"):
+            cols[model_field] = _nal_text(raw, csv_col)
+    for field in DOR_NAL_NUMERIC_FIELDS:
+        cols[field] = _nal_float(cols[field]) if field in cols else pl.lit(None, dtype=pl.Float64)
+
+    for exmpt_code, (bool_field, value_field) in DOR_EXEMPTION_FIELDS.items():
+        val = _nal_float(_nal_text(raw, f"exmpt_{exmpt_code}"))
+        if bool_field == "homestead_exempt":
+            total_hmstd = val.fill_null(0.0) + _nal_float(_nal_text(raw, "exmpt_02")).fill_null(0.0)
+            cols[bool_field] = total_hmstd > 0
+            cols[value_field] = pl.when(total_hmstd > 0).then(total_hmstd)
+        else:
+            cols[bool_field] = (val > 0).fill_null(value=False)
+            cols[value_field] = pl.coalesce(cols.get(value_field, pl.lit(None, dtype=pl.Float64)), val)
+
+    soh = cols["just_value_homestead"] - cols["assessed_value_homestead"]
+    cols["soh_differential"] = pl.when(soh > 0).then(soh)
+
+    millage = {
+        "total_millage": _nal_float(_nal_text(raw, "tot_mill")),
+        "county_millage": _nal_float(_nal_text(raw, "co_mill")),
+        "school_millage": _nal_float(_nal_text(raw, "schl_mill")),
+        "city_millage": _nal_float(_nal_text(raw, "muni_mill")),
+    }
+    if tax_year == 2025:
+        tax_auth = cols["tax_auth_cd"].fill_null("").str.strip_chars().str.to_uppercase()
+        use_fallback = millage["total_millage"].is_null() & tax_auth.is_in(list(HILLSBOROUGH_MILLAGE_2025))
+        millage = {
+            field: pl.when(use_fallback)
+            .then(
+                tax_auth.replace_strict(
+                    {code: rates[field] for code, rates in HILLSBOROUGH_MILLAGE_2025.items()},
+                    default=None,
+                    return_dtype=pl.Float64,
+                )
+            )
+            .otherwise(parsed)
+            for field, parsed in millage.items()
+        }
+    cols.update(millage)
+    cols["_annual_tax"] = cols["taxable_value_nonschool"] * cols["total_millage"] / 1000.0
+
+    legal = (
+        pl.concat_list(cols["legal_description"], *(_nal_text(raw, suffix) for suffix in ("lgl_2", "lgl_3", "lgl_4")))
+        .list.drop_nulls()
+        .list.join(" ")
+        .str.strip_chars()
+    )
+    cols["legal_description"] = pl.when(legal != "").then(legal)
+
+    frame = raw.select(expr.alias(name) for name, expr in cols.items())
+    # Python ``round`` keeps parity with the row parser (Polars rounds the
+    # binary value differently at exact half-cents).
+    frame = frame.with_columns(
+        _map_unique(frame.get_column("_annual_tax"), lambda v: None if v is None else round(v, 2), pl.Float64).alias(
+            "estimated_annual_tax"
+        )
+    ).drop("_annual_tax")
+
+    lookup = pl.DataFrame(
+        {
+            "parcel_id": list(folio_lookup),
+            "folio": [folio for folio, _strap in folio_lookup.values()],
+            "strap": [strap for _folio, strap in folio_lookup.values()],
+        },
+        schema={"parcel_id": pl.String, "folio": pl.String, "strap": pl.String},
+    )
+    return frame.join(lookup, on="parcel_id", how="left", maintain_order="left")
+
+
+def _upsert_dor_nal_parcels(session: Session, frame: pl.DataFrame, source_file_id: int) -> None:
     """Upsert a batch of DorNalParcel rows."""
-    if not rows:
-        return
-    stmt = pg_insert(DorNalParcel).values(rows)
-    update_cols = {col.name: getattr(stmt.excluded, col.name) for col in DorNalParcel.__table__.columns if col.name != "id"}
-    stmt = stmt.on_conflict_do_update(
-        constraint="uq_dor_nal_parcels_county_parcel_year",
-        set_=update_cols,
+    copy_upsert_frame(
+        session,
+        DorNalParcel,
+        frame,
+        conflict_constraint="uq_dor_nal_parcels_county_parcel_year",
+        update=excluded_updates(DorNalParcel, exclude={"id"}),
+        constants={"source_file_id": source_file_id, "loaded_at": _utc_now()},
     )
-    session.execute(stmt)
 
 
 def _infer_tax_year_from_path(path: Path) -> int | None:
@@ -2544,16 +3758,13 @@ def load_dor_nal(
         dsn: PostgreSQL DSN.
         nal_zip: Path to downloaded NAL ZIP file.
         tax_year: Override tax year (default: inferred from filename).
-        batch_size: Rows per INSERT batch.
+        batch_size: Rows per COPY upsert batch.
         limit_rows: Max rows to load (for testing).
         county_filter: DOR county code to filter (default: '29' for Hillsborough).
 
     Returns:
         Stats dict with counts.
     """
-    import csv
-    import io
-
     if tax_year is None:
         tax_year = _infer_tax_year_from_path(nal_zip)
     if tax_year is None:
@@ -2583,60 +3794,48 @@ def load_dor_nal(
         session.commit()
 
         try:
-            # Read CSV from ZIP
-            with zipfile.ZipFile(nal_zip) as zf:
-                with zf.open(member) as fp:
-                    text_stream = io.TextIOWrapper(fp, encoding="latin-1", errors="replace")
-                    reader = csv.DictReader(text_stream)
-
-                    # Normalize header names to lowercase
-                    if reader.fieldnames:
-                        reader.fieldnames = [f.strip().lower() for f in reader.fieldnames]
-                        print(f"  CSV has {len(reader.fieldnames)} columns")
-
-                    batch: list[dict] = []
-                    effective_batch = batch_size
-
-                    for row in reader:
-                        # Normalize all keys to lowercase
-                        row = {k.strip().lower(): v for k, v in row.items()}
-
-                        # Filter to target county
-                        co_no = (row.get("co_no") or "").strip()
-                        if county_filter and co_no != county_filter:
-                            skipped_county += 1
-                            continue
-
-                        parsed = _parse_nal_csv_row(
-                            row=row,
-                            file_id=file_id,
-                            tax_year=tax_year,
-                            source_file=member,
-                            folio_lookup=folio_lookup,
-                        )
-                        if parsed is None:
-                            skipped_empty += 1
-                            continue
-
-                        if inserted == 0:
-                            effective_batch = _effective_batch_size(batch_size, len(parsed))
-
-                        batch.append(parsed)
-                        inserted += 1
-
-                        if limit_rows is not None and inserted >= limit_rows:
-                            break
-
-                        if len(batch) >= effective_batch:
-                            _upsert_dor_nal_parcels(session, batch)
-                            session.commit()
-                            batch.clear()
-                            if inserted % 50000 == 0:
-                                print(f"  ... {inserted:,} rows loaded")
-
-                    if batch:
-                        _upsert_dor_nal_parcels(session, batch)
+            rows_read = 0
+            kept_total = 0
+            with contextlib.closing(_nal_column_batches(nal_zip, member, batch_rows=NAL_READ_BATCH_ROWS)) as batches:
+                for raw in batches:
+                    rows_read += raw.height
+                    # Same order as the row-at-a-time loop this replaced: other
+                    # counties are skipped first, then rows missing
+                    # co_no/parcel_id, and --limit-rows stops at the Nth kept row.
+                    co_no = pl.col("co_no").fill_null("").str.strip_chars() if "co_no" in raw.columns else pl.lit("")
+                    parcel_id = (
+                        pl.col("parcel_id").fill_null("").str.strip_chars()
+                        if "parcel_id" in raw.columns
+                        else pl.lit("")
+                    )
+                    in_county = (co_no == county_filter) if county_filter else pl.lit(value=True)
+                    raw = raw.with_columns(
+                        in_county.alias("_in_county"),
+                        (in_county & (co_no != "") & (parcel_id != "")).alias("_kept"),
+                    )
+                    if limit_rows is not None:
+                        remaining = limit_rows - kept_total
+                        raw = raw.filter(pl.col("_kept").cum_sum().shift(1, fill_value=0) < remaining)
+                    batch_skipped_county = int((~raw.get_column("_in_county")).sum())
+                    kept = raw.filter(pl.col("_kept")).drop("_in_county", "_kept")
+                    skipped_county += batch_skipped_county
+                    skipped_empty += raw.height - batch_skipped_county - kept.height
+                    kept_total += kept.height
+                    del raw
+
+                    parcels = _frame_dor_nal(kept, tax_year=tax_year, source_file=member, folio_lookup=folio_lookup)
+                    del kept
+                    # Later rows win for a repeated parcel: within a batch here,
+                    # across batches through the upsert.
+                    parcels = parcels.unique(subset=["county_code", "parcel_id"], keep="last", maintain_order=True)
+                    for chunk in _frame_slices(parcels, batch_size):
+                        _upsert_dor_nal_parcels(session, chunk, file_id)
                         session.commit()
+                    inserted += parcels.height
+
+                    if limit_rows is not None and kept_total >= limit_rows:
+                        break
+            print(f"  Read {rows_read:,} CSV rows")
 
             _mark_ingest_file(
                 session=session,
@@ -2699,6 +3898,12 @@ def _build_parser() -> argparse.ArgumentParser:
     raw_cmd.add_argument("--limit-files", type=int, default=None)
     raw_cmd.add_argument("--limit-lines", type=int, default=None)
     raw_cmd.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    raw_cmd.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Files loaded in parallel worker processes (default: SUNBIZ_LOAD_WORKERS or 1).",
+    )
     raw_cmd.add_argument(
         "--no-skip-unchanged",
         action="store_true",
@@ -2711,6 +3916,23 @@ def _build_parser() -> argparse.ArgumentParser:
     flr_cmd.add_argument("--limit-files", type=int, default=None)
     flr_cmd.add_argument("--limit-lines", type=int, default=None)
     flr_cmd.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    flr_cmd.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Files loaded in parallel worker processes (default: SUNBIZ_LOAD_WORKERS or 1).",
+    )
+    flr_cmd.add_argument(
+        "--max-rss-mb",
+        type=int,
+        default=None,
+        help="Process RSS ceiling in MiB (default: SUNBIZ_LOADER_MAX_RSS_MB or 2048; 0 disables).",
+    )
+    flr_cmd.add_argument(
+        "--row-parser",
+        action="store_true",
+        help="Use the per-line Python parsers instead of the Polars columnar parsers.",
+    )
 
     entity_cmd = sub.add_parser(
         "load-sunbiz-entity",
@@ -2721,6 +3943,23 @@ def _build_parser() -> argparse.ArgumentParser:
     entity_cmd.add_argument("--limit-files", type=int, default=None)
     entity_cmd.add_argument("--limit-lines", type=int, default=None)
     entity_cmd.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    entity_cmd.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Files loaded in parallel worker processes (default: SUNBIZ_LOAD_WORKERS or 1).",
+    )
+    entity_cmd.add_argument(
+        "--max-rss-mb",
+        type=int,
+        default=None,
+        help="Process RSS ceiling in MiB (default: SUNBIZ_LOADER_MAX_RSS_MB or 2048; 0 disables).",
+    )
+    entity_cmd.add_argument(
+        "--row-parser",
+        action="store_true",
+        help="Use the per-line Python parsers instead of the Polars columnar parsers.",
+    )
 
     hcpa_cmd = sub.add_parser(
         "load-hcpa",
@@ -2730,6 +3969,11 @@ def _build_parser() -> argparse.ArgumentParser:
     hcpa_cmd.add_argument("--latlon-file", type=Path, default=None)
     hcpa_cmd.add_argument("--limit-rows", type=int, default=None)
     hcpa_cmd.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    hcpa_cmd.add_argument(
+        "--prune-missing",
+        action="store_true",
+        help="Delete stored parcels whose folio is absent from the dump (full loads only).",
+    )
 
     sync_hcpa_cmd = sub.add_parser(
         "sync-hcpa",
@@ -2846,6 +4090,7 @@ def main() -> int:
             limit_lines=args.limit_lines,
             batch_size=args.batch_size,
             skip_unchanged=not args.no_skip_unchanged,
+            workers=args.workers,
         )
         print(stats)
         return 0
@@ -2858,6 +4103,9 @@ def main() -> int:
             limit_files=args.limit_files,
             limit_lines=args.limit_lines,
             batch_size=args.batch_size,
+            max_rss_mb=args.max_rss_mb,
+            columnar=not args.row_parser,
+            workers=args.workers,
         )
         print(stats)
         return 0
@@ -2870,6 +4118,9 @@ def main() -> int:
             limit_files=args.limit_files,
             limit_lines=args.limit_lines,
             batch_size=args.batch_size,
+            max_rss_mb=args.max_rss_mb,
+            columnar=not args.row_parser,
+            workers=args.workers,
         )
         print(stats)
         return 0
@@ -2881,6 +4132,7 @@ def main() -> int:
             latlon_file=args.latlon_file,
             batch_size=args.batch_size,
             limit_rows=args.limit_rows,
+            prune_missing=args.prune_missing,
         )
         print(stats)
         return 0
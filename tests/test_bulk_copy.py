@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import datetime as dt
+import re
+from types import SimpleNamespace
+from typing import Any, Self, cast
+
+import polars as pl
+import pytest
+from psycopg.types.json import Jsonb
+
+from src.services.models_clerk import ClerkCivilParty
+from src.services.models_clerk import OfficialRecordsDailyInstrument
+from sunbiz.bulk_copy import coalesce_updates
+from sunbiz.bulk_copy import copy_insert_frame
+from sunbiz.bulk_copy import copy_upsert
+from sunbiz.bulk_copy import copy_upsert_frame
+from sunbiz.bulk_copy import StagedUpsert
+from sunbiz.bulk_copy import excluded_updates
+from sunbiz.bulk_copy import UnsupportedDriverError
+from sunbiz.models import HcpaAllSale
+from sunbiz.models import HcpaLatLon
+from sunbiz.models import SunbizEntityFiling
+
+
+class _FakeCopy:
+    def __init__(self, sink: list[list[Any]]) -> None:
+        self.sink = sink
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        return None
+
+    def write_row(self, values: list[Any]) -> None:
+        self.sink.append(list(values))
+
+    def write(self, data: Any) -> None:
+        self.sink.append([bytes(data)])
+
+
+class _FakeCursor:
+    def __init__(self, owner: _FakeSession) -> None:
+        self.owner = owner
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        return None
+
+    def copy(self, sql: str) -> _FakeCopy:
+        self.owner.statements.append(sql)
+        return _FakeCopy(self.owner.copied)
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.copied: list[list[Any]] = []
+
+    def execute(self, statement: object) -> SimpleNamespace:
+        self.statements.append(str(statement))
+        return SimpleNamespace(rowcount=len(self.copied))
+
+    def connection(self) -> SimpleNamespace:
+        dbapi = SimpleNamespace(cursor=lambda: _FakeCursor(self))
+        return SimpleNamespace(connection=SimpleNamespace(dbapi_connection=dbapi))
+
+
+def test_copy_upsert_stages_rows_and_merges_with_update() -> None:
+    session = _FakeSession()
+    rows = [
+        {"case_number": "24-CA-1", "party_type": "DEFENDANT", "name": "DOE, JANE", "city": "TAMPA"},
+        {"case_number": "24-CA-2", "party_type": "PLAINTIFF", "name": "BANK", "city": None},
+    ]
+
+    merged = copy_upsert(
+        cast("Any", session),
+        ClerkCivilParty,
+        rows,
+        conflict_constraint="uq_clerk_parties_case_type_name",
+        update=coalesce_updates(ClerkCivilParty, ["city"]),
+    )
+
+    create, copy_sql, insert, drop = session.statements
+    assert create.startswith('CREATE TEMP TABLE "_stage_clerk_civil_parties" ON COMMIT DROP AS SELECT')
+    assert create.endswith('FROM "clerk_civil_parties" WITH NO DATA')
+    assert copy_sql.startswith('COPY "_stage_clerk_civil_parties" (')
+    assert 'ON CONFLICT ON CONSTRAINT "uq_clerk_parties_case_type_name"' in insert
+    assert (
+        'DO UPDATE SET "city" = COALESCE("clerk_civil_parties"."city", EXCLUDED."city")' in insert
+    )
+    assert drop == 'DROP TABLE "_stage_clerk_civil_parties"'
+    assert merged == 2
+    assert [row[:3] for row in session.copied] == [
+        ["24-CA-1", "DEFENDANT", "DOE, JANE"],
+        ["24-CA-2", "PLAINTIFF", "BANK"],
+    ]
+
+
+def test_copy_upsert_fills_python_defaults_and_wraps_json() -> None:
+    session = _FakeSession()
+    rows = [
+        {
+            "dataset_type": "cor",
+            "doc_number": "P12000000001",
+            "source_file_id": 7,
+            "source_member": "cordata.txt",
+            "source_line_number": 1,
+            "raw_fields": {"status": "A"},
+        }
+    ]
+
+    copy_upsert(
+        cast("Any", session),
+        SunbizEntityFiling,
+        rows,
+        conflict_constraint="uq_sunbiz_entity_filings_dataset_doc",
+        update=excluded_updates(SunbizEntityFiling, exclude={"id"}),
+    )
+
+    copy_sql = session.statements[1]
+    match = re.search(r"\((.*)\) FROM STDIN$", copy_sql)
+    assert match is not None
+    columns = [c.strip().strip('"') for c in match.group(1).split(",")]
+    values = dict(zip(columns, session.copied[0], strict=True))
+    assert "id" not in values
+    assert isinstance(values["updated_at"], dt.datetime)
+    assert isinstance(values["raw_fields"], Jsonb)
+    assert 'DO UPDATE SET "dataset_type" = EXCLUDED."dataset_type"' in session.statements[2]
+
+
+def test_copy_upsert_do_nothing_and_validation() -> None:
+    session = _FakeSession()
+
+    copy_upsert(
+        cast("Any", session),
+        OfficialRecordsDailyInstrument,
+        [{"instrument_number": "2024000001", "parties_from_json": None}],
+        conflict_columns=["instrument_number"],
+    )
+
+    assert session.statements[2].endswith('ON CONFLICT ("instrument_number") DO NOTHING')
+    assert copy_upsert(cast("Any", session), OfficialRecordsDailyInstrument, [], conflict_columns=["id"]) == 0
+    with pytest.raises(ValueError, match="Unknown columns"):
+        copy_upsert(
+            cast("Any", session),
+            OfficialRecordsDailyInstrument,
+            [{"not_a_column": 1}],
+            conflict_columns=["id"],
+        )
+    with pytest.raises(ValueError, match="exactly one"):
+        copy_upsert(cast("Any", session), OfficialRecordsDailyInstrument, [{"id": 1}])
+
+
+def test_copy_upsert_frame_streams_tuples_with_defaults() -> None:
+    session = _FakeSession()
+    frame = pl.DataFrame(
+        {
+            "doc_number": ["P1", "P2"],
+            "dataset_type": ["cor", "cor"],
+            "source_file_id": [7, 7],
+            "source_member": ["cordata.txt", "cordata.txt"],
+            "source_line_number": [1, 2],
+            "raw_fields": [{"status": "A"}, {"status": None}],
+        }
+    )
+
+    copy_upsert_frame(
+        cast("Any", session),
+        SunbizEntityFiling,
+        frame,
+        conflict_constraint="uq_sunbiz_entity_filings_dataset_doc",
+    )
+
+    match = re.search(r"\((.*)\) FROM STDIN$", session.statements[1])
+    assert match is not None
+    columns = [c.strip().strip('"') for c in match.group(1).split(",")]
+    first = dict(zip(columns, session.copied[0], strict=True))
+    assert first["doc_number"] == "P1"
+    assert isinstance(first["raw_fields"], Jsonb)
+    assert isinstance(first["updated_at"], dt.datetime)
+    assert len(session.copied) == 2
+
+
+def test_staged_upsert_copies_batches_then_merges_once() -> None:
+    session = _FakeSession()
+    staged = StagedUpsert(
+        cast("Any", session),
+        SunbizEntityFiling,
+        conflict_constraint="uq_sunbiz_entity_filings_dataset_doc",
+        update=excluded_updates(SunbizEntityFiling, exclude={"id"}),
+    )
+    row = {"dataset_type": "cor", "doc_number": "P1", "source_file_id": 7, "source_member": "c", "source_line_number": 1}
+
+    staged.stage_rows([row])
+    staged.stage_rows([{**row, "source_line_number": 2}])
+    with pytest.raises(ValueError, match="differ from staged columns"):
+        staged.stage_rows([{"dataset_type": "cor", "doc_number": "P2"}])
+    staged.merge()
+
+    create, identity, copy_one, copy_two, insert, drop = session.statements
+    assert create.startswith('CREATE TEMP TABLE "_staged_sunbiz_entity_filings" ON COMMIT DROP')
+    assert '"_stage_seq" bigint GENERATED ALWAYS AS IDENTITY' in identity
+    assert copy_one.startswith('COPY "_staged_sunbiz_entity_filings"')
+    assert copy_two == copy_one
+    # DO UPDATE merges keep the last staged row per conflict key.
+    assert 'SELECT DISTINCT ON ("dataset_type", "doc_number")' in insert
+    assert 'ORDER BY "dataset_type", "doc_number", "_stage_seq" DESC' in insert
+    assert drop == 'DROP TABLE "_staged_sunbiz_entity_filings"'
+    assert len(session.copied) == 2
+
+
+def test_staged_upsert_do_nothing_merges_in_staging_order() -> None:
+    session = _FakeSession()
+    staged = StagedUpsert(cast("Any", session), OfficialRecordsDailyInstrument, conflict_columns=["instrument_number"])
+
+    assert staged.merge() == 0
+    staged.stage_rows([{"instrument_number": "2024000001"}])
+    staged.merge()
+
+    insert = session.statements[-2]
+    assert 'ORDER BY "_stage_seq" ON CONFLICT ("instrument_number") DO NOTHING' in insert
+
+
+def test_copy_upsert_frame_streams_csv_with_constants() -> None:
+    session = _FakeSession()
+    frame = pl.DataFrame({"folio": ["A1", "B2", "C3"], "latitude": [27.5, None, 28.0], "longitude": [-82.5, -82.4, None]})
+    stamp = dt.datetime(2026, 1, 2, 3, 4, 5, tzinfo=dt.UTC)
+
+    copy_upsert_frame(
+        cast("Any", session),
+        HcpaLatLon,
+        frame,
+        conflict_columns=["folio"],
+        update=excluded_updates(HcpaLatLon, exclude={"folio"}),
+        constants={"source_file_id": 9, "updated_at": stamp},
+    )
+
+    copy_sql = session.statements[1]
+    assert copy_sql.endswith("FROM STDIN (FORMAT csv, NULL '\\N')")
+    assert '("folio", "latitude", "longitude", "source_file_id", "updated_at")' in copy_sql
+    assert session.copied == [
+        [
+            (
+                b'"A1",27.5,-82.5,9,"2026-01-02T03:04:05.000000+0000"\n'
+                b'"B2",\\N,-82.4,9,"2026-01-02T03:04:05.000000+0000"\n'
+                b'"C3",28.0,\\N,9,"2026-01-02T03:04:05.000000+0000"\n'
+            )
+        ]
+    ]
+
+
+def test_copy_insert_frame_copies_into_target_without_staging() -> None:
+    session = _FakeSession()
+    frame = pl.DataFrame({"folio": ["A1", ""], "grantor": ['SMITH "JR"', "\\N"], "source_line_number": [1, 2]})
+
+    copied = copy_insert_frame(cast("Any", session), HcpaAllSale, frame, constants={"source_file_id": 3})
+
+    assert copied == 2
+    assert len(session.statements) == 1
+    assert session.statements[0].startswith('COPY "hcpa_allsales" ("folio", "grantor", "source_line_number"')
+    lines = session.copied[0][0].decode().splitlines()
+    # Empty strings and a literal "\N" stay quoted text; only nulls are bare \N.
+    assert lines[0].startswith('"A1","SMITH ""JR""",1,3,')
+    assert lines[1].startswith('"","\\N",2,3,')
+
+
+def test_copy_entry_points_reject_psycopg2_before_any_statement() -> None:
+    session = _FakeSession()
+    engine = SimpleNamespace(dialect=SimpleNamespace(driver="psycopg2"))
+    session.get_bind = lambda: engine  # type: ignore[attr-defined]
+    rows = [{"case_number": "24-CA-1", "party_type": "DEFENDANT", "name": "DOE, JANE"}]
+
+    with pytest.raises(UnsupportedDriverError, match=r"postgresql\+psycopg://"):
+        copy_upsert(
+            cast("Any", session),
+            ClerkCivilParty,
+            rows,
+            conflict_constraint="uq_clerk_parties_case_type_name",
+        )
+    with pytest.raises(UnsupportedDriverError):
+        StagedUpsert(cast("Any", session), ClerkCivilParty, conflict_constraint="uq_clerk_parties_case_type_name")
+    assert session.statements == []
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import csv
+import io
+import zipfile
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Self
+
+import polars as pl
+import pytest
+
+from sunbiz import pg_loader
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+HEADER = [
+    "CO_NO",
+    "PARCEL_ID",
+    "OWN_NAME",
+    "OWN_ADDR1",
+    "PHY_ADDR1",
+    "DOR_UC",
+    "TAX_AUTH_CD",
+    "JV",
+    "JV_HMSTD",
+    "AV_HMSTD",
+    "TV_NSD",
+    "EXMPT_01",
+    "EXMPT_02",
+    "EXMPT_03",
+    "EXMPT_41",
+    "TOT_MILL",
+    "CO_MILL",
+    "S_LEGAL",
+    "LGL_2",
+    "LGL_4",
+    "UNUSED_COL",
+]
+
+ROWS = [
+    ["39", "A-1 ", " SMITH JOHN ", "", "1 MAIN ST", "0100", "TA", "250,000", "250000", "180000.5", "155000", "25000", "25000", "", "", "", "", "LOT 1", " BLOCK 2 ", "", "x"],
+    ["29", "B-2", "OTHER COUNTY", "", "", "", "U", "1", "", "", "", "", "", "", "", "", "", "", "", "", ""],
+    ["39", "", "NO PARCEL", "", "", "", "U", "", "", "", "", "", "", "", "", "", "", "", "", "", ""],
+    ["39", "C-3", "ACME LLC", "PO BOX 1", "", "1000", "tt ", "99999.99", "", "", "1234567", "", "", "500", "12", "", "7.5", "", "", "TRACT B", ""],
+    ["39", "D-4", "", "", "", "", "U", "bad", "100", "150", "", "", "25000", "", "", "20.125", "5", "  ", "", "", ""],
+    ["39", "E-5", "JONES", "", "", "", "ZZ", "1", "", "", "88000", "", "", "", "", "", "", "LOT 9", "", "", ""],
+]
+
+FOLIO_LOOKUP = {"A-1": ("0000010000", "A-1"), "D-4": ("0000040000", "D-4")}
+
+
+def _write_nal_zip(tmp_path: Path, rows: list[list[str]]) -> Path:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(HEADER)
+    writer.writerows(rows)
+    path = tmp_path / "Hillsborough 39 Final NAL 2025.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("NAL39F202501.csv", buffer.getvalue().encode("latin-1"))
+    return path
+
+
+def _row_parser(tax_year: int) -> list[dict[str, Any]]:
+    parsed = []
+    for values in ROWS:
+        row = {name.lower(): value for name, value in zip(HEADER, values, strict=True)}
+        if row["co_no"].strip() != "39":
+            continue
+        result = pg_loader._parse_nal_csv_row(  # noqa: SLF001
+            row=row,
+            file_id=5,
+            tax_year=tax_year,
+            source_file="NAL39F202501.csv",
+            folio_lookup=FOLIO_LOOKUP,
+        )
+        if result is not None:
+            result.pop("source_file_id")
+            result.pop("loaded_at")
+            parsed.append(result)
+    return parsed
+
+
+@pytest.mark.parametrize("tax_year", [2025, 2024])
+def test_columnar_nal_parser_matches_row_parser(tmp_path: Path, tax_year: int) -> None:
+    nal_zip = _write_nal_zip(tmp_path, ROWS)
+    raw = pl.concat(pg_loader._nal_column_batches(nal_zip, "NAL39F202501.csv"))  # noqa: SLF001
+    assert "unused_col" not in raw.columns
+    kept = raw.filter(
+        (pl.col("co_no").str.strip_chars() == "39") & (pl.col("parcel_id").fill_null("").str.strip_chars() != "")
+    )
+
+    frame = pg_loader._frame_dor_nal(  # noqa: SLF001
+        kept,
+        tax_year=tax_year,
+        source_file="NAL39F202501.csv",
+        folio_lookup=FOLIO_LOOKUP,
+    )
+
+    expected = _row_parser(tax_year)
+    rows = frame.to_dicts()
+    assert len(rows) == len(expected) == 4
+    for got, want in zip(rows, expected, strict=True):
+        assert got == pytest.approx(want)
+
+
+class _FakeSession:
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, _exc_type: object, _exc: object, _tb: object) -> bool:
+        return False
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def execute(self, *_args: Any, **_kwargs: Any) -> SimpleNamespace:
+        return SimpleNamespace(scalar=lambda: 0)
+
+
+def test_load_dor_nal_counts_skips_and_honours_limit(monkeypatch: Any, tmp_path: Path) -> None:
+    nal_zip = _write_nal_zip(tmp_path, ROWS)
+    written: list[pl.DataFrame] = []
+    marked: list[dict[str, Any]] = []
+    monkeypatch.setattr(pg_loader, "get_session_factory", lambda _dsn: _FakeSession)
+    monkeypatch.setattr(pg_loader, "_build_folio_lookup", lambda _session: FOLIO_LOOKUP)
+    monkeypatch.setattr(pg_loader, "_start_hcpa_ingest_file", lambda **_kwargs: 5)
+    monkeypatch.setattr(pg_loader, "_mark_ingest_file", lambda **kwargs: marked.append(kwargs))
+    monkeypatch.setattr(
+        pg_loader,
+        "_upsert_dor_nal_parcels",
+        lambda _session, frame, file_id: written.append(frame.with_columns(pl.lit(file_id).alias("source_file_id"))),
+    )
+
+    stats = pg_loader.load_dor_nal(dsn="postgresql://db", nal_zip=nal_zip, batch_size=2, limit_rows=2)
+
+    assert stats["parcels_upserted"] == 2
+    assert stats["skipped_other_county"] == 1
+    assert stats["skipped_empty"] == 1
+    assert [frame.height for frame in written] == [2]
+    assert pl.concat(written).get_column("parcel_id").to_list() == ["A-1", "C-3"]
+    assert marked[-1]["row_count"] == 2
+
+    written.clear()
+    stats = pg_loader.load_dor_nal(dsn="postgresql://db", nal_zip=nal_zip, batch_size=2)
+
+    assert stats["parcels_upserted"] == 4
+    assert [frame.height for frame in written] == [2, 2]
+    assert pl.concat(written).get_column("folio").to_list() == ["0000010000", None, "0000040000", None]
+
+
+def test_load_dor_nal_reads_in_batches_and_stops_at_limit(monkeypatch: Any, tmp_path: Path) -> None:
+    nal_zip = _write_nal_zip(tmp_path, ROWS)
+    written: list[pl.DataFrame] = []
+    batches_read: list[int] = []
+    real_batches = pg_loader._nal_column_batches  # noqa: SLF001
+
+    def _counting_batches(*args: Any, **kwargs: Any) -> Any:
+        for frame in real_batches(*args, **kwargs):
+            batches_read.append(frame.height)
+            yield frame
+
+    monkeypatch.setattr(pg_loader, "NAL_READ_BATCH_ROWS", 1)
+    monkeypatch.setattr(pg_loader, "_nal_column_batches", _counting_batches)
+    monkeypatch.setattr(pg_loader, "get_session_factory", lambda _dsn: _FakeSession)
+    monkeypatch.setattr(pg_loader, "_build_folio_lookup", lambda _session: FOLIO_LOOKUP)
+    monkeypatch.setattr(pg_loader, "_start_hcpa_ingest_file", lambda **_kwargs: 5)
+    monkeypatch.setattr(pg_loader, "_mark_ingest_file", lambda **_kwargs: None)
+    monkeypatch.setattr(pg_loader, "_upsert_dor_nal_parcels", lambda _session, frame, _file_id: written.append(frame))
+
+    stats = pg_loader.load_dor_nal(dsn="postgresql://db", nal_zip=nal_zip, batch_size=2, limit_rows=2)
+
+    assert stats["parcels_upserted"] == 2
+    assert stats["skipped_other_county"] == 1
+    assert stats["skipped_empty"] == 1
+    assert pl.concat(written).get_column("parcel_id").to_list() == ["A-1", "C-3"]
+    assert len(batches_read) < len(ROWS)
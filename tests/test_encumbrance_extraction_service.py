@@ -738,14 +738,13 @@ class TestEndToEnd:
         finally:
             doc.close()
 
-        image_paths = PgEncumbranceExtractionService._render_pages(pdf_path)  # noqa: SLF001
         try:
-            assert len(image_paths) == 4
-            for image_path in image_paths:
-                assert Path(image_path).exists()
+            pages = PgEncumbranceExtractionService._render_pages(pdf_path)  # noqa: SLF001
+            assert [page.page for page in pages] == [1, 2, 3, 4]
+            for page in pages:
+                assert page.mode == "L"
+                assert page.to_image().size == (page.width, page.height)
         finally:
-            for image_path in image_paths:
-                Path(image_path).unlink(missing_ok=True)
             pdf_path.unlink(missing_ok=True)
 
     def test_tally_result_counts_errors_separately(self) -> None:
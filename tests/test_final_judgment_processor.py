@@ -6,7 +6,7 @@ from typing import Any
 
 from PIL import Image
 
-import src.services.final_judgment_processor as final_judgment_processor_module
+from src.services import ocr_engine
 from src.services.final_judgment_processor import FinalJudgmentProcessor
 
 
@@ -319,7 +319,7 @@ def test_ocr_images_to_page_texts_uses_rescue_config(tmp_path, monkeypatch: Any)
         return "TEXT"
 
     monkeypatch.setattr(
-        final_judgment_processor_module.pytesseract,
+        ocr_engine.pytesseract,
         "image_to_string",
         _fake_image_to_string,
     )
@@ -359,8 +359,9 @@ def test_process_pdf_uses_high_res_ocr_rescue_for_invalid_initial_extraction(
         *,
         dpi: int,
         suffix: str = "",
+        grayscale: bool = False,
     ) -> tuple[list[str], int]:
-        calls["render"].append((pdf_path_arg, case_number_arg, dpi, suffix))
+        calls["render"].append((pdf_path_arg, case_number_arg, dpi, suffix, grayscale))
         prefix = "rescue" if suffix else "base"
         return ([f"{prefix}-page-1.png"], 1)
 
@@ -406,8 +407,8 @@ def test_process_pdf_uses_high_res_ocr_rescue_for_invalid_initial_extraction(
     assert result["raw_text"] == "--- PAGE 1 ---\nRESCUE OCR"
     assert "ocr_text_rescue" in result["_metadata"]["extraction_strategies"]
     assert calls["render"] == [
-        (str(pdf_path), "24-CA-TEST", 150, ""),
-        (str(pdf_path), "24-CA-TEST", 300, "ocr_rescue"),
+        (str(pdf_path), "24-CA-TEST", 150, "", False),
+        (str(pdf_path), "24-CA-TEST", 300, "ocr_rescue", True),
     ]
     assert calls["ocr"] == [
         (("base-page-1.png",), False, 150),
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Self
+
+import polars as pl
+import pytest
+
+from sunbiz import pg_loader
+
+
+def _dump(**overrides: list[Any]) -> pl.DataFrame:
+    columns: dict[str, list[Any]] = {
+        "folio": ["0001", "0002", "0003"],
+        "owner": ["SMITH JOHN", "DOE JANE", "ACME LLC"],
+        "just": ["100000", "250000.5", None],
+        "s_date": ["2024-01-02", None, "2019-07-31"],
+        "latitude": [27.9, None, 28.1],
+        "longitude": [-82.4, None, -82.3],
+    }
+    columns.update(overrides)
+    return pl.DataFrame(columns)
+
+
+def test_row_hash_is_stable_and_content_sensitive() -> None:
+    first = pg_loader._normalize_hcpa_parcels(_dump())  # noqa: SLF001
+    again = pg_loader._normalize_hcpa_parcels(_dump())  # noqa: SLF001
+    edited = pg_loader._normalize_hcpa_parcels(_dump(owner=["SMITH JOHN", "DOE JANE", "ACME INC"]))  # noqa: SLF001
+
+    assert first.get_column("row_hash").to_list() == again.get_column("row_hash").to_list()
+    assert first.get_column("row_hash").str.len_chars().to_list() == [32, 32, 32]
+    changed = [
+        a != b
+        for a, b in zip(
+            first.get_column("row_hash").to_list(),
+            edited.get_column("row_hash").to_list(),
+            strict=True,
+        )
+    ]
+    assert changed == [False, False, True]
+
+
+def test_row_hash_distinguishes_null_from_empty_and_ignores_absent_columns() -> None:
+    with_null = pg_loader._normalize_hcpa_parcels(pl.DataFrame({"folio": ["1"], "pin": [None]}))  # noqa: SLF001
+    with_empty = pg_loader._normalize_hcpa_parcels(pl.DataFrame({"folio": ["1"], "pin": [""]}))  # noqa: SLF001
+    absent = pg_loader._normalize_hcpa_parcels(pl.DataFrame({"folio": ["1"]}))  # noqa: SLF001
+
+    assert with_null.item(0, "row_hash") != with_empty.item(0, "row_hash")
+    assert with_null.item(0, "row_hash") == absent.item(0, "row_hash")
+
+
+def test_normalize_hashes_coordinates_filled_from_latlon() -> None:
+    latlon = pl.DataFrame({"folio": ["0002"], "latitude": [27.95], "longitude": [-82.45]})
+
+    plain = pg_loader._normalize_hcpa_parcels(_dump())  # noqa: SLF001
+    filled = pg_loader._normalize_hcpa_parcels(_dump(), latlon)  # noqa: SLF001
+
+    assert filled.columns[-1] == "row_hash"
+    assert filled.filter(pl.col("folio") == "0002").item(0, "latitude") == pytest.approx(27.95)
+    assert plain.get_column("row_hash").to_list()[1] != filled.get_column("row_hash").to_list()[1]
+    assert plain.get_column("row_hash").to_list()[0] == filled.get_column("row_hash").to_list()[0]
+
+
+def test_diff_classifies_inserted_changed_unchanged_and_missing() -> None:
+    parcels = pg_loader._normalize_hcpa_parcels(_dump())  # noqa: SLF001
+    hashes = dict(zip(parcels.get_column("folio"), parcels.get_column("row_hash"), strict=True))
+    existing = pl.DataFrame(
+        {
+            "folio": ["0001", "0002", "0009"],
+            "stored_hash": [hashes["0001"], "stale", None],
+        }
+    )
+
+    to_write, missing, counts = pg_loader._diff_hcpa_parcels(parcels, existing)  # noqa: SLF001
+
+    assert to_write.get_column("folio").to_list() == ["0002", "0003"]
+    assert to_write.columns == parcels.columns
+    assert missing == ["0009"]
+    assert counts == {"inserted": 1, "changed": 1, "unchanged": 1, "missing": 1}
+
+
+def test_diff_treats_null_stored_hash_as_changed() -> None:
+    parcels = pg_loader._normalize_hcpa_parcels(_dump())  # noqa: SLF001
+    existing = pl.DataFrame({"folio": ["0001", "0002", "0003"], "stored_hash": [None, None, None]})
+
+    to_write, missing, counts = pg_loader._diff_hcpa_parcels(parcels, existing)  # noqa: SLF001
+
+    assert to_write.height == 3
+    assert missing == []
+    assert counts == {"inserted": 0, "changed": 3, "unchanged": 0, "missing": 0}
+
+
+class _FakeResult:
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[tuple[Any, ...]]:
+        return self._rows
+
+
+class _FakeSession:
+    def __init__(self, stored: list[tuple[str, str | None]], indexed: list[str] | None = None) -> None:
+        self.stored = stored
+        self.indexed = indexed or []
+        self.deletes: list[Any] = []
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, _exc_type: object, _exc: object, _tb: object) -> bool:
+        return False
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def execute(self, stmt: Any, *_args: Any, **_kwargs: Any) -> _FakeResult:
+        if stmt.is_select:
+            if "hcpa_parcel_legal_index" in str(stmt):
+                return _FakeResult([(folio,) for folio in self.indexed])
+            return _FakeResult(self.stored)
+        self.deletes.append(stmt)
+        return _FakeResult([])
+
+
+def _patch_loader(
+    monkeypatch: Any,
+    session: _FakeSession,
+    upserted: list[dict[str, Any]],
+    indexed: list[str] | None = None,
+) -> None:
+    monkeypatch.setattr(pg_loader, "_load_parcel_dataframe", lambda _path: _dump())
+    monkeypatch.setattr(pg_loader, "get_session_factory", lambda _dsn: lambda: session)
+    monkeypatch.setattr(pg_loader, "_compute_sha256", lambda _path: "sha256")
+    monkeypatch.setattr(pg_loader, "_upsert_ingest_file", lambda **_kwargs: 11)
+    monkeypatch.setattr(pg_loader, "_mark_ingest_file", lambda **_kwargs: None)
+    monkeypatch.setattr(
+        pg_loader,
+        "_upsert_hcpa_parcels",
+        lambda _session, frame, file_id: upserted.extend({**row, "source_file_id": file_id} for row in frame.to_dicts()),
+    )
+    monkeypatch.setattr(
+        pg_loader,
+        "_upsert_hcpa_legal_index",
+        lambda _session, frame: (indexed if indexed is not None else []).extend(frame.get_column("folio")),
+    )
+
+
+def test_load_hcpa_bulk_upserts_only_new_and_changed_rows(monkeypatch: Any, tmp_path: Any) -> None:
+    parcel_file = tmp_path / "parcels.parquet"
+    parcel_file.write_bytes(b"placeholder")
+    hashes = pg_loader._normalize_hcpa_parcels(_dump()).get_column("row_hash").to_list()  # noqa: SLF001
+    session = _FakeSession([("0001", hashes[0]), ("0002", "stale"), ("0009", hashes[2])], indexed=["0001", "0002"])
+    upserted: list[dict[str, Any]] = []
+    indexed: list[str] = []
+    _patch_loader(monkeypatch, session, upserted, indexed)
+
+    stats = pg_loader.load_hcpa_bulk(
+        dsn="postgresql://db",
+        parcel_file=parcel_file,
+        latlon_file=None,
+        batch_size=100,
+    )
+
+    assert [row["folio"] for row in upserted] == ["0002", "0003"]
+    assert all(row["source_file_id"] == 11 and row["row_hash"] for row in upserted)
+    assert session.deletes == []
+    assert stats["parcels_upserted"] == 2
+    assert stats["parcels_inserted"] == 1
+    assert stats["parcels_changed"] == 1
+    assert stats["parcels_unchanged"] == 1
+    assert stats["parcels_missing"] == 1
+    assert stats["parcels_deleted"] == 0
+    # Rewritten parcels plus any parcel the legal index does not hold yet.
+    assert sorted(indexed) == ["0002", "0003"]
+    assert stats["legal_index_refreshed"] == 2
+
+
+def test_load_hcpa_bulk_prunes_missing_folios_on_request(monkeypatch: Any, tmp_path: Any) -> None:
+    parcel_file = tmp_path / "parcels.parquet"
+    parcel_file.write_bytes(b"placeholder")
+    session = _FakeSession([("0009", "gone")])
+    upserted: list[dict[str, Any]] = []
+    _patch_loader(monkeypatch, session, upserted)
+
+    stats = pg_loader.load_hcpa_bulk(
+        dsn="postgresql://db",
+        parcel_file=parcel_file,
+        latlon_file=None,
+        batch_size=100,
+        prune_missing=True,
+    )
+
+    assert len(session.deletes) == 1
+    assert stats["parcels_inserted"] == 3
+    assert stats["parcels_deleted"] == 1
+
+
+def test_load_hcpa_bulk_limited_load_never_reports_missing(monkeypatch: Any, tmp_path: Any) -> None:
+    parcel_file = tmp_path / "parcels.parquet"
+    parcel_file.write_bytes(b"placeholder")
+    session = _FakeSession([("0003", "stale"), ("0009", "gone")])
+    upserted: list[dict[str, Any]] = []
+    _patch_loader(monkeypatch, session, upserted)
+
+    stats = pg_loader.load_hcpa_bulk(
+        dsn="postgresql://db",
+        parcel_file=parcel_file,
+        latlon_file=None,
+        batch_size=100,
+        limit_rows=2,
+    )
+
+    assert [row["folio"] for row in upserted] == ["0001", "0002"]
+    assert stats["parcels_missing"] == 0
+
+    with pytest.raises(ValueError, match="prune_missing"):
+        pg_loader.load_hcpa_bulk(
+            dsn="postgresql://db",
+            parcel_file=parcel_file,
+            latlon_file=None,
+            batch_size=100,
+            limit_rows=2,
+            prune_missing=True,
+        )
+
+
+def test_normalize_parses_legal_fields_into_structured_columns() -> None:
+    parcels = pg_loader._normalize_hcpa_parcels(  # noqa: SLF001
+        _dump(
+            legal1=["LOT 5 BLOCK 2", " ", None],
+            legal2=["SUNSET LAKES UNIT 3", None, None],
+        )
+    )
+
+    assert parcels.get_column("legal_lot").to_list() == ["5", None, None]
+    assert parcels.get_column("legal_block").to_list() == ["2", None, None]
+    assert parcels.get_column("legal_subdivision").to_list()[0] == "SUNSET LAKES"
+    assert parcels.columns[-1] == "row_hash"
+    assert "legal_lot" not in pg_loader._normalize_hcpa_parcels(_dump()).columns  # noqa: SLF001
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import TYPE_CHECKING, Any
+
+from sunbiz import pg_loader
+from sunbiz.models import HcpaAllSale
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.commits = 0
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+def test_dbf_snapshot_copies_parsed_batches_with_constants(monkeypatch: Any, tmp_path: Any) -> None:
+    dbf_rows = [
+        (1, {"pin": " P1 ", "folio": "0001", "s_date": "01/31/2024", "s_amt": "125,000", "grantor": "SMITH"}),
+        (2, {"pin": "", "folio": "0002", "s_date": dt.date(2023, 5, 6), "s_amt": 99.5}),
+        (3, {"folio": "0003"}),
+    ]
+    copied: list[tuple[Any, pl.DataFrame, dict[str, Any]]] = []
+    monkeypatch.setattr(pg_loader, "_iter_dbf_rows_from_zip", lambda _zip, _member: iter(dbf_rows))
+    monkeypatch.setattr(
+        pg_loader,
+        "copy_insert_frame",
+        lambda _session, model, frame, *, constants: copied.append((model, frame, constants)),
+    )
+    session = _FakeSession()
+
+    inserted = pg_loader._load_hcpa_dbf_snapshot(  # noqa: SLF001
+        session,  # type: ignore[arg-type]
+        HcpaAllSale,
+        tmp_path / "allsales.zip",
+        "allsales.dbf",
+        pg_loader._HCPA_ALLSALES_FIELDS,  # noqa: SLF001
+        4,
+        2,
+        None,
+    )
+
+    assert inserted == 3
+    assert session.commits == 2
+    assert [frame.height for _model, frame, _constants in copied] == [2, 1]
+    assert all(model is HcpaAllSale and constants["source_file_id"] == 4 for model, _frame, constants in copied)
+    first = copied[0][1].to_dicts()
+    assert first[0]["pin"] == "P1"
+    assert first[0]["sale_date"] == dt.date(2024, 1, 31)
+    assert first[0]["sale_amount"] == 125000.0
+    assert first[1]["pin"] is None
+    assert first[1]["sale_date"] == dt.date(2023, 5, 6)
+    assert copied[1][1].to_dicts()[0]["source_line_number"] == 3
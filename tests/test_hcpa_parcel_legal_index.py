@@ -0,0 +1,178 @@
+"""hcpa_parcel_legal_index keys and the identifier-recovery lookups built on them."""
+
+from __future__ import annotations
+
+import random
+import re
+from typing import Any
+
+import polars as pl
+
+from src.services import (
+    pg_foreclosure_identifier_recovery_service as identifier_recovery,
+)
+from sunbiz import pg_loader
+
+_WORDS = [
+    "LOT",
+    "LOTS",
+    "L",
+    "LT",
+    "BLOCK",
+    "BLK",
+    "B",
+    "UNIT",
+    "UN",
+    "U",
+    "5",
+    "5A",
+    "12",
+    "A",
+    "B2",
+    "OAK",
+    "-",
+    ",",
+]
+
+
+def _random_legal(rng: random.Random) -> str:
+    parts = [rng.choice(_WORDS) for _ in range(rng.randint(1, 8))]
+    return rng.choice(["", " "]).join(parts) if rng.random() < 0.2 else " ".join(parts)
+
+
+def test_key_arrays_match_the_recovery_regexes_for_plain_values() -> None:
+    rng = random.Random(19)  # noqa: S311
+    for _ in range(2000):
+        legal = _random_legal(rng)
+        keys = pg_loader._legal_keys(legal)  # noqa: SLF001
+        for value in ("5", "5A", "12", "A", "B", "B2", "OAK", "OT5", "S"):
+            for column, keywords in (
+                ("lot_keys", "LOT|L|LT"),
+                ("block_keys", "BLOCK|BLK|B"),
+                ("unit_keys", "UNIT|U|UN"),
+            ):
+                pattern = identifier_recovery._legal_keyword_regex(keywords, value)  # noqa: SLF001
+                assert (value in keys[column]) == bool(re.search(pattern, legal)), (
+                    legal,
+                    column,
+                    value,
+                )
+
+
+def test_index_frame_mirrors_the_sql_legal_expression() -> None:
+    parcels = pg_loader._normalize_hcpa_parcels(  # noqa: SLF001
+        pl.DataFrame(
+            {
+                "folio": ["1", "2"],
+                "legal1": ["Lot 5 block b sunset lakes", None],
+                "legal3": ["unit 203b", None],
+            }
+        )
+    )
+
+    frame = pg_loader._hcpa_legal_index_frame(parcels)  # noqa: SLF001
+
+    assert frame.get_column("legal_text").to_list() == [
+        "LOT 5 BLOCK B SUNSET LAKES  UNIT 203B ",
+        "   ",
+    ]
+    first = frame.row(0, named=True)
+    assert "5" in first["lot_keys"]
+    assert "B" in first["block_keys"]
+    assert "203B" in first["unit_keys"]
+    assert first["subdivision"] == parcels.item(0, "legal_subdivision")
+    assert frame.row(1, named=True)["lot_keys"] == []
+
+
+class _Connection:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def execute(self, statement: Any, params: dict[str, Any]) -> Any:
+        self.calls.append((str(statement), params))
+        return self
+
+    def mappings(self) -> _Connection:
+        return self
+
+    def fetchall(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "folio": "F-1",
+                "strap": "S-1",
+                "raw_legal1": "SUNSET LAKES",
+                "source_file_id": 3,
+            }
+        ]
+
+
+def _service(
+    *, index_ready: bool
+) -> identifier_recovery.PgForeclosureIdentifierRecoveryService:
+    service = object.__new__(identifier_recovery.PgForeclosureIdentifierRecoveryService)
+    service._legal_index_ready = index_ready
+    return service
+
+
+_ROW = {
+    "jd_legal_description": "LOT 5, BLOCK B-2, SUNSET LAKES, PLAT BOOK 12 PAGE 34",
+    "jd_subdivision": "SUNSET LAKES",
+    "jd_lot": "5",
+    "jd_block": "B-2",
+    "jd_plat_book": "12",
+    "jd_plat_page": "34",
+}
+
+
+def test_legal_lookup_uses_index_keys_and_trigram_text() -> None:
+    conn = _Connection()
+
+    candidates = _service(index_ready=True)._lookup_by_legal_description(conn, row=_ROW)  # type: ignore[arg-type]  # noqa: SLF001
+
+    assert [c.folio for c in candidates] == ["F-1"]
+    ((sql, params),) = conn.calls
+    assert "FROM hcpa_parcel_legal_index li" in sql
+    assert "li.legal_text LIKE :sub_term_0" in sql
+    assert "li.lot_keys @> CAST(:lot_keys AS text[])" in sql
+    assert params["lot_keys"] == ["5"]
+    # "B-2" is not a single key token, so it keeps the regex (on indexed text).
+    assert "li.legal_text ~* :block_regex" in sql
+    assert "li.plat_book = :plat_book AND li.plat_page = :plat_page" in sql
+    assert "raw_legal1, '')" not in sql
+    assert params["sub_term_0"] == "%SUNSET%"
+
+
+def test_legal_lookup_scans_parcels_until_the_index_is_built() -> None:
+    conn = _Connection()
+
+    _service(index_ready=False)._lookup_by_legal_description(conn, row=_ROW)  # type: ignore[arg-type]  # noqa: SLF001
+
+    ((sql, params),) = conn.calls
+    assert "FROM hcpa_bulk_parcels" in sql
+    assert "hcpa_parcel_legal_index" not in sql
+    assert params["lot_regex"] == r"(^|[^A-Z0-9])(LOT|L|LT)\s*5([^A-Z0-9]|$)"
+
+
+class _ProbeConnection:
+    def __init__(self, *, table_exists: bool, unindexed: int = 0) -> None:
+        self._scalars: list[Any] = [table_exists, unindexed]
+        self.sql: list[str] = []
+
+    def execute(self, statement: Any) -> Any:
+        self.sql.append(str(statement))
+        return self
+
+    def scalar(self) -> Any:
+        return self._scalars.pop(0)
+
+
+def test_legal_index_is_used_only_when_it_covers_every_parcel() -> None:
+    probe = identifier_recovery.PgForeclosureIdentifierRecoveryService._probe_legal_index  # noqa: SLF001
+
+    assert probe(_ProbeConnection(table_exists=True)) is True  # type: ignore[arg-type]
+    partial = _ProbeConnection(table_exists=True, unindexed=12)
+    assert probe(partial) is False  # type: ignore[arg-type]
+    assert "NOT EXISTS" in partial.sql[1]
+    missing = _ProbeConnection(table_exists=False)
+    assert probe(missing) is False  # type: ignore[arg-type]
+    assert len(missing.sql) == 1
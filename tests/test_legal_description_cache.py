@@ -0,0 +1,65 @@
+"""Memoized and bulk legal-description parsing must match the plain parser."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import polars as pl
+
+from src.utils import legal_description
+from src.utils.legal_description import (
+    build_ori_search_terms,
+    generate_search_permutations,
+    parse_legal_column,
+    parse_legal_description,
+)
+
+LEGALS = [
+    "LOT 5 BLOCK 2 SUNSET LAKES UNIT 3",
+    "L 21 B 6 BRENTWOOD HILLS TR F #1",
+    "LOTS 1 AND 2, BLOCK R, MAP OF CASTLE HEIGHTS",
+    "LOT 24 BLOCK 1 CASA BLANCA RECORDED IN PLAT BOOK 89 PAGE 28",
+    "UNIT 203B BUILDING B OF EGYPT LAKE BEACH CLUB A CONDOMINIUM",
+    "W 220 FT OF E 245 OF S 297 FT OF SE 1/4 OF SE 1/4 LESS RD",
+]
+
+
+def test_cached_parse_matches_uncached_and_returns_fresh_copies() -> None:
+    for legal in LEGALS:
+        uncached = legal_description._parse_legal_text(legal)  # noqa: SLF001
+        first = parse_legal_description(legal)
+        first.lots.append("999")
+        first.lot = "999"
+        again = parse_legal_description(f"  {legal.lower()} ")
+
+        assert dataclasses.asdict(parse_legal_description(legal)) == dataclasses.asdict(uncached)
+        assert again.raw_text == f"  {legal.lower()} "
+        assert dataclasses.replace(again, raw_text=legal) == uncached
+
+
+def test_permutations_and_search_terms_are_stable_across_cache_hits() -> None:
+    for legal in LEGALS:
+        parsed = parse_legal_description(legal)
+        expected = legal_description._search_permutations(parsed, legal, 20)  # noqa: SLF001
+
+        first = generate_search_permutations(parsed, legal)
+        first.append("MUTATED*")
+        assert generate_search_permutations(parsed, legal) == expected
+
+        terms = build_ori_search_terms("1234", legal, None, None, None)
+        terms.clear()
+        assert build_ori_search_terms("5678", legal, None, None, None) != []
+
+
+def test_parse_legal_column_aligns_rows_and_parses_each_value_once() -> None:
+    series = pl.Series([LEGALS[0], None, LEGALS[3], LEGALS[0], ""])
+
+    parsed = parse_legal_column(series)
+
+    assert parsed.columns == [f"legal_{name}" for name in legal_description.LEGAL_COLUMN_FIELDS]
+    assert parsed.get_column("legal_lot").to_list() == ["5", None, "24", "5", None]
+    assert parsed.get_column("legal_block").to_list() == ["2", None, "1", "2", None]
+    expected = parse_legal_description(LEGALS[3])
+    assert parsed.row(2, named=True) == {
+        f"legal_{name}": getattr(expected, name) for name in legal_description.LEGAL_COLUMN_FIELDS
+    }
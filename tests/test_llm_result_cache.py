@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from src.services import llm_result_cache
+
+
+class _FailingEngine:
+    def begin(self) -> Any:
+        raise RuntimeError("relation llm_result_cache does not exist")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VISION_RESULT_CACHE", "1")
+    monkeypatch.setitem(llm_result_cache._STATE, "dsn", "postgresql://user:pw@host:5432/db")  # noqa: SLF001
+    monkeypatch.setitem(llm_result_cache._STATE, "disabled", value=False)  # noqa: SLF001
+    llm_result_cache.reset_llm_cache_counters()
+
+
+def test_key_covers_model_prompt_and_response_format() -> None:
+    payload = {
+        "model": "",
+        "messages": [{"role": "user", "content": "Extract this"}],
+        "max_tokens": 4000,
+        "temperature": 0.1,
+        "response_format": {"type": "json_schema"},
+    }
+    reordered = dict(reversed(list(payload.items())))
+
+    base = llm_result_cache.llm_cache_key(payload, "glm")
+
+    assert llm_result_cache.llm_cache_key(reordered, "glm") == base
+    assert llm_result_cache.llm_cache_key(payload, "qwen") != base
+    assert llm_result_cache.llm_cache_key({**payload, "response_format": None}, "glm") != base
+    assert (
+        llm_result_cache.llm_cache_key(
+            {**payload, "messages": [{"role": "user", "content": "Extract that"}]},
+            "glm",
+        )
+        != base
+    )
+
+
+def test_db_error_disables_cache_for_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(llm_result_cache, "get_engine", lambda _dsn: _FailingEngine())
+
+    assert llm_result_cache.llm_cache_get({"messages": []}, ["glm"]) is None
+    llm_result_cache.llm_cache_put({"messages": []}, "glm", "{}")
+
+    stats = llm_result_cache.llm_cache_stats()
+    assert stats["errors"] == 1
+    assert stats["enabled"] is False
+    assert stats["hit_rate"] is None
+
+
+def test_env_switch_bypasses_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("VISION_RESULT_CACHE", "0")
+    monkeypatch.setattr(
+        llm_result_cache,
+        "get_engine",
+        lambda _dsn: pytest.fail("cache must not touch the database when disabled"),
+    )
+
+    assert llm_result_cache.llm_cache_get({"messages": []}, ["glm"]) is None
+    assert llm_result_cache.llm_cache_stats()["enabled"] is False
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import sys
 import types
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
 
 from src.services import market_data_service
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class _FakeRow:
     def __init__(self, mapping: dict[str, Any]) -> None:
@@ -318,11 +322,10 @@ def test_run_batch_marks_degraded_when_photo_download_has_errors(monkeypatch: An
         "_get_market_state",
         lambda _strap: {"has_redfin": True, "has_zillow": True, "has_hh": True, "has_realtor": False},
     )
-    monkeypatch.setattr(
-        svc,
-        "_download_all_photos_with_stats",
-        lambda _properties: {"downloaded": 2, "errors": 3},
-    )
+    async def _photos(_properties: list[dict]) -> dict[str, int]:
+        return {"downloaded": 2, "errors": 3}
+
+    monkeypatch.setattr(svc, "_download_all_photos_async", _photos)
 
     result = asyncio.run(
         svc.run_batch(
@@ -342,11 +345,10 @@ def test_run_batch_marks_degraded_when_market_state_check_fails(monkeypatch: Any
     svc.__dict__["_has_realtor_column"] = False
     svc.__dict__["_engine"] = _RaisingEngine()
     monkeypatch.setattr(svc, "_repair_stale_detail_urls", lambda: 0)
-    monkeypatch.setattr(
-        svc,
-        "_download_all_photos_with_stats",
-        lambda _properties: {"downloaded": 0, "errors": 0},
-    )
+    async def _photos(_properties: list[dict]) -> dict[str, int]:
+        return {"downloaded": 0, "errors": 0}
+
+    monkeypatch.setattr(svc, "_download_all_photos_async", _photos)
 
     result = asyncio.run(
         svc.run_batch(
@@ -397,3 +399,45 @@ def test_run_homeharvest_does_not_count_failed_upsert(monkeypatch: Any) -> None:
 
     assert matched == 0
     assert errors == 1
+
+
+def test_download_property_photos_reuses_existing_and_keeps_url_order(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    svc = object.__new__(market_data_service.MarketDataService)
+    monkeypatch.setattr(market_data_service, "PROJECT_ROOT", tmp_path)
+    photos_dir = tmp_path / "data" / "Foreclosure" / "CASE1" / "photos"
+    photos_dir.mkdir(parents=True)
+    urls = [f"https://cdn.example.com/{n}.jpg" for n in range(4)]
+    stems = [
+        f"{idx:03d}_{hashlib.sha1(url.encode()).hexdigest()[:12]}"
+        for idx, url in enumerate(urls)
+    ]
+    (photos_dir / f"{stems[1]}.webp").write_bytes(b"old")
+
+    class _Downloader:
+        def __init__(self) -> None:
+            self.fetched: list[str] = []
+
+        async def fetch(self, url: str, target_dir: Path, stem: str) -> Path | None:
+            self.fetched.append(url)
+            if url.endswith("2.jpg"):
+                return None
+            if url.endswith("3.jpg"):
+                raise OSError("reset")
+            path = target_dir / f"{stem}.jpg"
+            path.write_bytes(b"new")
+            return path
+
+    downloader = _Downloader()
+    strap, paths, downloaded, errors = asyncio.run(
+        svc._download_property_photos(downloader, "STRAP1", "CASE1", urls)
+    )
+
+    assert strap == "STRAP1"
+    assert downloader.fetched == [urls[0], urls[2], urls[3]]
+    assert paths == [
+        f"Foreclosure/CASE1/photos/{stems[0]}.jpg",
+        f"Foreclosure/CASE1/photos/{stems[1]}.webp",
+    ]
+    assert (downloaded, errors) == (1, 1)
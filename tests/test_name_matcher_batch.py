@@ -0,0 +1,170 @@
+"""Parity tests for the batch NameMatcher API.
+
+``_legacy_match`` is the pre-batch pair matcher kept verbatim as the reference:
+``NameMatcher.match``, ``NameMatcher.match_many`` and ``NameIndex`` must
+return identical (type, score) tuples for every pair.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from difflib import SequenceMatcher
+
+from src.services.lien_survival import joinder_validator
+from src.utils.name_matcher import NameIndex, NameMatcher
+
+
+def _legacy_normalize(name: str) -> set[str]:
+    if not name:
+        return set()
+    clean = re.sub(r"[^\w\s]", " ", name.upper())
+    return {t for t in clean.split() if t not in NameMatcher.STOPWORDS and len(t) > 1}
+
+
+def _legacy_match(name1: str, name2: str) -> tuple[str, float]:
+    if not name1 or not name2:
+        return "NONE", 0.0
+    set1 = _legacy_normalize(name1)
+    set2 = _legacy_normalize(name2)
+    if not set1 or not set2:
+        return "NONE", 0.0
+    if set1 == set2:
+        return "EXACT", 1.0
+    intersection = set1.intersection(set2)
+    if min(len(set1), len(set2)) >= 2:
+        if set1.issubset(set2) and len(intersection) >= 2:
+            return "SUPERSET", 0.95
+        if set2.issubset(set1) and len(intersection) >= 2:
+            return "SUBSET", 0.95
+    if {NameMatcher.ALIASES.get(t, t) for t in set1} == {
+        NameMatcher.ALIASES.get(t, t) for t in set2
+    }:
+        return "ALIAS", 0.90
+    jaccard = len(intersection) / len(set1.union(set2))
+    if jaccard >= 0.65:
+        return "FUZZY_JACCARD", round(jaccard, 2)
+    ratio = SequenceMatcher(None, name1.upper(), name2.upper()).ratio()
+    if ratio > 0.88:
+        return "FUZZY_STRING", round(ratio, 2)
+    return "NONE", 0.0
+
+
+BASE_NAMES = [
+    "John Smith",
+    "John A. Smith",
+    "John Smith and Jane Doe",
+    "Robert Johnson",
+    "Bob Johnson",
+    "Steven Jobs",
+    "Stephen Jobs",
+    "Bank of America, N.A.",
+    "BANK OF AMERICA NA",
+    "Wells Fargo Bank NA",
+    "WELLS FARGO BK N A",
+    "Copper Ridge Brandon Homeowners Assn Inc",
+    "COPPER RIDGE BRANDON HOMEOWNER ASSOCIATION",
+    "Mortgage Electronic Registration Systems Inc",
+    "MTG ELECTRONIC REGISTRATION SYSTEMS",
+    "Federal National Mortgage Association",
+    "Fannie Mae",
+    "SMITH",
+    "J. Smith",
+    "",
+    "& LLC INC",
+    "Jon Smyth",
+    "JONATHAN SMITH",
+    "Unknown Spouse of John Smith",
+    "HILLSBOROUGH COUNTY CLERK OF COURT",
+]
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    if len(name) < 4:
+        return name
+    chars = list(name)
+    position = rng.randrange(len(chars))
+    operation = rng.randrange(3)
+    if operation == 0:
+        chars[position] = rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ ")
+    elif operation == 1:
+        del chars[position]
+    else:
+        chars.insert(position, rng.choice("AEIOU"))
+    return "".join(chars)
+
+
+def _corpus() -> list[str]:
+    rng = random.Random(17)  # noqa: S311
+    names = list(BASE_NAMES)
+    for _ in range(3):
+        names.extend(_typo(name, rng) for name in BASE_NAMES)
+    return names
+
+
+def test_match_is_unchanged_for_every_pair() -> None:
+    corpus = _corpus()
+    for left in corpus:
+        for right in corpus:
+            assert NameMatcher.match(left, right) == _legacy_match(left, right), (
+                left,
+                right,
+            )
+
+
+def test_name_index_matches_pairwise_results() -> None:
+    corpus = _corpus()
+    index = NameIndex(corpus)
+
+    assert len(index) == len(corpus)
+    for query in corpus:
+        assert index.match(query) == [_legacy_match(query, name) for name in corpus], (
+            query
+        )
+    assert NameMatcher.match_many("Stephen Jobs", corpus) == [
+        _legacy_match("Stephen Jobs", n) for n in corpus
+    ]
+
+
+def test_name_index_best_returns_first_highest_score() -> None:
+    index = NameIndex(["Jane Doe", "Bob Johnson", "Robert Johnson", "Robert Johnson"])
+
+    assert index.best("Robert Johnson") == (2, "EXACT", 1.0)
+    assert index.best("Nobody Here") == (None, "NONE", 0.0)
+    assert index.best("") == (None, "NONE", 0.0)
+
+
+def test_prepare_is_cached_and_interned() -> None:
+    first = NameMatcher.prepare("Bob Smith, Trustee")
+    again = NameMatcher.prepare("Bob Smith, Trustee")
+
+    assert first is again
+    assert first.tokens == {"BOB", "SMITH"}
+    assert first.aliased == {"ROBERT", "SMITH"}
+
+
+def test_is_joined_with_prebuilt_index_matches_legacy_loop() -> None:
+    defendants = [
+        {"name": "Jane Doe"},
+        {"name": None},
+        "Copper Ridge Brandon Homeowners Assn",
+        "Wells Fargo Bank NA",
+    ]
+    index = joinder_validator.build_defendant_index(defendants)
+
+    joined, matched, score = joinder_validator.is_joined(
+        "COPPER RIDGE BRANDON HOMEOWNER ASSN INC", defendants, index
+    )
+
+    assert joined is True
+    assert matched == "Copper Ridge Brandon Homeowners Assn"
+    assert (
+        score
+        == _legacy_match("COPPER RIDGE BRANDON HOMEOWNER ASSN INC", matched)[1]
+        == 0.9
+    )
+    assert joinder_validator.is_joined("Unrelated Creditor LLC", defendants) == (
+        False,
+        None,
+        0.0,
+    )
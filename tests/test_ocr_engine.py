@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any
+
+from PIL import Image
+
+from src.services import ocr_engine
+from src.services.pdf_render import RenderedPage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_pages(tmp_path: Path, count: int) -> list[str]:
+    paths: list[str] = []
+    for idx in range(count):
+        path = tmp_path / f"page_{idx + 1}.png"
+        Image.new("RGB", (8, 8), color=(idx * 40, 0, 0)).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def _fake_tesseract(monkeypatch: Any) -> None:
+    def fake_image_to_string(image: Any, **_kwargs: Any) -> str:
+        red = image.getpixel((0, 0))[0]
+        page = red // 40 + 1
+        if page == 2:
+            raise RuntimeError("tesseract crashed")
+        if page == 3:
+            return "   "
+        return f" text {page} "
+
+    monkeypatch.setattr(ocr_engine.pytesseract, "image_to_string", fake_image_to_string)
+
+
+def test_ocr_pages_inline_preserves_order_and_reports_errors(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    monkeypatch.setenv("OCR_WORKERS", "1")
+    _fake_tesseract(monkeypatch)
+
+    results = ocr_engine.ocr_pages(_write_pages(tmp_path, 4), label="test")
+
+    assert [r.page for r in results] == [1, 2, 3, 4]
+    assert results[0].text == "text 1"
+    assert results[1].text == ""
+    assert results[1].error is not None
+    assert "tesseract crashed" in results[1].error
+    assert results[2].text == ""
+    assert results[2].error is None
+    assert results[3].text == "text 4"
+
+
+def test_ocr_pages_falls_back_inline_when_pool_breaks(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    monkeypatch.setenv("OCR_WORKERS", "4")
+    _fake_tesseract(monkeypatch)
+    discarded: list[bool] = []
+
+    class _BrokenPool:
+        def submit(self, *_args: Any, **_kwargs: Any) -> Any:
+            raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(ocr_engine, "_get_pool", lambda _workers: _BrokenPool())
+    monkeypatch.setattr(ocr_engine, "_discard_pool", lambda _pool: discarded.append(True))
+
+    results = ocr_engine.ocr_pages(_write_pages(tmp_path, 2), label="test")
+
+    assert [r.page for r in results] == [1, 2]
+    assert results[0].text == "text 1"
+    assert results[1].error is not None
+    assert discarded == [True]
+
+
+def test_ocr_worker_count_reads_env(monkeypatch: Any) -> None:
+    monkeypatch.setenv("OCR_WORKERS", "3")
+    assert ocr_engine.ocr_worker_count() == 3
+    monkeypatch.setenv("OCR_WORKERS", "nope")
+    assert ocr_engine.ocr_worker_count() >= 1
+
+
+def test_ocr_pages_accepts_rendered_pages(tmp_path: Path, monkeypatch: Any) -> None:
+    monkeypatch.setenv("OCR_WORKERS", "1")
+    _fake_tesseract(monkeypatch)
+    pages = [
+        RenderedPage(
+            page=idx + 1,
+            width=8,
+            height=8,
+            mode="RGB",
+            stride=24,
+            samples=bytes([idx * 40, 0, 0]) * 64,
+            dpi=72,
+        )
+        for idx in (0, 3)
+    ]
+
+    results = ocr_engine.ocr_pages(pages, label="test")
+
+    assert [r.text for r in results] == ["text 1", "text 4"]
+
+
+def test_ocr_pages_bounds_pages_in_flight(tmp_path: Path, monkeypatch: Any) -> None:
+    monkeypatch.setenv("OCR_WORKERS", "2")
+    _fake_tesseract(monkeypatch)
+    paths = _write_pages(tmp_path, 6)
+    in_flight: list[int] = []
+    outstanding: list[Future[Any]] = []
+
+    class _InlinePool:
+        def submit(self, fn: Any, *args: Any) -> Future[Any]:
+            outstanding[:] = [f for f in outstanding if not f.done()]
+            future: Future[Any] = Future()
+            outstanding.append(future)
+            in_flight.append(len(outstanding))
+            future.set_running_or_notify_cancel()
+            real_result = future.result
+
+            def _result(timeout: float | None = None) -> Any:
+                if not future.done():
+                    future.set_result(fn(*args))
+                return real_result(timeout)
+
+            future.result = _result  # type: ignore[method-assign]
+            return future
+
+    monkeypatch.setattr(ocr_engine, "_get_pool", lambda _workers: _InlinePool())
+
+    results = ocr_engine.ocr_pages(paths, label="test")
+
+    assert [r.page for r in results] == [1, 2, 3, 4, 5, 6]
+    assert results[0].label == paths[0]
+    assert max(in_flight) == 2 * ocr_engine.OCR_PAGES_IN_FLIGHT_PER_WORKER
+
+
+def test_ocr_pages_finishes_inline_when_a_shared_future_is_cancelled(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    monkeypatch.setenv("OCR_WORKERS", "2")
+    _fake_tesseract(monkeypatch)
+
+    class _CancelledPool:
+        def submit(self, *_args: Any, **_kwargs: Any) -> Future[Any]:
+            future: Future[Any] = Future()
+            future.cancel()
+            return future
+
+    discarded: list[Any] = []
+    monkeypatch.setattr(ocr_engine, "_get_pool", lambda _workers: _CancelledPool())
+    monkeypatch.setattr(ocr_engine, "_discard_pool", discarded.append)
+
+    results = ocr_engine.ocr_pages(_write_pages(tmp_path, 2), label="test")
+
+    assert [r.text for r in results] == ["text 1", ""]
+    assert discarded == []
+
+
+def test_discard_pool_never_cancels_and_keeps_a_replacement_pool(monkeypatch: Any) -> None:
+    class _Pool:
+        def __init__(self) -> None:
+            self.shutdowns: list[dict[str, Any]] = []
+
+        def shutdown(self, **kwargs: Any) -> None:
+            self.shutdowns.append(kwargs)
+
+    broken, replacement = _Pool(), _Pool()
+    monkeypatch.setitem(ocr_engine._POOL, "executor", replacement)  # noqa: SLF001
+    monkeypatch.setitem(ocr_engine._POOL, "workers", 2)  # noqa: SLF001
+
+    ocr_engine._discard_pool(broken)  # type: ignore[arg-type]  # noqa: SLF001
+    assert ocr_engine._POOL["executor"] is replacement  # noqa: SLF001
+
+    ocr_engine._discard_pool(replacement)  # type: ignore[arg-type]  # noqa: SLF001
+    assert ocr_engine._POOL["executor"] is None  # noqa: SLF001
+    assert replacement.shutdowns == [{"wait": False}]
+    assert broken.shutdowns == []
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Self
+
+import pytest
+
+from sunbiz.parallel_ingest import EarlierFileFailedError
+from sunbiz.parallel_ingest import MergeGate
+from sunbiz.parallel_ingest import merge_file_stats
+from sunbiz.parallel_ingest import run_file_workers
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _ordered_job(seq: int, path: Path, gate: MergeGate | None) -> dict[str, Any]:
+    assert gate is not None
+    # Later files finish "parsing" first; merges must still happen in order.
+    time.sleep(0.05 * (3 - seq))
+    try:
+        if path.name == "bad.txt":
+            raise RuntimeError("parse failed")
+        gate.acquire(seq)
+        with path.parent.joinpath("merge_order.log").open("a") as fh:
+            fh.write(f"{path.name}\n")
+    except Exception:
+        gate.wait(seq)
+        gate.release(seq, failed=True)
+        raise
+    gate.release(seq, failed=False)
+    return {"rows": seq + 1, "peak_rss_mb": 10.0 + seq}
+
+
+def test_merge_gate_serializes_turns_across_threads() -> None:
+    with multiprocessing.get_context("spawn").Manager() as manager:
+        gate = MergeGate(manager)
+        order: list[int] = []
+
+        def worker(seq: int) -> None:
+            gate.acquire(seq)
+            order.append(seq)
+            gate.release(seq, failed=False)
+
+        threads = [threading.Thread(target=worker, args=(seq,)) for seq in (3, 1, 2, 0)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        assert order == [0, 1, 2, 3]
+
+
+def test_merge_gate_refuses_turn_after_earlier_failure() -> None:
+    with multiprocessing.get_context("spawn").Manager() as manager:
+        gate = MergeGate(manager)
+        gate.release(0, failed=True)
+        with pytest.raises(EarlierFileFailedError):
+            gate.acquire(1)
+
+
+def test_run_file_workers_merges_in_file_order(tmp_path: Path) -> None:
+    paths = [tmp_path / name for name in ("a.txt", "b.txt", "c.txt")]
+
+    results, failures = run_file_workers(_ordered_job, paths, workers=3, ordered=True, label="test")
+
+    assert failures == []
+    assert (tmp_path / "merge_order.log").read_text().split() == ["a.txt", "b.txt", "c.txt"]
+    total: dict[str, Any] = {"rows": 0}
+    for file_stats in results:
+        merge_file_stats(total, file_stats)
+    assert total == {"rows": 6, "peak_rss_mb": 12.0}
+
+
+def test_run_file_workers_stops_merging_after_a_failed_file(tmp_path: Path) -> None:
+    paths = [tmp_path / name for name in ("a.txt", "bad.txt", "c.txt")]
+
+    results, failures = run_file_workers(_ordered_job, paths, workers=3, ordered=True, label="test")
+
+    assert [r["rows"] for r in results] == [1]
+    assert sorted(path.name for path, _exc in failures) == ["bad.txt", "c.txt"]
+    assert (tmp_path / "merge_order.log").read_text().split() == ["a.txt"]
+
+
+def test_load_sunbiz_entity_dispatches_files_to_ordered_workers(monkeypatch: Any, tmp_path: Path) -> None:
+    # Imported here so the spawned workers above do not pay for pg_loader.
+    from sunbiz import pg_loader
+
+    files = [tmp_path / "cordata0.zip", tmp_path / "cordata1.zip"]
+    calls: dict[str, Any] = {}
+
+    def _run_file_workers(job: Any, paths: Any, **kwargs: Any) -> tuple[list[dict], list]:
+        calls.update(kwargs, paths=list(paths), options=job.args[3])
+        return [{"filings_upserted": 2, "peak_rss_mb": 5.0}, {"filings_upserted": 3, "peak_rss_mb": 7.5}], []
+
+    monkeypatch.setattr(pg_loader, "_collect_input_files", lambda **_kwargs: files)
+    monkeypatch.setattr(pg_loader, "get_session_factory", lambda _dsn: None)
+    monkeypatch.setattr(pg_loader, "run_file_workers", _run_file_workers)
+
+    stats = pg_loader.load_sunbiz_entity(
+        dsn="postgresql://db",
+        root=tmp_path,
+        pattern=None,
+        limit_files=None,
+        limit_lines=None,
+        batch_size=100,
+        workers=4,
+    )
+
+    assert calls["paths"] == files
+    assert calls["workers"] == 2
+    assert calls["ordered"] is True
+    assert calls["options"]["batch_size"] == 100
+    assert stats["filings_upserted"] == 5
+    assert stats["peak_rss_mb"] == 7.5
+    assert stats["workers"] == 2
+
+
+class _NoopSession:
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def commit(self) -> None:
+        return None
+
+    def rollback(self) -> None:
+        return None
+
+
+def _next_turn_error(gate: MergeGate, seq: int) -> BaseException | None:
+    """Take turn ``seq`` on a thread; fail the test instead of hanging."""
+    outcome: list[BaseException | None] = []
+
+    def _take() -> None:
+        try:
+            gate.acquire(seq)
+        except EarlierFileFailedError as exc:
+            outcome.append(exc)
+        else:
+            outcome.append(None)
+
+    thread = threading.Thread(target=_take, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert outcome, f"turn {seq} was never released"
+    return outcome[0]
+
+
+@pytest.mark.parametrize("ingest_name", ["_ingest_flr_file", "_ingest_entity_file"])
+def test_ingest_setup_failure_releases_the_merge_turn(
+    monkeypatch: Any, tmp_path: Path, ingest_name: str
+) -> None:
+    from sunbiz import pg_loader
+
+    path = tmp_path / "cordata0.zip"
+    path.write_bytes(b"placeholder")
+
+    def _db_down(**_kwargs: Any) -> int:
+        raise RuntimeError("connection refused")
+
+    monkeypatch.setattr(pg_loader, "_upsert_ingest_file", _db_down)
+    ingest = getattr(pg_loader, ingest_name)
+
+    with multiprocessing.get_context("spawn").Manager() as manager:
+        gate = MergeGate(manager)
+        with pytest.raises(RuntimeError, match="connection refused"):
+            ingest(
+                _NoopSession(),
+                path,
+                tmp_path,
+                limit_lines=None,
+                batch_size=10,
+                max_rss_mb=None,
+                columnar=False,
+                seq=0,
+                gate=gate,
+            )
+
+        assert isinstance(_next_turn_error(gate, 1), EarlierFileFailedError)
+
+
+def test_file_job_releases_the_merge_turn_when_the_session_cannot_open(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    from sunbiz import pg_loader
+
+    def _no_engine(_dsn: str) -> Any:
+        raise RuntimeError("could not connect")
+
+    monkeypatch.setattr(pg_loader, "get_session_factory", _no_engine)
+
+    with multiprocessing.get_context("spawn").Manager() as manager:
+        gate = MergeGate(manager)
+        with pytest.raises(RuntimeError, match="could not connect"):
+            pg_loader._file_job(  # noqa: SLF001
+                pg_loader._ingest_entity_file,  # noqa: SLF001
+                "postgresql://db",
+                tmp_path,
+                {},
+                0,
+                tmp_path / "cordata0.zip",
+                gate,
+            )
+
+        assert isinstance(_next_turn_error(gate, 1), EarlierFileFailedError)
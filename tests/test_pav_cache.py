@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Self
+
+import pytest
+
+from src.services import pav_cache
+
+
+class _FailingEngine:
+    def begin(self) -> Any:
+        raise RuntimeError("relation pav_response_cache does not exist")
+
+    def connect(self) -> Any:
+        raise RuntimeError("relation pav_response_cache does not exist")
+
+
+DSN = "postgresql://user:pw@host:5432/db"
+# Entries live for the cache's documented seven-day TTL.
+TTL_SECONDS = 7 * 24 * 3600
+
+
+@pytest.fixture(autouse=True)
+def _memory_only_cache(monkeypatch: pytest.MonkeyPatch) -> Any:
+    monkeypatch.setattr(pav_cache, "get_engine", lambda _dsn: _FailingEngine())
+    budget = int(pav_cache.pav_cache_stats(include_disk=False)["memory_budget_mb"] * 1024 * 1024)
+    # Switching DSNs re-enables a PG tier an earlier test disabled.
+    pav_cache.configure_pav_cache("postgresql://reset@localhost/reset")
+    pav_cache.configure_pav_cache(DSN)
+    pav_cache.reset_pav_cache_memory()
+    yield
+    pav_cache.reset_pav_cache_memory()
+    pav_cache.configure_pav_cache(DSN, memory_budget_bytes=budget)
+
+
+def test_put_then_get_hits_memory_and_returns_fresh_copy() -> None:
+    payload = {"QueryID": 350, "Keywords": [{"Id": 1, "Value": "SMITH JOHN"}]}
+    pav_cache.pav_cache_put(payload, {"Data": [{"ID": 1}]})
+
+    first = pav_cache.pav_cache_get(payload)
+    assert first == {"Data": [{"ID": 1}]}
+    first["Data"].append({"ID": 2})
+
+    assert pav_cache.pav_cache_get(payload) == {"Data": [{"ID": 1}]}
+    stats = pav_cache.pav_cache_stats(include_disk=False)
+    assert stats["memory_hits"] == 2
+    assert stats["writes"] == 1
+    assert stats["hit_rate"] == 1.0
+
+
+class _EmptyResult:
+    def first(self) -> None:
+        return None
+
+
+class _EmptyConn:
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def execute(self, *_args: Any, **_kwargs: Any) -> _EmptyResult:
+        return _EmptyResult()
+
+
+class _EmptyEngine:
+    def begin(self) -> _EmptyConn:
+        return _EmptyConn()
+
+
+def test_pg_failure_disables_disk_tier_and_counts_miss() -> None:
+    assert pav_cache.pav_cache_get({"QueryID": 1}) is None
+
+    stats = pav_cache.pav_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["disk_errors"] == 1
+    assert stats["entries"] is None
+    # During the cooldown later lookups no longer touch the PG tier.
+    assert pav_cache.pav_cache_get({"QueryID": 2}) is None
+    stats = pav_cache.pav_cache_stats()
+    assert stats["misses"] == 2
+    assert stats["disk_errors"] == 1
+
+
+def test_pg_tier_is_retried_after_cooldown(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = {"now": 5_000.0}
+    monkeypatch.setattr(pav_cache.time, "monotonic", lambda: clock["now"])
+    assert pav_cache.pav_cache_get({"QueryID": 1}) is None
+    assert pav_cache.pav_cache_stats(include_disk=False)["disk_errors"] == 1
+
+    # Still failing once the cooldown lapses: one more probe, then quiet again.
+    clock["now"] += pav_cache._DISK_RETRY_COOLDOWN_SECONDS + 1  # noqa: SLF001
+    assert pav_cache.pav_cache_get({"QueryID": 2}) is None
+    assert pav_cache.pav_cache_get({"QueryID": 3}) is None
+    assert pav_cache.pav_cache_stats(include_disk=False)["disk_errors"] == 2
+
+    # The database comes back: the next probe after the cooldown uses it.
+    engine = _EmptyEngine()
+    monkeypatch.setattr(pav_cache, "get_engine", lambda _dsn: engine)
+    clock["now"] += pav_cache._DISK_RETRY_COOLDOWN_SECONDS + 1  # noqa: SLF001
+    assert pav_cache._disk_engine() is engine  # noqa: SLF001
+    assert pav_cache.pav_cache_get({"QueryID": 4}) is None
+    stats = pav_cache.pav_cache_stats(include_disk=False)
+    assert stats["disk_errors"] == 2
+    assert stats["misses"] == 4
+
+
+def test_memory_tier_evicts_least_recently_used_within_budget() -> None:
+    body = {"Data": "x" * 100}
+    # The memory tier stores compact JSON bodies.
+    entry_bytes = len(json.dumps(body, separators=(",", ":")).encode("utf-8"))
+    pav_cache.configure_pav_cache(DSN, memory_budget_bytes=entry_bytes * 2)
+
+    pav_cache.pav_cache_put({"k": "a"}, body)
+    pav_cache.pav_cache_put({"k": "b"}, body)
+    assert pav_cache.pav_cache_get({"k": "a"}) is not None  # "a" is now most recent
+    pav_cache.pav_cache_put({"k": "c"}, body)
+
+    assert pav_cache.pav_cache_get({"k": "b"}) is None
+    assert pav_cache.pav_cache_get({"k": "a"}) is not None
+    assert pav_cache.pav_cache_get({"k": "c"}) is not None
+    stats = pav_cache.pav_cache_stats(include_disk=False)
+    assert stats["memory_entries"] == 2
+    assert stats["memory_evictions"] == 1
+
+
+def test_expired_memory_entry_is_dropped(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = {"now": 1_000_000.0}
+    monkeypatch.setattr(pav_cache.time, "time", lambda: clock["now"])
+    pav_cache.pav_cache_put({"k": "old"}, {"Data": []})
+
+    clock["now"] += TTL_SECONDS + 1
+
+    assert pav_cache.pav_cache_get({"k": "old"}) is None
+    stats = pav_cache.pav_cache_stats(include_disk=False)
+    assert stats["expirations"] == 1
+    assert stats["memory_entries"] == 0
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import base64
+import io
+from typing import TYPE_CHECKING
+
+import fitz
+from PIL import Image
+
+from src.services.pdf_render import PdfPages, iter_pdf_pages, render_pdf_pages
+from src.services.vision_service import VisionService
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_pdf(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    try:
+        for idx in range(pages):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Page {idx + 1}")
+        doc.save(str(path))
+    finally:
+        doc.close()
+
+
+def test_render_matches_png_round_trip(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "doc.pdf"
+    _write_pdf(pdf_path, 2)
+
+    pages = render_pdf_pages(pdf_path, dpi=72)
+
+    assert [page.page for page in pages] == [1, 2]
+    assert str(pages[1]) == "doc.pdf page 2"
+    doc = fitz.open(str(pdf_path))
+    try:
+        png_path = tmp_path / "page.png"
+        doc[0].get_pixmap(dpi=72).save(str(png_path))
+    finally:
+        doc.close()
+    with Image.open(png_path) as png:
+        assert pages[0].to_image().tobytes() == png.convert("RGB").tobytes()
+
+
+def test_iter_pdf_pages_honours_max_pages_and_grayscale(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "doc.pdf"
+    _write_pdf(pdf_path, 5)
+
+    pages = list(iter_pdf_pages(pdf_path, dpi=50, grayscale=True, max_pages=3))
+
+    assert len(pages) == 3
+    assert all(page.mode == "L" for page in pages)
+    assert len(pages[0].samples) == pages[0].stride * pages[0].height
+    # Identity hashing: dedup by object, not by (possibly equal) pixels.
+    assert len({pages[0], pages[1], pages[0]}) == 2
+
+
+def test_pdf_pages_renders_on_access(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "doc.pdf"
+    _write_pdf(pdf_path, 4)
+
+    pages = PdfPages(pdf_path, dpi=50, grayscale=True, max_pages=3)
+
+    assert len(pages) == 3
+    assert pages[-1].page == 3
+    assert [page.page for page in pages[1:]] == [2, 3]
+    assert [page.page for page in pages] == [1, 2, 3]
+    eager = render_pdf_pages(pdf_path, dpi=50, grayscale=True)
+    assert pages[0].samples == eager[0].samples
+    assert pages[0] is not pages[0]  # nothing is cached between accesses
+
+
+def test_encode_image_accepts_rendered_page(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "doc.pdf"
+    _write_pdf(pdf_path, 1)
+    page = render_pdf_pages(pdf_path, dpi=150)[0]
+    png_path = tmp_path / "page.png"
+    page.to_image().save(png_path)
+    service = VisionService.__new__(VisionService)
+
+    from_buffer = service._encode_image(page)  # noqa: SLF001
+    from_file = service._encode_image(str(png_path))  # noqa: SLF001
+
+    assert from_buffer == from_file
+    with Image.open(io.BytesIO(base64.b64decode(from_buffer))) as encoded:
+        assert max(encoded.size) <= 1024
@@ -90,17 +90,19 @@ def test_insert_criminal_name_index_batch_normalizes_null_conflict_keys(
 ) -> None:
     captured: dict[str, Any] = {}
 
-    class _FakeInsert:
-        def values(self, rows: list[dict[str, Any]]) -> Self:
-            captured["rows"] = rows
-            return self
-
-        def on_conflict_do_nothing(self, **kwargs: Any) -> Self:
-            captured["conflict_kwargs"] = kwargs
-            return self
+    def _fake_copy_upsert(
+        _session: Any,
+        model: Any,
+        rows: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> int:
+        captured["model"] = model
+        captured["rows"] = rows
+        captured["conflict_kwargs"] = kwargs
+        return len(rows)
 
     session = _FakeSession()
-    monkeypatch.setattr(pg_loader_clerk, "pg_insert", lambda _model: _FakeInsert())
+    monkeypatch.setattr(pg_loader_clerk, "copy_upsert", _fake_copy_upsert)
 
     pg_loader_clerk._insert_criminal_name_index_batch(  # noqa: SLF001
         cast("Any", session),
@@ -113,6 +115,7 @@ def test_insert_criminal_name_index_batch_normalizes_null_conflict_keys(
         ],
     )
 
+    assert captured["model"] is pg_loader_clerk.ClerkCriminalNameIndex
     assert captured["rows"] == [
         {
             "ucn": "2025CF000001",
@@ -120,4 +123,5 @@ def test_insert_criminal_name_index_batch_normalizes_null_conflict_keys(
             "disposition_code": "",
         }
     ]
-    assert captured["conflict_kwargs"]["constraint"] == "uq_clerk_crim_ni_ucn_count_disp"
+    assert captured["conflict_kwargs"]["conflict_constraint"] == "uq_clerk_crim_ni_ucn_count_disp"
+    assert captured["conflict_kwargs"].get("update") is None
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import asyncio
+import datetime as dt
+import json
 from typing import Any, Self
 
 import pytest
@@ -879,6 +881,142 @@ def test_run_site_loop_backs_off_on_blocked_html(monkeypatch: Any) -> None:
     assert 1.0 in sleeps
 
 
+def _site_props(count: int) -> list[dict[str, Any]]:
+    return [
+        {"strap": f"S{n}", "folio": f"F{n}", "case_number": f"C{n}", "property_address": f"{n} Main St"}
+        for n in range(count)
+    ]
+
+
+def test_site_lanes_fetch_in_parallel_with_their_own_pacing(monkeypatch: Any) -> None:
+    service = object.__new__(PgMarketDataScraplingService)
+    service.site_lanes = 3
+    active = 0
+    peak = 0
+    delays: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def _fetch(url: str, **_kwargs: Any) -> tuple[str, str]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await real_sleep(0.01)
+        active -= 1
+        return url, "<html>ok</html>"
+
+    async def _fake_sleep(duration: float) -> None:
+        delays.append(duration)
+
+    monkeypatch.setattr(service, "_fetch_site_html", _fetch)
+    monkeypatch.setattr(service, "_payload_matches_query", lambda *_args: True)
+    monkeypatch.setattr(pg_market_data_scrapling.random, "uniform", lambda *_args: 7.0)
+    monkeypatch.setattr(pg_market_data_scrapling.asyncio, "sleep", _fake_sleep)
+
+    matched, save_errors = asyncio.run(
+        service._run_site_loop(
+            "zillow",
+            _site_props(6),
+            url_builder=lambda address, **_kwargs: f"https://example.com/{address}",
+            html_parser=lambda *_args: {"zestimate": 1},
+            upsert_fn=lambda *_args: True,
+            is_useful_fn=bool,
+        )
+    )
+
+    assert (matched, save_errors) == (6, 0)
+    assert peak == 3
+    # Each lane skips its first delay: 6 properties over 3 lanes -> 3 delays.
+    assert delays == [7.0, 7.0, 7.0]
+
+
+def test_banned_site_stops_early_and_checkpoints_cooldown(monkeypatch: Any, tmp_path: Any) -> None:
+    service = object.__new__(PgMarketDataScraplingService)
+    service._site_state_path = tmp_path / "sites.json"
+    service._scrapling_blocked = {}
+    attempted: list[str] = []
+    monkeypatch.setitem(
+        pg_market_data_scrapling.DELAY_PROFILES,
+        "realtor",
+        pg_market_data_scrapling.SiteDelayProfile(
+            delay_min=0, delay_max=0, backoff_min=1, backoff_max=1, backoff_after=2
+        ),
+    )
+    monkeypatch.setattr(
+        service,
+        "_fetch_site_html",
+        lambda *_args, **_kwargs: asyncio.sleep(0, result=("https://example.com", "<html>captcha</html>")),
+    )
+    monkeypatch.setattr(
+        service,
+        "_mark_source_attempted",
+        lambda strap, _folio, _case_number, _site: attempted.append(strap),
+    )
+
+    async def _fake_sleep(_duration: float) -> None:
+        return None
+
+    monkeypatch.setattr(pg_market_data_scrapling.asyncio, "sleep", _fake_sleep)
+
+    asyncio.run(
+        service._run_site_loop(
+            "realtor",
+            _site_props(20),
+            url_builder=lambda address, **_kwargs: f"https://example.com/{address}",
+            html_parser=lambda *_args: {},
+            upsert_fn=lambda *_args: True,
+            is_useful_fn=bool,
+        )
+    )
+
+    # Three full backoffs after two failures each, then the fourth streak
+    # trips the ban.
+    assert attempted == [f"S{n}" for n in range(8)]
+    state = json.loads(service._site_state_path.read_text())
+    assert state["realtor"]["status"] == "blocked"
+    assert state["realtor"]["remaining"] == 12
+    assert "realtor" in service._scrapling_blocked
+    assert service._site_blocked_until("realtor") is not None
+    assert service._site_blocked_until("zillow") is None
+
+
+def test_run_batch_skips_site_in_ban_cooldown(monkeypatch: Any, tmp_path: Any) -> None:
+    svc = object.__new__(PgMarketDataScraplingService)
+    svc._has_realtor_column = True  # type: ignore[attr-defined]
+    svc._force = False  # type: ignore[attr-defined]
+    svc._site_state_path = tmp_path / "sites.json"
+    until = dt.datetime.now(dt.UTC) + dt.timedelta(hours=1)
+    svc._site_state_path.write_text(json.dumps({"realtor": {"status": "blocked", "blocked_until": until.isoformat()}}))
+    ran: list[str] = []
+
+    async def _fake_safe_site_run(site: str, _runner: Any, _properties: list[dict[str, Any]]) -> tuple[int, int]:
+        ran.append(site)
+        return (1, 0)
+
+    async def _fake_parent_run_batch(
+        self: Any,
+        properties: list[dict[str, Any]],
+        sources: list[str] | None = None,
+    ) -> dict[str, Any]:
+        return {"status": "success"}
+
+    monkeypatch.setattr(
+        svc,
+        "_build_site_needs",
+        lambda properties, _sources: {"realtor": properties, "zillow": properties},
+    )
+    monkeypatch.setattr(svc, "_safe_site_run", _fake_safe_site_run)
+    monkeypatch.setattr(market_data_service.MarketDataService, "run_batch", _fake_parent_run_batch)
+
+    result = asyncio.run(
+        svc.run_batch([{"strap": "A", "property_address": "1 Main St"}], sources=["realtor", "zillow"])
+    )
+
+    assert ran == ["zillow"]
+    assert result["scrapling"] == {"zillow": 1}
+    assert result["scrapling_blocked"] == {"realtor": until.isoformat(timespec="seconds")}
+    assert result["status"] == "degraded"
+
+
 # ---------------------------------------------------------------------------
 # _payload_failed tests
 # ---------------------------------------------------------------------------
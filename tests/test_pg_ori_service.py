@@ -2462,3 +2462,338 @@ def test_resolve_inferred_pass2_keeps_when_no_new_docs(monkeypatch: Any) -> None
     result = service.resolve_inferred_encumbrances()
     assert result["pass2_deleted"] == 0
     assert result["kept"] == 1
+
+
+def _fake_target_result(fid: int, api_calls: int) -> dict[str, Any]:
+    return {
+        "docs_found": 2,
+        "saved": 1,
+        "inferred": 0,
+        "api_calls": api_calls,
+        "retries": 0,
+        "truncated": 0,
+        "unresolved_truncations": 0,
+        "official_seed_docs": 0,
+        "save_skips": 0,
+        "case_only_stage_path": None,
+        "marked_ori_searched": fid % 2 == 0,
+    }
+
+
+def test_search_all_concurrent_overlaps_targets_and_aggregates(monkeypatch: Any) -> None:
+    import asyncio
+    import threading
+
+    service = _build_service(monkeypatch)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _fake_process(target: dict[str, Any], *, persist: bool) -> dict[str, Any]:
+        assert persist is True
+        fid = int(target["foreclosure_id"])
+        if fid == 4:
+            raise RuntimeError("boom")
+        # Three targets must be in flight at once for the barrier to release.
+        barrier.wait()
+        service._last_save_documents_stats = {"saved": fid, "skipped": 0, "eligible": fid}  # noqa: SLF001
+        barrier.wait()
+        assert service._last_save_documents_stats["saved"] == fid  # noqa: SLF001
+        return _fake_target_result(fid, api_calls=fid)
+
+    monkeypatch.setattr(service, "_process_target", _fake_process)
+    targets = [
+        {"foreclosure_id": fid, "case_number": f"CASE{fid}", "strap": f"S{fid}"}
+        for fid in (1, 2, 3, 4)
+    ]
+
+    result = asyncio.run(service._search_all(targets, concurrency=3))  # noqa: SLF001
+
+    assert result["targets"] == 4
+    assert result["concurrency"] == 3
+    assert result["errors"] == 1
+    assert result["api_calls"] == 6
+    assert result["encumbrances_saved"] == 3
+    assert result["targets_marked_searched"] == 1
+
+
+def test_search_all_sequential_runs_inline(monkeypatch: Any) -> None:
+    import asyncio
+    import threading
+
+    service = _build_service(monkeypatch)
+    main_thread = threading.get_ident()
+    seen: list[int] = []
+
+    def _fake_process(target: dict[str, Any], *, persist: bool) -> dict[str, Any]:
+        assert threading.get_ident() == main_thread
+        seen.append(int(target["foreclosure_id"]))
+        return _fake_target_result(int(target["foreclosure_id"]), api_calls=1)
+
+    monkeypatch.setattr(service, "_process_target", _fake_process)
+    targets = [
+        {"foreclosure_id": fid, "case_number": f"CASE{fid}", "strap": f"S{fid}"}
+        for fid in (1, 2)
+    ]
+
+    result = asyncio.run(service._search_all(targets))  # noqa: SLF001
+
+    assert seen == [1, 2]
+    assert result["concurrency"] == 1
+    assert result["api_calls"] == 2
+
+
+def test_pav_rate_limiter_spaces_requests(monkeypatch: Any) -> None:
+    sleeps: list[float] = []
+    clock = {"now": 100.0}
+    monkeypatch.setattr(pg_ori_service.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(pg_ori_service.time, "sleep", sleeps.append)
+
+    limiter = pg_ori_service._PavRateLimiter(4.0)  # noqa: SLF001
+
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.25
+    assert limiter.acquire() == 0.5
+    assert sleeps == [0.25, 0.5]
+
+
+def _pav_row(instrument: str, record_date: str) -> dict[str, Any]:
+    values = ["PARTY 1", "WELLS FARGO BANK", record_date, "(MTG) MORTGAGE", "O", "1", "2", "LOT 1", instrument]
+    return {"ID": instrument, "DisplayColumnValues": [{"Value": value} for value in values]}
+
+
+def _fake_post_pav_by_window(
+    monkeypatch: Any,
+    service: pg_ori_service.PgOriService,
+    responder: Any,
+) -> list[tuple[str, str]]:
+    calls: list[tuple[str, str]] = []
+
+    def _fake_post(
+        payload: dict[str, Any],
+        _label: str,
+        stats: dict[str, int],
+        *,
+        bypass_cache: bool = False,
+    ) -> dict[str, Any]:
+        stats["api_calls"] += 1
+        window = (payload["FromDate"], payload["ToDate"])
+        calls.append(window)
+        return responder(window)
+
+    monkeypatch.setattr(service, "_post_pav", _fake_post)
+    pg_ori_service._PAV_RANGE_INDEX.clear()  # noqa: SLF001
+    return calls
+
+
+def _dedup_stats() -> dict[str, int]:
+    return {"api_calls": 0, "retries": 0, "truncated": 0, "unresolved_truncations": 0}
+
+
+def test_pav_search_reuses_complete_wider_window(monkeypatch: Any) -> None:
+    from datetime import date
+
+    service = _build_service(monkeypatch)
+    calls = _fake_post_pav_by_window(
+        monkeypatch,
+        service,
+        lambda _window: {
+            "Data": [_pav_row("2020000001", "02/10/2020"), _pav_row("2020000002", "03/15/2020")],
+            "Truncated": False,
+        },
+    )
+    stats = _dedup_stats()
+
+    full = service._search_party_pav(  # noqa: SLF001
+        "WELLS FARGO BANK",
+        stats,
+        from_date=date(2020, 1, 1),
+        to_date=date(2020, 12, 31),
+        split_on_truncated=True,
+    )
+    narrow = service._search_party_pav(  # noqa: SLF001
+        "WELLS FARGO BANK",
+        stats,
+        from_date=date(2020, 3, 1),
+        to_date=date(2020, 3, 31),
+        split_on_truncated=True,
+    )
+    pg_ori_service._PAV_RANGE_INDEX.clear()  # noqa: SLF001
+
+    assert len(full) == 2
+    assert [doc["Instrument"] for doc in narrow] == ["2020000002"]
+    assert calls == [("01/01/2020", "12/31/2020")]
+    assert stats["api_calls"] == 1
+    assert stats["range_reuse"] == 1
+
+
+def test_pav_search_stitches_split_halves_and_skips_known_truncation(monkeypatch: Any) -> None:
+    from datetime import date
+
+    service = _build_service(monkeypatch)
+
+    def _respond(window: tuple[str, str]) -> dict[str, Any]:
+        if window == ("01/01/2020", "01/04/2020"):
+            return {"Data": [], "Truncated": True}
+        if window[0] == "01/01/2020":
+            return {"Data": [_pav_row("2020000001", "01/01/2020")], "Truncated": False}
+        return {"Data": [_pav_row("2020000003", "01/03/2020")], "Truncated": False}
+
+    calls = _fake_post_pav_by_window(monkeypatch, service, _respond)
+    stats = _dedup_stats()
+
+    first = service._search_legal_pav(  # noqa: SLF001
+        "LOT 1 BLOCK 2 OAK SUB",
+        stats,
+        from_date=date(2020, 1, 1),
+        to_date=date(2020, 1, 4),
+        split_on_truncated=True,
+    )
+    calls_after_first = list(calls)
+    # A wider window containing the truncated one goes straight to splitting,
+    # and its left half is stitched from the halves already fetched.
+    second = service._search_legal_pav(  # noqa: SLF001
+        "LOT 1 BLOCK 2 OAK SUB",
+        stats,
+        from_date=date(2020, 1, 1),
+        to_date=date(2020, 1, 8),
+        split_on_truncated=True,
+    )
+    pg_ori_service._PAV_RANGE_INDEX.clear()  # noqa: SLF001
+
+    assert calls_after_first == [
+        ("01/01/2020", "01/04/2020"),
+        ("01/01/2020", "01/02/2020"),
+        ("01/03/2020", "01/04/2020"),
+    ]
+    assert {doc["Instrument"] for doc in first} == {"2020000001", "2020000003"}
+    assert calls[len(calls_after_first):] == [("01/05/2020", "01/08/2020")]
+    assert {doc["Instrument"] for doc in second} == {"2020000001", "2020000003"}
+    assert stats["truncation_skips"] == 1
+    assert stats["range_reuse"] == 1
+
+
+def test_pav_range_index_expires_windows_after_ttl() -> None:
+    from datetime import date
+
+    now = [1000.0]
+    index = pg_ori_service._PavRangeIndex(1 << 20, ttl_seconds=60, clock=lambda: now[0])  # noqa: SLF001
+    index.record_complete("k", date(2020, 1, 1), date(2020, 1, 31), [("2020-01-10", {"ID": 1})])
+    index.record_truncated("k", date(2020, 2, 1), date(2020, 2, 2))
+
+    assert index.lookup("k", date(2020, 1, 5), date(2020, 1, 20)) == [{"ID": 1}]
+    assert index.known_truncated("k", date(2020, 2, 1), date(2020, 2, 28))
+
+    now[0] += 61
+
+    assert index.lookup("k", date(2020, 1, 5), date(2020, 1, 20)) is None
+    assert not index.known_truncated("k", date(2020, 2, 1), date(2020, 2, 28))
+
+
+def test_pav_range_index_is_bounded_by_bytes_not_keys() -> None:
+    from datetime import date
+
+    window = (date(2020, 1, 1), date(2020, 1, 31))
+    big = [("2020-01-10", {"ID": i, "Name": "x" * 1000}) for i in range(10)]
+    index = pg_ori_service._PavRangeIndex(  # noqa: SLF001
+        30_000,
+        max_window_bytes=20_000,
+    )
+    index.record_complete("big-1", *window, big)
+    index.record_complete("big-2", *window, big)
+    assert index.lookup("big-1", *window) is not None  # "big-1" is now most recent
+    index.record_complete("big-3", *window, big)
+
+    # Two ~10 KB result sets fit the budget; the least recently used one goes.
+    assert index.lookup("big-2", *window) is None
+    assert index.lookup("big-1", *window) is not None
+    assert index.lookup("big-3", *window) is not None
+    assert 20_000 < index.size_bytes <= 30_000
+
+    # Many small result sets share the same budget.
+    for i in range(20):
+        index.record_complete(f"small-{i}", *window, [("2020-01-10", {"ID": i})])
+    assert index.lookup("small-0", *window) == [{"ID": 0}]
+    assert index.size_bytes <= 30_000
+
+    # A window over the per-window cap is not remembered.
+    index.record_complete("huge", *window, big * 3)
+    assert index.lookup("huge", *window) is None
+    assert index.size_bytes <= 30_000
+
+    index.clear()
+    assert index.size_bytes == 0
+
+
+def test_pav_search_bypass_cache_skips_range_index_through_splits(monkeypatch: Any) -> None:
+    from datetime import date
+
+    service = _build_service(monkeypatch)
+    bypass_flags: list[bool] = []
+
+    def _fake_post(
+        payload: dict[str, Any],
+        _label: str,
+        stats: dict[str, int],
+        *,
+        bypass_cache: bool = False,
+    ) -> dict[str, Any]:
+        stats["api_calls"] += 1
+        bypass_flags.append(bypass_cache)
+        if (payload["FromDate"], payload["ToDate"]) == ("01/01/2020", "01/04/2020"):
+            return {"Data": [], "Truncated": True}
+        return {"Data": [_pav_row("2020000001", "01/01/2020")], "Truncated": False}
+
+    monkeypatch.setattr(service, "_post_pav", _fake_post)
+    pg_ori_service._PAV_RANGE_INDEX.clear()  # noqa: SLF001
+    stats = _dedup_stats()
+    search = {
+        "query_id": 326,
+        "keywords": [(1006, "WELLS FARGO BANK")],
+        "query_label": "party:WELLS FARGO BANK",
+        "stats": stats,
+        "from_date": date(2020, 1, 1),
+        "to_date": date(2020, 1, 4),
+        "split_on_truncated": True,
+    }
+
+    service._pav_search(**search)  # noqa: SLF001
+    cached_calls = stats["api_calls"]
+    service._pav_search(**search, bypass_cache=True)  # noqa: SLF001
+    pg_ori_service._PAV_RANGE_INDEX.clear()  # noqa: SLF001
+
+    assert cached_calls == 3
+    assert stats["api_calls"] == 6
+    assert bypass_flags[3:] == [True, True, True]
+    assert "range_reuse" not in stats
+    assert "truncation_skips" not in stats
+
+
+def test_pav_single_flight_shares_in_flight_call() -> None:
+    import threading
+    import time
+
+    flight = pg_ori_service._PavSingleFlight()  # noqa: SLF001
+    entered = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def _slow_call() -> dict[str, Any]:
+        calls.append(1)
+        entered.set()
+        release.wait(5)
+        return {"Data": [{"ID": 1}]}
+
+    results: dict[str, tuple[dict[str, Any] | None, bool]] = {}
+    leader = threading.Thread(target=lambda: results.__setitem__("leader", flight.do("k", _slow_call)))
+    leader.start()
+    assert entered.wait(5)
+    follower = threading.Thread(target=lambda: results.__setitem__("follower", flight.do("k", _slow_call)))
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert calls == [1]
+    assert results["leader"] == ({"Data": [{"ID": 1}]}, False)
+    assert results["follower"] == ({"Data": [{"ID": 1}]}, True)
+    assert results["follower"][0] is not results["leader"][0]
@@ -216,13 +216,38 @@ def test_run_title_chain_counts_chain_summary_and_event_rows(monkeypatch: Any) -
     assert result.details["update"]["summary_rows"] == 2
 
 
+def test_title_chain_materialization_is_incremental_unless_full_rebuild(monkeypatch: Any) -> None:
+    controller = _build_controller(monkeypatch)
+    configs: list[Any] = []
+
+    class _FakeTitleChainController:
+        def __init__(self, config: Any) -> None:
+            configs.append(config)
+
+        def run(self) -> dict[str, int]:
+            return {}
+
+    monkeypatch.setattr(
+        pg_pipeline_controller,
+        "TitleChainController",
+        _FakeTitleChainController,
+    )
+
+    controller._run_title_chain_materialization()  # noqa: SLF001
+    controller.settings.title_chain_full_rebuild = True
+    controller._run_title_chain_materialization()  # noqa: SLF001
+
+    assert [config.incremental for config in configs] == [True, False]
+    assert [config.partitions for config in configs] == [1, 1]
+
+
 def test_run_title_breaks_rebuilds_title_chain_after_repairs(monkeypatch: Any) -> None:
     controller = _build_controller(monkeypatch)
     rebuild_calls: list[str] = []
     run_calls: list[int] = []
 
     class _FakeTitleBreakService:
-        def __init__(self, dsn: str | None = None) -> None:
+        def __init__(self, dsn: str | None = None, *, concurrency: int = 1) -> None:
             assert dsn == controller.dsn
 
         def run(
@@ -231,6 +256,7 @@ def test_run_title_breaks_rebuilds_title_chain_after_repairs(monkeypatch: Any) -
             limit: int | None = None,
             foreclosure_id: int | None = None,
             case_number: str | None = None,
+            foreclosure_ids: list[int] | None = None,
         ) -> dict[str, Any]:
             run_calls.append(len(run_calls) + 1)
             assert limit is None
@@ -291,7 +317,7 @@ def test_run_title_breaks_runs_two_passes_before_noop_stop(monkeypatch: Any) ->
     run_calls: list[int] = []
 
     class _FakeTitleBreakService:
-        def __init__(self, dsn: str | None = None) -> None:
+        def __init__(self, dsn: str | None = None, *, concurrency: int = 1) -> None:
             assert dsn == controller.dsn
 
         def run(
@@ -300,6 +326,7 @@ def test_run_title_breaks_runs_two_passes_before_noop_stop(monkeypatch: Any) ->
             limit: int | None = None,
             foreclosure_id: int | None = None,
             case_number: str | None = None,
+            foreclosure_ids: list[int] | None = None,
         ) -> dict[str, Any]:
             run_calls.append(len(run_calls) + 1)
             assert limit is None
@@ -343,7 +370,7 @@ def test_run_title_breaks_passes_scope_to_service(monkeypatch: Any) -> None:
     captured: dict[str, Any] = {}
 
     class _FakeTitleBreakService:
-        def __init__(self, dsn: str | None = None) -> None:
+        def __init__(self, dsn: str | None = None, *, concurrency: int = 1) -> None:
             assert dsn == controller.dsn
 
         def run(
@@ -352,6 +379,7 @@ def test_run_title_breaks_passes_scope_to_service(monkeypatch: Any) -> None:
             limit: int | None = None,
             foreclosure_id: int | None = None,
             case_number: str | None = None,
+            foreclosure_ids: list[int] | None = None,
         ) -> dict[str, Any]:
             captured["limit"] = limit
             captured["foreclosure_id"] = foreclosure_id
@@ -384,7 +412,7 @@ def test_run_title_breaks_marks_sentinel_only_passes_degraded(monkeypatch: Any)
     run_calls: list[int] = []
 
     class _FakeTitleBreakService:
-        def __init__(self, dsn: str | None = None) -> None:
+        def __init__(self, dsn: str | None = None, *, concurrency: int = 1) -> None:
             assert dsn == controller.dsn
 
         def run(
@@ -393,6 +421,7 @@ def test_run_title_breaks_marks_sentinel_only_passes_degraded(monkeypatch: Any)
             limit: int | None = None,
             foreclosure_id: int | None = None,
             case_number: str | None = None,
+            foreclosure_ids: list[int] | None = None,
         ) -> dict[str, Any]:
             run_calls.append(len(run_calls) + 1)
             assert limit is None
@@ -445,7 +474,7 @@ def test_run_title_breaks_continues_after_second_pass_until_stop_condition(monke
     rebuild_calls: list[str] = []
 
     class _FakeTitleBreakService:
-        def __init__(self, dsn: str | None = None) -> None:
+        def __init__(self, dsn: str | None = None, *, concurrency: int = 1) -> None:
             assert dsn == controller.dsn
 
         def run(
@@ -454,6 +483,7 @@ def test_run_title_breaks_continues_after_second_pass_until_stop_condition(monke
             limit: int | None = None,
             foreclosure_id: int | None = None,
             case_number: str | None = None,
+            foreclosure_ids: list[int] | None = None,
         ) -> dict[str, Any]:
             run_calls.append(len(run_calls) + 1)
             if len(run_calls) == 1:
@@ -496,7 +526,7 @@ def test_run_title_breaks_hard_caps_after_five_extra_cycles(monkeypatch: Any) ->
     rebuild_calls: list[str] = []
 
     class _FakeTitleBreakService:
-        def __init__(self, dsn: str | None = None) -> None:
+        def __init__(self, dsn: str | None = None, *, concurrency: int = 1) -> None:
             assert dsn == controller.dsn
 
         def run(
@@ -505,6 +535,7 @@ def test_run_title_breaks_hard_caps_after_five_extra_cycles(monkeypatch: Any) ->
             limit: int | None = None,
             foreclosure_id: int | None = None,
             case_number: str | None = None,
+            foreclosure_ids: list[int] | None = None,
         ) -> dict[str, Any]:
             run_calls.append(len(run_calls) + 1)
             return {"targets": 1, "gaps_found": 1, "deeds_inserted": 1, "backfilled": 0, "errors": 0}
@@ -537,6 +568,58 @@ def test_run_title_breaks_hard_caps_after_five_extra_cycles(monkeypatch: Any) ->
     assert result.details["rebuild_count"] == 7
 
 
+def test_run_title_breaks_revisits_only_dirty_foreclosures(monkeypatch: Any) -> None:
+    controller = _build_controller(monkeypatch)
+    scopes: list[list[int] | None] = []
+    dirty_by_pass = [[11, 12], [12], []]
+
+    class _FakeTitleBreakService:
+        def __init__(self, dsn: str | None = None, *, concurrency: int = 1) -> None:
+            assert concurrency == controller.settings.title_breaks_concurrency
+
+        def run(
+            self,
+            *,
+            limit: int | None = None,
+            foreclosure_id: int | None = None,
+            case_number: str | None = None,
+            foreclosure_ids: list[int] | None = None,
+        ) -> dict[str, Any]:
+            scopes.append(foreclosure_ids)
+            dirty = dirty_by_pass[len(scopes) - 1]
+            return {
+                "targets": 2,
+                "gaps_found": 2,
+                "deeds_inserted": len(dirty),
+                "backfilled": 0,
+                "errors": 0,
+                "dirty_foreclosure_ids": dirty,
+            }
+
+    class _FakeTitleChainController:
+        def __init__(self, _config: Any) -> None:
+            pass
+
+        def run(self) -> dict[str, int]:
+            return {"chain_rows": 1, "summary_rows": 1, "events_inserted": 1}
+
+    monkeypatch.setattr(
+        "src.services.pg_title_break_service.PgTitleBreakService",
+        _FakeTitleBreakService,
+    )
+    monkeypatch.setattr(
+        pg_pipeline_controller,
+        "TitleChainController",
+        _FakeTitleChainController,
+    )
+
+    result = controller._run_title_breaks()  # noqa: SLF001
+
+    assert scopes == [None, [11, 12], [12]]
+    assert result.updated == 3
+    assert result.details["pass_count"] == 3
+
+
 def test_run_executes_recovery_after_audit_with_shared_state(monkeypatch: Any) -> None:
     controller = _build_controller(monkeypatch, audit_only=True)
     shared_report = {"targets": [101, 202]}
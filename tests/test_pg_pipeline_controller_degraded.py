@@ -203,7 +203,7 @@ def test_ori_search_staged_only_results_are_degraded(monkeypatch: Any) -> None:
     controller = _build_controller(monkeypatch)
 
     class _FakeOriService:
-        def __init__(self, dsn: str | None = None) -> None:
+        def __init__(self, dsn: str | None = None, target_concurrency: int = 1) -> None:
             assert dsn == controller.dsn
 
         def run(self, *, limit: int | None = None) -> dict[str, Any]:
@@ -230,7 +230,7 @@ def test_ori_search_save_skips_degrade_and_increment_errors(monkeypatch: Any) ->
     controller = _build_controller(monkeypatch)
 
     class _FakeOriService:
-        def __init__(self, dsn: str | None = None) -> None:
+        def __init__(self, dsn: str | None = None, target_concurrency: int = 1) -> None:
             assert dsn == controller.dsn
 
         def run(self, *, limit: int | None = None) -> dict[str, Any]:
@@ -164,8 +164,9 @@ def test_controller_reads_phase_b_service_metrics(monkeypatch: Any) -> None:
             return {"rows_updated": 7}
 
     class _FakeOriSvc:
-        def __init__(self, dsn: str | None = None) -> None:
+        def __init__(self, dsn: str | None = None, target_concurrency: int = 1) -> None:
             assert dsn == controller.dsn
+            assert target_concurrency == 1
 
         def run(self, limit: int | None = None) -> dict[str, Any]:
             assert limit is None
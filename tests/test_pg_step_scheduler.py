@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from src.services import pg_pipeline_controller
+from src.services.pg_step_scheduler import (
+    ALL_RESOURCES,
+    StepScheduler,
+    StepSpec,
+    build_step_dependencies,
+    critical_path_ms,
+)
+from src.utils.step_result import StepResult
+
+
+def _spec(name: str, reads: set[str] | None = None, writes: set[str] | None = None) -> StepSpec:
+    return StepSpec(
+        name=name,
+        skip=False,
+        fn=lambda: None,
+        reads=frozenset(reads or set()),
+        writes=frozenset(writes or set()),
+    )
+
+
+def test_dependencies_follow_read_write_hazards() -> None:
+    specs = [
+        _spec("hcpa", writes={"hcpa"}),
+        _spec("clerk", writes={"clerk"}),
+        _spec("refresh", reads={"hcpa", "clerk"}, writes={"foreclosures"}),
+        _spec("market", reads={"foreclosures"}, writes={"market"}),
+        _spec("pins", reads={"hcpa"}, writes={"permits"}),
+    ]
+
+    deps = build_step_dependencies(specs)
+
+    assert deps["hcpa"] == set()
+    assert deps["clerk"] == set()
+    assert deps["refresh"] == {"hcpa", "clerk"}
+    assert deps["market"] == {"refresh"}
+    assert deps["pins"] == {"hcpa"}
+
+
+def test_unknown_step_resources_serialize_against_everything() -> None:
+    specs = [
+        _spec("a", writes={"x"}),
+        StepSpec(name="legacy", skip=False, fn=lambda: None, writes=ALL_RESOURCES),
+        _spec("b", writes={"y"}),
+    ]
+
+    deps = build_step_dependencies(specs)
+
+    assert deps["legacy"] == {"a"}
+    assert deps["b"] == {"legacy"}
+
+
+def test_parallel_scheduler_overlaps_independent_steps_and_keeps_order() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def execute(spec: StepSpec) -> StepResult:
+        if spec.name in {"hcpa", "clerk"}:
+            # Both independent loads must be running at the same time.
+            barrier.wait()
+        with lock:
+            calls.append(spec.name)
+        return StepResult(step_name=spec.name, status="success", duration_ms=10)
+
+    specs = [
+        _spec("hcpa", writes={"hcpa"}),
+        _spec("clerk", writes={"clerk"}),
+        _spec("refresh", reads={"hcpa", "clerk"}, writes={"foreclosures"}),
+    ]
+    results = StepScheduler(specs, execute, max_workers=4).run()
+
+    assert [r.step_name for r in results] == ["hcpa", "clerk", "refresh"]
+    assert calls[-1] == "refresh"
+    assert critical_path_ms(specs, results) == 20
+
+
+def test_fail_fast_stops_launching_new_steps() -> None:
+    def execute(spec: StepSpec) -> StepResult:
+        if spec.name == "a":
+            return StepResult(step_name="a", status="failed", errors=1)
+        time.sleep(0.01)
+        return StepResult(step_name=spec.name, status="success")
+
+    specs = [
+        _spec("a", writes={"x"}),
+        _spec("b", reads={"x"}),
+        _spec("c", reads={"x"}),
+    ]
+
+    results = StepScheduler(specs, execute, max_workers=2, fail_fast=True).run()
+
+    assert [r.step_name for r in results] == ["a"]
+
+
+def test_failed_step_does_not_block_dependents_without_fail_fast() -> None:
+    def execute(spec: StepSpec) -> StepResult:
+        status = "failed" if spec.name == "a" else "success"
+        return StepResult(step_name=spec.name, status=status)
+
+    specs = [_spec("a", writes={"x"}), _spec("b", reads={"x"})]
+
+    results = StepScheduler(specs, execute, max_workers=2).run()
+
+    assert [(r.step_name, r.status) for r in results] == [("a", "failed"), ("b", "success")]
+
+
+def test_controller_declares_resources_for_every_step(monkeypatch: Any) -> None:
+    monkeypatch.setattr(
+        pg_pipeline_controller,
+        "resolve_pg_dsn",
+        lambda _dsn: "postgresql://user:pw@host:5432/db",
+    )
+    monkeypatch.setattr(pg_pipeline_controller, "get_engine", lambda _dsn: object())
+    settings = pg_pipeline_controller.ControllerSettings(step_workers=4)
+    for attr in dir(settings):
+        if attr.startswith("skip_"):
+            setattr(settings, attr, True)
+    controller = pg_pipeline_controller.PgPipelineController(settings)
+
+    summary = controller.run()
+
+    names = [step["name"] for step in summary["steps"]]
+    assert set(names) <= set(pg_pipeline_controller.STEP_RESOURCES)
+    assert all(step["status"] == "skipped" for step in summary["steps"])
+    assert summary["step_workers"] == 4
@@ -251,3 +251,137 @@ def test_load_encumbrances_maps_mortgage_holder_to_creditor(
             "case_number": "24-CA-000123",
         },
     ]
+
+
+def _enc_row(enc_id: int, strap: str, enc_type: str, recorded: str) -> dict[str, Any]:
+    return {
+        "id": enc_id,
+        "strap": strap,
+        "encumbrance_type": enc_type,
+        "party1": "OWNER ONE",
+        "party2": "LENDER BANK NA",
+        "amount": 100000.0,
+        "recording_date": recorded,
+        "instrument_number": f"2020{enc_id:06d}",
+        "book": "",
+        "page": "",
+        "is_satisfied": False,
+        "satisfaction_instrument": "",
+        "satisfaction_date": None,
+        "survival_status": None,
+        "case_number": "",
+        "current_holder": "",
+    }
+
+
+class _BatchConnection(_CaptureConnection):
+    def __init__(self, captured: dict[str, Any], fail_bulk: bool) -> None:
+        super().__init__(captured, [])
+        self._fail_bulk = fail_bulk
+
+    def execute(self, sql: Any, params: Any = None) -> _CaptureResult:
+        sql_text = str(sql)
+        self._captured.setdefault("executed", []).append((sql_text, params))
+        if self._fail_bulk and "ANY(:foreclosure_ids)" in sql_text:
+            raise RuntimeError("bulk write rejected")
+        if "FROM ori_encumbrances" in sql_text:
+            rows = [
+                _enc_row(11, "S1", "mortgage", "2019-05-01"),
+                _enc_row(12, "S1", "lien", "2021-02-01"),
+                _enc_row(21, "S2", "mortgage", "2018-01-01"),
+            ]
+            if "ANY(:straps)" in sql_text:
+                return _CaptureResult([r for r in rows if r["strap"] in params["straps"]])
+            return _CaptureResult([r for r in rows if r["strap"] == params["strap"]])
+        if "FROM foreclosure_title_chain" in sql_text:
+            return _CaptureResult([])
+        return _CaptureResult([])
+
+
+class _BatchEngine:
+    def __init__(self, captured: dict[str, Any], *, fail_bulk: bool = False) -> None:
+        self._captured = captured
+        self._fail_bulk = fail_bulk
+
+    def connect(self) -> _BatchConnection:
+        return _BatchConnection(self._captured, self._fail_bulk)
+
+    def begin(self) -> _BatchConnection:
+        return _BatchConnection(self._captured, self._fail_bulk)
+
+
+def _batch_targets() -> list[dict[str, Any]]:
+    judgment = {"plaintiff": "LENDER BANK NA", "foreclosing_refs": {"instrument": "2020000011"}}
+    return [
+        {"foreclosure_id": 1, "case_number": "24-CA-1", "strap": "S1", "judgment_data": dict(judgment), "homestead_exempt": False},
+        {"foreclosure_id": 2, "case_number": "24-CA-2", "strap": "S1", "judgment_data": {}, "homestead_exempt": True},
+        {"foreclosure_id": 3, "case_number": "24-CA-3", "strap": "S3", "judgment_data": {}, "homestead_exempt": False},
+    ]
+
+
+def test_run_loads_and_writes_each_page_in_bulk(monkeypatch: Any) -> None:
+    service = _build_service(monkeypatch)
+    captured: dict[str, Any] = {}
+    service.engine = _BatchEngine(captured)
+    monkeypatch.setattr(service, "_find_targets", lambda *_a, **_k: _batch_targets())
+
+    result = service.run(limit=10)
+
+    assert result == {"targets": 3, "analyzed": 2, "errors": 0}
+    executed = captured["executed"]
+    assert sum("FROM ori_encumbrances" in sql for sql, _ in executed) == 1
+    assert sum("FROM foreclosure_title_chain" in sql for sql, _ in executed) == 1
+    deletes = [p for sql, p in executed if "DELETE FROM foreclosure_encumbrance_survival" in sql]
+    assert deletes == [{"foreclosure_ids": [1, 2]}]
+    (upserts,) = [p for sql, p in executed if "INSERT INTO foreclosure_encumbrance_survival" in sql]
+    assert {(row["foreclosure_id"], row["encumbrance_id"]) for row in upserts} == {
+        (1, 11),
+        (1, 12),
+        (2, 11),
+        (2, 12),
+    }
+    (marks,) = [p for sql, p in executed if "step_survival_analyzed = now()" in sql]
+    assert marks == {"fids": [1, 2, 3]}
+
+
+def test_run_batch_results_match_per_foreclosure_analysis(monkeypatch: Any) -> None:
+    service = _build_service(monkeypatch)
+    captured: dict[str, Any] = {}
+    service.engine = _BatchEngine(captured)
+    monkeypatch.setattr(service, "_find_targets", lambda *_a, **_k: _batch_targets())
+
+    service.run(limit=10)
+
+    (upserts,) = [p for sql, p in captured["executed"] if "INSERT INTO foreclosure_encumbrance_survival" in sql]
+    expected: list[dict[str, Any]] = []
+    for target in _batch_targets()[:2]:
+        chain = service._load_chain(target["foreclosure_id"])  # noqa: SLF001
+        analysis = pg_survival_service._analyze_survival({  # noqa: SLF001
+            "strap": target["strap"],
+            "encumbrances": service._load_encumbrances(target["strap"]),  # noqa: SLF001
+            "judgment_data": target["judgment_data"],
+            "chain_of_title": chain,
+            "current_period_id": None,
+            "is_homestead": target["homestead_exempt"],
+        })
+        expected.extend(
+            service._survival_params(target["foreclosure_id"], target["case_number"], analysis)[0]  # noqa: SLF001
+        )
+    assert upserts == expected
+
+
+def test_run_falls_back_to_per_foreclosure_writes_when_bulk_write_fails(
+    monkeypatch: Any,
+) -> None:
+    service = _build_service(monkeypatch)
+    captured: dict[str, Any] = {}
+    service.engine = _BatchEngine(captured, fail_bulk=True)
+    monkeypatch.setattr(service, "_find_targets", lambda *_a, **_k: _batch_targets())
+
+    result = service.run(limit=10)
+
+    assert result == {"targets": 3, "analyzed": 2, "errors": 0}
+    per_target_deletes = [
+        p for sql, p in captured["executed"] if "WHERE foreclosure_id = :foreclosure_id" in sql
+    ]
+    assert per_target_deletes == [{"foreclosure_id": 1}, {"foreclosure_id": 2}]
@@ -1,3 +1,4 @@
+import threading
 from typing import Any
 
 from src.services import pg_title_break_service
@@ -729,3 +730,77 @@ def test_run_logs_recent_sentinel_skips(monkeypatch: Any) -> None:
         "chain_status=BROKEN gap_count=2 due to SEARCH_NO_RESULT sentinel dated 2026-03-09 "
         "(retry eligible 2026-03-23, 13 day(s) remaining)"
     ) in capture_logger.info_messages
+
+
+def _scripted_run_service(monkeypatch: Any, concurrency: int) -> tuple[PgTitleBreakService, dict[str, Any]]:
+    targets = [
+        {"foreclosure_id": fid, "folio": f"F{fid}", "case_number_raw": f"24-CA-{fid}"}
+        for fid in (1, 2, 3, 4)
+    ]
+    window = {"missing_from_date": "2020-01-01", "missing_to_date": "2021-01-01"}
+    gaps = {
+        "F1": [{"expected_from_party": "A", "observed_to_party": "B", **window}] * 2,
+        "F2": [],
+        "F3": [{"expected_from_party": "C", "observed_to_party": "D", **window}],
+        "F4": [{"expected_from_party": "BOOM", "observed_to_party": "E", **window}],
+    }
+    calls: dict[str, Any] = {"scopes": [], "inserted": [], "sentinels": [], "threads": set()}
+    service = PgTitleBreakService.__new__(PgTitleBreakService)
+    service.concurrency = concurrency
+
+    def find_targets(_limit: Any, **kwargs: Any) -> list[dict[str, Any]]:
+        calls["scopes"].append(kwargs["foreclosure_ids"])
+        return list(targets)
+
+    def search(target: dict[str, Any], gap: dict[str, Any], **_kwargs: Any) -> list[dict[str, Any]]:
+        calls["threads"].add(threading.current_thread().name)
+        if gap["expected_from_party"] == "BOOM":
+            raise RuntimeError("PAV down")
+        if target["folio"] == "F1":
+            return [{"Instrument": f"I{len(calls['inserted'])}"}]
+        return []
+
+    monkeypatch.setattr(service, "_find_recent_sentinel_skips", lambda **_kwargs: [])
+    monkeypatch.setattr(service, "_find_targets", find_targets)
+    monkeypatch.setattr(service, "_load_gaps", lambda folio: gaps[folio])
+    monkeypatch.setattr(service, "_search_gap_deeds", search)
+    monkeypatch.setattr(
+        service,
+        "_insert_deeds",
+        lambda target, deeds: calls["inserted"].append((target["foreclosure_id"], len(deeds))) or len(deeds),
+    )
+    monkeypatch.setattr(
+        service,
+        "_insert_search_sentinel",
+        lambda target: calls["sentinels"].append(target["foreclosure_id"]) or 1,
+    )
+    monkeypatch.setattr(service, "_backfill_deed_parties", lambda *_args, **_kwargs: 0)
+    return service, calls
+
+
+def test_run_concurrent_matches_sequential_and_reports_dirty_ids(monkeypatch: Any) -> None:
+    sequential, seq_calls = _scripted_run_service(monkeypatch, concurrency=1)
+    concurrent, con_calls = _scripted_run_service(monkeypatch, concurrency=3)
+
+    seq_result = sequential.run(foreclosure_ids=[4, 1, 2, 3])
+    con_result = concurrent.run(foreclosure_ids=[4, 1, 2, 3])
+
+    assert seq_result == con_result
+    assert con_result["gaps_found"] == 3
+    assert con_result["deeds_inserted"] == 2
+    assert con_result["sentinels_inserted"] == 1
+    assert con_result["errors"] == 1
+    assert con_result["dirty_foreclosure_ids"] == [1, 4]
+    assert con_calls["scopes"] == [[1, 2, 3, 4]]
+    assert con_calls["inserted"] == seq_calls["inserted"] == [(1, 2)]
+    assert con_calls["sentinels"] == [3]
+    assert all(name.startswith("title-breaks") for name in con_calls["threads"])
+
+
+def test_run_with_empty_dirty_set_searches_nothing(monkeypatch: Any) -> None:
+    service, calls = _scripted_run_service(monkeypatch, concurrency=2)
+
+    result = service.run(foreclosure_ids=[])
+
+    assert result == {"skipped": True, "reason": "no_dirty_foreclosures", "dirty_foreclosure_ids": []}
+    assert calls["scopes"] == []
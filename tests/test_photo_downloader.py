@@ -0,0 +1,142 @@
+"""Tests for the per-host listing-photo downloader."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Self
+
+import pytest
+
+from src.services import photo_downloader
+from src.services.photo_downloader import PhotoDownloader, TokenBucket, photo_index
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class _Response:
+    def __init__(
+        self,
+        status: int = 200,
+        content_type: str = "image/jpeg",
+        chunks: list[bytes | Exception] | None = None,
+    ) -> None:
+        self.status_code = status
+        self.headers = {"Content-Type": content_type}
+        self._chunks: list[bytes | Exception] = (
+            chunks if chunks is not None else [b"ab", b"", b"cd"]
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        return None
+
+    def iter_content(self, _size: int) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+
+class _Session:
+    def __init__(self, response: _Response) -> None:
+        self.response = response
+
+    def get(self, _url: str, **_kwargs: Any) -> _Response:
+        return self.response
+
+
+def test_photo_index_maps_stems_and_skips_partial_files(tmp_path: Path) -> None:
+    (tmp_path / "000_aaaaaaaaaaaa.jpg").write_bytes(b"x")
+    (tmp_path / "001_bbbbbbbbbbbb.jpg.part").write_bytes(b"x")
+
+    index = photo_index(tmp_path)
+
+    assert index == {"000_aaaaaaaaaaaa": tmp_path / "000_aaaaaaaaaaaa.jpg"}
+    assert photo_index(tmp_path / "missing") == {}
+
+
+def test_token_bucket_allows_burst_then_paces(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [0.0]
+    sleeps: list[float] = []
+
+    async def _sleep(delay: float) -> None:
+        sleeps.append(delay)
+        now[0] += delay
+
+    monkeypatch.setattr(photo_downloader.asyncio, "sleep", _sleep)
+
+    async def _acquire_four() -> list[float]:
+        bucket = TokenBucket(rate=2.0, burst=2, clock=lambda: now[0])
+        return [await bucket.acquire() for _ in range(4)]
+
+    waits = asyncio.run(_acquire_four())
+
+    assert waits == [0.0, 0.0, 0.5, 0.5]
+    assert sleeps == [0.5, 0.5]
+
+
+def test_stream_to_disk_writes_image_and_skips_other_responses(tmp_path: Path) -> None:
+    path = photo_downloader._stream_to_disk(  # noqa: SLF001
+        _Session(_Response(content_type="image/webp; charset=binary")),
+        "https://cdn.example.com/a",
+        tmp_path,
+        "000_abc",
+    )
+
+    assert path == tmp_path / "000_abc.webp"
+    assert path.read_bytes() == b"abcd"
+    for response in (_Response(status=404), _Response(content_type="text/html")):
+        assert (
+            photo_downloader._stream_to_disk(  # noqa: SLF001
+                _Session(response), "https://cdn.example.com/b", tmp_path, "001_abc"
+            )
+            is None
+        )
+
+
+def test_interrupted_stream_leaves_no_partial_file(tmp_path: Path) -> None:
+    response = _Response(chunks=[b"ab", ConnectionError("reset")])
+
+    with pytest.raises(ConnectionError):
+        photo_downloader._stream_to_disk(  # noqa: SLF001
+            _Session(response), "https://cdn.example.com/a", tmp_path, "000_abc"
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_downloader_bounds_concurrency_per_host(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    def _fake_stream(_session: object, url: str, _dir: Path, _stem: str) -> None:
+        host = url.split("/")[2]
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        time.sleep(0.02)
+        active[host] -= 1
+
+    monkeypatch.setattr(photo_downloader, "_stream_to_disk", _fake_stream)
+
+    async def _run() -> None:
+        async with PhotoDownloader(
+            host_concurrency=2, host_rate=0, max_workers=8
+        ) as dl:
+            await asyncio.gather(
+                *(
+                    dl.fetch(f"https://{host}/{n}.jpg", tmp_path, f"{n:03d}")
+                    for host in ("a.example.com", "b.example.com")
+                    for n in range(6)
+                )
+            )
+
+    asyncio.run(_run())
+
+    assert peak == {"a.example.com": 2, "b.example.com": 2}
@@ -0,0 +1,136 @@
+# ruff: noqa: SLF001
+"""Parity tests: the Polars fixed-width parsers must match the per-line parsers."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from sunbiz import pg_loader
+
+_ALPHABET = "0123456789" * 4 + " " * 30 + "ABCXYZ&.,-\xe9\xa0\x1c\t"
+_LINE_LENGTH = 800
+
+
+def _make_lines(fields: Any, count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)  # noqa: S311
+    lines: list[str] = []
+    for idx in range(count):
+        chars = [rng.choice(_ALPHABET) for _ in range(rng.choice((20, 300, _LINE_LENGTH)))]
+        for _name, start, end, kind in fields:
+            if start >= len(chars) or rng.random() < 0.3:
+                continue
+            width = end - start
+            if kind == "date":
+                value = rng.choice(("01152024", "20240115", "00000000", "02302024", "        ", "1 152024"))
+            elif kind == "int":
+                value = rng.choice(("00012", " 7   ", "-3", "abc", "     ", "+5"))
+            else:
+                value = rng.choice(("  ACME HOLDINGS LLC ", "Y", "", "  ", "N\xa0"))
+            value = value[:width].ljust(width)
+            chars[start:end] = list(value)[: max(0, min(end, len(chars)) - start)]
+        if idx % 11 == 0:
+            # Blank record key -> row parsers return None.
+            chars[0:13] = [" "] * min(13, len(chars))
+        lines.append("".join(chars))
+    return lines
+
+
+def _strip_stamps(rows: list[dict]) -> list[dict]:
+    return [{k: v for k, v in row.items() if k not in {"updated_at", "loaded_at"}} for row in rows]
+
+
+def _frame_rows(frame: Any) -> list[dict]:
+    return _strip_stamps(frame.to_dicts())
+
+
+def _assert_same(expected: list[dict], frame: Any) -> None:
+    actual = _frame_rows(frame)
+    assert len(actual) == len(expected)
+    for want, got in zip(_strip_stamps(expected), actual, strict=True):
+        assert got == want
+
+
+def _line_nos(lines: list[str]) -> list[int]:
+    return list(range(101, 101 + len(lines)))
+
+
+def test_flr_frames_match_row_parsers() -> None:
+    cases = [
+        (pg_loader._FLRF_FIELDS, pg_loader._parse_flrf_line, pg_loader._frame_flrf, {}),
+        (pg_loader._FLRE_FIELDS, pg_loader._parse_flre_line, pg_loader._frame_flre, {}),
+        (
+            pg_loader._FLR_PARTY_FIELDS,
+            pg_loader._parse_flr_party_line,
+            pg_loader._frame_flr_party,
+            {"party_role": "debtor"},
+        ),
+    ]
+    for seed, (fields, parse_line, parse_frame, extra) in enumerate(cases):
+        lines = _make_lines(fields, 200, seed)
+        nos = _line_nos(lines)
+        expected = [
+            row
+            for line, no in zip(lines, nos, strict=True)
+            if (row := parse_line(line, 9, "flrf.txt", no, **extra)) is not None
+        ]
+        _assert_same(expected, parse_frame(lines, nos, 9, "flrf.txt", **extra))
+
+
+def test_entity_event_frames_match_row_parsers() -> None:
+    cases = [
+        (pg_loader._COR_EVENT_FIELDS, pg_loader._parse_cor_event_line, pg_loader._frame_cor_event),
+        (pg_loader._GEN_EVENT_FIELDS, pg_loader._parse_gen_event_line, pg_loader._frame_gen_event),
+    ]
+    for seed, (fields, parse_line, parse_frame) in enumerate(cases, start=10):
+        lines = _make_lines(fields, 200, seed)
+        nos = _line_nos(lines)
+        expected = [
+            row
+            for line, no in zip(lines, nos, strict=True)
+            if (row := parse_line(line, 3, "corevt.txt", no)) is not None
+        ]
+        _assert_same(expected, parse_frame(lines, nos, 3, "corevt.txt"))
+
+
+def test_entity_data_frames_match_row_parsers() -> None:
+    officer_fields = tuple(
+        field
+        for idx in range(pg_loader._COR_OFFICER_COUNT)
+        for field in pg_loader._cor_officer_fields(
+            pg_loader._COR_OFFICER_BASE + idx * pg_loader._COR_OFFICER_BLOCK
+        )
+    )
+    cases = [
+        (
+            pg_loader._COR_DATA_FIELDS + officer_fields,
+            pg_loader._parse_cor_data_line,
+            pg_loader._frame_cor_data,
+        ),
+        (
+            pg_loader._GEN_DATA_FIELDS + pg_loader._GEN_PARTNER_FIELDS,
+            pg_loader._parse_gen_data_line,
+            pg_loader._frame_gen_data,
+        ),
+    ]
+    for seed, (fields, parse_line, parse_frame) in enumerate(cases, start=20):
+        lines = _make_lines(fields, 200, seed)
+        nos = _line_nos(lines)
+        expected_filings: list[dict] = []
+        expected_parties: list[dict] = []
+        for line, no in zip(lines, nos, strict=True):
+            filing, parties = parse_line(line, 5, "cordata0.txt", no)
+            if filing:
+                expected_filings.append(filing)
+            expected_parties.extend(parties)
+        filings, parties = parse_frame(lines, nos, 5, "cordata0.txt")
+        assert expected_parties
+        _assert_same(expected_filings, filings)
+        _assert_same(expected_parties, parties)
+
+
+def test_empty_block_yields_empty_frames() -> None:
+    filings, parties = pg_loader._frame_cor_data([], [], 1, "cordata0.txt")
+    assert filings.height == 0
+    assert parties.height == 0
+    assert pg_loader._frame_flrf(["   "], [1], 1, "flrf.txt").height == 0
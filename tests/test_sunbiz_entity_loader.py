@@ -75,3 +75,121 @@ def test_load_sunbiz_entity_marks_zero_row_files_failed(
             "error_message": "No entity records parsed from cor/cordata.zip; refusing to mark empty load as current",
         }
     ]
+
+
+def test_iter_deflate64_lines_streams_in_small_chunks(monkeypatch: Any, tmp_path: Any) -> None:
+    inflate64 = pytest.importorskip("inflate64")
+    import struct
+    import zipfile
+
+    payload = b"".join(f"REC{i:05d}  some fixed width text\r\n".encode() for i in range(500))
+    payload += b"bare-cr line\rlast line without newline"
+    deflater = inflate64.Deflater()
+    compressed = deflater.deflate(payload) + deflater.flush()
+
+    name = b"cordata0.txt"
+    header = b"PK\x03\x04" + b"\x00" * 22 + struct.pack("<HH", len(name), 0)
+    member_path = tmp_path / "cordata.zip"
+    member_path.write_bytes(header + name + compressed)
+
+    info = zipfile.ZipInfo("cordata0.txt")
+    info.header_offset = 0
+    info.compress_size = len(compressed)
+    monkeypatch.setattr(pg_loader, "DEFLATE64_READ_CHUNK_BYTES", 7)
+
+    lines = list(pg_loader._iter_deflate64_lines(member_path, info))  # noqa: SLF001
+
+    assert lines == payload.splitlines(keepends=True)
+
+
+def test_load_sunbiz_entity_flushes_bounded_chunks_while_parsing(
+    monkeypatch: Any,
+    tmp_path: Any,
+) -> None:
+    data_zip = tmp_path / "cor" / "corevt.zip"
+    data_zip.parent.mkdir(parents=True)
+    data_zip.write_bytes(b"placeholder")
+
+    session = _FakeSession()
+    parsed_lines: list[int] = []
+    flushes: list[tuple[int, int]] = []
+
+    def _records(_path: Any) -> Any:
+        for line_no in range(1, 6):
+            parsed_lines.append(line_no)
+            yield "corevt.txt", line_no, f"{line_no:012d}00001EVENT"
+
+    def _copy_upsert(_session: Any, model: Any, rows: Any, **_kwargs: Any) -> int:
+        assert model is pg_loader.SunbizEntityEvent
+        flushes.append((len(rows), len(parsed_lines)))
+        return len(rows)
+
+    monkeypatch.setattr(pg_loader, "_collect_input_files", lambda **_kwargs: [data_zip])
+    monkeypatch.setattr(pg_loader, "get_session_factory", lambda _dsn: lambda: session)
+    monkeypatch.setattr(pg_loader, "_compute_sha256", lambda _path: "sha256")
+    monkeypatch.setattr(pg_loader, "_upsert_ingest_file", lambda **_kwargs: 7)
+    monkeypatch.setattr(pg_loader, "_mark_ingest_file", lambda **_kwargs: None)
+    monkeypatch.setattr(pg_loader, "_iter_text_records", _records)
+    monkeypatch.setattr(pg_loader, "copy_upsert", _copy_upsert)
+
+    stats = pg_loader.load_sunbiz_entity(
+        dsn="postgresql://db",
+        root=tmp_path,
+        pattern=None,
+        limit_files=None,
+        limit_lines=None,
+        batch_size=2,
+        max_rss_mb=0,
+        columnar=False,
+    )
+
+    # Chunks are written as soon as they fill, not after the whole file is parsed.
+    assert flushes == [(2, 2), (2, 4), (1, 5)]
+    assert stats["events_inserted"] == 5
+    assert stats["peak_rss_mb"] > 0
+    assert session.rollbacks == 0
+
+
+def test_load_sunbiz_entity_columnar_writes_one_frame_per_block(
+    monkeypatch: Any,
+    tmp_path: Any,
+) -> None:
+    data_zip = tmp_path / "cor" / "corevt.zip"
+    data_zip.parent.mkdir(parents=True)
+    data_zip.write_bytes(b"placeholder")
+
+    session = _FakeSession()
+    frames: list[list[str]] = []
+
+    def _records(_path: Any) -> Any:
+        for line_no in range(1, 6):
+            yield "corevt.txt", line_no, f"{line_no:012d}00001EVENT"
+
+    def _copy_upsert_frame(_session: Any, model: Any, frame: Any, **_kwargs: Any) -> int:
+        assert model is pg_loader.SunbizEntityEvent
+        frames.append(frame.get_column("event_doc_number").to_list())
+        return frame.height
+
+    monkeypatch.setattr(pg_loader, "_collect_input_files", lambda **_kwargs: [data_zip])
+    monkeypatch.setattr(pg_loader, "get_session_factory", lambda _dsn: lambda: session)
+    monkeypatch.setattr(pg_loader, "_compute_sha256", lambda _path: "sha256")
+    monkeypatch.setattr(pg_loader, "_upsert_ingest_file", lambda **_kwargs: 7)
+    monkeypatch.setattr(pg_loader, "_mark_ingest_file", lambda **_kwargs: None)
+    monkeypatch.setattr(pg_loader, "_iter_text_records", _records)
+    monkeypatch.setattr(pg_loader, "copy_upsert_frame", _copy_upsert_frame)
+
+    stats = pg_loader.load_sunbiz_entity(
+        dsn="postgresql://db",
+        root=tmp_path,
+        pattern=None,
+        limit_files=None,
+        limit_lines=4,
+        batch_size=3,
+        max_rss_mb=0,
+    )
+
+    assert frames == [
+        ["000000000001", "000000000002", "000000000003"],
+        ["000000000004"],
+    ]
+    assert stats["events_inserted"] == 4
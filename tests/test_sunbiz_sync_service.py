@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from src.scripts.sunbiz_sync_service import SunbizMirror
+import os
+import threading
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Self
+
+from src.scripts import sunbiz_sync_service
+from src.scripts.sunbiz_sync_service import RemoteFile, SunbizMirror
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
 
 
 def test_entity_quarterly_profile_excludes_nonprofit_archives() -> None:
@@ -25,3 +36,164 @@ def test_entity_quarterly_profile_excludes_nonprofit_archives() -> None:
         )
         is False
     )
+
+
+class _FakeRemoteFile:
+    def __init__(self, data: bytes, fail_after: int | None) -> None:
+        self.data = data
+        self.pos = 0
+        self.fail_after = fail_after
+        self.prefetched_from: int | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def seek(self, offset: int) -> None:
+        self.pos = offset
+
+    def stat(self) -> SimpleNamespace:
+        return SimpleNamespace(st_size=len(self.data))
+
+    def prefetch(self, _size: int, max_concurrent_requests: int) -> None:
+        assert max_concurrent_requests > 0
+        self.prefetched_from = self.pos
+
+    def read(self, size: int) -> bytes:
+        if self.fail_after is not None and self.pos >= self.fail_after:
+            raise OSError("connection reset")
+        end = len(self.data) if self.fail_after is None else self.fail_after
+        chunk = self.data[self.pos : min(self.pos + min(size, 4), end)]
+        self.pos += len(chunk)
+        return chunk
+
+
+class _FakeServer:
+    def __init__(self, files: dict[str, bytes]) -> None:
+        self.files = files
+        self.fail_once: dict[str, int] = {}
+        self.opens: list[tuple[str, int]] = []
+        self.sessions = 0
+        self.lock = threading.Lock()
+
+    def connect(self) -> tuple[SimpleNamespace, SimpleNamespace]:
+        with self.lock:
+            self.sessions += 1
+        closer = SimpleNamespace(close=lambda: None)
+        return closer, SimpleNamespace(open=self.open, close=lambda: None)
+
+    def open(self, path: str, _mode: str) -> _FakeRemoteFile:
+        with self.lock:
+            fail_after = self.fail_once.pop(path, None)
+        remote = _FakeRemoteFile(self.files[path], fail_after)
+        original_prefetch = remote.prefetch
+
+        def prefetch(size: int, max_concurrent_requests: int) -> None:
+            original_prefetch(size, max_concurrent_requests)
+            with self.lock:
+                self.opens.append((path, remote.pos))
+
+        remote.prefetch = prefetch  # type: ignore[method-assign]
+        return remote
+
+
+def _mirror(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, server: _FakeServer
+) -> SunbizMirror:
+    mirror = SunbizMirror(
+        host="sftp.test",
+        port=22,
+        username=sunbiz_sync_service.DEFAULT_USER,
+        password=sunbiz_sync_service.DEFAULT_PASSWORD,
+        data_dir=tmp_path / "mirror",
+        manifest_path=tmp_path / "mirror" / "manifest.json",
+        workers=3,
+    )
+    monkeypatch.setattr(mirror, "_connect", server.connect)
+    monkeypatch.setattr(mirror, "resolve_mode_dirs", lambda *_a, **_k: ["/doc"])
+    monkeypatch.setattr(
+        mirror,
+        "list_remote_files",
+        lambda *_a, **_k: [
+            RemoteFile(path=path, size=len(data), mtime=1_700_000_000 + i)
+            for i, (path, data) in enumerate(server.files.items())
+        ],
+    )
+    monkeypatch.setattr(sunbiz_sync_service.time, "sleep", lambda _s: None)
+    return mirror
+
+
+def _sync(mirror: SunbizMirror) -> dict:
+    return mirror.sync(
+        mode="daily",
+        remote_dirs=None,
+        include=None,
+        exclude=None,
+        dataset_profile=None,
+        modified_since=None,
+        max_files=None,
+        dry_run=False,
+        force=False,
+    )
+
+
+def test_sync_downloads_in_parallel_and_reports_throughput(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = {f"/doc/{n}.txt": f"payload-{n}".encode() * 5 for n in range(6)}
+    server = _FakeServer(files)
+    mirror = _mirror(tmp_path, monkeypatch, server)
+
+    summary = _sync(mirror)
+
+    assert summary["downloaded"] == 6
+    assert summary["bytes_downloaded"] == sum(len(d) for d in files.values())
+    assert len(summary["transfers"]) == 6
+    assert 1 < server.sessions <= 4  # one listing session plus <= 3 workers
+    for path, data in files.items():
+        assert (tmp_path / "mirror" / path.lstrip("/")).read_bytes() == data
+    assert set(mirror.load_manifest()) == set(files)
+    assert _sync(mirror)["skipped"] == 6
+
+
+def test_interrupted_transfer_resumes_from_part_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = bytes(range(200))
+    server = _FakeServer({"/doc/big.zip": data})
+    server.fail_once["/doc/big.zip"] = 120
+    mirror = _mirror(tmp_path, monkeypatch, server)
+
+    summary = _sync(mirror)
+
+    assert (tmp_path / "mirror/doc/big.zip").read_bytes() == data
+    assert server.opens == [("/doc/big.zip", 0), ("/doc/big.zip", 120)]
+    assert summary["transfers"][0]["resumed_from"] == 0
+    assert not (tmp_path / "mirror/doc/big.zip.part").exists()
+
+
+def test_part_file_resumes_only_for_matching_remote_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    data = b"0123456789" * 10
+    server = _FakeServer({"/doc/a.zip": data, "/doc/b.zip": data})
+    mirror = _mirror(tmp_path, monkeypatch, server)
+    part_dir = tmp_path / "mirror/doc"
+    part_dir.mkdir(parents=True)
+    fresh = part_dir / "a.zip.part"
+    fresh.write_bytes(data[:40])
+    os.utime(fresh, (1_700_000_000, 1_700_000_000))
+    stale = part_dir / "b.zip.part"
+    stale.write_bytes(b"x" * 40)
+    os.utime(stale, (1_600_000_000, 1_600_000_000))
+
+    summary = _sync(mirror)
+
+    assert sorted(server.opens) == [("/doc/a.zip", 40), ("/doc/b.zip", 0)]
+    assert (part_dir / "a.zip").read_bytes() == data
+    assert (part_dir / "b.zip").read_bytes() == data
+    assert summary["resumed"] == 1
+    by_path = {t["path"]: t for t in summary["transfers"]}
+    assert by_path["/doc/a.zip"]["bytes_fetched"] == 60
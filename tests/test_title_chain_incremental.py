@@ -0,0 +1,132 @@
+"""Incremental title-chain rebuild tests.
+
+A scripted connection stands in for PostgreSQL: it records every statement and
+answers the watermark, scope-count and stats queries, which is enough to check
+mode selection, the scoped reset and watermark bookkeeping.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from src.services.pg_title_chain_controller import ControllerConfig, TitleChainController
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+MARK = dt.datetime(2026, 3, 1, 12, 0, tzinfo=dt.UTC)
+HIGH = dt.datetime(2026, 3, 8, 12, 0, tzinfo=dt.UTC)
+
+
+class _ScriptedConn:
+    def __init__(self, stored: dict[str, dt.datetime | None]) -> None:
+        self.stored = stored
+        self.statements: list[tuple[str, Any]] = []
+
+    def execute(self, statement: object, params: Any = None) -> SimpleNamespace:
+        sql = str(statement)
+        self.statements.append((sql, params))
+        if "FROM title_chain_watermarks" in sql:
+            return SimpleNamespace(all=lambda: list(self.stored.items()))
+        if sql.startswith("SELECT (SELECT max("):
+            row = dict.fromkeys(TitleChainController.WATERMARK_SOURCES, HIGH)
+            return SimpleNamespace(mappings=lambda: SimpleNamespace(one=lambda: row))
+        if "SELECT COUNT(*) FROM controller_scope" in sql:
+            return SimpleNamespace(scalar=lambda: 3)
+        if "INSERT INTO controller_dirty" in sql:
+            return SimpleNamespace(rowcount=2 if params["source"] == "county_permits" else 0)
+        stats = {"foreclosures_built": 3}
+        return SimpleNamespace(rowcount=1, mappings=lambda: SimpleNamespace(one=lambda: stats))
+
+    def sql_containing(self, fragment: str) -> list[tuple[str, Any]]:
+        return [(sql, params) for sql, params in self.statements if fragment in sql]
+
+
+def _controller(conn: _ScriptedConn, **config: Any) -> TitleChainController:
+    @contextmanager
+    def begin() -> Iterator[_ScriptedConn]:
+        yield conn
+
+    controller = TitleChainController.__new__(TitleChainController)
+    controller._config = ControllerConfig(**config)  # noqa: SLF001
+    controller._engine = SimpleNamespace(begin=begin)  # noqa: SLF001
+    return controller
+
+
+def test_incremental_run_rebuilds_only_dirty_scope_and_advances_watermarks() -> None:
+    conn = _ScriptedConn(dict.fromkeys(TitleChainController.WATERMARK_SOURCES, MARK))
+
+    result = _controller(conn, incremental=True, active_only=True, watermark_overlap_minutes=30).run()
+
+    assert result["mode"] == "incremental"
+    assert result["dirty_by_source"]["county_permits"] == 2
+    assert result["scope_count"] == 3
+    dirty_inserts = conn.sql_containing("INSERT INTO controller_dirty")
+    assert [params["source"] for _sql, params in dirty_inserts] == [
+        "unbuilt",
+        *TitleChainController.WATERMARK_SOURCES,
+    ]
+    assert all(params["since"] == MARK - dt.timedelta(minutes=30) for _sql, params in dirty_inserts[1:])
+    assert "f.archived_at IS NULL" in conn.sql_containing("CREATE TEMP TABLE controller_candidates")[0][0]
+    assert conn.sql_containing("TRUNCATE") == []
+    deletes = conn.sql_containing("DELETE FROM foreclosure_title_")
+    assert len(deletes) == 3
+    assert all("IN (SELECT foreclosure_id FROM controller_scope)" in sql for sql, _params in deletes)
+    (_sql, saved), = conn.sql_containing("INSERT INTO title_chain_watermarks")
+    assert {row["source"]: row["high_water"] for row in saved} == dict.fromkeys(
+        TitleChainController.WATERMARK_SOURCES, HIGH
+    )
+
+
+def test_incremental_run_without_stored_marks_falls_back_to_full_rebuild() -> None:
+    conn = _ScriptedConn({})
+
+    result = _controller(conn, incremental=True).run()
+
+    assert result["mode"] == "full"
+    assert "dirty_by_source" not in result
+    assert conn.sql_containing("controller_dirty") == []
+    assert len(conn.sql_containing("TRUNCATE TABLE foreclosure_title_chain")) == 1
+    assert len(conn.sql_containing("INSERT INTO title_chain_watermarks")) == 1
+
+
+def test_limited_incremental_run_keeps_watermarks() -> None:
+    conn = _ScriptedConn(dict.fromkeys(TitleChainController.WATERMARK_SOURCES, None))
+
+    result = _controller(conn, incremental=True, limit=5).run()
+
+    assert result["mode"] == "incremental"
+    assert "LIMIT 5" in conn.sql_containing("CREATE TEMP TABLE controller_scope")[0][0]
+    assert conn.sql_containing("INSERT INTO title_chain_watermarks") == []
+    assert all(params["since"].year == 1970 for _sql, params in conn.sql_containing("INSERT INTO controller_dirty"))
+
+
+def test_targeted_run_ignores_watermarks() -> None:
+    conn = _ScriptedConn(dict.fromkeys(TitleChainController.WATERMARK_SOURCES, MARK))
+
+    result = _controller(conn, incremental=True, foreclosure_id=42).run()
+
+    assert result["mode"] == "full"
+    assert conn.sql_containing("FROM title_chain_watermarks") == []
+    assert conn.sql_containing("INSERT INTO title_chain_watermarks") == []
+
+
+def test_dirty_scans_cover_every_watermarked_source() -> None:
+    scans = TitleChainController._dirty_sources_sql()  # noqa: SLF001
+
+    assert set(scans) == {"unbuilt", *TitleChainController.WATERMARK_SOURCES}
+    for source, (table, ts_column, _filter) in TitleChainController.WATERMARK_SOURCES.items():
+        assert f"{table} x" in scans[source]
+        assert f"x.{ts_column} > :since" in scans[source]
+    assert "x.event_source IN ('ORI_DEED_SEARCH', 'ORI_DEED_BACKFILL')" in scans["title_overlays"]
+
+
+def test_street_key_strips_unit_before_directional() -> None:
+    key = TitleChainController._street_key_sql("x.address", strip_unit=True)  # noqa: SLF001
+
+    assert key.startswith("regexp_replace(regexp_replace(upper(trim(split_part(replace(x.address, E'\\t', ' ')")
+    assert "[A-Z0-9/-]+$', '\\1', 'g')" in key
+    assert key.endswith("'^([0-9]+)[[:space:]]+(N|S|E|W)[[:space:]]+', '\\1 ', 'g')")
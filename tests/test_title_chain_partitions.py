@@ -0,0 +1,272 @@
+"""Partitioned title-chain build tests.
+
+Every ``engine.begin()`` hands out a fresh scripted connection, standing in
+for the separate backends that partitions run on.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from src.services import pg_title_chain_controller
+from src.services.pg_title_chain_controller import (
+    ControllerConfig,
+    TitleChainController,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _PartitionConn:
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, Any]] = []
+
+    def execute(self, statement: object, params: Any = None) -> SimpleNamespace:
+        sql = str(statement)
+        self.statements.append((sql, params))
+        if sql.startswith("SELECT (SELECT max("):
+            row = dict.fromkeys(TitleChainController.WATERMARK_SOURCES)
+            return SimpleNamespace(mappings=lambda: SimpleNamespace(one=lambda: row))
+        if "SELECT COUNT(*) FROM controller_scope" in sql:
+            return SimpleNamespace(scalar=lambda: 2)
+        stats = {
+            "total_foreclosures": 2,
+            "avg_years_covered": Decimal("10.00"),
+            "years_covered_sum": Decimal(20),
+            "years_covered_count": 2,
+        }
+        return SimpleNamespace(
+            rowcount=1, mappings=lambda: SimpleNamespace(one=lambda: stats)
+        )
+
+
+class _Engine:
+    def __init__(self, failures: dict[int, int] | None = None) -> None:
+        self.failures = dict(failures or {})
+        self.conns: list[_PartitionConn] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def begin(self) -> Iterator[_PartitionConn]:
+        conn = _PartitionConn()
+        with self._lock:
+            self.conns.append(conn)
+        yield conn
+        partition = next(
+            (
+                params["partition_index"]
+                for _sql, params in conn.statements
+                if params and "partition_index" in params
+            ),
+            None,
+        )
+        with self._lock:
+            fail_commit = self.failures.get(partition, 0) > 0
+            if fail_commit:
+                self.failures[partition] -= 1
+        if fail_commit:
+            raise OperationalError("COMMIT", None, Exception("deadlock detected"))
+
+    def sql_containing(self, fragment: str) -> list[tuple[str, Any]]:
+        return [
+            (sql, params)
+            for conn in self.conns
+            for sql, params in conn.statements
+            if fragment in sql
+        ]
+
+
+def _controller(engine: _Engine, **config: Any) -> TitleChainController:
+    controller = TitleChainController.__new__(TitleChainController)
+    controller._config = ControllerConfig(**config)  # noqa: SLF001
+    controller._engine = engine  # noqa: SLF001
+    return controller
+
+
+def test_partitioned_run_builds_each_partition_on_its_own_connection() -> None:
+    engine = _Engine()
+
+    result = _controller(engine, partitions=3).run()
+
+    assert result["partitions"] == 3
+    assert result["scope_count"] == 6
+    assert result["total_foreclosures"] == 6
+    assert result["avg_years_covered"] == Decimal("10.00")
+    assert "years_covered_sum" not in result
+    scopes = engine.sql_containing("CREATE TEMP TABLE controller_scope")
+    assert sorted(params["partition_index"] for _sql, params in scopes) == [0, 1, 2]
+    assert all("hashint8(f.foreclosure_id)" in sql for sql, _params in scopes)
+    # Setup, three partitions, then the watermark commit.
+    assert len(engine.conns) == 5
+    assert (
+        len(engine.sql_containing("CREATE OR REPLACE FUNCTION normalize_party_name"))
+        == 1
+    )
+    assert engine.sql_containing("TRUNCATE") == []
+    # Three scoped deletes plus one sweep of foreclosures outside the candidates.
+    assert len(engine.sql_containing("DELETE FROM foreclosure_title_summary")) == 4
+    outside = engine.sql_containing("WHERE NOT EXISTS")
+    assert [sql.split()[2] for sql, _params in outside] == [
+        "foreclosure_title_summary",
+        "foreclosure_title_chain",
+        "foreclosure_title_events",
+    ]
+    assert len(engine.sql_containing("INSERT INTO title_chain_watermarks")) == 1
+
+
+def test_partition_retries_operational_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pg_title_chain_controller.time, "sleep", lambda _seconds: None)
+    engine = _Engine(failures={1: 1})
+
+    result = _controller(engine, partitions=2).run()
+
+    assert result["scope_count"] == 4
+    assert len(engine.sql_containing("CREATE TEMP TABLE controller_scope")) == 3
+    assert len(engine.sql_containing("INSERT INTO title_chain_watermarks")) == 1
+
+
+def test_failed_partition_fails_run_and_keeps_watermarks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pg_title_chain_controller.time, "sleep", lambda _seconds: None)
+    engine = _Engine(failures={0: 5})
+
+    with pytest.raises(
+        RuntimeError, match=r"partitions \[0\] of 2 failed; 1 partition\(s\) committed"
+    ):
+        _controller(engine, partitions=2, partition_attempts=2).run()
+
+    assert engine.sql_containing("INSERT INTO title_chain_watermarks") == []
+
+
+def test_targeted_run_is_never_partitioned() -> None:
+    engine = _Engine()
+
+    result = _controller(engine, partitions=4, case_number="24-CA-000001").run()
+
+    assert "partitions" not in result
+    assert len(engine.conns) == 1
+    assert engine.sql_containing("hashint8") == []
+
+
+def test_merge_recomputes_average_from_partition_sums() -> None:
+    merged = TitleChainController._merge_partition_results(  # noqa: SLF001
+        [
+            {
+                "mode": "incremental",
+                "scope_count": 1,
+                "dirty_by_source": {"unbuilt": 1},
+                "total_foreclosures": 1,
+                "avg_years_covered": Decimal("4.00"),
+                "years_covered_sum": Decimal(4),
+                "years_covered_count": 1,
+            },
+            {
+                "mode": "incremental",
+                "scope_count": 3,
+                "dirty_by_source": {"unbuilt": 2},
+                "total_foreclosures": 3,
+                "avg_years_covered": Decimal("5.00"),
+                "years_covered_sum": Decimal(15),
+                "years_covered_count": 3,
+            },
+        ]
+    )
+
+    assert merged["scope_count"] == 4
+    assert merged["dirty_by_source"] == {"unbuilt": 3}
+    assert merged["avg_years_covered"] == Decimal("4.75")
+
+
+class _SummaryConn(_PartitionConn):
+    """Scripted connection that tracks which foreclosures have a summary row."""
+
+    def __init__(self, db: dict[str, Any]) -> None:
+        super().__init__()
+        self.db = db
+        self.scope: set[int] = set()
+
+    def execute(self, statement: object, params: Any = None) -> SimpleNamespace:
+        sql = str(statement)
+        db = self.db
+        if "CREATE TEMP TABLE controller_scope" in sql:
+            params = params or {}
+            count = params.get("partition_count", 1)
+            index = params.get("partition_index", 0)
+            self.scope = {
+                fid
+                for fid, archived in db["foreclosures"].items()
+                if fid % count == index
+                and not (archived and "f.archived_at IS NULL" in sql)
+            }
+        elif "SELECT COUNT(*) FROM controller_scope" in sql:
+            self.statements.append((sql, params))
+            return SimpleNamespace(scalar=lambda: len(self.scope))
+        elif "TRUNCATE TABLE" in sql:
+            db["summary"].clear()
+        elif sql.lstrip().startswith("DELETE FROM foreclosure_title_summary"):
+            if "controller_scope" in sql:
+                db["summary"] -= self.scope
+            elif "WHERE NOT EXISTS" in sql:
+                db["summary"] &= set(db["foreclosures"])
+        elif "INSERT INTO foreclosure_title_summary" in sql:
+            db["summary"] |= self.scope
+        return super().execute(statement, params)
+
+
+class _SummaryEngine(_Engine):
+    def __init__(self, db: dict[str, Any]) -> None:
+        super().__init__()
+        self.db = db
+
+    @contextmanager
+    def begin(self) -> Iterator[_PartitionConn]:
+        conn = _SummaryConn(self.db)
+        with self._lock:
+            self.conns.append(conn)
+        yield conn
+
+
+@pytest.mark.parametrize("active_only", [True, False])
+def test_partitioned_full_rebuild_matches_sequential_with_archived_rows(
+    *, active_only: bool
+) -> None:
+    def _run(partitions: int) -> set[int]:
+        # 1-4 are active, 5-6 archived; 99 was deleted but still has a summary.
+        db: dict[str, Any] = {
+            "foreclosures": {1: False, 2: False, 3: False, 4: False, 5: True, 6: True},
+            "summary": {1, 2, 5, 6, 99},
+        }
+        _controller(_SummaryEngine(db), partitions=partitions, active_only=active_only).run()
+        return db["summary"]
+
+    sequential = _run(1)
+    partitioned = _run(3)
+
+    assert partitioned == sequential
+    if active_only:
+        # Partial runs keep every row outside their scope, archived ones included.
+        assert sequential == {1, 2, 3, 4, 5, 6, 99}
+    else:
+        assert sequential == {1, 2, 3, 4, 5, 6}
+
+
+def test_partitioned_incremental_run_does_not_sweep() -> None:
+    engine = _Engine()
+    controller = _controller(engine, partitions=2, incremental=True)
+    controller._watermark_state = lambda _conn: (  # type: ignore[method-assign]  # noqa: SLF001
+        {},
+        dict.fromkeys(TitleChainController.WATERMARK_SOURCES),
+    )
+    controller._create_incremental_scope = lambda *_args: (0, {})  # type: ignore[method-assign]  # noqa: SLF001
+    controller.run()
+
+    assert engine.sql_containing("WHERE NOT EXISTS") == []
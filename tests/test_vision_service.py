@@ -3,10 +3,19 @@ from __future__ import annotations
 import time
 from typing import Any
 
+import pytest
+
+from src.services import vision_service
 from src.services.vision_service import VisionService
 from src.services.vision_service import _extract_response_text
 
 
+@pytest.fixture(autouse=True)
+def _no_result_cache(monkeypatch: Any) -> None:
+    # Keep these tests off the PG-backed LLM result cache.
+    monkeypatch.setenv("VISION_RESULT_CACHE", "0")
+
+
 def test_extract_response_text_handles_content_filtered_response() -> None:
     result = {
         "choices": [
@@ -258,3 +267,194 @@ def test_try_all_endpoints_probes_suspended_endpoint_when_all_candidates_are_sus
         VisionService.API_ENDPOINTS = original_api_endpoints
         VisionService.API_URLS = original_api_urls
         VisionService._endpoints_built = original_built  # noqa: SLF001
+
+
+def _install_endpoints(monkeypatch: Any, endpoints: list[dict[str, Any]]) -> None:
+    monkeypatch.setattr(VisionService, "_health_check_done", True)
+    monkeypatch.setattr(VisionService, "_healthy_endpoints", endpoints)
+    monkeypatch.setattr(VisionService, "_suspended_endpoints", {})
+    monkeypatch.setattr(VisionService, "_endpoint_loads", {})
+    monkeypatch.setattr(VisionService, "API_ENDPOINTS", endpoints)
+    monkeypatch.setattr(VisionService, "API_URLS", [endpoint["url"] for endpoint in endpoints])
+    monkeypatch.setattr(VisionService, "_endpoints_built", True)
+
+
+def test_concurrent_requests_spread_across_endpoints(monkeypatch: Any) -> None:
+    import threading
+
+    endpoints = [
+        {"url": "http://gpu-a:6969/v1/chat/completions", "model": "m", "max_concurrency": 1},
+        {"url": "http://gpu-b:6969/v1/chat/completions", "model": "m", "max_concurrency": 1},
+    ]
+    _install_endpoints(monkeypatch, endpoints)
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _FakeResponse:
+        ok = True
+        status_code = 200
+        text = ""
+
+    class _FakeSession:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        def post(self, url: str, **_kwargs: Any) -> _FakeResponse:
+            self.calls.append(url)
+            # Both requests must be in flight at the same time.
+            barrier.wait()
+            return _FakeResponse()
+
+    service = VisionService()
+    service.session = _FakeSession()
+    payload = {"messages": [{"role": "user", "content": "hi"}]}
+    results: list[Any] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(service._try_all_endpoints(payload, timeout=5)))  # noqa: SLF001
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(results) == 2
+    assert all(result is not None for result in results)
+    assert sorted(service.session.calls) == sorted(endpoint["url"] for endpoint in endpoints)
+    stats = VisionService.endpoint_stats()
+    assert {url: state["outstanding"] for url, state in stats.items()} == {
+        endpoints[0]["url"]: 0,
+        endpoints[1]["url"]: 0,
+    }
+    assert all(state["latency_ewma_s"] is not None for state in stats.values())
+
+
+def test_reserve_prefers_lower_latency_when_load_is_equal(monkeypatch: Any) -> None:
+    endpoints = [
+        {"url": "http://slow:6969/v1/chat/completions", "model": "m"},
+        {"url": "http://fast:6969/v1/chat/completions", "model": "m"},
+    ]
+    _install_endpoints(monkeypatch, endpoints)
+
+    for endpoint, latency in ((endpoints[0], 30.0), (endpoints[1], 5.0)):
+        assert VisionService._reserve_endpoint([endpoint], set(), []) is endpoint  # noqa: SLF001
+        VisionService._release_endpoint(endpoint, latency=latency)  # noqa: SLF001
+    VisionService._release_endpoint(endpoints[1], latency=15.0)  # noqa: SLF001
+
+    chosen = VisionService._reserve_endpoint(endpoints, set(), [])  # noqa: SLF001
+
+    assert chosen is endpoints[1]
+    assert VisionService.endpoint_stats()[endpoints[1]["url"]]["latency_ewma_s"] == 8.0
+    assert VisionService.dispatch_capacity() == 2 * VisionService._LOCAL_ENDPOINT_CONCURRENCY  # noqa: SLF001
+
+
+def test_single_endpoint_backoff_sleeps_without_holding_the_slot(monkeypatch: Any) -> None:
+    endpoint = {"url": "http://gpu-a:6969/v1/chat/completions", "model": "m", "max_concurrency": 1}
+    _install_endpoints(monkeypatch, [endpoint])
+    outstanding_during_sleep: list[int] = []
+
+    class _FakeResponse:
+        def __init__(self, status_code: int) -> None:
+            self.status_code = status_code
+            self.ok = status_code == 200
+            self.text = ""
+
+    class _FakeSession:
+        def __init__(self) -> None:
+            self.statuses = [429, 200]
+
+        def post(self, _url: str, **_kwargs: Any) -> _FakeResponse:
+            return _FakeResponse(self.statuses.pop(0))
+
+    def _fake_sleep(_seconds: float) -> None:
+        stats = VisionService.endpoint_stats()
+        outstanding_during_sleep.append(stats[endpoint["url"]]["outstanding"])
+
+    monkeypatch.setattr(vision_service.time, "sleep", _fake_sleep)
+    service = VisionService()
+    service.session = _FakeSession()
+
+    response = service._try_all_endpoints({"messages": []}, timeout=5)  # noqa: SLF001
+
+    assert response is not None
+    assert response.status_code == 200
+    assert outstanding_during_sleep == [0]
+
+
+def _text_completion(content: str) -> Any:
+    class _FakeResponse:
+        ok = True
+        status_code = 200
+        text = ""
+
+        @staticmethod
+        def json() -> dict[str, Any]:
+            return {"choices": [{"message": {"content": content}}]}
+
+    return _FakeResponse()
+
+
+def test_analyze_text_uses_result_cache_keyed_by_answering_model(monkeypatch: Any) -> None:
+    endpoints = [{"url": "http://gpu-a:6969/v1/chat/completions", "model": "glm"}]
+    _install_endpoints(monkeypatch, endpoints)
+    store: dict[tuple[str, str], str] = {}
+    lookups: list[list[str]] = []
+
+    def _fake_get(payload: dict[str, Any], models: list[str]) -> str | None:
+        lookups.append(models)
+        for model in models:
+            key = (payload["messages"][0]["content"], model)
+            if key in store:
+                return store[key]
+        return None
+
+    def _fake_put(payload: dict[str, Any], model: str, response_text: str) -> None:
+        store[(payload["messages"][0]["content"], model)] = response_text
+
+    monkeypatch.setattr(vision_service, "llm_cache_get", _fake_get)
+    monkeypatch.setattr(vision_service, "llm_cache_put", _fake_put)
+
+    class _FakeSession:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def post(self, url: str, **_kwargs: Any) -> Any:
+            self.calls += 1
+            return _text_completion('{"amount": 1}')
+
+    service = VisionService()
+    service.session = _FakeSession()
+    schema = {"type": "json_schema"}
+
+    first = service.analyze_text("Extract this", response_format=schema)
+    second = service.analyze_text("Extract this", response_format=schema)
+    bypassed = service.analyze_text("Extract this", response_format=schema, use_cache=False)
+
+    assert first == second == bypassed == '{"amount": 1}'
+    assert service.session.calls == 2
+    assert store == {("Extract this", "glm"): '{"amount": 1}'}
+    assert lookups == [["glm"], ["glm"]]
+
+
+def test_malformed_structured_answer_is_not_cached(monkeypatch: Any) -> None:
+    endpoints = [{"url": "http://gpu-a:6969/v1/chat/completions", "model": "glm"}]
+    _install_endpoints(monkeypatch, endpoints)
+    puts: list[str] = []
+    monkeypatch.setattr(vision_service, "llm_cache_get", lambda _payload, _models: None)
+    monkeypatch.setattr(
+        vision_service,
+        "llm_cache_put",
+        lambda _payload, _model, response_text: puts.append(response_text),
+    )
+
+    class _FakeSession:
+        @staticmethod
+        def post(_url: str, **_kwargs: Any) -> Any:
+            return _text_completion("sorry, I cannot help with that")
+
+    service = VisionService()
+    service.session = _FakeSession()
+
+    service.analyze_text("Extract this", response_format={"type": "json_schema"})
+    service.analyze_text("Transcribe this")
+
+    assert puts == ["sorry, I cannot help with that"]
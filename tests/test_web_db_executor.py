@@ -0,0 +1,110 @@
+"""Tests for the web dashboard's database thread-pool offload."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.dependencies.utils import get_dependant
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from app.web import db_executor
+from app.web.db_executor import WebDbSettings, db_route
+from app.web.exceptions import DatabaseTimeoutError, DatabaseUnavailableError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def fresh_executor(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    db_executor.shutdown_executor()
+    db_executor.web_db_settings.cache_clear()
+    monkeypatch.setenv("WEB_DB_THREADS", "2")
+    yield
+    db_executor.shutdown_executor()
+    db_executor.web_db_settings.cache_clear()
+
+
+def test_settings_read_env_and_default_pool_to_threads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("WEB_DB_THREADS", "3")
+    monkeypatch.setenv("WEB_DB_STATEMENT_TIMEOUT_MS", "500")
+    monkeypatch.delenv("WEB_DB_POOL_SIZE", raising=False)
+
+    settings = WebDbSettings.from_env()
+
+    assert settings.threads == 3
+    assert settings.pool_size == 3
+    assert settings.max_overflow == 4
+    assert settings.statement_timeout_ms == 500
+    assert settings.request_timeout == 45.0
+
+
+def test_db_route_keeps_signature_and_runs_off_the_event_loop(
+    fresh_executor: None,
+) -> None:
+    _ = fresh_executor
+
+    def handler(request: object, folio: str) -> tuple[str, str]:
+        return folio, threading.current_thread().name
+
+    wrapped = db_route(handler)
+
+    assert inspect.iscoroutinefunction(wrapped)
+    assert inspect.signature(wrapped) == inspect.signature(handler, eval_str=True)
+    folio, thread_name = asyncio.run(wrapped(None, folio="A1"))
+    assert folio == "A1"
+    assert thread_name.startswith("web-db")
+
+
+def test_slow_call_raises_database_timeout(
+    fresh_executor: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _ = fresh_executor
+    monkeypatch.setenv("WEB_DB_REQUEST_TIMEOUT", "0.05")
+
+    @db_route
+    def slow() -> None:
+        time.sleep(0.3)
+
+    with pytest.raises(DatabaseTimeoutError) as excinfo:
+        asyncio.run(slow())
+    assert isinstance(excinfo.value, DatabaseUnavailableError)
+
+
+def _echo(request: Request, folio: str) -> dict[str, str]:
+    return {"folio": folio, "path": request.url.path}
+
+
+def test_db_route_resolves_request_from_string_annotations(
+    fresh_executor: None,
+) -> None:
+    # This module, like the routers, uses postponed annotations, and
+    # db_executor does not import Request: the route must still see it.
+    _ = fresh_executor
+    app = FastAPI()
+    app.get("/echo")(db_route(_echo))
+
+    response = TestClient(app).get("/echo", params={"folio": "A1"})
+
+    assert response.status_code == 200
+    assert response.json() == {"folio": "A1", "path": "/echo"}
+
+
+def test_router_endpoints_take_no_request_query_parameter() -> None:
+    from app.web.routers import connections, database_view, history
+
+    for router in (connections.router, database_view.router, history.router):
+        for route in router.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            dependant = get_dependant(path=route.path, call=route.endpoint)
+            assert "request" not in {param.name for param in dependant.query_params}, route.path